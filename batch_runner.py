@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BATCH RUNNER - Headless Toplu Render
+JSON/YAML iş manifest'i ile menüsüz render. İşler sırayla veya worker
+limitiyle eşzamanlı çalışır; her iş için makine tarafından okunabilir
+bir sonuç dosyası yazılır.
+
+Kullanım:
+    python batch_runner.py jobs.yaml [--workers 2] [--results-dir DIR]
+    python main.py --batch jobs.yaml
+
+Manifest örneği (YAML):
+    workers: 2
+    defaults:
+      style: tiktok
+      compress: true
+      target_size_mb: 800
+    jobs:
+      - id: bolum_01
+        audio: C:/ses/bolum_01.mp3
+      - id: sessiz_demo
+        duration: 600          # ses yoksa hedef süre (saniye)
+        subtitles: false
+        effects: [color_grading, vignette_advanced]
+        output: demo.mp4
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import traceback
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+try:
+    from config import RENDER_KLASORU, RANDOMS_KLASORU
+except ImportError:
+    RENDER_KLASORU = os.getcwd()
+    RANDOMS_KLASORU = os.getcwd()
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+BATCH_CONFIG = {
+    'workers': 1,
+
+    # İş başına sonuç dosyaları: <results_dir>/<job_id>.result.json
+    'results_dir': os.path.join(RENDER_KLASORU, 'batch_results'),
+
+    # İş temp klasörleri (interaktif mod temp_pro'yu kullanır, çakışmasın)
+    'temp_root': os.path.join(RENDER_KLASORU, 'temp_batch'),
+
+    # Manifest'te verilmeyen alanlar
+    'job_defaults': {
+        'audio': None,
+        'duration': None,
+        'video_pool': None,        # None = RANDOMS_KLASORU
+        'output': None,            # None = otomatik dosya adı
+        'output_dir': None,        # None = RENDER_KLASORU
+        'style': None,             # None = hikaye modu varsayılanı
+        'highlight_color': None,
+        'font': None,
+        'subtitles': True,
+        'effects': None,           # None = akıllı seçim, liste = sadece bunlar
+        'compress': False,
+        'target_size_mb': 800,
+    },
+}
+
+JOB_STATUS_SUCCESS = 'success'
+JOB_STATUS_FAILED = 'failed'
+
+
+# ============================================================================
+# 📋 MANIFEST
+# ============================================================================
+
+def manifest_yukle(path: str) -> Dict:
+    """
+    JSON veya YAML manifest'i yükle ve doğrula
+
+    Returns:
+        {'workers': int, 'jobs': [job_dict, ...]}
+
+    Raises:
+        ValueError: Geçersiz manifest
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        icerik = f.read()
+
+    if path.lower().endswith(('.yaml', '.yml')):
+        if not YAML_AVAILABLE:
+            raise ValueError("YAML manifest için PyYAML gerekli (pip install pyyaml)")
+        manifest = yaml.safe_load(icerik)
+    else:
+        manifest = json.loads(icerik)
+
+    if isinstance(manifest, list):
+        manifest = {'jobs': manifest}
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('jobs'), list):
+        raise ValueError("Manifest 'jobs' listesi içermeli")
+
+    defaults = dict(BATCH_CONFIG['job_defaults'])
+    defaults.update(manifest.get('defaults') or {})
+
+    jobs = []
+    gorulen = set()
+    for i, job in enumerate(manifest['jobs'], 1):
+        if not isinstance(job, dict):
+            raise ValueError(f"İş {i}: sözlük olmalı")
+        birlesik = dict(defaults)
+        birlesik.update(job)
+        birlesik['id'] = str(job.get('id') or f"job_{i:03d}")
+
+        if birlesik['id'] in gorulen:
+            raise ValueError(f"İş {i}: tekrarlanan id '{birlesik['id']}'")
+        gorulen.add(birlesik['id'])
+
+        if not birlesik['audio'] and not birlesik['duration']:
+            raise ValueError(f"İş '{birlesik['id']}': 'audio' veya 'duration' gerekli")
+        if birlesik['audio'] and not os.path.exists(birlesik['audio']):
+            raise ValueError(f"İş '{birlesik['id']}': ses dosyası bulunamadı: {birlesik['audio']}")
+
+        jobs.append(birlesik)
+
+    return {
+        'workers': int(manifest.get('workers') or BATCH_CONFIG['workers']),
+        'jobs': jobs,
+    }
+
+
+def sonuc_yaz(result: Dict, results_dir: str) -> str:
+    """İş sonucunu atomik olarak yaz"""
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, f"{result['id']}.result.json")
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+    return path
+
+
+# ============================================================================
+# 🎬 İŞ ÇALIŞTIRMA
+# ============================================================================
+
+def is_calistir(job: Dict, encoder_type: str, encoder_config: Dict,
+                video_havuzlari: Dict[str, List[Dict]]) -> Dict:
+    """
+    Tek işi menüsüz çalıştır (main() ile aynı akış)
+
+    Returns:
+        Sonuç sözlüğü (status, output, size_mb, duration_sec, elapsed_sec, error, ...)
+    """
+    import main as pipeline
+
+    result = {
+        'id': job['id'],
+        'status': JOB_STATUS_FAILED,
+        'output': None,
+        'size_mb': None,
+        'duration_sec': None,
+        'elapsed_sec': None,
+        'error': None,
+        'scratch': None,
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'finished_at': None,
+        'job': job,
+    }
+    baslangic = time.time()
+    temp_klasor = os.path.join(BATCH_CONFIG['temp_root'], job['id'])
+    pipeline.telemetry_run_baslat(job['id'], mode='batch')
+    log_token = pipeline.job_log_ayarla(job['id']) if pipeline.LOGGING_SETUP_AVAILABLE else None
+    cikti_adi = None
+
+    try:
+        video_bilgileri = video_havuzlari[job['video_pool'] or RANDOMS_KLASORU]
+        if not video_bilgileri:
+            raise RuntimeError("Video havuzu boş")
+
+        ses = job['audio']
+        with pipeline.telemetry_span('probe', files=1 if ses else 0):
+            ses_suresi = pipeline.ses_bilgisi_al(ses) if ses else None
+        if ses and not ses_suresi:
+            raise RuntimeError(f"Ses bilgisi okunamadı: {ses}")
+        hedef_sure = ses_suresi or float(job['duration'])
+
+        subtitle_config = None
+        if job['subtitles'] and ses:
+            subtitle_config = pipeline.altyazi_config_olustur(
+                hikaye_modu=True, secilen_font=job['font'], style=job['style']
+            )
+            subtitle_config['interactive'] = False
+            if job['highlight_color']:
+                subtitle_config['highlight_color'] = job['highlight_color']
+
+        cikti_klasoru = job['output_dir'] or RENDER_KLASORU
+        rapor, video_bilgileri = pipeline.girdi_on_kontrol(
+            video_bilgileri, ses, subtitle_config, hedef_sure, encoder_config,
+            klasorler=(cikti_klasoru, temp_klasor), verbose=False
+        )
+        if rapor is not None:
+            for uyari in rapor['warnings']:
+                logger.warning(f"[{job['id']}] {uyari}")
+            if not rapor['ok']:
+                raise RuntimeError("Preflight: " + "; ".join(rapor['errors']))
+
+        if subtitle_config:
+            with pipeline.telemetry_span('transcribe', audio_s=ses_suresi) as sp:
+                sp['bytes'] = os.path.getsize(ses)
+                subtitle_config = pipeline.otomatik_altyazi_olustur(ses, subtitle_config)
+                sp['ok'] = bool(subtitle_config)
+
+        if job['effects'] is not None:
+            secilen_efektler = set(job['effects'])
+        else:
+            # None parallel_encode'da "tüm efektler" demek; akıllı seçim render bütçesini uygular
+            secilen_efektler = pipeline.akilli_efekt_secimi()
+        cikti_adi = job['output'] or pipeline.random_dosya_adi_olustur()
+        os.makedirs(cikti_klasoru, exist_ok=True)
+        os.makedirs(temp_klasor, exist_ok=True)
+        pipeline.scratch_ac(job['id'], temp_klasor)
+
+        with pipeline.telemetry_span('analysis', videos=len(video_bilgileri)):
+            secilen_videolar = pipeline.akilli_video_sec(video_bilgileri, hedef_sure, max_varyasyon=10)
+            playlist = pipeline.playlist_olustur(secilen_videolar, hedef_sure, temp_klasor)
+
+        basarili, sonuc = pipeline.parallel_encode(
+            playlist, cikti_adi, temp_klasor, cikti_klasoru,
+            encoder_type, encoder_config, ses, subtitle_config, secilen_efektler,
+            batch_options={'compress': job['compress'], 'target_size_mb': job['target_size_mb']}
+        )
+
+        if basarili:
+            bilgi = pipeline.video_bilgisi_al(sonuc)
+            result.update({
+                'status': JOB_STATUS_SUCCESS,
+                'output': sonuc,
+                'size_mb': round(os.path.getsize(sonuc) / (1024 * 1024), 1),
+                'duration_sec': round(bilgi['sure'], 2) if bilgi else None,
+            })
+        else:
+            result['error'] = str(sonuc)
+
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        logger.debug(traceback.format_exc())
+
+    finally:
+        result['scratch'] = pipeline.scratch_kapat(temp_klasor)
+        if os.path.exists(temp_klasor):
+            shutil.rmtree(temp_klasor, ignore_errors=True)
+        if cikti_adi and pipeline.JOB_JOURNAL_AVAILABLE:
+            pipeline.run_bitir(cikti_adi, 'closed')
+        pipeline.telemetry_run_bitir(ok=result['status'] == JOB_STATUS_SUCCESS, output=cikti_adi,
+                                     scratch=result['scratch'])
+        if log_token is not None:
+            pipeline.job_log_sifirla(log_token)
+
+    result['elapsed_sec'] = round(time.time() - baslangic, 1)
+    result['finished_at'] = datetime.now().isoformat(timespec='seconds')
+    return result
+
+
+def batch_calistir(manifest: Dict, workers: Optional[int] = None,
+                   results_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Manifest'teki tüm işleri çalıştır
+
+    İşler thread'lerde çalışır; her iş kendi ProcessPoolExecutor'ı ile
+    klipleri encode eder (iç içe process pool olmaz).
+
+    Returns:
+        İş sonuçları (manifest sırasıyla)
+    """
+    import main as pipeline
+
+    workers = max(1, workers or manifest['workers'])
+    results_dir = results_dir or BATCH_CONFIG['results_dir']
+    jobs = manifest['jobs']
+
+    if not pipeline.ffmpeg_yuklu_mu():
+        raise RuntimeError("ffmpeg yüklü değil")
+
+    encoder_type, encoder_config = pipeline.gpu_durumunu_tespit_et()
+    pipeline.cache_temizle(max_size_gb=5)
+
+    # Video havuzları bir kez okunur, işler arasında paylaşılır
+    video_havuzlari = {}
+    for job in jobs:
+        havuz = job['video_pool'] or RANDOMS_KLASORU
+        if havuz not in video_havuzlari:
+            video_havuzlari[havuz], _ = pipeline.video_havuzu_oku(havuz, verbose=False)
+
+    print(f"\n📦 BATCH: {len(jobs)} iş, {workers} worker → {results_dir}")
+
+    sonuclar = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(is_calistir, job, encoder_type, encoder_config, video_havuzlari): job['id']
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            sonuclar[result['id']] = result
+            sonuc_yaz(result, results_dir)
+            durum = "✅" if result['status'] == JOB_STATUS_SUCCESS else "❌"
+            print(f"\n   {durum} {result['id']} ({result['elapsed_sec']}s) "
+                  f"{result['output'] or result['error']}")
+
+    ordered = [sonuclar[job['id']] for job in jobs]
+    ozet = {
+        'total': len(ordered),
+        'success': sum(1 for r in ordered if r['status'] == JOB_STATUS_SUCCESS),
+        'failed': sum(1 for r in ordered if r['status'] != JOB_STATUS_SUCCESS),
+        'jobs': [{'id': r['id'], 'status': r['status'], 'output': r['output']} for r in ordered],
+    }
+    sonuc_yaz(dict(ozet, id='_batch_summary'), results_dir)
+    print(f"\n📦 BATCH TAMAMLANDI: {ozet['success']}/{ozet['total']} başarılı")
+
+    return ordered
+
+
+# ============================================================================
+# 🖥️ CLI
+# ============================================================================
+
+def cli_main(argv: Optional[List[str]] = None) -> int:
+    """
+    Komut satırı girişi
+
+    Returns:
+        Çıkış kodu (0 = tüm işler başarılı, 1 = en az bir iş başarısız, 2 = manifest hatası)
+    """
+    parser = argparse.ArgumentParser(description="Headless toplu render (JSON/YAML manifest)")
+    parser.add_argument('manifest', help="İş manifest'i (.json / .yaml)")
+    parser.add_argument('--workers', type=int, default=None, help="Eşzamanlı iş sayısı")
+    parser.add_argument('--results-dir', default=None, help="Sonuç dosyaları klasörü")
+    args = parser.parse_args(argv)
+
+    import main as pipeline
+    pipeline.loglama_baslat()
+
+    try:
+        manifest = manifest_yukle(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"❌ Manifest hatası: {e}")
+        return 2
+
+    try:
+        sonuclar = batch_calistir(manifest, args.workers, args.results_dir)
+    except RuntimeError as e:
+        print(f"❌ Batch başlatılamadı: {e}")
+        return 2
+    return 0 if all(r['status'] == JOB_STATUS_SUCCESS for r in sonuclar) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(cli_main())
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BENCHMARK SUITE - Performans Ölçümleri
+- Başlangıç (import) süresi profili: `python -X importtime` çıktısı
+  ayrıştırılır, en pahalı modüller ve toplam süre raporlanır.
+- Emoji eşleştirme: binlerce satırlık sentetik transkriptte eski
+  (kalıp başına substring) ve derlenmiş eşleştirici karşılaştırılır.
+- Uçtan uca pipeline: ffmpeg testsrc2/sine ile üretilen sentetik girdilerde
+  probe, altyazı, ses analizi, efekt render, altyazı basma, QC ve sıkıştırma
+  aşamaları ayrı ayrı ölçülür (yalnız CPU / libx264). Sonuçlar JSON geçmiş
+  dosyasına eklenir; aynı makine + girdi için önceki çalışmaların medyanına
+  göre yavaşlayan aşamalar regresyon olarak işaretlenir.
+
+Kullanım:
+    python benchmark_suite.py
+    python benchmark_suite.py --pipeline    # regresyon varsa çıkış kodu 1
+"""
+
+import os
+import sys
+import json
+import hashlib
+import time
+import random
+import re
+import shutil
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+BENCHMARK_CONFIG = {
+    # Import profili alınacak modül
+    'import_module': 'main',
+
+    # Dry-run / QC-only başlangıç bütçesi (ms)
+    'startup_budget_ms': 1000,
+
+    # Raporda gösterilecek en pahalı modül sayısı
+    'import_top_n': 15,
+
+    'timeout': 120,
+
+    # Emoji benchmark: sentetik transkript satır sayısı ve tekrar
+    'emoji_lines': 5000,
+    'emoji_repeat': 3,
+    'emoji_seed': 42,
+
+    # Pipeline benchmark: sentetik girdi (testsrc2 + sine)
+    'pipeline_duration': 10,
+    'pipeline_resolution': '1920x1080',
+    'pipeline_fps': 30,
+    'pipeline_seed': 42,
+    'pipeline_repeat': 3,          # Aşama başına en iyi süre
+    'pipeline_preset': 'veryfast',
+    'pipeline_crf': 23,
+
+    # Geçmiş ve regresyon eşikleri
+    'history_file': os.path.join(BASE_DIR, 'benchmark_history.json'),
+    'history_max': 200,
+    'baseline_runs': 5,            # Referans: son N uyumlu çalışmanın medyanı
+    'regression_pct': 15.0,        # Bu yüzdeden fazla yavaşlama...
+    'regression_min_seconds': 0.05,  # ...ve en az bu kadar saniye → regresyon
+}
+
+
+# ============================================================================
+# ⏱️ IMPORT-TIME PROFİLİ
+# ============================================================================
+
+def importtime_ayristir(stderr: str) -> List[Dict]:
+    """
+    `-X importtime` çıktısını ayrıştır
+
+    Satır formatı: 'import time: self [us] | cumulative | imported package'
+
+    Returns:
+        [{'module', 'self_ms', 'cumulative_ms', 'depth'}]
+    """
+    kayitlar = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # Başlık satırı
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        kayitlar.append({
+            'module': name.strip(),
+            'self_ms': self_us / 1000.0,
+            'cumulative_ms': cumulative_us / 1000.0,
+            'depth': depth,
+        })
+    return kayitlar
+
+
+def import_time_profili(module: Optional[str] = None, top_n: Optional[int] = None) -> Dict:
+    """
+    Modülün temiz bir yorumlayıcıda import süresini ölç
+
+    Returns:
+        {
+            'module', 'wall_ms', 'import_ms', 'budget_ms', 'within_budget',
+            'top_self': [...], 'top_cumulative': [...]  # en pahalı modüller
+        }
+    """
+    module = module or BENCHMARK_CONFIG['import_module']
+    top_n = top_n or BENCHMARK_CONFIG['import_top_n']
+
+    # argv boş: main'in __main__ dışı kod yolları tetiklenmez
+    code = f"import sys; sys.argv = ['benchmark']; import {module}"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BASE_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        timeout=BENCHMARK_CONFIG['timeout']
+    )
+    wall_ms = (time.perf_counter() - start) * 1000.0
+
+    kayitlar = importtime_ayristir(result.stderr)
+    hedef = next((k for k in kayitlar if k['module'] == module and k['depth'] == 0), None)
+    import_ms = hedef['cumulative_ms'] if hedef else None
+
+    return {
+        'module': module,
+        'ok': result.returncode == 0,
+        'wall_ms': round(wall_ms, 1),
+        'import_ms': round(import_ms, 1) if import_ms is not None else None,
+        'budget_ms': BENCHMARK_CONFIG['startup_budget_ms'],
+        'within_budget': wall_ms <= BENCHMARK_CONFIG['startup_budget_ms'],
+        'top_self': sorted(kayitlar, key=lambda k: k['self_ms'], reverse=True)[:top_n],
+        'top_cumulative': sorted((k for k in kayitlar if k['depth'] <= 1),
+                                 key=lambda k: k['cumulative_ms'], reverse=True)[:top_n],
+    }
+
+
+def import_raporu_yazdir(profil: Dict) -> None:
+    """Import profilini konsola yazdır"""
+    print("\n" + "=" * 70)
+    print(f"⏱️  IMPORT-TIME PROFİLİ: {profil['module']}".center(70))
+    print("=" * 70)
+
+    if not profil['ok']:
+        print("   ❌ Import başarısız")
+        return
+
+    durum = "✅" if profil['within_budget'] else "⚠️"
+    print(f"   {durum} Başlangıç (süreç dahil): {profil['wall_ms']:.0f} ms "
+          f"(bütçe {profil['budget_ms']} ms)")
+    if profil['import_ms'] is not None:
+        print(f"   📦 import {profil['module']}: {profil['import_ms']:.1f} ms")
+
+    print(f"\n   En pahalı modüller (kümülatif, üst seviye):")
+    for k in profil['top_cumulative']:
+        print(f"      {k['cumulative_ms']:8.1f} ms  {k['module']}")
+
+    print(f"\n   En pahalı modüller (kendi süresi):")
+    for k in profil['top_self']:
+        print(f"      {k['self_ms']:8.1f} ms  {k['module']}")
+
+
+# ============================================================================
+# 😊 EMOJI EŞLEŞTİRME
+# ============================================================================
+
+_DOLGU_KELIMELERI = ('bugün', 'sonra', 'çünkü', 'bence', 'aslında', 'şimdi', 'orada', 'herkes',
+                     'zaman', 'yolda', 'evde', 'gerçekten', 'biraz', 'tekrar', 'hikaye', 'anlatmak')
+
+
+def _naif_emoji_bul(text: str, emoji_map: Dict[str, str]) -> Optional[str]:
+    """Eski emoji_ekle taraması (kalıp başına split + substring)"""
+    text_lower = text.lower()
+    for pattern, emoji in emoji_map.items():
+        for keyword in pattern.split('|'):
+            if keyword in text_lower:
+                return emoji
+    return None
+
+
+def sentetik_transkript(emoji_map: Dict[str, str], satir_sayisi: int, seed: int) -> List[str]:
+    """Satırların ~%40'ında bir anahtar kelime geçen Whisper benzeri satırlar"""
+    rng = random.Random(seed)
+    keywords = [kw for pattern in emoji_map for kw in pattern.split('|')]
+    satirlar = []
+    for _ in range(satir_sayisi):
+        kelimeler = [rng.choice(_DOLGU_KELIMELERI) for _ in range(rng.randint(4, 12))]
+        if rng.random() < 0.4:
+            kelimeler.insert(rng.randrange(len(kelimeler) + 1), rng.choice(keywords))
+        satirlar.append(' '.join(kelimeler).capitalize())
+    return satirlar
+
+
+def emoji_benchmark(satir_sayisi: Optional[int] = None) -> Dict:
+    """
+    Eski ve derlenmiş emoji eşleştiricinin satır başına süresi
+
+    Returns:
+        {'lines', 'naive_ms', 'compiled_ms', 'speedup', 'matches_naive',
+         'matches_compiled', 'agreement'}
+    """
+    from effects import DYNAMIC_SUBTITLE_CONFIG
+    from emoji_matcher import eslestirici
+
+    cfg = BENCHMARK_CONFIG
+    emoji_map = DYNAMIC_SUBTITLE_CONFIG['emoji']['emoji_map']
+    satirlar = sentetik_transkript(emoji_map, satir_sayisi or cfg['emoji_lines'], cfg['emoji_seed'])
+
+    def olc(fonksiyon) -> float:
+        en_iyi = None
+        for _ in range(cfg['emoji_repeat']):
+            start = time.perf_counter()
+            for satir in satirlar:
+                fonksiyon(satir)
+            sure = time.perf_counter() - start
+            en_iyi = sure if en_iyi is None else min(en_iyi, sure)
+        return en_iyi * 1000.0
+
+    derli = eslestirici(emoji_map)
+    naif_ms = olc(lambda t: _naif_emoji_bul(t, emoji_map))
+    derli_ms = olc(derli.bul)
+
+    naif = [_naif_emoji_bul(t, emoji_map) for t in satirlar]
+    yeni = [derli.bul(t) for t in satirlar]
+    return {
+        'lines': len(satirlar),
+        'naive_ms': round(naif_ms, 2),
+        'compiled_ms': round(derli_ms, 2),
+        'speedup': round(naif_ms / derli_ms, 2) if derli_ms else None,
+        'matches_naive': sum(1 for e in naif if e),
+        'matches_compiled': sum(1 for e in yeni if e),
+        # Farklar kelime içi eşleşmelerden gelir (ör. 'hot' → 'photo')
+        'agreement': round(sum(1 for a, b in zip(naif, yeni) if a == b) / len(satirlar), 4),
+    }
+
+
+def emoji_raporu_yazdir(sonuc: Dict) -> None:
+    """Emoji benchmark sonucunu konsola yazdır"""
+    print("\n" + "=" * 70)
+    print(f"😊 EMOJI EŞLEŞTİRME: {sonuc['lines']} satır".center(70))
+    print("=" * 70)
+    print(f"   Eski (substring):  {sonuc['naive_ms']:8.2f} ms  ({sonuc['matches_naive']} eşleşme)")
+    print(f"   Derlenmiş regex:   {sonuc['compiled_ms']:8.2f} ms  ({sonuc['matches_compiled']} eşleşme)")
+    print(f"   Hızlanma: {sonuc['speedup']}x | Aynı sonuç: %{sonuc['agreement'] * 100:.1f}")
+
+
+# ============================================================================
+# 🎬 UÇTAN UCA PIPELINE
+# ============================================================================
+
+PIPELINE_ASAMALARI = ('probe', 'subtitle', 'audio', 'effect', 'burn', 'qc', 'compress')
+
+
+def ffmpeg_var() -> bool:
+    """ffmpeg ve ffprobe PATH'te mi"""
+    return bool(shutil.which('ffmpeg') and shutil.which('ffprobe'))
+
+
+def _ffmpeg(komut: List[str]) -> None:
+    sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                           text=True, timeout=BENCHMARK_CONFIG['timeout'])
+    if sonuc.returncode != 0:
+        raise RuntimeError(sonuc.stderr[-200:])
+
+
+def sentetik_girdiler(klasor: str, sure: float, cozunurluk: str, fps: int) -> Dict[str, str]:
+    """
+    testsrc2 videosu ve sine anlatım sesi (deterministik)
+
+    Returns:
+        {'video', 'audio'}
+    """
+    video = os.path.join(klasor, 'synthetic_video.mp4')
+    audio = os.path.join(klasor, 'synthetic_audio.wav')
+    _ffmpeg(['ffmpeg', '-v', 'error', '-nostdin',
+             '-f', 'lavfi', '-i', f"testsrc2=size={cozunurluk}:rate={fps}:duration={sure}",
+             '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '18', '-g', str(fps),
+             '-pix_fmt', 'yuv420p', '-y', video])
+    _ffmpeg(['ffmpeg', '-v', 'error', '-nostdin',
+             '-f', 'lavfi', '-i', f"sine=frequency=440:beep_factor=4:sample_rate=48000:duration={sure}",
+             '-c:a', 'pcm_s16le', '-y', audio])
+    return {'video': video, 'audio': audio}
+
+
+def sentetik_altyazi(sure: float, seed: int, segment_suresi: float = 2.5) -> List[Dict]:
+    """Kelime zamanlamalı Whisper benzeri altyazı segmentleri"""
+    rng = random.Random(seed)
+    segmentler = []
+    bas = 0.0
+    while bas < sure:
+        bit = min(bas + segment_suresi, sure)
+        kelimeler = [rng.choice(_DOLGU_KELIMELERI) for _ in range(rng.randint(3, 8))]
+        adim = (bit - bas) / len(kelimeler)
+        segmentler.append({
+            'start': bas,
+            'end': bit,
+            'text': ' '.join(kelimeler),
+            'words': [{'text': k, 'start': bas + i * adim, 'end': bas + (i + 1) * adim}
+                      for i, k in enumerate(kelimeler)],
+        })
+        bas = bit
+    return segmentler
+
+
+def _zamanla(fonksiyon: Callable, tekrar: int, hazirlik: Optional[Callable] = None):
+    """
+    En iyi süre (saniye) ve son çağrının dönüş değeri
+
+    hazirlik her tekrardan önce, ölçüm dışında çağrılır.
+    """
+    en_iyi = None
+    deger = None
+    for _ in range(max(1, tekrar)):
+        if hazirlik:
+            hazirlik()
+        start = time.perf_counter()
+        deger = fonksiyon()
+        sure = time.perf_counter() - start
+        en_iyi = sure if en_iyi is None else min(en_iyi, sure)
+    return en_iyi, deger
+
+
+def _gerekli(deger, mesaj: str):
+    if not deger:
+        raise RuntimeError(mesaj)
+    return deger
+
+
+def _zincir_kimligi(filtre: Optional[str]) -> Optional[str]:
+    """Filtre zincirinin kısa hash'i (efekt track dosya adlarındaki rastgele ek hariç)"""
+    if not filtre:
+        return None
+    normal = re.sub(r"_[0-9a-f]{12}\.cmd", ".cmd", filtre)
+    return hashlib.sha1(normal.encode('utf-8')).hexdigest()[:12]
+
+
+def surum_bilgisi() -> Optional[str]:
+    """Çalışma ağacının git sürümü (ör. 'abc1234-dirty'); git yoksa None"""
+    try:
+        sonuc = subprocess.run(['git', 'describe', '--always', '--dirty', '--tags'], cwd=BASE_DIR,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if sonuc.returncode != 0:
+        return None
+    return sonuc.stdout.strip() or None
+
+
+def makine_bilgisi() -> Dict:
+    """Regresyon karşılaştırmasında eşleştirilen makine bilgisi"""
+    ffmpeg_surum = None
+    if shutil.which('ffmpeg'):
+        try:
+            sonuc = subprocess.run(['ffmpeg', '-version'], stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE, text=True, timeout=10)
+            ffmpeg_surum = (sonuc.stdout.splitlines() or [None])[0]
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+    return {
+        'node': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'cpus': os.cpu_count(),
+        'ffmpeg': ffmpeg_surum,
+    }
+
+
+def pipeline_benchmark(sure: Optional[float] = None, tekrar: Optional[int] = None) -> Dict:
+    """
+    Sentetik girdilerde pipeline aşamalarını ölç (yalnız CPU)
+
+    Aşamalar pipeline'ın kendi fonksiyonlarını çağırır. ffmpeg yoksa ya da
+    bir aşama başarısız olursa ona bağlı aşamalar atlanır.
+
+    Returns:
+        {
+            'timestamp', 'version', 'machine', 'input',
+            'stages': {ad: {'seconds', 'ok', 'skipped', 'error'}},
+            'total_seconds', 'effect_chain'
+        }
+    """
+    cfg = BENCHMARK_CONFIG
+    sure = sure or cfg['pipeline_duration']
+    tekrar = tekrar or cfg['pipeline_repeat']
+    seed = cfg['pipeline_seed']
+    girdi = {
+        'duration': sure,
+        'resolution': cfg['pipeline_resolution'],
+        'fps': cfg['pipeline_fps'],
+        'seed': cfg['pipeline_seed'],
+        'preset': cfg['pipeline_preset'],
+        'crf': cfg['pipeline_crf'],
+    }
+    asamalar: Dict[str, Dict] = {}
+    ffmpeg_hazir = ffmpeg_var()
+
+    def asama(ad: str, fonksiyon: Callable, gereken: Sequence[str] = (), ffmpeg: bool = True,
+              hazirlik: Optional[Callable] = None):
+        eksik = [g for g in gereken if not asamalar.get(g, {}).get('ok')]
+        if (ffmpeg and not ffmpeg_hazir) or eksik:
+            sebep = 'ffmpeg yok' if ffmpeg and not ffmpeg_hazir else f"bağımlı aşama yok: {', '.join(eksik)}"
+            asamalar[ad] = {'seconds': None, 'ok': False, 'skipped': True, 'error': sebep}
+            return None
+        try:
+            saniye, deger = _zamanla(fonksiyon, tekrar, hazirlik)
+        except Exception as e:
+            asamalar[ad] = {'seconds': None, 'ok': False, 'skipped': False, 'error': str(e)[:200]}
+            return None
+        asamalar[ad] = {'seconds': round(saniye, 4), 'ok': True, 'skipped': False, 'error': None}
+        return deger
+
+    import main
+    from subtitle_styles import generate_ass_subtitle
+    from subtitle_burn import paralel_altyazi_bas
+    from youtube_optimization_addon import post_render_quality_check
+    import loudness
+
+    encoder_args = ['-c:v', 'libx264', '-preset', cfg['pipeline_preset'],
+                    '-crf', str(cfg['pipeline_crf']), '-pix_fmt', 'yuv420p']
+
+    with tempfile.TemporaryDirectory(prefix='render_bench_') as klasor:
+        dosyalar = {}
+        if ffmpeg_hazir:
+            dosyalar = sentetik_girdiler(klasor, sure, cfg['pipeline_resolution'], cfg['pipeline_fps'])
+        video = dosyalar.get('video')
+        audio = dosyalar.get('audio')
+
+        # 1. Probe
+        asama('probe', lambda: (_gerekli(main.video_bilgisi_al(video), 'video probe başarısız'),
+                                _gerekli(main.ses_bilgisi_al(audio), 'ses probe başarısız')))
+
+        # 2. Altyazı (ASS üretimi, ffmpeg gerekmez)
+        segmentler = sentetik_altyazi(sure, cfg['pipeline_seed'])
+        ass = asama('subtitle', lambda: _gerekli(generate_ass_subtitle(segmentler, 'storytime', klasor),
+                                                 'ASS oluşturulamadı'), ffmpeg=False)
+
+        # 3. Ses analizi (loudnorm birinci geçiş; cache atlanır)
+        asama('audio', lambda: loudness.olc(audio, '', main._loudness_hedefi(main.AUDIO_SETTINGS)))
+
+        # 4. Efekt render: tek klip, tam render'ın filtre zinciri + anlatım sesi
+        # Varyasyon, efekt ve fingerprint parametreleri sabit seed'le: her çalışma aynı zinciri ölçer
+        klip = os.path.join(klasor, 'clip.mp4')
+        filtre = None
+        if ffmpeg_hazir:
+            item = {'dosya': video, 'sure': sure, 'gercek_sure': sure,
+                    'varyasyon': main.gelismis_varyasyon_uret(os.path.basename(video), 1, seed=seed)}
+            filtre = main.klip_video_filtresi(item, 1, main.cinematic_effects_uret(1, None, seed=seed),
+                                              main.fingerprint_parametreleri_olustur(1, seed=seed),
+                                              job_dir=klasor)
+        klip_komutu = ['ffmpeg', '-v', 'error', '-nostdin', '-i', video or '', '-i', audio or '',
+                       '-map', '0:v:0', '-map', '1:a:0']
+        if filtre:
+            klip_komutu.extend(['-vf', filtre])
+        klip_komutu.extend(encoder_args + ['-c:a', 'aac', '-b:a', '192k', '-shortest', '-y', klip])
+        asama('effect', lambda: _ffmpeg(klip_komutu))
+
+        # 5. Altyazı basma (paralel parçalı yol)
+        altyazili = os.path.join(klasor, 'subtitled.mp4')
+        asama('burn', lambda: paralel_altyazi_bas(klip, ass, altyazili, encoder_args, klasor),
+              gereken=('effect', 'subtitle'))
+
+        # 6. QC (config'te kapalı olsa da kontroller çalıştırılır)
+        qc_config = dict(main.ADVANCED_QUALITY_CHECKS, enabled=True)
+        asama('qc', lambda: post_render_quality_check(altyazili, qc_config), gereken=('burn',))
+
+        # 7. Sıkıştırma: hedef mevcut boyutun yarısı, her tekrarda taze kopya
+        sikistir = os.path.join(klasor, 'compress.mp4')
+
+        def _kopyala():
+            shutil.copy2(altyazili, sikistir)
+
+        def _sikistir():
+            hedef_mb = os.path.getsize(sikistir) / (1024 * 1024) / 2
+            return _gerekli(main.post_render_compress(sikistir, target_size_mb=hedef_mb),
+                            'sıkıştırma başarısız')
+
+        asama('compress', _sikistir, gereken=('burn',), hazirlik=_kopyala)
+
+    olculen = [a['seconds'] for a in asamalar.values() if a['seconds'] is not None]
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'version': surum_bilgisi(),
+        'machine': makine_bilgisi(),
+        'input': girdi,
+        'stages': {ad: asamalar[ad] for ad in PIPELINE_ASAMALARI if ad in asamalar},
+        'total_seconds': round(sum(olculen), 4),
+        # Efekt zincirinin kimliği: sürümler arası zincir değişimi regresyonun sebebi olabilir
+        'effect_chain': _zincir_kimligi(filtre),
+    }
+
+
+# ============================================================================
+# 📈 GEÇMİŞ VE REGRESYON
+# ============================================================================
+
+def gecmis_oku(yol: Optional[str] = None) -> List[Dict]:
+    """Geçmiş kayıtları (dosya yoksa veya bozuksa boş liste)"""
+    yol = yol or BENCHMARK_CONFIG['history_file']
+    try:
+        with open(yol, 'r', encoding='utf-8') as f:
+            veri = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return veri if isinstance(veri, list) else []
+
+
+def gecmise_ekle(sonuc: Dict, yol: Optional[str] = None) -> List[Dict]:
+    """Sonucu geçmişe ekle (atomik yazma, en fazla history_max kayıt)"""
+    yol = yol or BENCHMARK_CONFIG['history_file']
+    gecmis = (gecmis_oku(yol) + [sonuc])[-BENCHMARK_CONFIG['history_max']:]
+    klasor = os.path.dirname(yol)
+    if klasor:
+        os.makedirs(klasor, exist_ok=True)
+    gecici = f"{yol}.tmp"
+    with open(gecici, 'w', encoding='utf-8') as f:
+        json.dump(gecmis, f, ensure_ascii=False, indent=2)
+    os.replace(gecici, yol)
+    return gecmis
+
+
+def _karsilastirilabilir(a: Dict, b: Dict) -> bool:
+    """Aynı makine ve aynı sentetik girdi"""
+    ma, mb = a.get('machine', {}), b.get('machine', {})
+    return (ma.get('node') == mb.get('node') and ma.get('cpus') == mb.get('cpus')
+            and a.get('input') == b.get('input'))
+
+
+def regresyon_kontrol(sonuc: Dict, gecmis: Sequence[Dict],
+                      esik_yuzde: Optional[float] = None,
+                      min_saniye: Optional[float] = None,
+                      pencere: Optional[int] = None) -> List[Dict]:
+    """
+    Aşama sürelerini önceki uyumlu çalışmaların medyanıyla karşılaştır
+
+    Regresyon: süre referansı hem esik_yuzde hem min_saniye kadar aşarsa
+    (kısa aşamalarda ölçüm gürültüsü yüzdeyi kolayca aşar).
+
+    Args:
+        gecmis: Önceki kayıtlar (sonuc dahil edilmemeli)
+
+    Returns:
+        [{'stage', 'seconds', 'baseline', 'runs', 'change_pct', 'regression'}]
+        (referansı olmayan aşamalar listede yer almaz)
+    """
+    cfg = BENCHMARK_CONFIG
+    esik_yuzde = cfg['regression_pct'] if esik_yuzde is None else esik_yuzde
+    min_saniye = cfg['regression_min_seconds'] if min_saniye is None else min_saniye
+    pencere = pencere or cfg['baseline_runs']
+
+    onceki = [k for k in gecmis if _karsilastirilabilir(k, sonuc)][-pencere:]
+    rapor = []
+    for ad, asama in sonuc.get('stages', {}).items():
+        saniye = asama.get('seconds')
+        if saniye is None:
+            continue
+        referanslar = [k['stages'][ad]['seconds'] for k in onceki
+                       if k.get('stages', {}).get(ad, {}).get('seconds') is not None]
+        if not referanslar:
+            continue
+        referans = statistics.median(referanslar)
+        degisim = (saniye - referans) / referans * 100 if referans else 0.0
+        rapor.append({
+            'stage': ad,
+            'seconds': saniye,
+            'baseline': round(referans, 4),
+            'runs': len(referanslar),
+            'change_pct': round(degisim, 1),
+            'regression': degisim > esik_yuzde and saniye - referans >= min_saniye,
+        })
+    return rapor
+
+
+def pipeline_raporu_yazdir(sonuc: Dict, regresyonlar: Sequence[Dict]) -> None:
+    """Pipeline benchmark sonucunu ve regresyonları konsola yazdır"""
+    karsilastirma = {r['stage']: r for r in regresyonlar}
+    girdi = sonuc['input']
+    print("\n" + "=" * 70)
+    print(f"🎬 PIPELINE: {girdi['duration']}s {girdi['resolution']}@{girdi['fps']} (CPU)".center(70))
+    print("=" * 70)
+    print(f"   Sürüm: {sonuc['version'] or '?'} | {sonuc['machine']['cpus']} çekirdek | "
+          f"efekt zinciri {sonuc.get('effect_chain') or '-'}")
+
+    for ad, asama in sonuc['stages'].items():
+        if asama['seconds'] is None:
+            durum = "⏭️" if asama['skipped'] else "❌"
+            print(f"   {durum} {ad:<10} {'-':>9}    {asama['error']}")
+            continue
+        satir = f"   ✅ {ad:<10} {asama['seconds']:8.3f}s"
+        r = karsilastirma.get(ad)
+        if r:
+            isaret = "⚠️ REGRESYON" if r['regression'] else ""
+            satir += f"  (ref {r['baseline']:.3f}s, {r['change_pct']:+.1f}%) {isaret}"
+        print(satir.rstrip())
+
+    print(f"\n   Toplam: {sonuc['total_seconds']:.3f}s")
+    yavaslayan = [r['stage'] for r in regresyonlar if r['regression']]
+    if yavaslayan:
+        print(f"   ⚠️ Yavaşlayan aşamalar: {', '.join(yavaslayan)}")
+    elif regresyonlar:
+        print(f"   ✅ Regresyon yok (eşik %{BENCHMARK_CONFIG['regression_pct']:.0f})")
+    else:
+        print("   ℹ️ Karşılaştırılacak önceki çalışma yok")
+
+
+if __name__ == "__main__":
+    if '--pipeline' in sys.argv:
+        sonuc = pipeline_benchmark()
+        gecmis = gecmis_oku()
+        regresyonlar = regresyon_kontrol(sonuc, gecmis)
+        gecmise_ekle(sonuc)
+        pipeline_raporu_yazdir(sonuc, regresyonlar)
+        sys.exit(1 if any(r['regression'] for r in regresyonlar) else 0)
+
+    import_raporu_yazdir(import_time_profili())
+    emoji_raporu_yazdir(emoji_benchmark())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CACHE STORE - İçerik Adresli Ara Dosya Deposu
+İşlenmiş klipler içerik hash'i ile saklanır (aynı içerik tek kopya).
+Boyut ve erişim zamanları SQLite indekste tutulur: eviction dizini
+taramadan LRU sırasıyla yapılır. Ekleme/çıkarma mümkünse reflink veya
+hardlink ile, değilse kopyalayarak yapılır.
+
+Klasör yapısı:
+    <root>/index.db
+    <root>/objects/ab/abcdef....mp4
+"""
+
+import os
+import time
+import errno
+import sqlite3
+import shutil
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import CACHE_KLASORU
+except ImportError:
+    CACHE_KLASORU = os.path.join(os.getcwd(), '.cache')
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+CACHE_STORE_CONFIG = {
+    'root': CACHE_KLASORU,
+    'max_size_gb': 5,
+
+    # Sınır aşılınca toplam boyut bu orana inene kadar LRU eviction
+    'low_watermark': 0.8,
+
+    # 'auto' = reflink → hardlink → kopya, 'copy' = her zaman kopya
+    'link_mode': 'auto',
+
+    'hash_block_bytes': 1024 * 1024,
+    'busy_timeout': 30,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    digest  TEXT PRIMARY KEY,
+    size    INTEGER NOT NULL,
+    atime   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_objects_atime ON objects (atime);
+CREATE TABLE IF NOT EXISTS keys (
+    key     TEXT PRIMARY KEY,
+    digest  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_keys_digest ON keys (digest);
+CREATE TABLE IF NOT EXISTS counters (
+    name    TEXT PRIMARY KEY,
+    value   INTEGER NOT NULL
+);
+"""
+
+COUNTER_NAMES = ('hits', 'misses', 'inserts', 'dedup', 'evictions', 'evicted_bytes',
+                 'reflinks', 'hardlinks', 'copies')
+
+# Thread ve process başına bağlantı; klipler worker process'lerde, batch işleri thread'lerde
+_local = threading.local()
+
+# Fork ile devralınan bağlantılar: child'da kullanılmaz ve kapatılmaz (kapatmak
+# parent'ın WAL/kilit durumunu bozabilir), sadece GC'den korunur
+_devralinan = []
+
+
+# ============================================================================
+# 🗄️ İNDEKS
+# ============================================================================
+
+def _root(root: Optional[str] = None) -> str:
+    return root or CACHE_STORE_CONFIG['root']
+
+
+def _baglanti(root: Optional[str] = None) -> sqlite3.Connection:
+    root = _root(root)
+    db_path = os.path.join(root, 'index.db')
+    baglantilar = getattr(_local, 'baglantilar', None)
+    if getattr(_local, 'pid', None) != os.getpid():
+        # Fork sonrası child: parent'ın bağlantısı paylaşılamaz, yenisi açılır
+        if baglantilar:
+            _devralinan.extend(baglantilar.values())
+        baglantilar = _local.baglantilar = {}
+        _local.pid = os.getpid()
+
+    conn = baglantilar.get(db_path)
+    if conn is not None and not os.path.exists(db_path):
+        # Cache klasörü dışarıdan silinmiş (render sonrası temizlik)
+        conn.close()
+        conn = None
+
+    if conn is None:
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=CACHE_STORE_CONFIG['busy_timeout'])
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(_SCHEMA)
+        baglantilar[db_path] = conn
+    return conn
+
+
+def _sayac(conn: sqlite3.Connection, name: str, delta: int = 1) -> None:
+    conn.execute(
+        'INSERT INTO counters (name, value) VALUES (?, ?) '
+        'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+        (name, delta)
+    )
+
+
+def _obje_yolu(digest: str, root: Optional[str] = None) -> str:
+    return os.path.join(_root(root), 'objects', digest[:2], f"{digest}.mp4")
+
+
+# ============================================================================
+# 🔗 LINK / KOPYA
+# ============================================================================
+
+_FICLONE = 0x40049409  # Linux ioctl: btrfs/xfs/ext4(reflink) klonlama
+
+
+def _reflink(kaynak: str, hedef: str) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(kaynak, 'rb') as src, open(hedef, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        if os.path.exists(hedef):
+            os.remove(hedef)
+        return False
+
+
+def yerlestir(kaynak: str, hedef: str) -> str:
+    """
+    Dosyayı hedefe reflink/hardlink ile, olmazsa kopyalayarak yerleştir
+
+    Hardlink'te hedef ve cache objesi aynı inode'dur: hedefin yolu sonradan
+    yerinde (ffmpeg -y / O_TRUNC) yazılmamalı; önce silinmeli veya yeni
+    dosya os.replace ile yerine konmalı.
+
+    Returns:
+        Kullanılan yöntem: 'reflinks' / 'hardlinks' / 'copies'
+    """
+    if os.path.exists(hedef):
+        os.remove(hedef)
+
+    if CACHE_STORE_CONFIG['link_mode'] == 'auto':
+        if _reflink(kaynak, hedef):
+            return 'reflinks'
+        try:
+            os.link(kaynak, hedef)
+            return 'hardlinks'
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EACCES):
+                logger.debug(f"Hardlink başarısız: {e}")
+
+    shutil.copyfile(kaynak, hedef)
+    return 'copies'
+
+
+def icerik_hash(path: str) -> str:
+    """Dosya içeriğinin SHA-256'sı"""
+    blok = CACHE_STORE_CONFIG['hash_block_bytes']
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for parca in iter(lambda: f.read(blok), b''):
+            h.update(parca)
+    return h.hexdigest()
+
+
+# ============================================================================
+# 📦 DEPO İŞLEMLERİ
+# ============================================================================
+
+def ara(key: str, root: Optional[str] = None) -> Optional[str]:
+    """
+    Anahtara karşılık gelen obje yolu (yoksa veya bozulmuşsa None)
+
+    Hardlink'li objeler yerinde üzerine yazılırsa boyut değişir; indeksle
+    uyuşmayan obje silinir ve miss sayılır.
+    """
+    conn = _baglanti(root)
+    row = conn.execute(
+        'SELECT o.digest, o.size FROM keys k JOIN objects o ON o.digest = k.digest WHERE k.key = ?',
+        (key,)
+    ).fetchone()
+
+    with conn:
+        if row is not None:
+            digest, size = row
+            path = _obje_yolu(digest, root)
+            try:
+                gecerli = os.path.getsize(path) == size
+            except OSError:
+                gecerli = False
+
+            if gecerli:
+                conn.execute('UPDATE objects SET atime = ? WHERE digest = ?', (time.time(), digest))
+                _sayac(conn, 'hits')
+                return path
+
+            logger.warning(f"⚠️ Cache objesi bozuk, siliniyor: {digest[:12]}")
+            _obje_sil(conn, digest, root)
+
+        _sayac(conn, 'misses')
+    return None
+
+
+def ekle(key: str, path: str, root: Optional[str] = None) -> Optional[str]:
+    """
+    Dosyayı depoya ekle ve anahtarı ona bağla
+
+    Aynı içerik zaten varsa yeni kopya oluşmaz (dedup).
+
+    Returns:
+        Obje yolu
+    """
+    digest = icerik_hash(path)
+    obje = _obje_yolu(digest, root)
+    size = os.path.getsize(path)
+    conn = _baglanti(root)
+
+    mevcut = conn.execute('SELECT size FROM objects WHERE digest = ?', (digest,)).fetchone()
+    yontem = None
+    if mevcut is None or not os.path.exists(obje):
+        os.makedirs(os.path.dirname(obje), exist_ok=True)
+        gecici = f"{obje}.{os.getpid()}.tmp"
+        yontem = yerlestir(path, gecici)
+        os.replace(gecici, obje)
+
+    with conn:
+        conn.execute(
+            'INSERT INTO objects (digest, size, atime) VALUES (?, ?, ?) '
+            'ON CONFLICT(digest) DO UPDATE SET atime = excluded.atime, size = excluded.size',
+            (digest, size, time.time())
+        )
+        conn.execute('INSERT OR REPLACE INTO keys (key, digest) VALUES (?, ?)', (key, digest))
+        _sayac(conn, 'inserts')
+        _sayac(conn, yontem or 'dedup')
+
+    return obje
+
+
+def toplam_boyut(root: Optional[str] = None) -> int:
+    """İndeksteki objelerin toplam boyutu (dizin taranmaz)"""
+    return _baglanti(root).execute('SELECT COALESCE(SUM(size), 0) FROM objects').fetchone()[0]
+
+
+def _obje_sil(conn: sqlite3.Connection, digest: str, root: Optional[str] = None) -> None:
+    try:
+        os.remove(_obje_yolu(digest, root))
+    except FileNotFoundError:
+        pass
+    conn.execute('DELETE FROM keys WHERE digest = ?', (digest,))
+    conn.execute('DELETE FROM objects WHERE digest = ?', (digest,))
+
+
+def temizle(max_size_gb: Optional[float] = None, root: Optional[str] = None) -> Dict:
+    """
+    Boyut sınırı aşıldıysa en uzun süredir kullanılmayan objeleri sil
+
+    Returns:
+        {'evicted': adet, 'freed_bytes', 'total_bytes'}
+    """
+    cfg = CACHE_STORE_CONFIG
+    max_bytes = int((cfg['max_size_gb'] if max_size_gb is None else max_size_gb) * 1024 ** 3)
+    conn = _baglanti(root)
+    toplam = toplam_boyut(root)
+    sonuc = {'evicted': 0, 'freed_bytes': 0, 'total_bytes': toplam}
+
+    if toplam <= max_bytes:
+        return sonuc
+
+    hedef = max_bytes * cfg['low_watermark']
+    with conn:
+        for digest, size in conn.execute('SELECT digest, size FROM objects ORDER BY atime').fetchall():
+            if toplam <= hedef:
+                break
+            _obje_sil(conn, digest, root)
+            toplam -= size
+            sonuc['evicted'] += 1
+            sonuc['freed_bytes'] += size
+        _sayac(conn, 'evictions', sonuc['evicted'])
+        _sayac(conn, 'evicted_bytes', sonuc['freed_bytes'])
+
+    sonuc['total_bytes'] = toplam
+    logger.info(f"🧹 Cache eviction: {sonuc['evicted']} obje, {sonuc['freed_bytes'] / 1024 ** 2:.0f} MB")
+    return sonuc
+
+
+def istatistikler(root: Optional[str] = None) -> Dict:
+    """
+    Sayaçlar ve doluluk
+
+    Returns:
+        {'hits', 'misses', 'hit_rate', 'inserts', 'dedup', 'evictions',
+         'evicted_bytes', 'reflinks', 'hardlinks', 'copies', 'objects', 'total_bytes'}
+    """
+    conn = _baglanti(root)
+    stats = {name: 0 for name in COUNTER_NAMES}
+    stats.update(dict(conn.execute('SELECT name, value FROM counters').fetchall()))
+    istek = stats['hits'] + stats['misses']
+    stats['hit_rate'] = round(stats['hits'] / istek, 3) if istek else 0.0
+    stats['objects'] = conn.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
+    stats['total_bytes'] = toplam_boyut(root)
+    return stats
+
+
+def kapat() -> None:
+    """Bu thread'in bağlantılarını kapat (cache klasörü silinmeden önce)"""
+    baglantilar = getattr(_local, 'baglantilar', {})
+    if getattr(_local, 'pid', None) == os.getpid():
+        for conn in baglantilar.values():
+            conn.close()
+    else:
+        _devralinan.extend(baglantilar.values())
+    _local.baglantilar = {}
+    _local.pid = os.getpid()
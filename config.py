@@ -1086,6 +1086,11 @@ SUBTITLE_CONFIG = {
     'auto_model': 'base',
     'max_words_per_line': 8,
     'min_duration': 1.5,
+    # 'inline'  = sesli render'da altyazı klip encode'unda basılır (final mux -c:v copy)
+    # 'overlay' = inline gibi, ama ASS bir kez alpha katmana rasterize edilip
+    #             (ASS hash'iyle cache'lenir) kliplere overlay ile bindirilir
+    # 'final'   = birleştirilmiş video ayrı bir encode geçişinde altyazılanır
+    'burn_in': 'inline',
 }
 
 # ============================================================================
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EFFECT TRACKS - Zaman Değişimli Efektler İçin İfadesiz Hızlı Yollar
+Kare başına parametre izleri Python'da (NumPy varsa vektörel) önceden
+hesaplanır ve ffmpeg'e sendcmd dosyası ile verilir; sabit zoompan
+aşamaları daha ucuz crop+scale ile değiştirilir.
+"""
+
+import os
+import math
+import uuid
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from config import VIDEO_OUTPUT
+except ImportError:
+    VIDEO_OUTPUT = {'resolution': '1920x1080', 'fps': 30}
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+EFFECT_TRACKS_CONFIG = {
+    'enabled': True,
+
+    # sendcmd dosyaları işin temp klasörü altında (iş klasörüyle birlikte silinir,
+    # paralel batch işleri çakışmaz); klasör verilmezse ifadeli crop kullanılır
+    'track_subdir': 'tracks',
+
+    # İz uzunluğu: segmentler 7-11 sn, hız değişimi payı ile 60 sn yeterli
+    'track_seconds': 60,
+
+    # Sabit zoom'lu zoompan → crop+scale
+    'replace_static_zoompan': True,
+}
+
+
+# ============================================================================
+# 📈 İZ HESAPLAMA
+# ============================================================================
+
+def shake_track(amount: int, period_x: float, period_y: float, frames: int) -> Tuple[Sequence[int], Sequence[int]]:
+    """
+    crop sallama izi: x = A + A*sin(n/px), y = A + A*cos(n/py)
+
+    crop x/y'yi tam sayıya yuvarladığı için iz de tam sayı üretir
+    (ifadeli sürümle aynı kareler).
+
+    Returns:
+        (x_listesi, y_listesi)
+    """
+    if NUMPY_AVAILABLE:
+        n = np.arange(frames, dtype=np.float64)
+        xs = np.trunc(amount + amount * np.sin(n / period_x)).astype(np.int64)
+        ys = np.trunc(amount + amount * np.cos(n / period_y)).astype(np.int64)
+        return xs.tolist(), ys.tolist()
+
+    xs = [int(amount + amount * math.sin(i / period_x)) for i in range(frames)]
+    ys = [int(amount + amount * math.cos(i / period_y)) for i in range(frames)]
+    return xs, ys
+
+
+def change_points(values: Sequence[int]) -> List[Tuple[int, int]]:
+    """Sadece değerin değiştiği kareleri döndür: [(kare, değer)]"""
+    if NUMPY_AVAILABLE and len(values) > 0:
+        arr = np.asarray(values)
+        idx = np.flatnonzero(np.diff(arr)) + 1
+        idx = np.concatenate(([0], idx))
+        return list(zip(idx.tolist(), arr[idx].tolist()))
+
+    points = []
+    previous = None
+    for i, value in enumerate(values):
+        if value != previous:
+            points.append((i, value))
+            previous = value
+    return points
+
+
+# ============================================================================
+# 📝 SENDCMD DOSYASI
+# ============================================================================
+
+def _escape_filter_path(path: str) -> str:
+    """Filtre argümanı için yol kaçışı (subtitles ile aynı kural)"""
+    path = path.replace('\\', '/')
+    if len(path) > 1 and path[1] == ':':
+        path = path.replace(':', '\\:', 1)
+    return path
+
+
+def write_sendcmd(target: str, tracks: dict, fps: float, pts_factor: float = 1.0,
+                  path: Optional[str] = None, job_dir: Optional[str] = None) -> str:
+    """
+    Parametre izlerini sendcmd dosyasına yaz (sadece değişim anları)
+
+    Args:
+        target: Komut hedefi (örn: 'crop@shake')
+        tracks: {'x': [...], 'y': [...]}
+        fps: İzin kare hızı
+        pts_factor: Zincirde önceki setpts çarpanı (t = n / fps * pts_factor)
+        path: Dosya yolu (None = job_dir/track_subdir içinde benzersiz)
+        job_dir: İşin temp klasörü (path verilmezse zorunlu)
+
+    Returns:
+        Dosya yolu
+    """
+    if path is None:
+        if not job_dir:
+            raise ValueError("sendcmd dosyası için path veya job_dir gerekli")
+        track_dir = os.path.join(job_dir, EFFECT_TRACKS_CONFIG['track_subdir'])
+        os.makedirs(track_dir, exist_ok=True)
+        path = os.path.join(track_dir, f"{target.replace('@', '_')}_{uuid.uuid4().hex[:12]}.cmd")
+
+    # Aynı karedeki komutları tek satırda topla
+    events = {}
+    for param, values in tracks.items():
+        for frame, value in change_points(values):
+            events.setdefault(frame, []).append(f"{target} {param} {value}")
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for frame in sorted(events):
+            t = frame / fps * pts_factor
+            f.write(f"{t:.6f} {', '.join(events[frame])};\n")
+
+    return path
+
+
+# ============================================================================
+# 🎬 FİLTRE ÜRETİCİLERİ
+# ============================================================================
+
+_instance_counter = 0
+
+
+def _instance_name(prefix: str) -> str:
+    """Aynı zincirde çakışmayan filtre örnek adı"""
+    global _instance_counter
+    _instance_counter += 1
+    return f"{prefix}{_instance_counter}"
+
+
+def shake_crop_filters(amount: int, period_x: float, period_y: float, margin: Optional[int] = None,
+                       pts_factor: float = 1.0, job_dir: Optional[str] = None) -> List[str]:
+    """
+    sin/cos ifadeli crop yerine önceden hesaplanmış iz + sendcmd
+
+    Eşdeğeri:
+        crop=2*trunc((iw-2M)/2):2*trunc((ih-2M)/2):A+A*sin(n/px):A+A*cos(n/py)
+
+    Returns:
+        ['sendcmd=f=...', 'crop@shkN=...'] veya boş liste (iş klasörü yok / iz yazılamadı)
+    """
+    if not job_dir:
+        return []
+
+    margin = amount * 2 if margin is None else margin
+    fps = float(VIDEO_OUTPUT.get('fps', 30))
+    frames = int(EFFECT_TRACKS_CONFIG['track_seconds'] * fps / max(pts_factor, 0.01))
+
+    xs, ys = shake_track(amount, period_x, period_y, frames)
+    name = _instance_name('shk')
+
+    try:
+        cmd_path = write_sendcmd(f"crop@{name}", {'x': xs, 'y': ys}, fps, pts_factor, job_dir=job_dir)
+    except OSError as e:
+        logger.debug(f"Shake izi yazılamadı, ifadeli crop kullanılacak: {e}")
+        return []
+
+    return [
+        f"sendcmd=f='{_escape_filter_path(cmd_path)}'",
+        f"crop@{name}=2*trunc((iw-{margin})/2):2*trunc((ih-{margin})/2):{xs[0]}:{ys[0]}",
+    ]
+
+
+def static_zoom_filters(zoom: float, size: Optional[str] = None, flags: str = 'bicubic') -> List[str]:
+    """
+    zoompan=z='Z':d=1:x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':s=WxH eşdeğeri
+
+    Sabit zoom için kare başına zoompan ifadesi gereksiz; merkez crop + scale
+    aynı görüntüyü verir ve zoompan'ın 25 fps varsayılanına düşmez.
+    """
+    size = size or VIDEO_OUTPUT.get('resolution', '1920x1080')
+    width, height = size.split('x')
+    return [
+        f"crop=2*trunc(iw/{zoom:.4f}/2):2*trunc(ih/{zoom:.4f}/2):(iw-ow)/2:(ih-oh)/2",
+        f"scale={width}:{height}:flags={flags}",
+    ]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EMOJI MATCHER - Derlenmiş Emoji Anahtar Kelime Eşleştirici
+`emoji_map` ('happy|güzel|harika': '😊', ...) bir kez tek bir regex'e
+derlenir; her altyazı satırı tek geçişte taranır. Önceki yöntem her satır
+için her kalıbı '|' ile bölüp anahtar kelime başına substring araması
+yapıyordu.
+
+Eşleşme kuralları:
+    - Anahtar kelime kelime başında eşleşir ('kitap' → 'kitaplar' ✓,
+      'hot' → 'photo' ✗). Türkçe ekler korunur, kelime içi yanlış
+      eşleşmeler elenir.
+    - Birden çok kalıp eşleşirse emoji_map'te önce gelen kazanır
+      (eski davranışla aynı öncelik).
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+
+class EmojiEslestirici:
+    """emoji_map'ten derlenmiş tek geçişli eşleştirici"""
+
+    def __init__(self, emoji_map: Dict[str, str]):
+        self._emojiler = list(emoji_map.values())
+
+        # Anahtar kelime → en düşük kalıp sırası (aynı kelime birden çok kalıpta olabilir)
+        sira: Dict[str, int] = {}
+        for i, pattern in enumerate(emoji_map):
+            for keyword in pattern.split('|'):
+                keyword = keyword.strip().lower()
+                if keyword and keyword not in sira:
+                    sira[keyword] = i
+
+        # Aynı konumda eşleşen önek kelimeler de (ör. 'dur' / 'durum') hesaba katılır:
+        # regex en uzununu seçer, öncelik o konumda eşleşebilecek tüm kelimelerin en iyisi
+        self._sira = {
+            kw: min(s for diger, s in sira.items() if kw.startswith(diger))
+            for kw in sira
+        }
+
+        self._regex = None
+        if sira:
+            alternatifler = '|'.join(re.escape(kw) for kw in sorted(sira, key=len, reverse=True))
+            # Sıfır genişlikli lookahead: çok kelimeli bir eşleşmenin içindeki kelime başları da taranır
+            self._regex = re.compile(rf"(?<!\w)(?=({alternatifler}))")
+
+    def bul(self, text: str) -> Optional[str]:
+        """Metne uyan emoji (yoksa None)"""
+        if self._regex is None:
+            return None
+        en_iyi = None
+        for m in self._regex.finditer(text.lower()):
+            s = self._sira[m.group(1)]
+            if en_iyi is None or s < en_iyi:
+                en_iyi = s
+                if s == 0:
+                    break
+        return None if en_iyi is None else self._emojiler[en_iyi]
+
+
+@lru_cache(maxsize=8)
+def _derle(items: Tuple[Tuple[str, str], ...]) -> EmojiEslestirici:
+    return EmojiEslestirici(dict(items))
+
+
+def eslestirici(emoji_map: Dict[str, str]) -> EmojiEslestirici:
+    """emoji_map için derlenmiş eşleştirici (aynı içerik için bir kez derlenir)"""
+    return _derle(tuple(emoji_map.items()))
+
+
+def emoji_bul(text: str, emoji_map: Dict[str, str]) -> Optional[str]:
+    """Metne uyan emoji (yoksa None)"""
+    return eslestirici(emoji_map).bul(text)
@@ -13,6 +13,7 @@ Version: 1.0
 
 FEATURES:
 ✅ Retry decorator with exponential backoff
+✅ Error-classified retry policy (retry / degrade / fail fast)
 ✅ Fallback mechanisms
 ✅ User-friendly error messages
 ✅ Partial success tracking
@@ -20,11 +21,14 @@ FEATURES:
 ✅ Error categorization
 """
 
+import errno
 import functools
 import logging
+import subprocess
+import threading
 import time
 import traceback
-from typing import Callable, Any, Optional, Dict, List
+from typing import Callable, Any, Optional, Dict, List, Iterable, NamedTuple, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -45,6 +49,8 @@ class ErrorCategory(Enum):
     NETWORK_ERROR = "network_error"
     CODEC_ERROR = "codec_error"
     TIMEOUT_ERROR = "timeout_error"
+    INPUT_ERROR = "input_error"
+    DISK_FULL = "disk_full"
     UNKNOWN_ERROR = "unknown_error"
 
 
@@ -101,6 +107,16 @@ ERROR_MESSAGES = {
         'suggestion': '💡 Daha küçük dosyalar kullanın veya timeout süresini artırın.',
         'recoverable': True,
     },
+    ErrorCategory.INPUT_ERROR: {
+        'message': '🧩 Girdi dosyası bozuk veya okunamıyor',
+        'suggestion': '💡 Dosyayı bir oynatıcıda açıp kontrol edin veya havuzdan çıkarın.',
+        'recoverable': False,
+    },
+    ErrorCategory.DISK_FULL: {
+        'message': '💽 Diskte yer kalmadı',
+        'suggestion': '💡 Render klasöründe yer açın veya cache\'i temizleyin.',
+        'recoverable': False,
+    },
 }
 
 
@@ -113,7 +129,8 @@ def retry_on_failure(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
-    on_retry: Optional[Callable] = None
+    on_retry: Optional[Callable] = None,
+    policy: Optional['RetryPolicy'] = None
 ):
     """
     Retry decorator with exponential backoff
@@ -124,6 +141,9 @@ def retry_on_failure(
         backoff: Multiplier for delay (exponential backoff)
         exceptions: Tuple of exceptions to catch
         on_retry: Callback function on retry (receives attempt number)
+        policy: RetryPolicy; errors are classified and permanent ones
+                (missing file, unsupported codec, ...) are raised at once
+                with no sleep. The policy's delays replace delay/backoff.
 
     Example:
         @retry_on_failure(max_attempts=3, delay=2.0)
@@ -143,6 +163,13 @@ def retry_on_failure(
                 except exceptions as e:
                     last_exception = e
 
+                    if policy is not None:
+                        decision = policy.decide(classify_exception(e), attempt)
+                        if decision.action != RetryAction.RETRY:
+                            logger.error(f"❌ {func.__name__} failed ({decision.category.value}), not retrying")
+                            raise
+                        current_delay = decision.delay
+
                     if attempt == max_attempts:
                         logger.error(f"❌ {func.__name__} failed after {max_attempts} attempts")
                         logger.error(f"   Last error: {str(e)}")
@@ -164,6 +191,164 @@ def retry_on_failure(
     return decorator
 
 
+# ============================================================================
+# RETRY POLICY (ERROR-CLASSIFIED)
+# ============================================================================
+
+class RetryAction(Enum):
+    """What to do after a failed attempt"""
+    RETRY = "retry"  # Same settings again (after delay)
+    DEGRADE = "degrade"  # Cheaper settings (GPU→CPU, faster preset)
+    FAIL = "fail"  # Permanent error, stop immediately
+
+
+class RetryRule(NamedTuple):
+    action: RetryAction
+    max_attempts: int = 1
+    delay: float = 0.0
+    backoff: float = 2.0
+
+
+class RetryDecision(NamedTuple):
+    action: RetryAction
+    delay: float
+    category: ErrorCategory
+
+
+# Per-category rules. max_attempts = attempts with the same settings before
+# degrading (or failing when nothing cheaper is left).
+DEFAULT_RETRY_RULES: Dict[ErrorCategory, RetryRule] = {
+    ErrorCategory.GPU_ERROR: RetryRule(RetryAction.DEGRADE),
+    ErrorCategory.MEMORY_ERROR: RetryRule(RetryAction.DEGRADE, max_attempts=1, delay=2.0),
+    ErrorCategory.TIMEOUT_ERROR: RetryRule(RetryAction.DEGRADE, max_attempts=1),
+    ErrorCategory.FFMPEG_ERROR: RetryRule(RetryAction.RETRY, max_attempts=2, delay=0.5),
+    ErrorCategory.AUDIO_ERROR: RetryRule(RetryAction.RETRY, max_attempts=2, delay=0.5),
+    ErrorCategory.NETWORK_ERROR: RetryRule(RetryAction.RETRY, max_attempts=3, delay=1.0),
+    ErrorCategory.UNKNOWN_ERROR: RetryRule(RetryAction.RETRY, max_attempts=2, delay=0.5),
+    ErrorCategory.FILE_NOT_FOUND: RetryRule(RetryAction.FAIL),
+    ErrorCategory.PERMISSION_DENIED: RetryRule(RetryAction.FAIL),
+    ErrorCategory.CODEC_ERROR: RetryRule(RetryAction.FAIL),
+    ErrorCategory.INPUT_ERROR: RetryRule(RetryAction.FAIL),
+    ErrorCategory.DISK_FULL: RetryRule(RetryAction.FAIL),
+}
+
+RETRY_STAT_FIELDS = ('failures', 'retry', 'degrade', 'fail', 'recovered')
+
+
+class RetryStats:
+    """
+    Per-category retry statistics
+
+    Events are (category_value, action_value) pairs, so results from worker
+    processes can be shipped back and merged in the parent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.by_category: Dict[str, Dict[str, int]] = {}
+
+    def record(self, category: str, action: str) -> None:
+        with self._lock:
+            counts = self.by_category.setdefault(category, {k: 0 for k in RETRY_STAT_FIELDS})
+            if action != 'recovered':
+                counts['failures'] += 1
+            counts[action] += 1
+
+    def merge(self, events: Iterable[Tuple[str, str]]) -> None:
+        for category, action in events:
+            self.record(category, action)
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {k: dict(v) for k, v in self.by_category.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.by_category.clear()
+
+    def print_summary(self) -> None:
+        summary = self.summary()
+        if not summary:
+            return
+        print(f"\n   🔁 Retry özeti:")
+        for category, counts in sorted(summary.items(), key=lambda kv: -kv[1]['failures']):
+            print(f"      {category:<18} hata {counts['failures']:>3} | retry {counts['retry']:>3} | "
+                  f"degrade {counts['degrade']:>3} | fail {counts['fail']:>3} | kurtarıldı {counts['recovered']:>3}")
+        logger.info(f"🔁 Retry stats: {summary}")
+
+
+class RetryPolicy:
+    """
+    Decides retry / degrade / fail fast from the error category
+
+    Example:
+        decision = policy.decide(parse_ffmpeg_error(stderr), attempt, can_degrade=on_gpu)
+        if decision.action == RetryAction.FAIL:
+            return failure
+        elif decision.action == RetryAction.DEGRADE:
+            switch_to_cpu()
+        else:
+            time.sleep(decision.delay)
+    """
+
+    def __init__(self, rules: Optional[Dict[ErrorCategory, RetryRule]] = None):
+        self.rules = dict(DEFAULT_RETRY_RULES)
+        if rules:
+            self.rules.update(rules)
+        self.stats = RetryStats()
+
+    def decide(self, category: ErrorCategory, attempt: int, can_degrade: bool = False,
+               record: bool = True) -> RetryDecision:
+        """
+        Args:
+            category: Classified error of the failed attempt
+            attempt: 1-based attempt number with the current settings
+            can_degrade: Whether a cheaper configuration is still available
+            record: Count the decision in self.stats
+        """
+        rule = self.rules.get(category, self.rules[ErrorCategory.UNKNOWN_ERROR])
+
+        if rule.action == RetryAction.FAIL:
+            action = RetryAction.FAIL
+        elif rule.action == RetryAction.DEGRADE and can_degrade:
+            action = RetryAction.DEGRADE
+        elif attempt < max(rule.max_attempts, 1):
+            action = RetryAction.RETRY
+        else:
+            action = RetryAction.DEGRADE if can_degrade else RetryAction.FAIL
+
+        delay = rule.delay * (rule.backoff ** (attempt - 1)) if action == RetryAction.RETRY else 0.0
+        if record:
+            self.stats.record(category.value, action.value)
+        return RetryDecision(action, delay, category)
+
+
+def classify_exception(exc: BaseException) -> ErrorCategory:
+    """Map an exception to an ErrorCategory (uses ffmpeg stderr when available)"""
+    if isinstance(exc, subprocess.TimeoutExpired):
+        return ErrorCategory.TIMEOUT_ERROR
+    if isinstance(exc, subprocess.CalledProcessError):
+        stderr = exc.stderr or ''
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode('utf-8', errors='replace')
+        return parse_ffmpeg_error(stderr)
+    if isinstance(exc, FileNotFoundError):
+        return ErrorCategory.FILE_NOT_FOUND
+    if isinstance(exc, PermissionError):
+        return ErrorCategory.PERMISSION_DENIED
+    if isinstance(exc, MemoryError):
+        return ErrorCategory.MEMORY_ERROR
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return ErrorCategory.NETWORK_ERROR
+    if isinstance(exc, OSError) and exc.errno == errno.ENOSPC:
+        return ErrorCategory.DISK_FULL
+    return ErrorCategory.UNKNOWN_ERROR
+
+
+# Shared policy for ffmpeg invocations
+ffmpeg_retry_policy = RetryPolicy()
+
+
 # ============================================================================
 # FALLBACK DECORATOR
 # ============================================================================
@@ -408,6 +593,11 @@ def parse_ffmpeg_error(stderr: str) -> ErrorCategory:
         return ErrorCategory.FILE_NOT_FOUND
     elif 'permission denied' in stderr_lower:
         return ErrorCategory.PERMISSION_DENIED
+    elif 'no space left' in stderr_lower:
+        return ErrorCategory.DISK_FULL
+    elif ('invalid data found when processing input' in stderr_lower or 'moov atom not found' in stderr_lower
+          or ('end of file' in stderr_lower and 'error while decoding' in stderr_lower)):
+        return ErrorCategory.INPUT_ERROR
     elif 'codec' in stderr_lower or 'encoder' in stderr_lower:
         return ErrorCategory.CODEC_ERROR
     elif 'memory' in stderr_lower or 'out of memory' in stderr_lower:
@@ -428,6 +618,7 @@ if __name__ == "__main__":
     print("This module should be imported by main.py")
     print("\nFeatures:")
     print("  ✅ Retry decorator with exponential backoff")
+    print("  ✅ Error-classified retry policy")
     print("  ✅ Fallback mechanisms")
     print("  ✅ Graceful error handling")
     print("  ✅ User-friendly error messages")
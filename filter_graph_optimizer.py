@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FILTER GRAPH OPTIMIZER - Gereksiz Efekt Aşamalarını Birleştirme
+Üretilen -vf zincirini parse eder, ardışık eq aşamalarını birleştirir,
+eq'yu geometrik aşamaların arkasına taşır, crop+scale çiftlerini katlar, etkisiz filtreleri ve tekrarlanan format
+dönüşümlerini ffmpeg çalışmadan önce kaldırır.
+"""
+
+import re
+import logging
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+FILTER_GRAPH_OPTIMIZER_CONFIG = {
+    'enabled': True,
+
+    # Birebir aynı çıktı veren (bit-exact) geçişler
+    'drop_identity': True,         # eq=contrast=1, setpts=1.0*PTS, null, crop=iw:ih ...
+    'dedupe_idempotent': True,     # format=X,format=X / fps=30,fps=30
+    'cancel_involutions': True,    # hflip,hflip / vflip,vflip / negate,negate
+
+    # Yaklaşık (ara 8-bit yuvarlama/kırpma farkı olabilir, görsel fark yok)
+    'merge_eq': True,              # eq,eq → tek eq
+    'sink_eq': True,               # eq,crop/scale → crop/scale,eq (renk ayarı kırpılmış karede)
+    'fold_crop_scale': True,       # crop,scale,crop,scale → tek crop + tek scale
+    'collapse_scale': True,        # scale=A,scale=1920:1080 → scale=1920:1080
+
+    # Doğrulama (framemd5 karşılaştırması, yaklaşık geçişler için PSNR)
+    'verify_frames': 60,
+    'verify_min_psnr': 30.0,       # dB; yaklaşık zincir bunun altına düşerse farklı sayılır
+}
+
+# Art arda iki kez uygulanması tek uygulamayla aynı olan filtreler
+IDEMPOTENT_FILTERS = {'format', 'fps', 'setsar', 'setdar', 'colorspace'}
+
+# İki kez uygulanınca etkisiz olan filtreler
+INVOLUTION_FILTERS = {'hflip', 'vflip', 'negate'}
+
+# eq parametrelerinin nötr değerleri
+EQ_NEUTRAL = {
+    'contrast': 1.0,
+    'brightness': 0.0,
+    'saturation': 1.0,
+    'gamma': 1.0,
+    'gamma_r': 1.0,
+    'gamma_g': 1.0,
+    'gamma_b': 1.0,
+    'gamma_weight': 1.0,
+}
+EQ_GAMMA_KEYS = ('gamma', 'gamma_r', 'gamma_g', 'gamma_b')
+
+# ffmpeg eq'nun kabul ettiği aralıklar (dışındaki değerle grafik açılmaz)
+EQ_RANGES = {
+    'contrast': (-1000.0, 1000.0),
+    'brightness': (-1.0, 1.0),
+    'saturation': (0.0, 3.0),
+    'gamma': (0.1, 10.0),
+    'gamma_r': (0.1, 10.0),
+    'gamma_g': (0.1, 10.0),
+    'gamma_b': (0.1, 10.0),
+    'gamma_weight': (0.0, 1.0),
+}
+
+
+# ============================================================================
+# 🔍 PARSER
+# ============================================================================
+
+def _split_top_level(text: str, separators: str) -> List[Tuple[str, str]]:
+    """
+    Tırnak ('...'), kaçış (\\) ve [label] dışındaki ayraçlardan böl
+
+    Returns:
+        [(parça, ardından_gelen_ayraç)] - son parçanın ayracı ''
+    """
+    parts = []
+    current = []
+    in_quote = False
+    bracket = 0
+    i = 0
+
+    while i < len(text):
+        ch = text[i]
+        if ch == '\\' and i + 1 < len(text):
+            current.append(text[i:i + 2])
+            i += 2
+            continue
+        if ch == "'":
+            in_quote = not in_quote
+        elif not in_quote:
+            if ch == '[':
+                bracket += 1
+            elif ch == ']':
+                bracket = max(0, bracket - 1)
+            elif ch in separators and bracket == 0:
+                parts.append((''.join(current), ch))
+                current = []
+                i += 1
+                continue
+        current.append(ch)
+        i += 1
+
+    parts.append((''.join(current), ''))
+    return parts
+
+
+_LABELS_PREFIX = re.compile(r'^\s*((?:\[[^\]]*\]\s*)*)')
+_LABELS_SUFFIX = re.compile(r'((?:\s*\[[^\]]*\])*)\s*$')
+
+
+def parse_filter_graph(graph: str) -> List[Dict]:
+    """
+    -vf / filter_complex metnini filtre listesine çevir
+
+    Her eleman: {'in': '[a]', 'name': 'eq', 'args': '...', 'out': '[b]', 'sep': ','}
+    """
+    filters = []
+    for token, sep in _split_top_level(graph, ',;'):
+        prefix = _LABELS_PREFIX.match(token).group(1)
+        rest = token[len(prefix):]
+        suffix = _LABELS_SUFFIX.search(rest).group(1) if ']' in rest else ''
+        body = rest[:len(rest) - len(suffix)] if suffix else rest
+        body = body.strip()
+
+        if '=' in body:
+            name, args = body.split('=', 1)
+        else:
+            name, args = body, None
+
+        filters.append({
+            'in': prefix.strip(),
+            'name': name.strip(),
+            'args': args,
+            'out': suffix.strip(),
+            'sep': sep,
+        })
+    return filters
+
+
+def build_filter_graph(filters: List[Dict]) -> str:
+    """parse_filter_graph çıktısını tekrar metne çevir"""
+    parts = []
+    for f in filters:
+        body = f['name'] if f['args'] is None else f"{f['name']}={f['args']}"
+        parts.append(f"{f['in']}{body}{f['out']}{f['sep']}")
+    return ''.join(parts)
+
+
+def _parse_options(args: Optional[str]) -> Optional[Dict[str, str]]:
+    """key=value:key=value seçeneklerini sözlüğe çevir (pozisyonel varsa None)"""
+    if not args:
+        return {}
+    options = {}
+    for part, _ in _split_top_level(args, ':'):
+        if '=' not in part:
+            return None
+        key, value = part.split('=', 1)
+        options[key.strip()] = value.strip()
+    return options
+
+
+def _literal(value: str) -> Optional[float]:
+    """Sabit sayı ise float döndür (ifade ise None)"""
+    try:
+        return float(value.strip("'"))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _fmt(value: float) -> str:
+    """Sayıyı kısa ve kararlı biçimde yaz"""
+    return f"{value:.6f}".rstrip('0').rstrip('.') or '0'
+
+
+def _linked(prev: Dict, nxt: Dict) -> bool:
+    """İki filtre aynı doğrusal zincirde ardışık mı? (label yok, ayraç virgül)"""
+    return prev['sep'] == ',' and not prev['out'] and not nxt['in']
+
+
+# ============================================================================
+# ✂️ PASSES
+# ============================================================================
+
+def _is_identity(f: Dict) -> bool:
+    """Çıktıyı değiştirmeyen filtre mi?"""
+    name, args = f['name'], f['args']
+
+    if name == 'null':
+        return True
+
+    if name == 'eq':
+        options = _parse_options(args)
+        if options is None or not options:
+            return options is not None
+        for key, value in options.items():
+            if key not in EQ_NEUTRAL or _literal(value) != EQ_NEUTRAL[key]:
+                return False
+        return True
+
+    if name == 'setpts' and args is not None:
+        compact = args.replace(' ', '')
+        if compact == 'PTS':
+            return True
+        match = re.fullmatch(r'([0-9.]+)\*PTS', compact)
+        return bool(match) and _literal(match.group(1)) == 1.0
+
+    if name in ('scale', 'crop') and args is not None:
+        options = _split_top_level(args, ':')
+        values = [p.strip().strip("'") for p, _ in options]
+        if name == 'scale':
+            return values in (['iw', 'ih'], ['in_w', 'in_h'])
+        if values[:2] in (['iw', 'ih'], ['in_w', 'in_h']):
+            return all(v == '0' for v in values[2:4])
+
+    return False
+
+
+def drop_identity_filters(filters: List[Dict]) -> List[Dict]:
+    """Etkisiz filtreleri kaldır (label taşıyanlar korunur)"""
+    result = []
+    for f in filters:
+        if not f['in'] and not f['out'] and _is_identity(f):
+            # Ayracı bir önceki filtreye devret (zincir bozulmasın)
+            if result and f['sep'] != ',':
+                result[-1]['sep'] = f['sep']
+            continue
+        result.append(f)
+    return result
+
+
+def dedupe_idempotent(filters: List[Dict]) -> List[Dict]:
+    """format=X,format=X gibi tekrarları tek aşamaya indir"""
+    result = []
+    for f in filters:
+        if (result and _linked(result[-1], f) and f['name'] in IDEMPOTENT_FILTERS
+                and result[-1]['name'] == f['name'] and result[-1]['args'] == f['args']):
+            result[-1]['sep'] = f['sep']
+            result[-1]['out'] = f['out']
+            continue
+        result.append(f)
+    return result
+
+
+def cancel_involutions(filters: List[Dict]) -> List[Dict]:
+    """hflip,hflip gibi birbirini götüren çiftleri kaldır"""
+    result = []
+    for f in filters:
+        if (result and _linked(result[-1], f) and f['name'] in INVOLUTION_FILTERS
+                and result[-1]['name'] == f['name'] and result[-1]['args'] is None and f['args'] is None
+                and not result[-1]['in'] and not f['out']):
+            prev = result.pop()
+            if result and f['sep'] != ',':
+                result[-1]['sep'] = f['sep']
+            elif not result and f['sep'] != ',':
+                # Zincir başında kalan ayraç için etkisiz yer tutucu
+                result.append({'in': prev['in'], 'name': 'null', 'args': None, 'out': '', 'sep': f['sep']})
+            continue
+        result.append(f)
+    return result
+
+
+def _eq_values(options: Dict[str, str]) -> Optional[Dict[str, float]]:
+    """eq seçeneklerini sayıya çevir (ifade/eval varsa None)"""
+    values = dict(EQ_NEUTRAL)
+    for key, value in options.items():
+        if key not in EQ_NEUTRAL:
+            return None
+        number = _literal(value)
+        if number is None:
+            return None
+        values[key] = number
+    return values
+
+
+def _merge_eq_values(first: Dict[str, float], second: Dict[str, float]) -> Optional[Dict[str, float]]:
+    """
+    İki eq aşamasını tek aşamada ifade et
+
+    eq: v' = contrast*(v-0.5) + 0.5 + brightness, ardından gamma.
+    İlk aşamada gamma yoksa doğrusal kısımlar birleşir; ikinci aşamada
+    doğrusal kısım yoksa gamma'lar çarpılır. Diğer durumlar ve ffmpeg'in
+    aralığı dışına çıkan sonuçlar birleştirilemez.
+    """
+    if first['gamma_weight'] != 1.0 or second['gamma_weight'] != 1.0:
+        return None
+
+    first_has_gamma = any(first[k] != 1.0 for k in EQ_GAMMA_KEYS)
+    second_is_linear = second['contrast'] != 1.0 or second['brightness'] != 0.0
+    if first_has_gamma and second_is_linear:
+        return None
+
+    merged = dict(EQ_NEUTRAL)
+    merged['contrast'] = first['contrast'] * second['contrast']
+    merged['brightness'] = second['contrast'] * first['brightness'] + second['brightness']
+    merged['saturation'] = first['saturation'] * second['saturation']
+    for key in EQ_GAMMA_KEYS:
+        merged[key] = first[key] * second[key]
+
+    for key, (low, high) in EQ_RANGES.items():
+        if not low <= merged[key] <= high:
+            return None
+    return merged
+
+
+def merge_eq_stages(filters: List[Dict]) -> List[Dict]:
+    """Ardışık sabit değerli eq aşamalarını birleştir"""
+    result = []
+    for f in filters:
+        prev = result[-1] if result else None
+        if prev and f['name'] == 'eq' and prev['name'] == 'eq' and _linked(prev, f):
+            prev_opts, cur_opts = _parse_options(prev['args']), _parse_options(f['args'])
+            if prev_opts is not None and cur_opts is not None:
+                prev_vals, cur_vals = _eq_values(prev_opts), _eq_values(cur_opts)
+                if prev_vals and cur_vals:
+                    merged = _merge_eq_values(prev_vals, cur_vals)
+                    if merged:
+                        args = ':'.join(f"{k}={_fmt(v)}" for k, v in merged.items() if v != EQ_NEUTRAL[k])
+                        prev['args'] = args or 'contrast=1'
+                        prev['out'] = f['out']
+                        prev['sep'] = f['sep']
+                        continue
+        result.append(f)
+    return result
+
+
+_FIXED_SCALE = re.compile(r"^(\d+):(\d+)((?::[a-z_]+=[^:]+)*)$")
+
+# Çıktı boyutunu değiştirmeyen scale seçenekleri (force_original_aspect_ratio,
+# force_divisible_by gibi boyutu yeniden hesaplayanlar katlanamaz)
+_SIZE_NEUTRAL_SCALE_OPTIONS = {'flags', 'interl', 'in_range', 'out_range',
+                               'in_color_matrix', 'out_color_matrix'}
+
+# Katlanabilir crop ifadelerinde izin verilen adlar (zamana bağlı t/n yok)
+_CROP_NAMES = {'iw', 'ih', 'in_w', 'in_h', 'ow', 'oh', 'out_w', 'out_h', 'trunc'}
+_NAME = re.compile(r'[A-Za-z_][A-Za-z_0-9]*')
+
+
+def _substitute(expr: str, values: Dict[str, str]) -> str:
+    """İfadedeki değişkenleri parantezli karşılıklarıyla değiştir"""
+    aliases = {'in_w': 'iw', 'in_h': 'ih', 'out_w': 'ow', 'out_h': 'oh'}
+    return _NAME.sub(lambda m: f"({values[aliases.get(m.group(0), m.group(0))]})"
+                     if aliases.get(m.group(0), m.group(0)) in values else m.group(0), expr)
+
+
+def _crop_rect(f: Dict) -> Optional[Tuple[str, str, str, str]]:
+    """
+    crop=W:H:X:Y → giriş boyutu cinsinden (W, H, X, Y) ifadeleri
+
+    W/H yalnız iw/ih'ye, X/Y ayrıca ow/oh'ye bağlı olabilir; ow/oh
+    W/H ile yerine konur. Zamana bağlı veya eksik crop'lar için None.
+    """
+    if f['name'] != 'crop' or not f['args']:
+        return None
+    parts = [p.strip().strip("'") for p, _ in _split_top_level(f['args'], ':')]
+    if len(parts) != 4 or any('=' in p for p in parts):
+        return None
+    for part in parts:
+        if any(name not in _CROP_NAMES for name in _NAME.findall(part)):
+            return None
+    w, h, x, y = parts
+    if set(_NAME.findall(w + h)) & {'ow', 'oh', 'out_w', 'out_h'}:
+        return None
+    out = {'ow': w, 'oh': h}
+    return w, h, _substitute(x, out), _substitute(y, out)
+
+
+def _fixed_scale(f: Dict) -> Optional[Tuple[int, int, str]]:
+    """scale=W:H[:flags=...] → (W, H, ek_seçenekler)"""
+    if f['name'] != 'scale' or not f['args']:
+        return None
+    match = _FIXED_SCALE.match(f['args'].replace(' ', ''))
+    if not match:
+        return None
+    options = [opt.split('=', 1)[0] for opt in match.group(3).split(':') if opt]
+    if any(opt not in _SIZE_NEUTRAL_SCALE_OPTIONS for opt in options):
+        return None
+    return int(match.group(1)), int(match.group(2)), match.group(3)
+
+
+def _eq_is_affine(f: Dict) -> bool:
+    """Gamma'sız sabit eq (piksel başına doğrusal renk ayarı)"""
+    if f['name'] != 'eq':
+        return False
+    options = _parse_options(f['args'])
+    values = _eq_values(options) if options is not None else None
+    return bool(values) and all(values[k] == 1.0 for k in EQ_GAMMA_KEYS) and values['gamma_weight'] == 1.0
+
+
+def sink_eq_stages(filters: List[Dict]) -> List[Dict]:
+    """
+    eq,crop / eq,scale → crop,eq / scale,eq
+
+    Doğrusal renk ayarı kırpma ve ölçeklemeyle yer değiştirebilir (ara
+    yuvarlama farkı dışında); eq geometrinin arkasına geçince daha az
+    piksel işler ve araya girdiği crop/scale çiftleri katlanabilir hale gelir.
+    """
+    result = list(filters)
+    moved = True
+    while moved:
+        moved = False
+        for i in range(len(result) - 1):
+            eq, nxt = result[i], result[i + 1]
+            if (_eq_is_affine(eq) and (_crop_rect(nxt) or _fixed_scale(nxt)) and _linked(eq, nxt)
+                    and not eq['in'] and not nxt['out']):
+                eq_sep, nxt_sep = eq['sep'], nxt['sep']
+                nxt['sep'], eq['sep'] = eq_sep, nxt_sep
+                result[i], result[i + 1] = nxt, eq
+                moved = True
+    return result
+
+
+def fold_crop_scale(filters: List[Dict]) -> List[Dict]:
+    """
+    crop(A),scale(WxH),crop(B),scale(W2xH2) → crop(A∘B),scale(W2xH2)
+
+    İkinci crop WxH uzayında; giriş boyutuna ilk crop'un çıktısının WxH'e
+    oranıyla taşınarak tek crop ifadesine dönüştürülür. Bir ara ölçekleme kalkar.
+    """
+    result = list(filters)
+    i = 0
+    while i + 3 < len(result):
+        c1, s1, c2, s2 = result[i:i + 4]
+        r1, r2 = _crop_rect(c1), _crop_rect(c2)
+        sc1, sc2 = _fixed_scale(s1), _fixed_scale(s2)
+
+        if (r1 and r2 and sc1 and sc2 and _linked(c1, s1) and _linked(s1, c2) and _linked(c2, s2)
+                and not c1['in'] and not s2['out']):
+            w1, h1, x1, y1 = r1
+            sw, sh, _ = sc1
+            # crop2 ifadeleri WxH uzayında
+            scaled = {'iw': str(sw), 'ih': str(sh)}
+            w2, h2, x2, y2 = (_substitute(e, scaled) for e in r2)
+            fw = f"({w1})/{sw}"
+            fh = f"({h1})/{sh}"
+            folded = {
+                'in': '',
+                'name': 'crop',
+                'args': (f"'({w2})*{fw}':'({h2})*{fh}':"
+                         f"'{x1}+({x2})*{fw}':'{y1}+({y2})*{fh}'"),
+                'out': '',
+                'sep': s1['sep'],
+            }
+            result[i:i + 4] = [folded, s2]
+            continue
+        i += 1
+    return result
+
+
+def collapse_scales(filters: List[Dict]) -> List[Dict]:
+    """
+    Ardışık iki sabit boyutlu scale'de sonuncusu yeterli (ilk scale düşer)
+
+    İfadeli scale'ler (pixelate gibi kasıtlı küçült/büyüt) korunur.
+    """
+    result = []
+    for f in filters:
+        prev = result[-1] if result else None
+        if (prev and prev['name'] == 'scale' and _linked(prev, f) and _fixed_scale(prev) and _fixed_scale(f)
+                and not prev['in']):
+            result[-1] = f
+            continue
+        result.append(f)
+    return result
+
+
+# ============================================================================
+# 🚀 ANA API
+# ============================================================================
+
+def optimize_filter_graph(graph: Optional[str], exact_only: bool = False,
+                          config: Optional[Dict] = None) -> Optional[str]:
+    """
+    Filtre grafiğini sadeleştir
+
+    Args:
+        graph: -vf zinciri (veya filter_complex)
+        exact_only: True ise sadece bit-exact geçişler uygulanır
+        config: FILTER_GRAPH_OPTIMIZER_CONFIG override
+
+    Returns:
+        Sadeleştirilmiş zincir (hata olursa orijinal)
+    """
+    cfg = config or FILTER_GRAPH_OPTIMIZER_CONFIG
+    if not graph or not cfg.get('enabled', True):
+        return graph
+
+    try:
+        filters = parse_filter_graph(graph)
+
+        if cfg.get('drop_identity', True):
+            filters = drop_identity_filters(filters)
+        if cfg.get('cancel_involutions', True):
+            filters = cancel_involutions(filters)
+        if not exact_only:
+            if cfg.get('sink_eq', True):
+                filters = sink_eq_stages(filters)
+            if cfg.get('merge_eq', True):
+                filters = merge_eq_stages(filters)
+                # Birleşen eq nötr olabilir
+                filters = drop_identity_filters(filters)
+            if cfg.get('fold_crop_scale', True):
+                filters = fold_crop_scale(filters)
+            if cfg.get('collapse_scale', True):
+                filters = collapse_scales(filters)
+        if cfg.get('dedupe_idempotent', True):
+            filters = dedupe_idempotent(filters)
+
+        if not filters:
+            return None
+        filters[-1]['sep'] = ''
+        return build_filter_graph(filters)
+
+    except Exception as e:
+        logger.warning(f"⚠️ Filter graph optimizasyonu atlandı: {e}")
+        return graph
+
+
+def count_stages(graph: Optional[str]) -> int:
+    """Zincirdeki filtre aşaması sayısı"""
+    return len(parse_filter_graph(graph)) if graph else 0
+
+
+# ============================================================================
+# ✅ DOĞRULAMA (frame hash karşılaştırması)
+# ============================================================================
+
+def frame_hashes(video_path: str, graph: Optional[str], frames: Optional[int] = None) -> Optional[List[str]]:
+    """Filtre uygulanmış karelerin framemd5 listesi"""
+    frames = frames or FILTER_GRAPH_OPTIMIZER_CONFIG['verify_frames']
+    komut = ['ffmpeg', '-hide_banner', '-v', 'error', '-nostdin', '-i', video_path, '-an']
+    if graph:
+        komut.extend(['-vf', graph])
+    komut.extend(['-frames:v', str(frames), '-f', 'framemd5', '-'])
+
+    try:
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=300)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"⚠️ framemd5 alınamadı: {e}")
+        return None
+
+    if sonuc.returncode != 0:
+        logger.warning(f"⚠️ framemd5 hatası: {sonuc.stderr[:200]}")
+        return None
+
+    return [line.rsplit(',', 1)[-1].strip() for line in sonuc.stdout.splitlines()
+            if line and not line.startswith('#')]
+
+
+_SHOWINFO_SIZE = re.compile(r'\bs:(\d+)x(\d+)\b')
+_PSNR_AVERAGE = re.compile(r'average:(inf|[\d.]+)')
+
+
+def frame_size(video_path: str, graph: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Filtre uygulanmış ilk karenin boyutu (showinfo'dan)"""
+    chain = f"{graph},showinfo" if graph else "showinfo"
+    komut = ['ffmpeg', '-hide_banner', '-nostdin', '-i', video_path, '-an',
+             '-vf', chain, '-frames:v', '1', '-f', 'null', '-']
+
+    try:
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=300)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"⚠️ Kare boyutu alınamadı: {e}")
+        return None
+
+    match = _SHOWINFO_SIZE.search(sonuc.stderr) if sonuc.returncode == 0 else None
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def frame_psnr(video_path: str, graph_a: Optional[str], graph_b: Optional[str],
+               frames: Optional[int] = None) -> Optional[float]:
+    """İki zincirin çıktıları arasındaki ortalama PSNR (dB, birebir aynıysa inf)"""
+    frames = frames or FILTER_GRAPH_OPTIMIZER_CONFIG['verify_frames']
+    sol = f"[a]{graph_a}[ra]" if graph_a else "[a]null[ra]"
+    sag = f"[b]{graph_b}[rb]" if graph_b else "[b]null[rb]"
+    komut = ['ffmpeg', '-hide_banner', '-nostdin', '-i', video_path, '-an',
+             '-filter_complex', f"[0:v]split[a][b];{sol};{sag};[ra][rb]psnr",
+             '-frames:v', str(frames), '-f', 'null', '-']
+
+    try:
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=300)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"⚠️ PSNR alınamadı: {e}")
+        return None
+
+    match = _PSNR_AVERAGE.search(sonuc.stderr) if sonuc.returncode == 0 else None
+    if not match:
+        return None
+    return float('inf') if match.group(1) == 'inf' else float(match.group(1))
+
+
+def verify_optimization(video_path: str, graph: str, frames: Optional[int] = None) -> Dict:
+    """
+    Test klibi üzerinde orijinal ve sadeleştirilmiş zincirleri karşılaştır
+
+    Exact zincir framemd5 ile birebir, tam (yaklaşık) zincir çıktı boyutu
+    ve PSNR ile karşılaştırılır.
+
+    Returns:
+        {'exact_match': bool, 'approx_match_ratio': float, 'size_match': bool,
+         'psnr': float|None, 'approx_ok': bool, 'stages': (önce, exact, tam)}
+    """
+    exact_graph = optimize_filter_graph(graph, exact_only=True)
+    full_graph = optimize_filter_graph(graph)
+
+    original = frame_hashes(video_path, graph, frames)
+    exact = frame_hashes(video_path, exact_graph, frames)
+    full = frame_hashes(video_path, full_graph, frames)
+
+    report = {
+        'exact_match': bool(original) and original == exact,
+        'approx_match_ratio': 0.0,
+        'size_match': False,
+        'psnr': None,
+        'approx_ok': False,
+        'stages': (count_stages(graph), count_stages(exact_graph), count_stages(full_graph)),
+    }
+    if original and full:
+        same = sum(1 for a, b in zip(original, full) if a == b)
+        report['approx_match_ratio'] = same / max(len(original), 1)
+
+    original_size = frame_size(video_path, graph)
+    report['size_match'] = original_size is not None and original_size == frame_size(video_path, full_graph)
+    if report['size_match']:
+        report['psnr'] = frame_psnr(video_path, graph, full_graph, frames)
+    report['approx_ok'] = (report['psnr'] is not None
+                           and report['psnr'] >= FILTER_GRAPH_OPTIMIZER_CONFIG['verify_min_psnr'])
+
+    return report
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JOB JOURNAL - Çökmeye Dayanıklı İş Günlüğü
+Her aşamanın (klip encode, final çıktı) girdi hash'i, çıktı yolu, checksum'ı
+ve durumu append-only bir SQLite (WAL) tablosuna yazılır. Yeniden başlatılan
+bir çalışma, doğrulanan çıktıları atlar ve sadece eksik aşamaları yeniden yapar.
+
+Kayıtlar hiç güncellenmez; bir (run, stage, key) için geçerli durum son
+eklenen olaydır.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import RENDER_KLASORU
+except ImportError:
+    RENDER_KLASORU = os.getcwd()
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+JOB_JOURNAL_CONFIG = {
+    'db_path': os.path.join(RENDER_KLASORU, 'job_journal.db'),
+
+    # 'fast' = boyut + baş/son blokların SHA1'i, 'full' = tüm dosyanın SHA1'i
+    'checksum_mode': 'fast',
+    'checksum_block_bytes': 1024 * 1024,
+
+    # Biten çalışmaların olayları bu kadar gün sonra silinir
+    'retain_days': 14,
+
+    'busy_timeout': 30,
+}
+
+STATUS_STARTED = 'started'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_CLOSED = 'closed'
+
+STAGE_RUN = 'run'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts          REAL NOT NULL,
+    run_id      TEXT NOT NULL,
+    stage       TEXT NOT NULL,
+    key         TEXT NOT NULL DEFAULT '',
+    status      TEXT NOT NULL,
+    inputs_hash TEXT,
+    output      TEXT,
+    size        INTEGER,
+    checksum    TEXT,
+    detail      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_lookup ON events (run_id, stage, key, id);
+"""
+
+# Thread başına bağlantı (batch modunda işler thread'lerde çalışır)
+_local = threading.local()
+
+
+# ============================================================================
+# 🗄️ BAĞLANTI
+# ============================================================================
+
+def _baglanti(db_path: Optional[str] = None) -> sqlite3.Connection:
+    db_path = db_path or JOB_JOURNAL_CONFIG['db_path']
+    baglantilar = getattr(_local, 'baglantilar', None)
+    if baglantilar is None:
+        baglantilar = _local.baglantilar = {}
+
+    conn = baglantilar.get(db_path)
+    if conn is None:
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=JOB_JOURNAL_CONFIG['busy_timeout'])
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(_SCHEMA)
+        baglantilar[db_path] = conn
+    return conn
+
+
+def kapat() -> None:
+    """Bu thread'in bağlantılarını kapat"""
+    for conn in getattr(_local, 'baglantilar', {}).values():
+        conn.close()
+    _local.baglantilar = {}
+
+
+# ============================================================================
+# 🔑 HASH / CHECKSUM
+# ============================================================================
+
+def girdi_hash(girdiler: Any) -> str:
+    """Aşama girdilerinin (JSON'a çevrilebilir) kararlı hash'i"""
+    veri = json.dumps(girdiler, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(veri.encode('utf-8')).hexdigest()
+
+
+def checksum_hesapla(path: str, mode: Optional[str] = None) -> str:
+    """
+    Dosya checksum'ı
+
+    'fast' modunda boyut + ilk ve son blok hash'lenir: yarım yazılmış
+    (kesilmiş) dosyaları yakalar, büyük videoları baştan sona okumaz.
+    """
+    mode = mode or JOB_JOURNAL_CONFIG['checksum_mode']
+    blok = JOB_JOURNAL_CONFIG['checksum_block_bytes']
+    h = hashlib.sha1()
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as f:
+        if mode == 'full' or size <= blok * 2:
+            for parca in iter(lambda: f.read(blok), b''):
+                h.update(parca)
+        else:
+            h.update(str(size).encode('ascii'))
+            h.update(f.read(blok))
+            f.seek(-blok, os.SEEK_END)
+            h.update(f.read(blok))
+
+    return f"{mode}:{h.hexdigest()}"
+
+
+# ============================================================================
+# ✍️ OLAY KAYDI
+# ============================================================================
+
+def olay_ekle(run_id: str, stage: str, status: str, key: str = '',
+              inputs_hash: Optional[str] = None, output: Optional[str] = None,
+              size: Optional[int] = None, checksum: Optional[str] = None,
+              detail: Optional[Any] = None, db_path: Optional[str] = None) -> None:
+    """Günlüğe tek olay ekle (append-only)"""
+    if detail is not None and not isinstance(detail, str):
+        detail = json.dumps(detail, default=str, ensure_ascii=False)
+    conn = _baglanti(db_path)
+    with conn:
+        conn.execute(
+            'INSERT INTO events (ts, run_id, stage, key, status, inputs_hash, output, size, checksum, detail) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (time.time(), run_id, stage, key, status, inputs_hash, output, size, checksum, detail)
+        )
+
+
+def son_olay(run_id: str, stage: str, key: str = '',
+             db_path: Optional[str] = None) -> Optional[sqlite3.Row]:
+    """(run, stage, key) için en son olay"""
+    return _baglanti(db_path).execute(
+        'SELECT * FROM events WHERE run_id = ? AND stage = ? AND key = ? ORDER BY id DESC LIMIT 1',
+        (run_id, stage, key)
+    ).fetchone()
+
+
+def asama_tamamlandi(run_id: str, stage: str, key: str, inputs_hash: str, output: str,
+                     db_path: Optional[str] = None) -> None:
+    """Aşama çıktısını checksum'ı ile birlikte 'done' olarak kaydet"""
+    olay_ekle(run_id, stage, STATUS_DONE, key=key, inputs_hash=inputs_hash, output=output,
+              size=os.path.getsize(output), checksum=checksum_hesapla(output), db_path=db_path)
+
+
+def asama_hatali(run_id: str, stage: str, key: str, inputs_hash: str,
+                 detail: Optional[Any] = None, db_path: Optional[str] = None) -> None:
+    olay_ekle(run_id, stage, STATUS_FAILED, key=key, inputs_hash=inputs_hash,
+              detail=detail, db_path=db_path)
+
+
+def dogrulanmis_cikti(run_id: str, stage: str, key: str, inputs_hash: str,
+                      db_path: Optional[str] = None) -> Optional[str]:
+    """
+    Aşama daha önce aynı girdilerle tamamlandıysa ve çıktısı hâlâ
+    sağlamsa çıktı yolunu döndür
+
+    Dosya yok, boyut veya checksum uyuşmuyor ya da girdiler değişmişse None.
+    """
+    olay = son_olay(run_id, stage, key, db_path)
+    if olay is None or olay['status'] != STATUS_DONE or olay['inputs_hash'] != inputs_hash:
+        return None
+
+    output = olay['output']
+    try:
+        if os.path.getsize(output) != olay['size']:
+            return None
+        if checksum_hesapla(output, olay['checksum'].split(':', 1)[0]) != olay['checksum']:
+            return None
+    except (OSError, TypeError, AttributeError):
+        return None
+    return output
+
+
+# ============================================================================
+# 🏁 ÇALIŞMA (RUN) DURUMU
+# ============================================================================
+
+def run_baslat(run_id: str, params: Dict, db_path: Optional[str] = None) -> None:
+    """Çalışmayı ve devam ettirmek için gereken parametreleri kaydet"""
+    olay_ekle(run_id, STAGE_RUN, STATUS_STARTED, detail=params, db_path=db_path)
+
+
+def run_bitir(run_id: str, status: str = STATUS_DONE, db_path: Optional[str] = None) -> None:
+    """Açık çalışmayı kapat (zaten kapalıysa bir şey yapmaz)"""
+    olay = son_olay(run_id, STAGE_RUN, db_path=db_path)
+    if olay is not None and olay['status'] == STATUS_STARTED:
+        olay_ekle(run_id, STAGE_RUN, status, db_path=db_path)
+        eski_kayitlari_temizle(db_path=db_path)
+
+
+def run_ozeti(run_id: str, db_path: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+    """Aşama başına son durum sayıları: {stage: {status: adet}}"""
+    rows = _baglanti(db_path).execute(
+        'SELECT e.stage, e.status, COUNT(*) AS n FROM events e '
+        'JOIN (SELECT MAX(id) AS id FROM events WHERE run_id = ? AND stage != ? '
+        '      GROUP BY stage, key) son ON e.id = son.id '
+        'GROUP BY e.stage, e.status',
+        (run_id, STAGE_RUN)
+    ).fetchall()
+    ozet = {}
+    for row in rows:
+        ozet.setdefault(row['stage'], {})[row['status']] = row['n']
+    return ozet
+
+
+def acik_run(db_path: Optional[str] = None) -> Optional[Dict]:
+    """
+    Son açık (bitmemiş) çalışma
+
+    Returns:
+        {'run_id', 'started_at', 'params', 'stages'} veya None
+    """
+    conn = _baglanti(db_path)
+    olay = conn.execute(
+        'SELECT * FROM events WHERE stage = ? ORDER BY id DESC LIMIT 1', (STAGE_RUN,)
+    ).fetchone()
+    if olay is None or olay['status'] != STATUS_STARTED:
+        return None
+
+    try:
+        params = json.loads(olay['detail']) if olay['detail'] else {}
+    except ValueError:
+        params = {}
+
+    return {
+        'run_id': olay['run_id'],
+        'started_at': olay['ts'],
+        'params': params,
+        'stages': run_ozeti(olay['run_id'], db_path),
+    }
+
+
+def eski_kayitlari_temizle(retain_days: Optional[float] = None, db_path: Optional[str] = None) -> int:
+    """Kapanmış ve retain_days'ten eski çalışmaların olaylarını sil"""
+    retain_days = JOB_JOURNAL_CONFIG['retain_days'] if retain_days is None else retain_days
+    sinir = time.time() - retain_days * 86400
+    conn = _baglanti(db_path)
+    with conn:
+        cur = conn.execute(
+            'DELETE FROM events WHERE run_id IN ('
+            '  SELECT e.run_id FROM events e '
+            '  JOIN (SELECT run_id, MAX(id) AS id FROM events WHERE stage = ? GROUP BY run_id) son '
+            '  ON e.id = son.id WHERE e.status != ? AND e.ts < ?)',
+            (STAGE_RUN, STATUS_STARTED, sinir)
+        )
+    return cur.rowcount
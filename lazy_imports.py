@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LAZY IMPORTS - İhtiyaç Anında Modül Yükleme
+Alt sistemler (GPU algılama, YouTube optimizasyon, humanization) ilk
+kullanıldıkları anda yüklenir; başlangıçta sadece varlıkları kontrol edilir.
+"""
+
+import time
+import logging
+import importlib
+import importlib.util
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Yükleme süreleri (benchmark raporu için): {modül: saniye}
+LOAD_TIMES: Dict[str, float] = {}
+
+
+def module_available(name: str) -> bool:
+    """Modül import edilmeden bulunabiliyor mu"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """
+    İlk attribute erişiminde import edilen modül vekili
+
+    Args:
+        name: Modül adı
+        on_load: Yüklendikten sonra modülle çağrılır (init/log için)
+    """
+
+    def __init__(self, name: str, on_load: Optional[Callable[[Any], None]] = None):
+        self._name = name
+        self._on_load = on_load
+        self._module = None
+        self.available = module_available(name)
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        if self._module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self._name)
+            LOAD_TIMES[self._name] = time.perf_counter() - start
+            self._module = module
+            logger.debug(f"Lazy import: {self._name} ({LOAD_TIMES[self._name] * 1000:.1f} ms)")
+            if self._on_load:
+                self._on_load(module)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self.load(), attr)
+
+    def function(self, attr: str) -> Callable:
+        """Çağrıldığında modülü yükleyen fonksiyon vekili"""
+        lazy = self
+
+        def proxy(*args, **kwargs):
+            return getattr(lazy.load(), attr)(*args, **kwargs)
+
+        proxy.__name__ = attr
+        proxy.__qualname__ = attr
+        proxy.__doc__ = f"Lazy proxy for {self._name}.{attr}"
+        return proxy
+
+
+class LazyMapping(Mapping):
+    """
+    İlk okunduğunda factory ile hesaplanan salt-okunur dict
+
+    NVENC_INFO gibi pahalı algılamalar (ffmpeg/nvidia-smi çağrıları) için.
+    """
+
+    def __init__(self, factory: Callable[[], Dict], fallback: Optional[Dict] = None):
+        self._factory = factory
+        self._fallback = fallback
+        self._value = None
+
+    def _resolve(self) -> Dict:
+        if self._value is None:
+            try:
+                self._value = dict(self._factory())
+            except Exception as e:
+                if self._fallback is None:
+                    raise
+                logger.warning(f"⚠️ Lazy değer hesaplanamadı: {e}")
+                self._value = dict(self._fallback)
+        return self._value
+
+    @property
+    def resolved(self) -> bool:
+        return self._value is not None
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __repr__(self):
+        return repr(self._value) if self.resolved else '<LazyMapping (not resolved)>'
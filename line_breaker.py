@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LINE BREAKER - Ortak Dengeli Satır Kırma Motoru
+Altyazı satır kırma noktaları her aday bölme için satırları yeniden
+birleştirip ölçmek yerine tek seferde bulunur: kelime genişlikleri bir kez
+hesaplanır, satır genişlikleri prefix toplamlarından O(1) okunur ve en iyi
+1, 2 veya N satırlık bölünme dinamik programlama ile seçilir.
+
+Badness (Knuth-Plass benzeri): satır genişliklerinin karelerinin toplamı.
+Sabit satır sayısında toplam genişlik sabit olduğundan bu, satırları
+dengelemekle eşdeğerdir; 2 satırda |len1 - len2| en küçüklemesiyle aynı
+sonucu verir. max_genislik'i aşan satır geçersizdir.
+"""
+
+import math
+from typing import Callable, Dict, Hashable, List, Optional, Sequence
+
+
+def _prefix(genislikler: Sequence[float]) -> List[float]:
+    pos = [0.0]
+    for g in genislikler:
+        pos.append(pos[-1] + g)
+    return pos
+
+
+def _dp(pos: List[float], k: int, max_genislik: float, bosluk: float) -> Optional[List[int]]:
+    """Tam k satır için en iyi kırılım (satır başı indeksleri, ilk satır hariç)"""
+    n = len(pos) - 1
+
+    def genislik(i: int, j: int) -> float:
+        return pos[j] - pos[i] + bosluk * (j - i - 1)
+
+    # maliyet[m][j]: ilk j kelime m satırda; geri[m][j]: son satırın başlangıcı
+    maliyet = [[math.inf] * (n + 1) for _ in range(k + 1)]
+    geri = [[0] * (n + 1) for _ in range(k + 1)]
+    maliyet[0][0] = 0.0
+
+    for m in range(1, k + 1):
+        # Kalan satırların her birine en az bir kelime kalmalı
+        for j in range(m, n - (k - m) + 1):
+            en_iyi = math.inf
+            for i in range(m - 1, j):
+                onceki = maliyet[m - 1][i]
+                if onceki == math.inf:
+                    continue
+                g = genislik(i, j)
+                if g > max_genislik:
+                    continue
+                deger = onceki + g * g
+                if deger < en_iyi:
+                    en_iyi = deger
+                    geri[m][j] = i
+            maliyet[m][j] = en_iyi
+
+    if maliyet[k][n] == math.inf:
+        return None
+
+    kirilim = []
+    j = n
+    for m in range(k, 1, -1):
+        j = geri[m][j]
+        kirilim.append(j)
+    return kirilim[::-1]
+
+
+def en_iyi_kirilim(genislikler: Sequence[float], max_genislik: float = math.inf,
+                   max_satir: int = 2, bosluk: float = 1.0,
+                   satir_sayisi: Optional[int] = None, min_satir: int = 1) -> Optional[List[int]]:
+    """
+    En dengeli satır kırılımı
+
+    Args:
+        genislikler: Kelime genişlikleri (karakter veya piksel)
+        max_genislik: Satır başına üst sınır (kelimeler + aradaki boşluklar)
+        max_satir: satir_sayisi verilmezse, sığan en az satır (min_satir..max_satir) aranır
+        bosluk: Kelimeler arası boşluk genişliği
+        satir_sayisi: Tam olarak bu kadar satır
+        min_satir: Aramanın başladığı satır sayısı
+
+    Returns:
+        Yeni satırın başladığı kelime indeksleri ([] = tek satır),
+        sınırlara uyan bölünme yoksa None
+    """
+    n = len(genislikler)
+    if n == 0:
+        return []
+    pos = _prefix(genislikler)
+
+    adaylar = [satir_sayisi] if satir_sayisi else range(min_satir, max_satir + 1)
+    for k in adaylar:
+        if k > n:
+            break
+        kirilim = _dp(pos, k, max_genislik, bosluk)
+        if kirilim is not None:
+            return kirilim
+    return None
+
+
+def satirlara_bol(kelimeler: Sequence, kirilim: Sequence[int]) -> List[List]:
+    """Kırılım indekslerine göre kelime listesini satırlara ayır"""
+    sinirlar = [0, *kirilim, len(kelimeler)]
+    return [list(kelimeler[a:b]) for a, b in zip(sinirlar, sinirlar[1:])]
+
+
+def toplu_kirilim(kelime_listeleri: Sequence[Sequence[Hashable]],
+                  genislik_fn: Callable[[Hashable], float] = len,
+                  **kwargs) -> List[Optional[List[int]]]:
+    """
+    Bütün transkriptin segmentlerini tek çağrıda kır
+
+    Genişlik her benzersiz kelime için bir kez hesaplanır (transkriptte
+    aynı kelimeler tekrar tekrar geçer). kwargs → en_iyi_kirilim.
+    """
+    genislik_cache: Dict[Hashable, float] = {}
+
+    def genislik(kelime: Hashable) -> float:
+        deger = genislik_cache.get(kelime)
+        if deger is None:
+            deger = genislik_cache[kelime] = genislik_fn(kelime)
+        return deger
+
+    return [en_iyi_kirilim([genislik(k) for k in kelimeler], **kwargs) for kelimeler in kelime_listeleri]
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LOGGING SETUP - Asenkron ve İş Bazlı Loglama
+Tüm process'ler log kayıtlarını tek bir multiprocessing kuyruğuna koyar;
+diske ve konsola sadece ana process'teki QueueListener yazar. Worker'lar
+dosya açmaz, disk yazımında beklemez.
+
+Kayıtlar:
+    video_process.log         → tüm kayıtlar (rotasyonlu)
+    <log_dir>/<job_id>.log    → iş bağlamında üretilen kayıtlar (rotasyonlu)
+"""
+
+import os
+import atexit
+import logging
+import contextvars
+import multiprocessing
+import logging.handlers
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+try:
+    from config import RENDER_KLASORU
+except ImportError:
+    RENDER_KLASORU = os.getcwd()
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+LOGGING_CONFIG = {
+    'level': logging.INFO,
+    'format': '%(asctime)s - %(levelname)s - %(message)s',
+    'job_format': '%(asctime)s - %(processName)s - %(levelname)s - %(message)s',
+
+    # Ana log (tüm kayıtlar)
+    'main_log': 'video_process.log',
+
+    # İş logları: <log_dir>/<job_id>.log
+    'log_dir': os.path.join(RENDER_KLASORU, 'logs'),
+
+    # Rotasyon (ana ve iş logları)
+    'max_bytes': 5 * 1024 * 1024,
+    'backup_count': 3,
+
+    # Aynı anda açık tutulacak iş log dosyası sayısı
+    'max_open_job_logs': 16,
+}
+
+_job_id: contextvars.ContextVar = contextvars.ContextVar('log_job_id', default=None)
+
+_queue = None
+_listener = None
+
+
+# ============================================================================
+# 🏷️ İŞ BAĞLAMI
+# ============================================================================
+
+class JobContextFilter(logging.Filter):
+    """Kayda o anki iş kimliğini ekler (record.job_id)"""
+
+    def __init__(self, job_id: Optional[str] = None):
+        super().__init__()
+        self._sabit = job_id
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'job_id'):
+            record.job_id = self._sabit or _job_id.get()
+        return True
+
+
+def job_log_ayarla(job_id: Optional[str]) -> contextvars.Token:
+    """Bu thread'in bundan sonraki log kayıtları job_id ile işaretlenir"""
+    return _job_id.set(job_id)
+
+
+def job_log_sifirla(token: contextvars.Token) -> None:
+    _job_id.reset(token)
+
+
+@contextmanager
+def job_log_baglami(job_id: str) -> Iterator[None]:
+    """with bloğundaki log kayıtları job_id ile işaretlenir"""
+    token = job_log_ayarla(job_id)
+    try:
+        yield
+    finally:
+        job_log_sifirla(token)
+
+
+def aktif_job_id() -> Optional[str]:
+    return _job_id.get()
+
+
+class JobLogRouter(logging.Handler):
+    """job_id'li kayıtları iş başına rotasyonlu dosyaya yönlendirir"""
+
+    def __init__(self, log_dir: str):
+        super().__init__()
+        self._log_dir = log_dir
+        self._handlers: 'OrderedDict[str, logging.Handler]' = OrderedDict()
+        self.setFormatter(logging.Formatter(LOGGING_CONFIG['job_format']))
+
+    def _handler(self, job_id: str) -> logging.Handler:
+        handler = self._handlers.get(job_id)
+        if handler is not None:
+            self._handlers.move_to_end(job_id)
+            return handler
+
+        os.makedirs(self._log_dir, exist_ok=True)
+        safe_id = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in job_id)
+        handler = logging.handlers.RotatingFileHandler(
+            os.path.join(self._log_dir, f"{safe_id}.log"),
+            maxBytes=LOGGING_CONFIG['max_bytes'],
+            backupCount=LOGGING_CONFIG['backup_count'],
+            encoding='utf-8', delay=True
+        )
+        handler.setFormatter(self.formatter)
+        self._handlers[job_id] = handler
+
+        while len(self._handlers) > LOGGING_CONFIG['max_open_job_logs']:
+            _, eski = self._handlers.popitem(last=False)
+            eski.close()
+        return handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        job_id = getattr(record, 'job_id', None)
+        if not job_id:
+            return
+        try:
+            self._handler(job_id).handle(record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        for handler in self._handlers.values():
+            handler.close()
+        self._handlers.clear()
+        super().close()
+
+
+# ============================================================================
+# 🔧 KURULUM
+# ============================================================================
+
+def _kuyruk_handler(queue, job_id: Optional[str] = None) -> logging.Handler:
+    handler = logging.handlers.QueueHandler(queue)
+    handler.addFilter(JobContextFilter(job_id))
+    return handler
+
+
+def logging_kur(level: Optional[int] = None) -> None:
+    """
+    Ana process loglamasını kur (tekrar çağrılırsa bir şey yapmaz)
+
+    Worker process'lerde çağrılmamalı: onlar worker_logging_kur ile
+    ana process'in kuyruğuna bağlanır.
+    """
+    global _queue, _listener
+    if _listener is not None:
+        return
+
+    cfg = LOGGING_CONFIG
+    level = cfg['level'] if level is None else level
+    formatter = logging.Formatter(cfg['format'])
+
+    main_log = logging.handlers.RotatingFileHandler(
+        cfg['main_log'], maxBytes=cfg['max_bytes'], backupCount=cfg['backup_count'], encoding='utf-8'
+    )
+    console = logging.StreamHandler()
+    for handler in (main_log, console):
+        handler.setFormatter(formatter)
+
+    _queue = multiprocessing.Queue(-1)
+    _listener = logging.handlers.QueueListener(
+        _queue, main_log, console, JobLogRouter(cfg['log_dir']), respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(logging_durdur)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_kuyruk_handler(_queue))
+    root.setLevel(level)
+
+
+def logging_durdur() -> None:
+    """Kuyruktaki kayıtları yaz ve listener'ı durdur"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def log_kuyrugu():
+    """Worker'lara initargs olarak verilecek kuyruk (kurulmamışsa None)"""
+    return _queue
+
+
+def worker_logging_kur(queue, job_id: Optional[str] = None, level: Optional[int] = None) -> None:
+    """
+    ProcessPoolExecutor initializer'ı: worker'ın tüm logları kuyruğa gider
+
+    fork ile miras kalan dosya/konsol handler'ları kaldırılır.
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    if queue is not None:
+        root.addHandler(_kuyruk_handler(queue, job_id))
+    root.setLevel(LOGGING_CONFIG['level'] if level is None else level)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LOUDNESS - İki Geçişli Loudness Normalizasyonu
+Tek geçişli `loudnorm` dinamik modda çalışır: sinyali bilmeden kayan
+pencereyle kazanç ayarlar (yavaş, hedefe daha az isabetli). Bunun yerine
+anlatım dosyası bir kez ölçülür, ölçüm (I/TP/LRA/thresh) içerik hash'iyle
+saklanır ve render geçişinde `loudnorm` lineer modda ölçülen değerlerle
+çalışır. Aynı ses tekrar render edilirse analiz tamamen atlanır.
+
+Cache: <CACHE_KLASORU>/loudness.json
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+import subprocess
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import CACHE_KLASORU
+except ImportError:
+    CACHE_KLASORU = os.path.join(os.getcwd(), '.cache')
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+LOUDNESS_CONFIG = {
+    'enabled': True,
+    'cache_path': os.path.join(CACHE_KLASORU, 'loudness.json'),
+    'max_entries': 500,
+    'timeout': 600,
+    'hash_block_bytes': 1024 * 1024,
+}
+
+_OLCUM_ALANLARI = ('input_i', 'input_tp', 'input_lra', 'input_thresh', 'target_offset')
+
+_lock = threading.Lock()
+
+
+# ============================================================================
+# 🔑 CACHE
+# ============================================================================
+
+def icerik_hash(path: str) -> str:
+    """Dosya içeriğinin SHA-256'sı"""
+    blok = LOUDNESS_CONFIG['hash_block_bytes']
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for parca in iter(lambda: f.read(blok), b''):
+            h.update(parca)
+    return h.hexdigest()
+
+
+def _cache_oku() -> Dict:
+    try:
+        with open(LOUDNESS_CONFIG['cache_path'], 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _cache_yaz(cache: Dict) -> None:
+    path = LOUDNESS_CONFIG['cache_path']
+    if len(cache) > LOUDNESS_CONFIG['max_entries']:
+        # En eski ölçümler düşer (insertion order = ölçüm sırası)
+        for anahtar in list(cache)[:len(cache) - LOUDNESS_CONFIG['max_entries']]:
+            del cache[anahtar]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def _anahtar(digest: str, on_filtre: str, hedef: Dict) -> str:
+    return f"{digest}|{on_filtre}|{hedef['I']}|{hedef['TP']}|{hedef['LRA']}"
+
+
+# ============================================================================
+# 📏 ÖLÇÜM
+# ============================================================================
+
+def _json_blok(stderr: str) -> Dict:
+    """loudnorm'un stderr'e yazdığı son JSON bloğu"""
+    bas = stderr.rfind('{')
+    bit = stderr.rfind('}')
+    if bas == -1 or bit < bas:
+        raise RuntimeError("loudnorm ölçümü okunamadı")
+    return json.loads(stderr[bas:bit + 1])
+
+
+def olc(path: str, on_filtre: str, hedef: Dict) -> Dict:
+    """
+    Birinci geçiş: sesi loudnorm ile analiz et (çıktı atılır)
+
+    Args:
+        on_filtre: loudnorm'dan önce render'da da uygulanan filtreler ('' = yok)
+        hedef: {'I', 'TP', 'LRA'}
+
+    Returns:
+        {'input_i', 'input_tp', 'input_lra', 'input_thresh', 'target_offset'} (float)
+    """
+    filtre = f"loudnorm=I={hedef['I']}:TP={hedef['TP']}:LRA={hedef['LRA']}:print_format=json"
+    if on_filtre:
+        filtre = f"{on_filtre},{filtre}"
+    komut = ['ffmpeg', '-hide_banner', '-nostdin', '-i', path,
+             '-map', '0:a:0', '-af', filtre, '-f', 'null', '-']
+    sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                           text=True, timeout=LOUDNESS_CONFIG['timeout'])
+    if sonuc.returncode != 0:
+        raise RuntimeError(f"Loudness ölçümü başarısız: {sonuc.stderr[-200:]}")
+
+    veri = _json_blok(sonuc.stderr)
+    olcum = {alan: float(veri[alan]) for alan in _OLCUM_ALANLARI}
+    # Sessiz dosya: -inf ölçümü lineer modda kullanılamaz
+    if any(v != v or v in (float('inf'), float('-inf')) for v in olcum.values()):
+        raise RuntimeError(f"Geçersiz loudness ölçümü: {olcum}")
+    return olcum
+
+
+def olcum_al(path: str, hedef: Dict, on_filtre: str = '') -> Optional[Dict]:
+    """
+    Cache'lenmiş ölçüm (yoksa ölç ve kaydet); ölçülemezse None
+
+    Aynı içerik + ön filtre + hedef için analiz bir kez yapılır; on_filtre
+    deterministik olmalı (rastgele parametreli zincir her render'da cache'i kaçırır).
+    """
+    if not LOUDNESS_CONFIG['enabled']:
+        return None
+    try:
+        anahtar = _anahtar(icerik_hash(path), on_filtre, hedef)
+    except OSError as e:
+        logger.warning(f"⚠️ Loudness: dosya okunamadı: {e}")
+        return None
+
+    with _lock:
+        olcum = _cache_oku().get(anahtar)
+    if olcum:
+        logger.info(f"🔊 Loudness ölçümü cache'ten: I={olcum['input_i']:.1f} LUFS")
+        return olcum
+
+    try:
+        olcum = olc(path, on_filtre, hedef)
+    except (RuntimeError, OSError, ValueError, KeyError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"⚠️ Loudness ölçülemedi, tek geçişli loudnorm kullanılacak: {e}")
+        return None
+
+    with _lock:
+        cache = _cache_oku()
+        cache[anahtar] = olcum
+        try:
+            _cache_yaz(cache)
+        except OSError as e:
+            logger.debug(f"Loudness cache yazılamadı: {e}")
+
+    logger.info(f"🔊 Loudness ölçüldü: I={olcum['input_i']:.1f} LUFS, TP={olcum['input_tp']:.1f} dBTP, "
+                f"LRA={olcum['input_lra']:.1f}")
+    return olcum
+
+
+def loudnorm_filtresi(hedef: Dict, olcum: Optional[Dict] = None) -> str:
+    """
+    Render geçişinin loudnorm filtresi
+
+    Ölçüm varsa lineer mod (sabit kazanç; TP sınırı aşılacaksa ffmpeg
+    kendisi dinamik moda düşer), yoksa tek geçişli dinamik mod.
+    """
+    filtre = f"loudnorm=I={hedef['I']}:TP={hedef['TP']}:LRA={hedef['LRA']}"
+    if not olcum:
+        return filtre
+    return (
+        f"{filtre}:"
+        f"measured_I={olcum['input_i']:.2f}:"
+        f"measured_TP={olcum['input_tp']:.2f}:"
+        f"measured_LRA={olcum['input_lra']:.2f}:"
+        f"measured_thresh={olcum['input_thresh']:.2f}:"
+        f"offset={olcum['target_offset']:.2f}:"
+        f"linear=true"
+    )
@@ -21,22 +21,39 @@ import multiprocessing
 import hashlib
 import logging
 import glob
+import re
 from pathlib import Path
 from datetime import datetime, timedelta
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import shutil
 
-# ==================== LOGGING SETUP (İLK ÖNCE!) ====================
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('video_process.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# ==================== LOGGING SETUP ====================
+# Ana process: kuyruk + QueueListener (rotasyonlu ana log, iş logları, konsol)
+# Worker process'ler: parallel_encode'daki initializer kuyruğa bağlar
+# Kurulum import'ta değil giriş noktalarında (loglama_baslat): import yan etkisiz
+try:
+    from logging_setup import logging_kur, worker_logging_kur, log_kuyrugu, job_log_ayarla, job_log_sifirla, aktif_job_id
+    LOGGING_SETUP_AVAILABLE = True
+except ImportError:
+    LOGGING_SETUP_AVAILABLE = False
 logger = logging.getLogger(__name__)
 
+
+def loglama_baslat():
+    """Ana process loglamasını kur (main(), batch ve kalibrasyon girişlerinden çağrılır)"""
+    if LOGGING_SETUP_AVAILABLE:
+        logging_kur()
+        return
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler('video_process.log', encoding='utf-8'),
+                logging.StreamHandler()
+            ]
+        )
+
 # Import config files
 from config import *
 from effects import CINEMATIC_EFFECTS, TRANSITION_EFFECTS, ADVANCED_CONFIG, DYNAMIC_SUBTITLE_CONFIG
@@ -46,87 +63,312 @@ from error_handler import (
     PartialSuccessTracker,
     parse_ffmpeg_error,
     retry_on_failure,
+    RetryAction,
+    classify_exception,
+    ffmpeg_retry_policy,
 )
 
+# ==================== 📐 LINE BREAKER (Ortak dengeli satır kırma motoru) ====================
+from line_breaker import en_iyi_kirilim, satirlara_bol
+
+# ==================== 💤 LAZY IMPORTS (Alt sistemler ilk kullanımda yüklenir) ====================
+# Başlangıçta sadece modüllerin varlığı kontrol edilir; import, init ve
+# NVENC algılama (ffmpeg/nvidia-smi çağrıları) ilk kullanıma ertelenir.
+# ProcessPoolExecutor worker'ları main'i yeniden import ettiğinde de geçerli.
+from lazy_imports import LazyModule, LazyMapping
+
 # ==================== 🚀 FFMPEG HUMANIZATION V2.0 ====================
-try:
-    from ffmpeg_humanization import (
-        build_complete_ffmpeg_params,
-        init_encoding_log,
-        encoding_stats,
-        print_encoding_dashboard,
-        detect_available_encoders,
-    )
-    FFMPEG_HUMANIZATION_AVAILABLE = True
-    logger.info("✅ FFmpeg Humanization V2.0 loaded (18 features)")
-except ImportError as e:
-    FFMPEG_HUMANIZATION_AVAILABLE = False
-    logger.warning(f"⚠️ FFmpeg Humanization V2.0 not available: {e}")
+_ffmpeg_humanization = LazyModule(
+    'ffmpeg_humanization',
+    on_load=lambda m: logger.info("✅ FFmpeg Humanization V2.0 loaded (18 features)")
+)
+FFMPEG_HUMANIZATION_AVAILABLE = _ffmpeg_humanization.available
+if FFMPEG_HUMANIZATION_AVAILABLE:
+    build_complete_ffmpeg_params = _ffmpeg_humanization.function('build_complete_ffmpeg_params')
+    init_encoding_log = _ffmpeg_humanization.function('init_encoding_log')
+    print_encoding_dashboard = _ffmpeg_humanization.function('print_encoding_dashboard')
+    detect_available_encoders = _ffmpeg_humanization.function('detect_available_encoders')
+else:
+    logger.warning("⚠️ FFmpeg Humanization V2.0 not available: ffmpeg_humanization bulunamadı")
 
 # ==================== 🎙️ AUDIO HUMANİZATION MODÜLÜ ====================
-try:
-    from audio_humanization import (
-        build_humanized_audio_filter,
-        init_audio_log,
-        AUDIO_HUMANIZATION_CONFIG,
-    )
-    AUDIO_HUMANIZATION_AVAILABLE = True
-    logger.info("✅ Audio Humanization V1.0 loaded (ElevenLabs → Real Voice)")
-except ImportError as e:
-    AUDIO_HUMANIZATION_AVAILABLE = False
-    logger.warning(f"⚠️ Audio Humanization not available: {e}")
+_audio_humanization = LazyModule(
+    'audio_humanization',
+    on_load=lambda m: logger.info("✅ Audio Humanization V1.0 loaded (ElevenLabs → Real Voice)")
+)
+AUDIO_HUMANIZATION_AVAILABLE = _audio_humanization.available
+if AUDIO_HUMANIZATION_AVAILABLE:
+    build_humanized_audio_filter = _audio_humanization.function('build_humanized_audio_filter')
+    init_audio_log = _audio_humanization.function('init_audio_log')
+else:
+    logger.warning("⚠️ Audio Humanization not available: audio_humanization bulunamadı")
 
 # ==================== 🚀 GPU OPTIMIZER V1.0 (NVENC Hardware Acceleration) ====================
-try:
-    from gpu_optimizer import (
-        detect_nvenc_support,
-        get_optimal_encoding_params,
-        translate_x264_to_nvenc,
-        get_hardware_accel_params,
-        monitor_gpu_performance,
-        init_gpu_log,
-    )
-    GPU_OPTIMIZER_AVAILABLE = True
+# Initialize GPU logging (reduced verbosity for parallel workers)
+_gpu_optimizer = LazyModule('gpu_optimizer', on_load=lambda m: m.init_gpu_log('WARNING'))
+GPU_OPTIMIZER_AVAILABLE = _gpu_optimizer.available
 
-    # Initialize GPU logging (reduced verbosity for parallel workers)
-    init_gpu_log('WARNING')  # Only show warnings/errors, not INFO
 
-    # Detect NVENC on startup
-    NVENC_INFO = detect_nvenc_support()
+def _nvenc_algila():
+    """NVENC algılama (NVENC_INFO ilk okunduğunda bir kez çalışır)"""
+    info = _gpu_optimizer.detect_nvenc_support()
 
-    if NVENC_INFO['available']:
+    if info['available']:
         logger.info("✅ GPU Optimizer V1.0 loaded")
-        logger.info(f"✅ NVENC ready: {NVENC_INFO['gpu_name']} (v{NVENC_INFO.get('nvenc_version', 'N/A')})")
+        logger.info(f"✅ NVENC ready: {info['gpu_name']} (v{info.get('nvenc_version', 'N/A')})")
         logger.info("✅ Expected speedup: 5-10x faster encoding")
     else:
-        logger.info(f"⚠️ GPU Optimizer loaded (NVENC unavailable: {NVENC_INFO['reason']})")
+        logger.info(f"⚠️ GPU Optimizer loaded (NVENC unavailable: {info['reason']})")
         logger.info("ℹ️ Will use CPU encoding (libx264)")
+    return info
 
-except ImportError as e:
-    GPU_OPTIMIZER_AVAILABLE = False
+
+if GPU_OPTIMIZER_AVAILABLE:
+    detect_nvenc_support = _gpu_optimizer.function('detect_nvenc_support')
+    get_optimal_encoding_params = _gpu_optimizer.function('get_optimal_encoding_params')
+    translate_x264_to_nvenc = _gpu_optimizer.function('translate_x264_to_nvenc')
+    get_hardware_accel_params = _gpu_optimizer.function('get_hardware_accel_params')
+    monitor_gpu_performance = _gpu_optimizer.function('monitor_gpu_performance')
+
+    # Detect NVENC on first use
+    NVENC_INFO = LazyMapping(_nvenc_algila, fallback={'available': False, 'reason': 'Detection failed'})
+else:
     NVENC_INFO = {'available': False, 'reason': 'Module not found'}
-    logger.warning(f"⚠️ GPU Optimizer not available: {e}")
+    logger.warning("⚠️ GPU Optimizer not available: gpu_optimizer bulunamadı")
     logger.info("ℹ️ Will use CPU encoding (libx264)")
 
 # ==================== 🚀 YOUTUBE OPTİMİZASYON MODÜLLERİ ====================
+_youtube_optimization = LazyModule(
+    'youtube_optimization_addon',
+    on_load=lambda m: logger.info("✅ YouTube optimizasyon modülü yüklendi")
+)
+YOUTUBE_OPTIMIZATION_ENABLED = _youtube_optimization.available
+if YOUTUBE_OPTIMIZATION_ENABLED:
+    post_render_quality_check = _youtube_optimization.function('post_render_quality_check')
+    enhanced_metadata_injection = _youtube_optimization.function('enhanced_metadata_injection')
+    generate_video_fingerprint = _youtube_optimization.function('generate_video_fingerprint')
+    save_fingerprint_database = _youtube_optimization.function('save_fingerprint_database')
+    apply_effect_balancing = _youtube_optimization.function('apply_effect_balancing')
+    suggest_upload_time = _youtube_optimization.function('suggest_upload_time')
+    apply_youtube_optimizations = _youtube_optimization.function('apply_youtube_optimizations')
+    generate_optimization_report = _youtube_optimization.function('generate_optimization_report')
+else:
+    logger.warning("⚠️  YouTube optimizasyon modülü yüklenemedi: youtube_optimization_addon bulunamadı")
+    logger.warning("⚠️  Program normal modda çalışacak")
+
+# ==================== ⏱️ RENDER BUDGET (Maliyet bazlı efekt seçimi) ====================
 try:
-    from youtube_optimization_addon import (
-        post_render_quality_check,
-        enhanced_metadata_injection,
-        generate_video_fingerprint,
-        save_fingerprint_database,
-        apply_effect_balancing,
-        suggest_upload_time,
-        apply_youtube_optimizations,
-        generate_optimization_report
+    from render_budget import (
+        RENDER_BUDGET_CONFIG,
+        butce_ms_hesapla,
+        maliyet_tablosu_yukle,
+        kombinasyon_maliyeti,
+        kalibrasyon_yap,
     )
+    RENDER_BUDGET_AVAILABLE = True
+except ImportError as e:
+    RENDER_BUDGET_AVAILABLE = False
+    logger.warning(f"⚠️ Render budget modülü yüklenemedi: {e}")
 
-    YOUTUBE_OPTIMIZATION_ENABLED = True
-    logger.info("✅ YouTube optimizasyon modülü yüklendi")
+# ==================== 🧩 FILTER GRAPH OPTIMIZER (Gereksiz aşamaları birleştir) ====================
+try:
+    from filter_graph_optimizer import (
+        FILTER_GRAPH_OPTIMIZER_CONFIG,
+        optimize_filter_graph,
+        count_stages,
+    )
+    FILTER_GRAPH_OPTIMIZER_AVAILABLE = True
 except ImportError as e:
-    logger.warning(f"⚠️  YouTube optimizasyon modülü yüklenemedi: {e}")
-    logger.warning("⚠️  Program normal modda çalışacak")
-    YOUTUBE_OPTIMIZATION_ENABLED = False
+    FILTER_GRAPH_OPTIMIZER_AVAILABLE = False
+    logger.warning(f"⚠️ Filter graph optimizer yüklenemedi: {e}")
+
+# ==================== 📈 EFFECT TRACKS (İfadesiz zaman değişimli efektler) ====================
+try:
+    from effect_tracks import (
+        EFFECT_TRACKS_CONFIG,
+        shake_crop_filters,
+    )
+    EFFECT_TRACKS_AVAILABLE = True
+except ImportError as e:
+    EFFECT_TRACKS_AVAILABLE = False
+    logger.warning(f"⚠️ Effect tracks modülü yüklenemedi: {e}")
+
+# ==================== 🔀 TRANSITION PLANNER (Tek geçişte geçiş planı) ====================
+try:
+    from transition_planner import (
+        TRANSITION_PLANNER_CONFIG,
+        gecis_sec,
+        gecis_plani_olustur,
+        grup_plani_olustur,
+        offsetleri_hesapla,
+        plan_dogrula,
+        plan_suresi,
+        xfade_filter_complex,
+    )
+    TRANSITION_PLANNER_AVAILABLE = True
+except ImportError as e:
+    TRANSITION_PLANNER_AVAILABLE = False
+    logger.warning(f"⚠️ Transition planner yüklenemedi: {e}")
+
+# ==================== 🎯 SIZE TARGETING (Tek geçişli hedef boyut) ====================
+try:
+    from size_targeting import (
+        SIZE_TARGETING_CONFIG,
+        hedef_video_kbps,
+        crf_tahmin_et,
+        duzeltilmis_crf,
+        vbv_ayarlari,
+        boyut_raporu,
+    )
+    SIZE_TARGETING_AVAILABLE = True
+except ImportError as e:
+    SIZE_TARGETING_AVAILABLE = False
+    logger.warning(f"⚠️ Size targeting modülü yüklenemedi: {e}")
+
+# ==================== ⚡ PARALLEL COMPRESS (Segment paralel sıkıştırma) ====================
+try:
+    from parallel_compress import PARALLEL_COMPRESS_CONFIG, paralel_sikistir
+    PARALLEL_COMPRESS_AVAILABLE = True
+except ImportError as e:
+    PARALLEL_COMPRESS_AVAILABLE = False
+    logger.warning(f"⚠️ Parallel compress modülü yüklenemedi: {e}")
+
+# ==================== 📒 JOB JOURNAL (Devam ettirilebilir render) ====================
+try:
+    from job_journal import (
+        JOB_JOURNAL_CONFIG,
+        girdi_hash,
+        asama_tamamlandi,
+        asama_hatali,
+        dogrulanmis_cikti,
+        run_baslat,
+        run_bitir,
+        acik_run,
+    )
+    JOB_JOURNAL_AVAILABLE = True
+except ImportError as e:
+    JOB_JOURNAL_AVAILABLE = False
+    logger.warning(f"⚠️ Job journal modülü yüklenemedi: {e}")
+
+# ==================== 📦 CACHE STORE (İçerik adresli klip cache'i) ====================
+try:
+    import cache_store
+    from cache_store import CACHE_STORE_CONFIG
+    CACHE_STORE_AVAILABLE = True
+except ImportError as e:
+    CACHE_STORE_AVAILABLE = False
+    logger.warning(f"⚠️ Cache store modülü yüklenemedi: {e}")
+
+# ==================== 📊 TELEMETRY (Aşama bazlı süre ölçümü) ====================
+try:
+    from telemetry import (
+        span as telemetry_span,
+        span_ac as telemetry_span_ac,
+        span_kapat as telemetry_span_kapat,
+        run_baslat as telemetry_run_baslat,
+        run_bitir as telemetry_run_bitir,
+    )
+    TELEMETRY_AVAILABLE = True
+except ImportError as e:
+    TELEMETRY_AVAILABLE = False
+    logger.warning(f"⚠️ Telemetry modülü yüklenemedi: {e}")
+    from contextlib import nullcontext
+
+    def telemetry_span(stage, **attrs):
+        return nullcontext({'bytes': 0, 'subprocesses': 0})
+
+    def telemetry_span_ac(stage, **attrs):
+        return {'bytes': 0, 'subprocesses': 0}
+
+    def telemetry_span_kapat(veri, ok=True):
+        pass
+
+    def telemetry_run_baslat(run_id=None, **attrs):
+        return run_id
+
+    def telemetry_run_bitir(ok=True, **attrs):
+        pass
+
+# ==================== 🛫 PREFLIGHT (Render öncesi girdi doğrulaması) ====================
+try:
+    from preflight import PREFLIGHT_CONFIG, preflight_calistir, rapor_yazdir as preflight_rapor_yazdir
+    PREFLIGHT_AVAILABLE = True
+except ImportError as e:
+    PREFLIGHT_AVAILABLE = False
+    logger.warning(f"⚠️ Preflight modülü yüklenemedi: {e}")
+
+# ==================== 📝 SUBTITLE BURN (Segment paralel altyazı basma) ====================
+try:
+    from subtitle_burn import SUBTITLE_BURN_CONFIG, paralel_altyazi_bas
+    SUBTITLE_BURN_AVAILABLE = True
+except ImportError as e:
+    SUBTITLE_BURN_AVAILABLE = False
+    logger.warning(f"⚠️ Subtitle burn modülü yüklenemedi: {e}")
+
+# ==================== 🎞️ SUBTITLE OVERLAY (Önceden rasterize altyazı katmanı) ====================
+try:
+    from subtitle_overlay import overlay_hazirla, overlay_anahtari, overlay_filtresi
+    SUBTITLE_OVERLAY_AVAILABLE = True
+except ImportError as e:
+    SUBTITLE_OVERLAY_AVAILABLE = False
+    logger.warning(f"⚠️ Subtitle overlay modülü yüklenemedi: {e}")
+
+# ==================== 🔊 LOUDNESS (İki geçişli loudnorm, ölçüm cache'i) ====================
+try:
+    from loudness import LOUDNESS_CONFIG, olcum_al as loudness_olcum_al, loudnorm_filtresi
+    LOUDNESS_AVAILABLE = True
+except ImportError as e:
+    LOUDNESS_AVAILABLE = False
+    logger.warning(f"⚠️ Loudness modülü yüklenemedi: {e}")
+
+# ==================== 😊 EMOJI MATCHER (Derlenmiş anahtar kelime eşleştirici) ====================
+try:
+    from emoji_matcher import emoji_bul
+    EMOJI_MATCHER_AVAILABLE = True
+except ImportError as e:
+    EMOJI_MATCHER_AVAILABLE = False
+    logger.warning(f"⚠️ Emoji matcher modülü yüklenemedi: {e}")
+
+# ==================== 👁️ PROXY PREVIEW (Düşük çözünürlüklü önizleme) ====================
+try:
+    from proxy_preview import (
+        PROXY_PREVIEW_CONFIG, proxyleri_hazirla, pencere_sec, filtre_olcekle, proxy_boyutu
+    )
+    PROXY_PREVIEW_AVAILABLE = True
+except ImportError as e:
+    PROXY_PREVIEW_AVAILABLE = False
+    logger.warning(f"⚠️ Proxy preview modülü yüklenemedi: {e}")
+
+# ==================== 🧮 SCRATCH SPACE (RAM/disk ara dosya alanı) ====================
+try:
+    from scratch_space import (
+        SCRATCH_CONFIG, alan_ac as scratch_ac, alan_kapat as scratch_kapat,
+        dosya_yolu as scratch_yolu, olc as scratch_olc
+    )
+    SCRATCH_AVAILABLE = True
+except ImportError as e:
+    SCRATCH_AVAILABLE = False
+    logger.warning(f"⚠️ Scratch space modülü yüklenemedi: {e}")
+
+    def scratch_ac(job_id, disk_klasor):
+        return None
+
+    def scratch_kapat(disk_klasor):
+        return None
+
+    def scratch_yolu(disk_klasor, ad, tahmini_boyut=None):
+        return os.path.join(disk_klasor, ad)
+
+    def scratch_olc(disk_klasor):
+        return None
+
+# ==================== 🔀 STAGE PIPE (Ara dosya yerine boru aktarımı) ====================
+try:
+    from stage_pipe import STAGE_PIPE_CONFIG, boru_ile_calistir, uretici_cikisi, tuketici_girisi
+    STAGE_PIPE_AVAILABLE = True
+except ImportError as e:
+    STAGE_PIPE_AVAILABLE = False
+    logger.warning(f"⚠️ Stage pipe modülü yüklenemedi: {e}")
 
 # Import yeni config modülleri
 try:
@@ -340,9 +582,13 @@ def gpu_durumunu_tespit_et():
 
 # ==================== POST-RENDER SIKISTIRMA ====================
 
-def post_render_compress(input_path: str, target_size_mb: int = 500) -> bool:
+def post_render_compress(input_path: str, target_size_mb: int = 500, strategy: str = None) -> bool:
     """
     Render sonrası video sıkıştırma - Dosya boyutunu küçültür (İlerleme çubuğu ile)
+
+    Args:
+        strategy: 'single_pass' (örneklenmiş CRF + VBV) veya 'two_pass'
+                  (None = SIZE_TARGETING_CONFIG['strategy'])
     """
     import os
     import subprocess
@@ -379,8 +625,14 @@ def post_render_compress(input_path: str, target_size_mb: int = 500) -> bool:
     target_bitrate_kbps = int((target_size_mb * 8 * 1024 * 0.85) / duration)
     target_bitrate_kbps = max(target_bitrate_kbps, 1000)
 
-    # Tahmini süre hesapla (gerçek sürenin ~2-3 katı)
-    estimated_time_min = (duration / 60) * 2.5  # Her pass için ~1.25x
+    if strategy is None:
+        strategy = SIZE_TARGETING_CONFIG['strategy'] if SIZE_TARGETING_AVAILABLE else 'two_pass'
+    single_pass = strategy == 'single_pass' and SIZE_TARGETING_AVAILABLE
+    if single_pass:
+        target_bitrate_kbps = hedef_video_kbps(target_size_mb, duration)
+
+    # Tahmini süre hesapla (2-pass: gerçek sürenin ~2-3 katı, tek geçiş: ~1.3x)
+    estimated_time_min = (duration / 60) * (1.3 if single_pass else 2.5)  # Her pass için ~1.25x
     print(f"   📐 Video süresi: {duration/60:.1f} dakika")
     print(f"   📐 Hedef bitrate: {target_bitrate_kbps} kbps")
     print(f"   ⏱️  Tahmini süre: ~{estimated_time_min:.0f} dakika")
@@ -388,7 +640,7 @@ def post_render_compress(input_path: str, target_size_mb: int = 500) -> bool:
     output_path = input_path + '.compressed.mp4'
     pass_log = input_path + '_2pass'
 
-    def run_ffmpeg_with_progress(cmd, pass_num, total_duration):
+    def run_ffmpeg_with_progress(cmd, pass_num, total_duration, total_passes=2):
         """FFmpeg'i ilerleme çubuğu ile çalıştır"""
         process = subprocess.Popen(
             cmd,
@@ -424,11 +676,15 @@ def post_render_compress(input_path: str, target_size_mb: int = 500) -> bool:
                 else:
                     eta_str = "--:--"
 
-                print(f"\r   Pass {pass_num}/2 [{bar}] {progress*100:5.1f}% | ETA: {eta_str}  ", end='', flush=True)
+                print(f"\r   Pass {pass_num}/{total_passes} [{bar}] {progress*100:5.1f}% | ETA: {eta_str}  ", end='', flush=True)
 
         print()  # Yeni satır
         return process.returncode
 
+    if single_pass:
+        return _single_pass_compress(input_path, output_path, duration, target_size_mb,
+                                     target_bitrate_kbps, current_size_mb, run_ffmpeg_with_progress)
+
     try:
         # Pass 1 - Analiz
         print(f"\n   ⏳ Pass 1/2 - Analiz başlıyor...")
@@ -499,6 +755,102 @@ def post_render_compress(input_path: str, target_size_mb: int = 500) -> bool:
         return False
 
 
+def _single_pass_compress(input_path, output_path, duration, target_size_mb, target_kbps,
+                          current_size_mb, run_ffmpeg_with_progress):
+    """
+    Tek geçişli hedef boyut sıkıştırma (post_render_compress yardımcısı)
+
+    Örnek segmentlerden CRF tahmin edilir, tek encode CRF + VBV ile yapılır.
+    Sonuç tolerans dışındaysa ölçülen orana göre düzeltme encode'u yapılabilir.
+    """
+    cfg = SIZE_TARGETING_CONFIG
+
+    print(f"\n   🔬 Örnek segmentlerle CRF tahmini...")
+    tahmin = crf_tahmin_et(input_path, duration, target_kbps)
+    if not tahmin:
+        print(f"   ⚠️  CRF tahmini başarısız, 2-pass kullanılacak")
+        return post_render_compress(input_path, target_size_mb, strategy='two_pass')
+
+    olcum_str = ', '.join(f"CRF {crf}: {kbps:.0f} kbps" for crf, kbps in sorted(tahmin['measurements'].items()))
+    print(f"   📐 {tahmin['samples']} örnek → {olcum_str}")
+    print(f"   📐 Tahmini CRF: {tahmin['crf']}")
+
+    crf = tahmin['crf']
+    rapor = None
+
+    try:
+        for deneme in range(cfg['max_corrections'] + 1):
+            video_args = ['-c:v', 'libx264', '-preset', cfg['preset'], '-crf', str(crf)] + vbv_ayarlari(target_kbps)
+            audio_args = ['-c:a', 'aac', '-b:a', f"{cfg['audio_bitrate_kbps']}k"]
+
+            returncode = None
+            if (PARALLEL_COMPRESS_AVAILABLE and PARALLEL_COMPRESS_CONFIG['enabled'] and
+                    duration >= PARALLEL_COMPRESS_CONFIG['min_chunk_seconds'] * 2):
+                print(f"\n   ⏳ Segment paralel encode (CRF {crf})...")
+
+                def parca_ilerleme(tamamlanan, toplam):
+                    print(f"\r   ⚡ Parçalar: {tamamlanan}/{toplam}  ", end='', flush=True)
+
+                basarili, hata = paralel_sikistir(input_path, output_path, duration,
+                                                  video_args, audio_args, parca_ilerleme)
+                print()
+                if basarili:
+                    returncode = 0
+                else:
+                    logger.warning(f"⚠️ Paralel sıkıştırma başarısız, tek parça encode: {hata}")
+                    if os.path.exists(output_path):
+                        os.remove(output_path)
+
+            if returncode is None:
+                print(f"\n   ⏳ Tek geçiş encode (CRF {crf})...")
+                cmd = ['ffmpeg', '-y', '-i', input_path] + video_args + audio_args + [
+                    '-movflags', '+faststart',
+                    output_path
+                ]
+                returncode = run_ffmpeg_with_progress(cmd, 1, duration, total_passes=1)
+
+            if returncode != 0 or not os.path.exists(output_path):
+                print(f"\n   ❌ Sıkıştırma başarısız")
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+                return False
+
+            new_size_mb = os.path.getsize(output_path) / (1024 * 1024)
+            rapor = boyut_raporu(new_size_mb, target_size_mb)
+            if rapor['within_tolerance'] or deneme == cfg['max_corrections']:
+                break
+
+            crf = duzeltilmis_crf(crf, new_size_mb, target_size_mb)
+            print(f"   ↻ {new_size_mb:.0f} MB tolerans dışında (%{rapor['deviation'] * 100:+.1f}), CRF {crf} ile düzeltiliyor")
+
+        durum = "✅ tolerans içinde" if rapor['within_tolerance'] else "⚠️ tolerans dışında"
+        print(f"\n   🎯 Hedef: {target_size_mb} MB | Ulaşılan: {rapor['achieved_mb']:.0f} MB "
+              f"(%{rapor['deviation'] * 100:+.1f}, ±%{rapor['tolerance'] * 100:.0f}) {durum}")
+        logger.info(f"Tek geçiş sıkıştırma: CRF {crf}, {rapor}")
+
+        if new_size_mb < current_size_mb:
+            os.remove(input_path)
+            shutil.move(output_path, input_path)
+
+            reduction = ((current_size_mb - new_size_mb) / current_size_mb) * 100
+            print(f"\n   ✅ Sıkıştırma başarılı!")
+            print(f"   📊 Yeni boyut: {new_size_mb:.0f} MB (-%{reduction:.0f})")
+            return True
+
+        os.remove(output_path)
+        print(f"\n   ⚠️  Sıkıştırma fayda sağlamadı, orijinal korunuyor")
+        return False
+
+    except Exception as e:
+        print(f"\n   ❌ Sıkıştırma hatası: {e}")
+        if os.path.exists(output_path):
+            try:
+                os.remove(output_path)
+            except:
+                pass
+        return False
+
+
 # ==================== FONT SEÇİM SİSTEMİ ====================
 
 def font_secim_menusu():
@@ -572,7 +924,207 @@ def font_secim_menusu():
 
 # ==================== EFEKT SEÇİM SİSTEMİ ====================
 
-def akilli_efekt_secimi():
+# ===== 🎨 EFEKT KATEGORİLERİ VE ÖZELLİKLERİ =====
+# performans: render maliyeti kategorisi (ölçüm yoksa render_budget tahmini için kullanılır)
+EFEKT_OZELLIKLERI = {
+    # HAFIF EFEKTLER (her kombinasyonda kullanılabilir)
+    'sharpen_boost': {
+        'kategori': ['modern', 'quality'],
+        'yogunluk': 'hafif',
+        'performans': 'hafif',
+        'tip': 'quality',
+        'uyumluluk_skoru': 10  # Yüksek = her şeyle uyumlu
+    },
+    'vignette_advanced': {
+        'kategori': ['modern', 'cinematic'],
+        'yogunluk': 'hafif',
+        'performans': 'hafif',
+        'tip': 'overlay',
+        'uyumluluk_skoru': 10
+    },
+    'dream_glow': {
+        'kategori': ['modern', 'soft'],
+        'yogunluk': 'hafif',
+        'performans': 'orta',
+        'tip': 'color',
+        'uyumluluk_skoru': 9
+    },
+    'color_grading': {
+        'kategori': ['modern', 'cinematic'],
+        'yogunluk': 'hafif',
+        'performans': 'hafif',
+        'tip': 'color',
+        'uyumluluk_skoru': 10
+    },
+    'motion_blur': {
+        'kategori': ['modern', 'motion'],
+        'yogunluk': 'hafif',
+        'performans': 'orta',
+        'tip': 'motion',
+        'uyumluluk_skoru': 9
+    },
+    'light_leaks': {
+        'kategori': ['modern', 'cinematic'],
+        'yogunluk': 'hafif',
+        'performans': 'hafif',
+        'tip': 'overlay',
+        'uyumluluk_skoru': 9
+    },
+
+    # ORTA EFEKTLER (dikkatli kullanılmalı)
+    'camera_shake': {
+        'kategori': ['modern', 'motion'],
+        'yogunluk': 'orta',
+        'performans': 'hafif',
+        'tip': 'motion',
+        'uyumluluk_skoru': 8
+    },
+    'zoom_pulse': {
+        'kategori': ['modern', 'motion'],
+        'yogunluk': 'orta',
+        'performans': 'hafif',
+        'tip': 'motion',
+        'uyumluluk_skoru': 8
+    },
+    'lens_distortion': {
+        'kategori': ['modern', 'distortion'],
+        'yogunluk': 'orta',
+        'performans': 'orta',
+        'tip': 'distortion',
+        'uyumluluk_skoru': 7
+    },
+    'chromatic_aberration': {
+        'kategori': ['modern', 'color'],
+        'yogunluk': 'orta',
+        'performans': 'orta',
+        'tip': 'color',
+        'uyumluluk_skoru': 8
+    },
+    'neon_glow': {
+        'kategori': ['modern', 'color'],
+        'yogunluk': 'orta',
+        'performans': 'orta',
+        'tip': 'color',
+        'uyumluluk_skoru': 8
+    },
+    'velocity_ramp': {
+        'kategori': ['modern', 'motion'],
+        'yogunluk': 'orta',
+        'performans': 'orta',
+        'tip': 'motion',
+        'uyumluluk_skoru': 9
+    },
+    'ghost_trail': {
+        'kategori': ['modern', 'motion'],
+        'yogunluk': 'orta',
+        'performans': 'agir',
+        'tip': 'motion',
+        'uyumluluk_skoru': 7
+    },
+    'overlay_particles': {
+        'kategori': ['modern', 'overlay'],
+        'yogunluk': 'orta',
+        'performans': 'orta',
+        'tip': 'overlay',
+        'uyumluluk_skoru': 8
+    },
+
+    # AĞIR EFEKTLER (sınırlı kullanım)
+    'glitch': {
+        'kategori': ['digital', 'distortion'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'distortion',
+        'uyumluluk_skoru': 6
+    },
+    'datamosh': {
+        'kategori': ['digital', 'distortion'],
+        'yogunluk': 'agir',
+        'performans': 'agir',
+        'tip': 'distortion',
+        'uyumluluk_skoru': 5
+    },
+    'pixelate': {
+        'kategori': ['digital', 'distortion'],
+        'yogunluk': 'agir',
+        'performans': 'hafif',
+        'tip': 'distortion',
+        'uyumluluk_skoru': 6
+    },
+    'posterize': {
+        'kategori': ['artistic', 'color'],
+        'yogunluk': 'agir',
+        'performans': 'hafif',
+        'tip': 'color',
+        'uyumluluk_skoru': 6
+    },
+    'edge_detect': {
+        'kategori': ['artistic', 'distortion'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'distortion',
+        'uyumluluk_skoru': 5
+    },
+    'mirror_kaleidoscope': {
+        'kategori': ['artistic', 'distortion'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'distortion',
+        'uyumluluk_skoru': 5
+    },
+    'solarize': {
+        'kategori': ['artistic', 'color'],
+        'yogunluk': 'agir',
+        'performans': 'hafif',
+        'tip': 'color',
+        'uyumluluk_skoru': 6
+    },
+    'halftone': {
+        'kategori': ['retro', 'artistic'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'artistic',
+        'uyumluluk_skoru': 6
+    },
+    'vhs_advanced': {
+        'kategori': ['retro', 'distortion'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'distortion',
+        'uyumluluk_skoru': 7
+    },
+    'prism': {
+        'kategori': ['artistic', 'color'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'color',
+        'uyumluluk_skoru': 6
+    },
+    'rgb_split_advanced': {
+        'kategori': ['digital', 'color'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'color',
+        'uyumluluk_skoru': 7
+    },
+    'shake_advanced': {
+        'kategori': ['modern', 'motion'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'motion',
+        'uyumluluk_skoru': 7
+    },
+    'vintage_styles': {
+        'kategori': ['retro', 'color'],
+        'yogunluk': 'agir',
+        'performans': 'orta',
+        'tip': 'color',
+        'uyumluluk_skoru': 7
+    },
+}
+
+
+def akilli_efekt_secimi(hedef_fps=None, dakika_basina_butce_sn=None):
     """🧠 Akıllı Efekt Seçimi - Her video için uyumlu rastgele efektler seçer (2-10 adet)
 
     Algoritma:
@@ -580,205 +1132,28 @@ def akilli_efekt_secimi():
     - Efektlerin uyumluluğunu kontrol eder
     - Ağır efektleri dengeleyerek performansı optimize eder
     - Görsel uyumu sağlar (renk, hareket, distorsiyon dengesi)
+    - ⏱️ Render bütçesi verildiyse toplam ölçülmüş maliyeti bütçe içinde tutar
+
+    Args:
+        hedef_fps: Hedef render hızı (None = RENDER_BUDGET_CONFIG)
+        dakika_basina_butce_sn: Çıktı dakikası başına render süresi (None = RENDER_BUDGET_CONFIG)
     """
 
     # ===== 🎨 EFEKT KATEGORİLERİ VE ÖZELLİKLERİ =====
-    efekt_ozellikleri = {
-        # HAFIF EFEKTLER (her kombinasyonda kullanılabilir)
-        'sharpen_boost': {
-            'kategori': ['modern', 'quality'],
-            'yogunluk': 'hafif',
-            'performans': 'hafif',
-            'tip': 'quality',
-            'uyumluluk_skoru': 10  # Yüksek = her şeyle uyumlu
-        },
-        'vignette_advanced': {
-            'kategori': ['modern', 'cinematic'],
-            'yogunluk': 'hafif',
-            'performans': 'hafif',
-            'tip': 'overlay',
-            'uyumluluk_skoru': 10
-        },
-        'dream_glow': {
-            'kategori': ['modern', 'soft'],
-            'yogunluk': 'hafif',
-            'performans': 'orta',
-            'tip': 'color',
-            'uyumluluk_skoru': 9
-        },
-        'color_grading': {
-            'kategori': ['modern', 'cinematic'],
-            'yogunluk': 'hafif',
-            'performans': 'hafif',
-            'tip': 'color',
-            'uyumluluk_skoru': 10
-        },
-        'motion_blur': {
-            'kategori': ['modern', 'motion'],
-            'yogunluk': 'hafif',
-            'performans': 'orta',
-            'tip': 'motion',
-            'uyumluluk_skoru': 9
-        },
-        'light_leaks': {
-            'kategori': ['modern', 'cinematic'],
-            'yogunluk': 'hafif',
-            'performans': 'hafif',
-            'tip': 'overlay',
-            'uyumluluk_skoru': 9
-        },
-
-        # ORTA EFEKTLER (dikkatli kullanılmalı)
-        'camera_shake': {
-            'kategori': ['modern', 'motion'],
-            'yogunluk': 'orta',
-            'performans': 'hafif',
-            'tip': 'motion',
-            'uyumluluk_skoru': 8
-        },
-        'zoom_pulse': {
-            'kategori': ['modern', 'motion'],
-            'yogunluk': 'orta',
-            'performans': 'hafif',
-            'tip': 'motion',
-            'uyumluluk_skoru': 8
-        },
-        'lens_distortion': {
-            'kategori': ['modern', 'distortion'],
-            'yogunluk': 'orta',
-            'performans': 'orta',
-            'tip': 'distortion',
-            'uyumluluk_skoru': 7
-        },
-        'chromatic_aberration': {
-            'kategori': ['modern', 'color'],
-            'yogunluk': 'orta',
-            'performans': 'orta',
-            'tip': 'color',
-            'uyumluluk_skoru': 8
-        },
-        'neon_glow': {
-            'kategori': ['modern', 'color'],
-            'yogunluk': 'orta',
-            'performans': 'orta',
-            'tip': 'color',
-            'uyumluluk_skoru': 8
-        },
-        'velocity_ramp': {
-            'kategori': ['modern', 'motion'],
-            'yogunluk': 'orta',
-            'performans': 'orta',
-            'tip': 'motion',
-            'uyumluluk_skoru': 9
-        },
-        'ghost_trail': {
-            'kategori': ['modern', 'motion'],
-            'yogunluk': 'orta',
-            'performans': 'agir',
-            'tip': 'motion',
-            'uyumluluk_skoru': 7
-        },
-        'overlay_particles': {
-            'kategori': ['modern', 'overlay'],
-            'yogunluk': 'orta',
-            'performans': 'orta',
-            'tip': 'overlay',
-            'uyumluluk_skoru': 8
-        },
-
-        # AĞIR EFEKTLER (sınırlı kullanım)
-        'glitch': {
-            'kategori': ['digital', 'distortion'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'distortion',
-            'uyumluluk_skoru': 6
-        },
-        'datamosh': {
-            'kategori': ['digital', 'distortion'],
-            'yogunluk': 'agir',
-            'performans': 'agir',
-            'tip': 'distortion',
-            'uyumluluk_skoru': 5
-        },
-        'pixelate': {
-            'kategori': ['digital', 'distortion'],
-            'yogunluk': 'agir',
-            'performans': 'hafif',
-            'tip': 'distortion',
-            'uyumluluk_skoru': 6
-        },
-        'posterize': {
-            'kategori': ['artistic', 'color'],
-            'yogunluk': 'agir',
-            'performans': 'hafif',
-            'tip': 'color',
-            'uyumluluk_skoru': 6
-        },
-        'edge_detect': {
-            'kategori': ['artistic', 'distortion'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'distortion',
-            'uyumluluk_skoru': 5
-        },
-        'mirror_kaleidoscope': {
-            'kategori': ['artistic', 'distortion'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'distortion',
-            'uyumluluk_skoru': 5
-        },
-        'solarize': {
-            'kategori': ['artistic', 'color'],
-            'yogunluk': 'agir',
-            'performans': 'hafif',
-            'tip': 'color',
-            'uyumluluk_skoru': 6
-        },
-        'halftone': {
-            'kategori': ['retro', 'artistic'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'artistic',
-            'uyumluluk_skoru': 6
-        },
-        'vhs_advanced': {
-            'kategori': ['retro', 'distortion'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'distortion',
-            'uyumluluk_skoru': 7
-        },
-        'prism': {
-            'kategori': ['artistic', 'color'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'color',
-            'uyumluluk_skoru': 6
-        },
-        'rgb_split_advanced': {
-            'kategori': ['digital', 'color'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'color',
-            'uyumluluk_skoru': 7
-        },
-        'shake_advanced': {
-            'kategori': ['modern', 'motion'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'motion',
-            'uyumluluk_skoru': 7
-        },
-        'vintage_styles': {
-            'kategori': ['retro', 'color'],
-            'yogunluk': 'agir',
-            'performans': 'orta',
-            'tip': 'color',
-            'uyumluluk_skoru': 7
-        },
-    }
+    efekt_ozellikleri = EFEKT_OZELLIKLERI
+
+    # ===== ⏱️ RENDER BÜTÇESİ (ms/kare) =====
+    kare_butcesi_ms = None
+    maliyet_tablosu = None
+    if RENDER_BUDGET_AVAILABLE and RENDER_BUDGET_CONFIG.get('enabled', False):
+        if hedef_fps is None:
+            hedef_fps = RENDER_BUDGET_CONFIG.get('target_fps')
+        if dakika_basina_butce_sn is None:
+            dakika_basina_butce_sn = RENDER_BUDGET_CONFIG.get('budget_sec_per_min')
+        kare_butcesi_ms = butce_ms_hesapla(hedef_fps, dakika_basina_butce_sn)
+        if kare_butcesi_ms is not None:
+            # Ölçüm yoksa boş tablo → kategori tahminleri kullanılır
+            maliyet_tablosu = maliyet_tablosu_yukle()
 
     # ===== 🎲 RASTGELE EFEKT SAYISI BELİRLE (2-10) =====
     hedef_efekt_sayisi = random.randint(2, 10)
@@ -786,6 +1161,13 @@ def akilli_efekt_secimi():
     # ===== 🧮 UYUMLULUK KURALLARI =====
     def efekt_uyumlu_mu(secili_efektler, yeni_efekt):
         """İki efektin uyumlu olup olmadığını kontrol eder"""
+        # Kural 0: Render bütçesi (ilk efekt dahil)
+        if kare_butcesi_ms is not None:
+            toplam_maliyet = kombinasyon_maliyeti(list(secili_efektler) + [yeni_efekt],
+                                                  efekt_ozellikleri, maliyet_tablosu)
+            if toplam_maliyet > kare_butcesi_ms:
+                return False
+
         if not secili_efektler:
             return True
 
@@ -901,6 +1283,14 @@ def akilli_efekt_secimi():
     print(f"      • Orta efektler: {len(orta_secilen)}")
     print(f"      • Ağır efektler: {len(agir_secilen)}")
 
+    if kare_butcesi_ms is not None:
+        tahmini_maliyet = kombinasyon_maliyeti(secilen_efektler, efekt_ozellikleri, maliyet_tablosu)
+        kaynak = "ölçülmüş" if maliyet_tablosu and maliyet_tablosu.get('effects') else "kategori tahmini"
+        print(f"\n   ⏱️  Render bütçesi: {kare_butcesi_ms:.1f} ms/kare ({kaynak})")
+        print(f"      • Tahmini maliyet: {tahmini_maliyet:.1f} ms/kare (~{1000 / tahmini_maliyet:.0f} fps)")
+        if tahmini_maliyet > kare_butcesi_ms:
+            print(f"      ⚠️  Efektsiz render bile bütçeyi aşıyor, bütçeyi artırın")
+
     # Efekt isimlerini göster
     efekt_isimleri = {
         'velocity_ramp': '🚀 Velocity/Speed Ramping',
@@ -1339,7 +1729,29 @@ def halftone_filtre_olustur(halftone_params):
     return filters
 
 
-def shake_advanced_filtre_olustur(shake_params):
+def _shake_crop_filtre(shake_amount, margin, period_x, period_y, pts_factor=1.0, job_dir=None):
+    """
+    Sallama crop'u: önceden hesaplanmış iz + sendcmd, olmazsa sin/cos ifadesi
+
+    period_x/period_y: x = A + A*sin(n/period_x), y = A + A*cos(n/period_y)
+    job_dir: İz dosyalarının yazılacağı iş temp klasörü (None = ifadeli crop)
+    """
+    if EFFECT_TRACKS_AVAILABLE and EFFECT_TRACKS_CONFIG.get('enabled', True):
+        fast_filters = shake_crop_filters(shake_amount, period_x, period_y, margin, pts_factor, job_dir=job_dir)
+        if fast_filters:
+            return fast_filters
+
+    # ✅ FIX: Crop boyutları çift sayı olmalı
+    crop_w = f"2*trunc((iw-{margin})/2)"
+    crop_h = f"2*trunc((ih-{margin})/2)"
+    return [
+        f"crop={crop_w}:{crop_h}:"
+        f"{shake_amount}+{shake_amount}*sin(n/{period_x}):"
+        f"{shake_amount}+{shake_amount}*cos(n/{period_y})"
+    ]
+
+
+def shake_advanced_filtre_olustur(shake_params, pts_factor=1.0, job_dir=None):
     """🆕 Shake Advanced - Daha güçlü sallama"""
     if not shake_params:
         return []
@@ -1355,34 +1767,14 @@ def shake_advanced_filtre_olustur(shake_params):
     # Sabit sin/cos pattern kullan
     if shake_type == 'earthquake':
         # Güçlü, düzensiz sallama - daha yüksek amplitude
-        # ✅ FIX: Crop boyutları çift sayı olmalı
-        crop_w = f"2*trunc((iw-{shake_amount * 2})/2)"
-        crop_h = f"2*trunc((ih-{shake_amount * 2})/2)"
-        filters.append(
-            f"crop={crop_w}:{crop_h}:"
-            f"{shake_amount}+{shake_amount}*sin(n/{frequency}):"
-            f"{shake_amount}+{shake_amount}*cos(n/{frequency * 1.3})"
-        )
+        filters.extend(_shake_crop_filtre(shake_amount, shake_amount * 2, frequency, frequency * 1.3, pts_factor, job_dir))
     elif shake_type == 'handheld':
         # Yumuşak, organik sallama
-        # ✅ FIX: Crop boyutları çift sayı olmalı
-        crop_w = f"2*trunc((iw-{shake_amount * 2})/2)"
-        crop_h = f"2*trunc((ih-{shake_amount * 2})/2)"
-        filters.append(
-            f"crop={crop_w}:{crop_h}:"
-            f"{shake_amount}+{shake_amount}*sin(n/{frequency}):"
-            f"{shake_amount}+{shake_amount}*cos(n/{frequency})"
-        )
+        filters.extend(_shake_crop_filtre(shake_amount, shake_amount * 2, frequency, frequency, pts_factor, job_dir))
     elif shake_type == 'explosion':
-        # Ani, şiddetli sallama
-        # ✅ FIX: Crop boyutları çift sayı olmalı
-        crop_w = f"2*trunc((iw-{shake_amount * 3})/2)"
-        crop_h = f"2*trunc((ih-{shake_amount * 3})/2)"
-        filters.append(
-            f"crop={crop_w}:{crop_h}:"
-            f"{shake_amount}+{shake_amount}*sin(n*{frequency / 10}):"
-            f"{shake_amount}+{shake_amount}*cos(n*{frequency / 10})"
-        )
+        # Ani, şiddetli sallama (n*f/10 = n/(10/f))
+        period = 10 / frequency
+        filters.extend(_shake_crop_filtre(shake_amount, shake_amount * 3, period, period, pts_factor, job_dir))
     else:  # impact
         # Basit sallama
         # ✅ FIX: Crop boyutları çift sayı olmalı
@@ -1970,7 +2362,7 @@ def time_displacement_filtre_olustur(time_params):
 
 # ==================== VINTAGE/RETRO FILTERS ====================
 
-def camera_shake_filtre_olustur(shake_params):
+def camera_shake_filtre_olustur(shake_params, pts_factor=1.0, job_dir=None):
     """Kamera sallama filtresi - CapCut tarzı"""
     if not shake_params:
         return []
@@ -1978,23 +2370,9 @@ def camera_shake_filtre_olustur(shake_params):
     intensity = shake_params['intensity']
     frequency = shake_params['frequency']
 
-    filters = []
-
     shake_amount = int(intensity * 20)
 
-    # ✅ FIX: Crop boyutları çift sayı olmalı
-    crop_w = f"2*trunc((iw-{shake_amount * 2})/2)"
-    crop_h = f"2*trunc((ih-{shake_amount * 2})/2)"
-
-    shake_filter = (
-        f"crop={crop_w}:{crop_h}:"
-        f"{shake_amount}+{shake_amount}*sin(n/{frequency}):"
-        f"{shake_amount}+{shake_amount}*cos(n/{frequency})"
-    )
-
-    filters.append(shake_filter)
-
-    return filters
+    return _shake_crop_filtre(shake_amount, shake_amount * 2, frequency, frequency, pts_factor, job_dir)
 
 
 def vintage_70s_filtre_olustur(params):
@@ -2134,14 +2512,18 @@ def light_leak_filtre_olustur(leak_params):
 
 # ==================== CINEMATIC EFFECTS GENERATOR ====================
 
-def cinematic_effects_uret(klip_index, secilen_efektler=None):
+def cinematic_effects_uret(klip_index, secilen_efektler=None, seed=None):
     """🆕 Her klip için cinematic efekt parametreleri oluştur - CapCut Ultra (30+ efekt!)
 
     Args:
         klip_index: Klip numarası
         secilen_efektler: Kullanıcının seçtiği efektler (set) veya None (tüm efektler)
+        seed: Verilirse tekrarlanabilir seçim (benchmark); None = her çalıştırmada farklı
     """
-    random.seed(hash(f"cinematic_{klip_index}_{time.time()}"))
+    if seed is None:
+        random.seed(hash(f"cinematic_{klip_index}_{time.time()}"))
+    else:
+        random.seed(f"cinematic_{klip_index}_{seed}")
 
     effects = {
         # 🎥 SUBTITLE-FRIENDLY EFFECTS (Story Channels Optimized)
@@ -2576,9 +2958,15 @@ def cinematic_effects_uret(klip_index, secilen_efektler=None):
 
 # ==================== VIDEO/AUDIO FILTER CREATION ====================
 
-def gelismis_varyasyon_uret(video_ad, varyasyon_no):
-    """Gelişmiş varyasyon parametreleri + Cinematic Effects"""
-    random.seed(hash(f"{video_ad}_{varyasyon_no}"))
+def gelismis_varyasyon_uret(video_ad, varyasyon_no, seed=None):
+    """Gelişmiş varyasyon parametreleri + Cinematic Effects
+
+    seed: Verilirse süreçten bağımsız (PYTHONHASHSEED etkilemez) tekrarlanabilir varyasyon
+    """
+    if seed is None:
+        random.seed(hash(f"{video_ad}_{varyasyon_no}"))
+    else:
+        random.seed(f"{video_ad}_{varyasyon_no}_{seed}")
     conf = ADVANCED_CONFIG
 
     return {
@@ -2615,8 +3003,18 @@ def gelismis_varyasyon_uret(video_ad, varyasyon_no):
     }
 
 
-def gelismis_video_filtre_olustur(varyasyon, subtitle_config=None, cinematic_effects=None):
-    """🆕 Gelişmiş video filtreleri + TÜM CAPCUT PLUS EFEKTLER"""
+def _setpts_carpani(filters):
+    """'setpts=X*PTS' filtrelerinden toplam zaman çarpanını çıkar"""
+    factor = 1.0
+    for f in filters:
+        match = re.fullmatch(r"setpts=([0-9.]+)\*PTS", f)
+        if match:
+            factor *= float(match.group(1))
+    return factor
+
+
+def gelismis_video_filtre_olustur(varyasyon, subtitle_config=None, cinematic_effects=None, job_dir=None):
+    """🆕 Gelişmiş video filtreleri + TÜM CAPCUT PLUS EFEKTLER (job_dir: sendcmd izleri için iş temp klasörü)"""
     filtreler = []
 
     # 1. RESOLUTION NORMALIZATION (1920x1080)
@@ -2633,11 +3031,14 @@ def gelismis_video_filtre_olustur(varyasyon, subtitle_config=None, cinematic_eff
     filtreler.append(f"fps={video_output['fps']}")
 
     # 3. CINEMATIC EFFECTS
+    pts_factor = 1.0
     if cinematic_effects:
         # 🆕 Velocity/Speed Ramping
         if cinematic_effects.get('velocity_ramp'):
             velocity_filters = velocity_ramp_filtre_olustur(cinematic_effects['velocity_ramp'])
             filtreler.extend(velocity_filters)
+            # sendcmd izleri setpts sonrası zamanla hizalanmalı
+            pts_factor = _setpts_carpani(velocity_filters)
 
         # 🆕 Ghost Trail
         if cinematic_effects.get('ghost_trail'):
@@ -2691,7 +3092,7 @@ def gelismis_video_filtre_olustur(varyasyon, subtitle_config=None, cinematic_eff
 
         # 🆕 Shake Advanced
         if cinematic_effects.get('shake_advanced'):
-            shake_adv_filters = shake_advanced_filtre_olustur(cinematic_effects['shake_advanced'])
+            shake_adv_filters = shake_advanced_filtre_olustur(cinematic_effects['shake_advanced'], pts_factor, job_dir)
             filtreler.extend(shake_adv_filters)
 
         # 🆕 Overlay Particles
@@ -2706,7 +3107,7 @@ def gelismis_video_filtre_olustur(varyasyon, subtitle_config=None, cinematic_eff
 
         # Camera Shake (eski)
         if cinematic_effects.get('camera_shake'):
-            shake_filters = camera_shake_filtre_olustur(cinematic_effects['camera_shake'])
+            shake_filters = camera_shake_filtre_olustur(cinematic_effects['camera_shake'], pts_factor, job_dir)
             filtreler.extend(shake_filters)
 
         # Glitch Effect
@@ -3026,6 +3427,51 @@ def gelismis_audio_filtre_olustur(varyasyon):
     return ','.join(filtreler) if filtreler else None
 
 
+# ==================== ⏱️ EFEKT MALİYET KALİBRASYONU ====================
+
+# Seçim adı → cinematic_effects_uret anahtarı (farklı olanlar)
+EFEKT_ANAHTAR_ESLESME = {
+    'light_leaks': 'light_leak',
+    'vintage_styles': 'vintage_style',
+}
+
+
+def efekt_maliyet_kalibrasyonu(max_deneme=50):
+    """⏱️ Her efektin gerçek render maliyetini ölçüp kalıcı tabloya yazar
+
+    Sentetik 1080p kaynak üzerinde efektsiz zincir ile efektli zincirin
+    kare başına süre farkı ölçülür. Sonuç akilli_efekt_secimi bütçesinde kullanılır.
+    """
+    if not RENDER_BUDGET_AVAILABLE:
+        print("❌ render_budget modülü yok, kalibrasyon yapılamaz")
+        return None
+
+    # Nötr varyasyon: sadece efektin kendi maliyeti ölçülsün
+    notr_varyasyon = {
+        'hiz': 1.0, 'parlaklik': 0, 'kontrast': 0, 'doygunluk': 0, 'zoom': 1.0,
+        'flip': False, 'rotate': 0.0, 'unsharp': 0.0, 'vignette': False, 'grain': 0,
+        'color_tint': None,
+    }
+    taban_filtre = gelismis_video_filtre_olustur(notr_varyasyon)
+
+    efekt_filtreleri = {}
+    for efekt_adi in EFEKT_OZELLIKLERI:
+        anahtar = EFEKT_ANAHTAR_ESLESME.get(efekt_adi, efekt_adi)
+        # Efektler olasılıkla üretiliyor, parametre gelene kadar tekrar dene
+        for deneme in range(max_deneme):
+            fx = cinematic_effects_uret(deneme + 1, {efekt_adi})
+            if fx.get(anahtar):
+                efekt_filtreleri[efekt_adi] = gelismis_video_filtre_olustur(
+                    notr_varyasyon, cinematic_effects={anahtar: fx[anahtar]}
+                )
+                break
+        else:
+            logger.debug(f"Kalibrasyon: {efekt_adi} parametre üretilemedi (config kapalı olabilir)")
+
+    print(f"\n⏱️  EFEKT MALİYET KALİBRASYONU ({len(efekt_filtreleri)} efekt)")
+    return kalibrasyon_yap(efekt_filtreleri, taban_filtre)
+
+
 # ==================== TRANSITION FUNCTIONS ====================
 
 def transition_sec(transition_index, used_transitions=None):
@@ -3036,6 +3482,10 @@ def transition_sec(transition_index, used_transitions=None):
     if used_transitions is None:
         used_transitions = []
 
+    if TRANSITION_PLANNER_AVAILABLE:
+        recent = used_transitions[-TRANSITION_EFFECTS['min_clip_gap']:]
+        return gecis_sec(transition_index, recent)
+
     transitions = TRANSITION_EFFECTS['transitions']
     transition_names = list(transitions.keys())
     weights = [transitions[t]['weight'] for t in transition_names]
@@ -3077,15 +3527,27 @@ def xfade_filter_olustur(transition_info, offset):
     return xfade_str
 
 
-def calculate_xfade_offsets(playlist):
-    """Her transition için offset hesapla"""
+def calculate_xfade_offsets(playlist, transitions=None):
+    """
+    Her transition için offset hesapla
+
+    transitions verilirse her geçişin kendi süresi düşülür (sabit
+    overlap_duration yerine); aksi halde eski davranış.
+    """
     offsets = []
     cumulative_time = 0
 
     for i, item in enumerate(playlist):
         if i > 0:
-            offset = cumulative_time - TRANSITION_EFFECTS['overlap_duration']
+            if transitions and i - 1 < len(transitions):
+                overlap = transitions[i - 1]['duration']
+            else:
+                overlap = TRANSITION_EFFECTS['overlap_duration']
+            offset = cumulative_time - overlap
             offsets.append(max(0, offset))
+            # xfade sonrası akış, geçiş süresi kadar kısalır
+            if transitions:
+                cumulative_time -= overlap
 
         cumulative_time += item['gercek_sure']
 
@@ -3716,9 +4178,12 @@ def altyazi_srt_olustur(subtitle_config, temp_klasor):
             configured_style = subtitle_config.get('style', 'tiktok')
             configured_color = subtitle_config.get('highlight_color', 'yellow')
 
+            # Headless (batch) çalıştırmada menü yok: config'deki stil/renk
+            interactive = subtitle_config.get('interactive', True)
+
             # 🎯 INTERACTIVE MENU: User chooses from 40+ styles
             try:
-                chosen_style = interactive_style_selector(default_style=configured_style)
+                chosen_style = interactive_style_selector(default_style=configured_style) if interactive else configured_style
             except Exception as e:
                 logger.warning(f"Style selector failed: {e}, using default")
                 chosen_style = configured_style
@@ -3730,7 +4195,7 @@ def altyazi_srt_olustur(subtitle_config, temp_klasor):
 
             # 🎨 INTERACTIVE MENU: User chooses highlight color
             try:
-                chosen_color = interactive_highlight_color_selector(default_color=configured_color)
+                chosen_color = interactive_highlight_color_selector(default_color=configured_color) if interactive else configured_color
             except Exception as e:
                 logger.warning(f"Color selector failed: {e}, using default")
                 chosen_color = configured_color
@@ -3751,7 +4216,7 @@ def altyazi_srt_olustur(subtitle_config, temp_klasor):
                 # Fall through to legacy system
 
         # 🔙 FALLBACK: Legacy system (if styles not available or error)
-        ass_dosya = os.path.join(temp_klasor, 'subtitles.ass')
+        ass_dosya = scratch_yolu(temp_klasor, 'subtitles.ass')
 
         try:
             # FONT FIX: subtitle_config'den seçilen fontu kullan
@@ -3868,31 +4333,18 @@ def altyazi_srt_olustur(subtitle_config, temp_klasor):
 
                         # 🔙 LEGACY: Basic karaoke (simple, reliable)
                         if len(word_list) > 8:
-                            # Karakter sayısını kontrol ederek en iyi bölme noktasını bul
-                            best_split = len(word_list) // 2
-                            min_diff = float('inf')
-
-                            for i in range(1, len(word_list)):
-                                # Test satırları oluştur
-                                line1_test = ' '.join([w['text'] for w in word_list[:i]])
-                                line2_test = ' '.join([w['text'] for w in word_list[i:]])
-
-                                len1 = len(line1_test)
-                                len2 = len(line2_test)
-
-                                # Her iki satır da limite uyuyorsa ve dengeli ise
-                                if len1 <= MAX_CHARS_PER_LINE and len2 <= MAX_CHARS_PER_LINE:
-                                    diff = abs(len1 - len2)
-                                    if diff < min_diff:
-                                        min_diff = diff
-                                        best_split = i
+                            # Karakter sayısını kontrol ederek en dengeli bölme noktasını bul
+                            kirilim = en_iyi_kirilim([len(w['text']) for w in word_list],
+                                                     MAX_CHARS_PER_LINE, satir_sayisi=2)
 
                             # Eğer hiçbir split uygun değilse, kelimeleri kısalt
-                            if min_diff == float('inf'):
+                            if kirilim is None:
                                 # Çok uzun - kelime sayısını azalt
                                 target_words = 6  # Her satıra max 3 kelime
                                 word_list = word_list[:target_words]
                                 best_split = 3
+                            else:
+                                best_split = kirilim[0]
 
                             line1_words = word_list[:best_split]
                             line2_words = word_list[best_split:]
@@ -3977,17 +4429,21 @@ def emoji_ekle(text, emoji_config):
         return text
 
     emoji_map = emoji_config.get('emoji_map', {})
-    text_lower = text.lower()
 
     added_emoji = None
-    for pattern, emoji in emoji_map.items():
-        keywords = pattern.split('|')
-        for keyword in keywords:
-            if keyword in text_lower:
-                added_emoji = emoji
+    if EMOJI_MATCHER_AVAILABLE:
+        # Harita bir kez regex'e derlenir, satır tek geçişte taranır
+        added_emoji = emoji_bul(text, emoji_map)
+    else:
+        text_lower = text.lower()
+        for pattern, emoji in emoji_map.items():
+            keywords = pattern.split('|')
+            for keyword in keywords:
+                if keyword in text_lower:
+                    added_emoji = emoji
+                    break
+            if added_emoji:
                 break
-        if added_emoji:
-            break
 
     if added_emoji:
         position = emoji_config.get('position', 'end')
@@ -4055,32 +4511,13 @@ def akilli_satir_kir(text, max_chars_per_line=30, max_lines=2, font_name=None, f
         # Çok az kelime, tek satır
         return ' '.join(words)
 
-    # En dengeli bölünme noktasını bul
-    best_split = len(words) // 2
-    min_diff = float('inf')
-
-    for i in range(1, len(words)):
-        line1 = ' '.join(words[:i])
-        line2 = ' '.join(words[i:])
-
-        # Her satırın karakter sayısı
-        len1 = len(line1)
-        len2 = len(line2)
-
-        # İki satır arasındaki fark
-        diff = abs(len1 - len2)
-
-        # Her iki satır da limite uyuyorsa ve daha dengeli ise
-        if len1 <= max_chars_per_line and len2 <= max_chars_per_line:
-            if diff < min_diff:
-                min_diff = diff
-                best_split = i
-
-    # En iyi noktadan böl
-    line1 = ' '.join(words[:best_split])
-    line2 = ' '.join(words[best_split:])
+    # En dengeli bölünme (2..max_lines satır; sığmıyorsa ortadan 2 satır)
+    kirilim = en_iyi_kirilim([len(w) for w in words], max_chars_per_line,
+                             min_satir=2, max_satir=max(2, max_lines))
+    if kirilim is None:
+        kirilim = [len(words) // 2]
 
-    return f"{line1}\\N{line2}"
+    return '\\N'.join(' '.join(satir) for satir in satirlara_bol(words, kirilim))
 
 
 def renk_kodla_kelime(word, color_config):
@@ -4258,7 +4695,7 @@ def dinamik_altyazi_ass_olustur(subtitle_config, dynamic_config, temp_klasor, pl
             preset_marginv = preset['margin_vertical']
 
     segments = subtitle_config['segments']
-    ass_dosya = os.path.join(temp_klasor, 'dynamic_subtitles.ass')
+    ass_dosya = scratch_yolu(temp_klasor, 'dynamic_subtitles.ass')
 
     try:
         # Tipografi ayarları
@@ -4450,31 +4887,18 @@ def dinamik_altyazi_ass_olustur(subtitle_config, dynamic_config, temp_klasor, pl
                     karaoke_text = f"{{{animation_tags}{bg_tags}}}"
 
                     if len(word_list) > 8:
-                        # Karakter sayısını kontrol ederek en iyi bölme noktasını bul
-                        best_split = len(word_list) // 2
-                        min_diff = float('inf')
-
-                        for i in range(1, len(word_list)):
-                            # Test satırları oluştur (renk tag'leri olmadan)
-                            line1_test = ' '.join([w['text'] for w in word_list[:i]])
-                            line2_test = ' '.join([w['text'] for w in word_list[i:]])
-
-                            len1 = len(line1_test)
-                            len2 = len(line2_test)
-
-                            # Her iki satır da limite uyuyorsa ve dengeli ise
-                            if len1 <= MAX_CHARS_PER_LINE and len2 <= MAX_CHARS_PER_LINE:
-                                diff = abs(len1 - len2)
-                                if diff < min_diff:
-                                    min_diff = diff
-                                    best_split = i
+                        # Karakter sayısını kontrol ederek en dengeli bölme noktasını bul (renk tag'leri olmadan)
+                        kirilim = en_iyi_kirilim([len(w['text']) for w in word_list],
+                                                 MAX_CHARS_PER_LINE, satir_sayisi=2)
 
                         # Eğer hiçbir split uygun değilse, kelimeleri kısalt
-                        if min_diff == float('inf'):
+                        if kirilim is None:
                             # Çok uzun - kelime sayısını azalt
                             target_words = 6  # Her satıra max 3 kelime
                             word_list = word_list[:target_words]
                             best_split = 3
+                        else:
+                            best_split = kirilim[0]
 
                         line1_words = word_list[:best_split]
                         line2_words = word_list[best_split:]
@@ -4557,6 +4981,16 @@ def cache_hash_olustur(video_yolu, varyasyon):
 
 def cache_kontrol(video_yolu, varyasyon):
     """Cache'de işlenmiş versiyon var mı?"""
+    if CACHE_STORE_AVAILABLE:
+        try:
+            cache_dosya = cache_store.ara(cache_hash_olustur(video_yolu, varyasyon))
+        except Exception as e:
+            logger.warning(f"Cache okuma hatası: {e}")
+            return None
+        if cache_dosya:
+            logger.info(f"✅ Cache hit: {os.path.basename(video_yolu)}")
+        return cache_dosya
+
     if not os.path.exists(CACHE_KLASORU):
         os.makedirs(CACHE_KLASORU, exist_ok=True)
 
@@ -4573,6 +5007,9 @@ def cache_kontrol(video_yolu, varyasyon):
 def cache_kaydet(islenimis_dosya, video_yolu, varyasyon):
     """İşlenmiş dosyayı cache'e kaydet"""
     try:
+        if CACHE_STORE_AVAILABLE:
+            return cache_store.ekle(cache_hash_olustur(video_yolu, varyasyon), islenimis_dosya)
+
         if not os.path.exists(CACHE_KLASORU):
             os.makedirs(CACHE_KLASORU, exist_ok=True)
 
@@ -4590,6 +5027,10 @@ def cache_kaydet(islenimis_dosya, video_yolu, varyasyon):
 def cache_temizle(max_size_gb=5):
     """Cache boyutunu sınırla"""
     try:
+        if CACHE_STORE_AVAILABLE:
+            cache_store.temizle(max_size_gb)
+            return
+
         if not os.path.exists(CACHE_KLASORU):
             return
 
@@ -4620,7 +5061,7 @@ def cache_temizle(max_size_gb=5):
 # ==================== PROGRESS TRACKING ====================
 
 def ilerleme_kaydet(playlist_index, toplam, cikti_adi):
-    """İlerlemeyi kaydet"""
+    """İlerlemeyi kaydet (özet; klip bazlı durum job journal'da)"""
     try:
         progress_data = {
             'timestamp': datetime.now().isoformat(),
@@ -4628,14 +5069,27 @@ def ilerleme_kaydet(playlist_index, toplam, cikti_adi):
             'toplam': toplam,
             'cikti_adi': cikti_adi,
         }
-        with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
+        temp_path = PROGRESS_FILE + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
             json.dump(progress_data, f, indent=2)
+        os.replace(temp_path, PROGRESS_FILE)
     except Exception as e:
         logger.warning(f"İlerleme kayıt hatası: {e}")
 
 
 def ilerleme_yukle():
-    """Kaydedilmiş ilerlemeyi yükle"""
+    """
+    Kaydedilmiş ilerlemeyi yükle
+
+    Job journal varsa son açık çalışma döner:
+        {'run_id', 'started_at', 'params', 'stages'}
+    Yoksa progress.json içeriği.
+    """
+    if JOB_JOURNAL_AVAILABLE:
+        try:
+            return acik_run()
+        except Exception as e:
+            logger.warning(f"Job journal okunamadı: {e}")
     try:
         if os.path.exists(PROGRESS_FILE):
             with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
@@ -4645,8 +5099,13 @@ def ilerleme_yukle():
     return None
 
 
-def ilerleme_temizle():
-    """İlerleme dosyasını sil"""
+def ilerleme_temizle(cikti_adi=None):
+    """İlerleme dosyasını sil, çalışma açık kaldıysa journal'da kapat"""
+    if JOB_JOURNAL_AVAILABLE and cikti_adi:
+        try:
+            run_bitir(cikti_adi, 'closed')
+        except Exception as e:
+            logger.warning(f"Job journal kapatılamadı: {e}")
     try:
         if os.path.exists(PROGRESS_FILE):
             os.remove(PROGRESS_FILE)
@@ -4654,28 +5113,161 @@ def ilerleme_temizle():
         pass
 
 
-# ==================== SCENE DETECTION ====================
+def _klip_girdi_hash(item, klip_index, encoder_type, sessiz_yap, secilen_efektler, altyazi_dilimi=None):
+    """Klip aşamasının girdileri: kaynak dosya (boyut/mtime), varyasyon, encoder, efektler, altyazı dilimi"""
+    try:
+        stat = os.stat(item['dosya'])
+        kaynak = (stat.st_size, int(stat.st_mtime))
+    except OSError:
+        kaynak = None
+    return girdi_hash({
+        'dosya': item['dosya'],
+        'kaynak': kaynak,
+        'varyasyon': item.get('varyasyon'),
+        'sure': item.get('sure'),
+        'index': klip_index,
+        'encoder': encoder_type,
+        'sessiz': sessiz_yap,
+        'efektler': sorted(secilen_efektler) if secilen_efektler is not None else None,
+        'altyazi': _dilim_anahtari(altyazi_dilimi),
+    })
+
+
+def _dilim_anahtari(altyazi_dilimi):
+    """Altyazı diliminin yoldan bağımsız kimliği (cache / journal anahtarı için)"""
+    if not altyazi_dilimi:
+        return None
+    return {k: v for k, v in altyazi_dilimi.items() if k not in ('ass', 'overlay')}
 
-def sahne_tespiti_yap(video_yolu, threshold=None):
-    """ffmpeg scene detection ile akıllı segmentasyon"""
-    if threshold is None:
-        threshold = ADVANCED_CONFIG['min_scene_score']
 
-    logger.info(f"🔍 Sahne tespiti: {os.path.basename(video_yolu)}")
+def altyazi_dilimleri_olustur(playlist, ass_dosya, fps=None):
+    """
+    Altyazıyı klip encode'unda basmak için klip başına dilim
 
-    try:
-        komut = [
-            'ffmpeg', '-i', video_yolu,
-            '-vf', f'select=gt(scene\\,{threshold}),showinfo',
-            '-f', 'null', '-'
-        ]
+    Her klibin kare sayısı sabitlenir; offset'ler önceki kliplerin kare
+    sayılarından hesaplandığı için concat sonrası zaman çizelgesi (ve ses)
+    ile birebir örtüşür, klip sürelerindeki yuvarlamalar birikmez.
 
-        sonuc = subprocess.run(
-            komut,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            timeout=120
+    Returns:
+        [{'ass', 'ass_hash', 'offset', 'frames', 'fps'}, ...] (playlist sırasıyla)
+    """
+    fps = fps or VIDEO_OUTPUT['fps']
+    with open(ass_dosya, 'rb') as f:
+        ass_hash = hashlib.sha1(f.read()).hexdigest()
+
+    dilimler = []
+    kare = 0
+    for item in playlist:
+        kare_sayisi = max(1, int(round(item['gercek_sure'] * fps)))
+        dilimler.append({
+            'ass': ass_dosya,
+            'ass_hash': ass_hash,
+            'offset': round(kare / fps, 6),
+            'frames': kare_sayisi,
+            'fps': fps,
+        })
+        kare += kare_sayisi
+    return dilimler
+
+
+def klip_altyazi_filtresi(dilim):
+    """
+    Klibi final zaman çizelgesindeki yerine kaydırıp altyazıyı bas
+
+    Kare hızı ve 1920x1080 burada sabitlenir: final mux'ta scale/altyazı
+    için yeniden encode gerekmez (-c:v copy). Kısa kalan klipte son kare
+    tekrarlanır; fazlası -frames:v ile kesilir. Dilimde 'overlay' varsa
+    libass yerine önceden rasterize edilmiş katman bindirilir.
+    """
+    zincir = (
+        f"fps={dilim['fps']},"
+        "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1,"
+        "tpad=stop_mode=clone:stop_duration=5,"
+        f"setpts=PTS-STARTPTS+{dilim['offset']}/TB"
+    )
+
+    if dilim.get('overlay'):
+        return zincir + overlay_filtresi(dilim['overlay'], dilim['offset']) + ",setpts=PTS-STARTPTS"
+
+    ass_path = dilim['ass'].replace('\\', '/').replace("'", "\\'")
+
+    if re.match(r'^[A-Za-z]:', ass_path):
+        ass_path = ass_path.replace(':', '\\:', 1)
+
+    return zincir + f",subtitles='{ass_path}',setpts=PTS-STARTPTS"
+
+
+def bosluk_klibi_olustur(dilim, klip_index, temp_klasor):
+    """
+    Encode edilemeyen klibin yerine aynı kare sayısında siyah, altyazılı klip
+
+    Sonraki kliplerin altyazı offset'leri bu klibin kare sayısını içerir;
+    boşluk doldurulunca zaman çizelgesi (anlatım sesi ve altyazı) kaymaz.
+
+    Returns:
+        Klip yolu veya None
+    """
+    klip_dosya = os.path.join(temp_klasor, f"c_{klip_index:05d}.mp4")
+    klip_gecici = os.path.join(temp_klasor, f"c_{klip_index:05d}.part.mp4")
+    cpu_settings = QUALITY_SETTINGS['cpu']
+    komut = [
+        'ffmpeg', '-v', 'error', '-nostdin',
+        '-f', 'lavfi', '-i', f"color=c=black:s=1920x1080:r={dilim['fps']}",
+        '-vf', klip_altyazi_filtresi(dilim),
+        '-frames:v', str(dilim['frames']),
+        '-c:v', 'libx264',
+        '-preset', cpu_settings['preset'],
+        '-crf', str(cpu_settings['crf']),
+        '-profile:v', 'high',
+        '-pix_fmt', VIDEO_OUTPUT['pixel_format'],
+        '-colorspace', 'bt709',
+        '-color_primaries', 'bt709',
+        '-color_trc', 'bt709',
+        '-color_range', VIDEO_OUTPUT['color_range'],
+        '-an', '-movflags', '+faststart',
+        '-y', klip_gecici
+    ]
+
+    try:
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=180)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"⚠️ Boşluk klibi {klip_index} oluşturulamadı: {e}")
+        return None
+
+    if sonuc.returncode != 0 or not dosya_gecerli_mi(klip_gecici):
+        logger.warning(f"⚠️ Boşluk klibi {klip_index} oluşturulamadı: {sonuc.stderr[:200]}")
+        try:
+            os.remove(klip_gecici)
+        except OSError:
+            pass
+        return None
+
+    os.replace(klip_gecici, klip_dosya)
+    return klip_dosya
+
+
+# ==================== SCENE DETECTION ====================
+
+def sahne_tespiti_yap(video_yolu, threshold=None):
+    """ffmpeg scene detection ile akıllı segmentasyon"""
+    if threshold is None:
+        threshold = ADVANCED_CONFIG['min_scene_score']
+
+    logger.info(f"🔍 Sahne tespiti: {os.path.basename(video_yolu)}")
+
+    try:
+        komut = [
+            'ffmpeg', '-i', video_yolu,
+            '-vf', f'select=gt(scene\\,{threshold}),showinfo',
+            '-f', 'null', '-'
+        ]
+
+        sonuc = subprocess.run(
+            komut,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=120
         )
 
         scene_times = []
@@ -4697,6 +5289,14 @@ def sahne_tespiti_yap(video_yolu, threshold=None):
     return []
 
 
+def _segment_boyut_tahmini(video_info, segment_suresi):
+    """Stream copy segmentin tahmini boyutu (kaynak boyutu × süre oranı); scratch yerleşimi için"""
+    try:
+        return os.path.getsize(video_info['yol']) * segment_suresi / max(video_info['sure'], 0.001)
+    except (OSError, KeyError, TypeError):
+        return None
+
+
 def sahne_bazli_segmentasyon(video_info, temp_klasor, scene_times):
     """Sahne değişimlerine göre segment oluştur"""
     video_yolu = video_info['yol']
@@ -4716,7 +5316,8 @@ def sahne_bazli_segmentasyon(video_info, temp_klasor, scene_times):
         segment_suresi = min(scene_time - baslangic, 15)
 
         if segment_suresi > 4:
-            segment_dosya = os.path.join(temp_klasor, f"s_{segment_no:04d}.mp4")
+            segment_dosya = scratch_yolu(temp_klasor, f"s_{segment_no:04d}.mp4",
+                                         _segment_boyut_tahmini(video_info, segment_suresi))
 
             komut = [
                 'ffmpeg', '-v', 'error',
@@ -4740,7 +5341,8 @@ def sahne_bazli_segmentasyon(video_info, temp_klasor, scene_times):
             baslangic = scene_time
 
     if sure - baslangic > 4:
-        segment_dosya = os.path.join(temp_klasor, f"s_{segment_no:04d}.mp4")
+        segment_dosya = scratch_yolu(temp_klasor, f"s_{segment_no:04d}.mp4",
+                                     _segment_boyut_tahmini(video_info, sure - baslangic))
         komut = [
             'ffmpeg', '-v', 'error',
             '-i', video_yolu,
@@ -4779,7 +5381,8 @@ def normal_segmentasyon(video_info, temp_klasor):
         if segment_suresi < 4:
             break
 
-        segment_dosya = os.path.join(temp_klasor, f"s_{segment_no:04d}.mp4")
+        segment_dosya = scratch_yolu(temp_klasor, f"s_{segment_no:04d}.mp4",
+                                     _segment_boyut_tahmini(video_info, segment_suresi))
 
         komut = [
             'ffmpeg', '-v', 'error',
@@ -4817,9 +5420,12 @@ def videoyu_segmentlere_bol(video_info, temp_klasor, use_scene_detection=True):
 
 # ==================== FINGERPRINT RANDOMIZATION ====================
 
-def fingerprint_parametreleri_olustur(klip_index):
-    """Her klip için benzersiz encoding parametreleri"""
-    random.seed(hash(f"fingerprint_{klip_index}_{time.time()}"))
+def fingerprint_parametreleri_olustur(klip_index, seed=None):
+    """Her klip için benzersiz encoding parametreleri (seed verilirse tekrarlanabilir)"""
+    if seed is None:
+        random.seed(hash(f"fingerprint_{klip_index}_{time.time()}"))
+    else:
+        random.seed(f"fingerprint_{klip_index}_{seed}")
 
     fp_config = FINGERPRINT_CONFIG
 
@@ -4929,11 +5535,55 @@ def metadata_randomize(video_yolu, cikti_yolu):
 
 # ==================== PARALLEL PROCESSING ====================
 
+def klip_video_filtresi(item, klip_index, cinematic_fx, fp_params, altyazi_dilimi=None, job_dir=None):
+    """Klibin video filtre zinciri (efektler + fingerprint + altyazı dilimi); yoksa None"""
+    video_filtre = gelismis_video_filtre_olustur(
+        item['varyasyon'],
+        subtitle_config=None,
+        cinematic_effects=cinematic_fx,
+        job_dir=job_dir
+    )
+
+    # Fingerprint filtreleri
+    fp_video_filtre = fingerprint_video_filtresi(fp_params)
+
+    # Video filtreleri birleştir
+    tum_video_filtreler = []
+    if video_filtre:
+        tum_video_filtreler.append(video_filtre)
+    if fp_video_filtre:
+        tum_video_filtreler.extend(fp_video_filtre)
+
+    final_video_filtre = ','.join(tum_video_filtreler) if tum_video_filtreler else None
+
+    # 🧩 Ardışık eq/crop/scale aşamalarını birleştir, etkisiz filtreleri at
+    if final_video_filtre and FILTER_GRAPH_OPTIMIZER_AVAILABLE and FILTER_GRAPH_OPTIMIZER_CONFIG.get('enabled', False):
+        optimize_filtre = optimize_filter_graph(final_video_filtre)
+        if klip_index == 1 and optimize_filtre != final_video_filtre:
+            logger.debug(f"🧩 Filter graph: {count_stages(final_video_filtre)} → {count_stages(optimize_filtre)} aşama")
+        final_video_filtre = optimize_filtre
+
+    # 📝 Altyazı ana encode'da basılır (final'de ayrı decode+encode geçişi yok)
+    if altyazi_dilimi:
+        altyazi_filtre = klip_altyazi_filtresi(altyazi_dilimi)
+        final_video_filtre = f"{final_video_filtre},{altyazi_filtre}" if final_video_filtre else altyazi_filtre
+
+    return final_video_filtre
+
+
 def klip_isle_parallel(args):
     """🆕 Tek bir klibi işle + CAPCUT PLUS EFFECTS + 🌟 STORY FEATURES"""
-    item, klip_index, encoder_type, encoder_config, temp_klasor, sessiz_yap, subtitle_config, secilen_efektler, cumulative_time = args
+    item, klip_index, encoder_type, encoder_config, temp_klasor, sessiz_yap, altyazi_dilimi, secilen_efektler, cumulative_time = args
 
     klip_dosya = os.path.join(temp_klasor, f"c_{klip_index:05d}.mp4")
+    # ffmpeg geçici ada yazar, sonuç os.replace ile yerine geçer: klip_dosya cache
+    # objesine hardlink'li olabilir, -y (O_TRUNC) ile yerinde yazmak objeyi bozar
+    klip_gecici = os.path.join(temp_klasor, f"c_{klip_index:05d}.part.mp4")
+
+    # Altyazılı klip zaman çizelgesindeki yerine bağlı: cache anahtarına dilim de girer
+    cache_varyasyon = item['varyasyon']
+    if altyazi_dilimi:
+        cache_varyasyon = dict(item['varyasyon'], _altyazi=_dilim_anahtari(altyazi_dilimi))
 
     fp_params = fingerprint_parametreleri_olustur(klip_index)
 
@@ -4941,11 +5591,14 @@ def klip_isle_parallel(args):
     cinematic_fx = cinematic_effects_uret(klip_index, secilen_efektler)
 
     # Cache kontrolü
-    cached = cache_kontrol(item['dosya'], item['varyasyon'])
+    cached = cache_kontrol(item['dosya'], cache_varyasyon)
     if cached:
         try:
-            shutil.copy2(cached, klip_dosya)
-            return (klip_index, True, klip_dosya, "cache")
+            if CACHE_STORE_AVAILABLE:
+                cache_store.yerlestir(cached, klip_dosya)
+            else:
+                shutil.copy2(cached, klip_dosya)
+            return (klip_index, True, klip_dosya, "cache", [])
         except:
             pass
 
@@ -4959,31 +5612,20 @@ def klip_isle_parallel(args):
         encoders_to_try.append(('cpu', {'video': 'libx264'}))
 
     last_error = None
+    # Hata sınıfına göre retry / degrade / fail-fast; olaylar parent'ta istatistiğe eklenir
+    retry_olaylari = []
+    hafif_mod = False
 
     for current_encoder_type, current_encoder_config in encoders_to_try:
-        for deneme in range(2):
+        for deneme in range(3):
+            error_category = None
             try:
-                # Filtreler - CINEMATIC EFFECTS EKLENDİ
-                video_filtre = gelismis_video_filtre_olustur(
-                    item['varyasyon'],
-                    subtitle_config=None,
-                    cinematic_effects=cinematic_fx
-                )
+                # Filtreler - CINEMATIC EFFECTS + fingerprint + altyazı dilimi
+                final_video_filtre = klip_video_filtresi(item, klip_index, cinematic_fx, fp_params, altyazi_dilimi,
+                                                         job_dir=temp_klasor)
                 ses_filtre = gelismis_audio_filtre_olustur(item['varyasyon'])
-
-                # Fingerprint filtreleri
-                fp_video_filtre = fingerprint_video_filtresi(fp_params)
                 fp_audio_filtre = fingerprint_audio_filtresi(fp_params)
 
-                # Video filtreleri birleştir
-                tum_video_filtreler = []
-                if video_filtre:
-                    tum_video_filtreler.append(video_filtre)
-                if fp_video_filtre:
-                    tum_video_filtreler.extend(fp_video_filtre)
-
-                final_video_filtre = ','.join(tum_video_filtreler) if tum_video_filtreler else None
-
                 # Audio filtreleri birleştir
                 tum_audio_filtreler = []
                 if ses_filtre:
@@ -5274,12 +5916,15 @@ def klip_isle_parallel(args):
                             '-bf', str(fp_params['bframes']),
                         ])
 
+                if altyazi_dilimi:
+                    komut.extend(['-frames:v', str(altyazi_dilimi['frames'])])
+
                 # Audio encoding
                 if sessiz_yap:
                     komut.extend([
                         '-an',
                         '-movflags', '+faststart',
-                        '-y', klip_dosya
+                        '-y', klip_gecici
                     ])
                 else:
                     audio_cfg = AUDIO_SETTINGS
@@ -5289,9 +5934,12 @@ def klip_isle_parallel(args):
                         '-ar', audio_cfg['sample_rate'],
                         '-ac', str(audio_cfg['channels']),
                         '-movflags', '+faststart',
-                        '-y', klip_dosya
+                        '-y', klip_gecici
                     ])
 
+                if hafif_mod:
+                    komut = _komut_hafiflet(komut)
+
                 sonuc = subprocess.run(
                     komut,
                     stdout=subprocess.PIPE,
@@ -5300,15 +5948,18 @@ def klip_isle_parallel(args):
                     timeout=180
                 )
 
-                if sonuc.returncode == 0 and dosya_gecerli_mi(klip_dosya):
-                    cache_kaydet(klip_dosya, item['dosya'], item['varyasyon'])
+                if sonuc.returncode == 0 and dosya_gecerli_mi(klip_gecici):
+                    os.replace(klip_gecici, klip_dosya)
+                    cache_kaydet(klip_dosya, item['dosya'], cache_varyasyon)
 
                     # ✅ İYİLEŞTİRİLMİŞ: GPU→CPU fallback bilgilendirmesi
                     if current_encoder_type == 'cpu' and encoder_type != 'cpu':
                         if klip_index <= 3:
                             logger.info(f"✅ Klip {klip_index}: GPU başarısız oldu, CPU ile tamamlandı")
 
-                    return (klip_index, True, klip_dosya, None)
+                    if retry_olaylari:
+                        retry_olaylari.append((retry_olaylari[-1][0], 'recovered'))
+                    return (klip_index, True, klip_dosya, None, retry_olaylari)
                 else:
                     stderr_output = sonuc.stderr if sonuc.stderr else ""
                     last_error = stderr_output[:200] if stderr_output else "encoding_failed"
@@ -5322,42 +5973,465 @@ def klip_isle_parallel(args):
                     # ✅ İYİLEŞTİRİLMİŞ: FFmpeg hatasını kategorize et
                     error_category = parse_ffmpeg_error(stderr_output)
 
-                    # GPU hatası tespiti - otomatik CPU fallback
-                    if current_encoder_type != 'cpu' and error_category == ErrorCategory.GPU_ERROR:
-                        if klip_index <= 3:
-                            logger.warning(f"⚠️ Klip {klip_index}: GPU encoding hatası (CPU deneniyor...)")
-                        # ✅ FIX: Break inner loop to try CPU encoder immediately
-                        break  # Exit deneme loop, outer loop will try CPU
-                    else:
-                        # Diğer hatalar için detaylı log
-                        if klip_index <= 3:
-                            logger.warning(f"⚠️ Klip {klip_index} ({current_encoder_type}): {error_category.value}")
-                            logger.debug(f"   Detay: {last_error}")
+                    if klip_index <= 3:
+                        logger.warning(f"⚠️ Klip {klip_index} ({current_encoder_type}): {error_category.value}")
+                        logger.debug(f"   Detay: {last_error}")
 
             except subprocess.TimeoutExpired:
                 last_error = "timeout"
+                error_category = ErrorCategory.TIMEOUT_ERROR
                 if klip_index <= 3:
-                    logger.warning(f"⏱️ Klip {klip_index}: Timeout (deneme {deneme + 1}/2)")
+                    logger.warning(f"⏱️ Klip {klip_index}: Timeout (deneme {deneme + 1})")
             except Exception as e:
                 last_error = str(e)[:100]
+                error_category = classify_exception(e)
                 if klip_index <= 3:
                     logger.warning(f"❌ Klip {klip_index}: {last_error}")
 
-        if current_encoder_type != 'cpu':
-            logger.debug(f"Klip {klip_index}: {current_encoder_type} başarısız, CPU deneniyor...")
+            # GPU hatası → CPU, CPU'da bellek/timeout → hızlı preset, kalıcı hata → hemen bırak
+            karar = ffmpeg_retry_policy.decide(
+                error_category, deneme + 1,
+                can_degrade=current_encoder_type != 'cpu' or not hafif_mod,
+                record=False
+            )
+            retry_olaylari.append((error_category.value, karar.action.value))
+
+            if karar.action == RetryAction.FAIL:
+                if os.path.exists(klip_gecici):
+                    os.remove(klip_gecici)
+                return (klip_index, False, None, f"{error_category.value}: {last_error}", retry_olaylari)
+            if karar.action == RetryAction.DEGRADE:
+                if current_encoder_type != 'cpu':
+                    if klip_index <= 3:
+                        logger.warning(f"⚠️ Klip {klip_index}: {current_encoder_type} hatası (CPU deneniyor...)")
+                    break  # Dış döngü CPU'yu dener
+                hafif_mod = True
+                continue
+            time.sleep(karar.delay)
+
+    if os.path.exists(klip_gecici):
+        os.remove(klip_gecici)
+    return (klip_index, False, None, f"all_failed: {last_error}", retry_olaylari)
+
+
+def _komut_hafiflet(komut):
+    """x264 komutunu daha hızlı preset ve sınırlı thread ile yeniden yaz (degrade)"""
+    if 'libx264' not in komut:
+        return komut
+    yeni = list(komut)
+    for i, arg in enumerate(yeni[:-1]):
+        if arg == '-preset':
+            yeni[i + 1] = 'veryfast'
+    if '-threads' not in yeni:
+        yeni[-1:-1] = ['-threads', '2']
+    return yeni
+
+
+def _ses_on_filtreleri(audio_cfg):
+    """Final ses zincirinin loudnorm öncesi deterministik kısmı (sample rate + mono→stereo)"""
+    filtreler = []
+    # Convert to target sample rate before any processing to maintain quality
+    if audio_cfg['sample_rate'] != '44100':
+        filtreler.append(f"aresample={audio_cfg['sample_rate']}")
+    # Use pan filter for proper mono→stereo conversion instead of just channel duplication
+    filtreler.append("pan=stereo|FL=FC|FR=FC")
+    return filtreler
+
+
+def _ses_humanizasyon_filtresi():
+    """🎙️ Audio humanization zinciri veya None (parametreler rastgele: render başına bir kez üretilir)"""
+    if not AUDIO_HUMANIZATION_AVAILABLE:
+        return None
+    try:
+        humanized_audio = build_humanized_audio_filter()
+    except Exception as e:
+        logger.warning(f"⚠️ Audio humanization failed, using standard: {e}")
+        return None
+    return humanized_audio.get('audio_filters') if humanized_audio else None
+
+
+def _loudness_hedefi(audio_cfg):
+    return {'I': audio_cfg['target_loudness'], 'TP': audio_cfg['true_peak'], 'LRA': audio_cfg['lra']}
+
+
+def altyazi_paralel_uygun(video_suresi):
+    """Parçalı altyazı geçişi denenecek mi (girdinin seek edilebilir bir dosya olması gerekir)"""
+    if not SUBTITLE_BURN_AVAILABLE or not SUBTITLE_BURN_CONFIG['enabled']:
+        return False
+    return bool(video_suresi) and video_suresi >= SUBTITLE_BURN_CONFIG['min_duration']
+
+
+def altyazi_paralel_gecis(girdi, ass_file, cikti, encoder_type, temp_klasor, video_suresi):
+    """
+    Ayrı altyazı geçişini keyframe parçalarında paralel çalıştır
+
+    Returns:
+        True = cikti yazıldı, False = tek geçişli eski yola dönülmeli
+    """
+    if not altyazi_paralel_uygun(video_suresi):
+        return False
+
+    nvenc = GPU_OPTIMIZER_AVAILABLE and NVENC_INFO['available'] and encoder_type == 'nvidia'
+    if nvenc:
+        nv_settings = QUALITY_SETTINGS['nvidia']
+        encoder_args = [
+            '-c:v', 'h264_nvenc',
+            '-preset', nv_settings['preset'],
+            '-rc', nv_settings['rc'],
+            '-b:v', nv_settings['bitrate'],
+            '-maxrate', nv_settings['maxrate'],
+            '-bufsize', nv_settings['bufsize'],
+            '-profile:v', nv_settings['profile'],
+            '-pix_fmt', 'yuv420p',
+        ]
+    else:
+        encoder_args = ['-c:v', 'libx264', '-preset', 'fast', '-crf', '18', '-pix_fmt', 'yuv420p']
+
+    import time
+    baslangic = time.time()
+    try:
+        sonuc = paralel_altyazi_bas(girdi, ass_file, cikti, encoder_args, temp_klasor, nvenc=nvenc)
+    except (RuntimeError, OSError, ValueError) as e:
+        logger.warning(f"⚠️ Paralel altyazı basma başarısız, tek geçiş kullanılacak: {e}")
+        return False
+
+    if not dosya_gecerli_mi(cikti):
+        return False
+    print(f"   📝 Alt yazılar {sonuc['chunks']} parçada paralel basıldı "
+          f"({sonuc['workers']} worker, {time.time() - baslangic:.0f}s)")
+    return True
+
+
+def _scale_komutu(girdi_args, encoder_type, cikti_args, ham=False):
+    """
+    Concat sonrası 1920x1080 normalizasyon geçişi
+
+    Args:
+        girdi_args: ['-i', dosya] veya concat demuxer argümanları
+        cikti_args: ['-y', dosya] veya boru çıkışı
+        ham: True = encode yok (kareler boru ile yeniden encode eden aşamaya gider)
+    """
+    komut = [
+        'ffmpeg', '-v', 'warning',
+        *girdi_args,
+        '-vf', 'scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2',
+    ]
+
+    # Scale için GPU encoding - klip encoding ile aynı parametreler
+    if ham:
+        komut.extend(['-pix_fmt', 'yuv420p'])
+    elif GPU_OPTIMIZER_AVAILABLE and NVENC_INFO['available'] and encoder_type == 'nvidia':
+        nv_settings = QUALITY_SETTINGS['nvidia']
+        komut.extend([
+            '-c:v', 'h264_nvenc',
+            '-preset', nv_settings['preset'],
+            '-rc', nv_settings['rc'],
+            '-b:v', nv_settings['bitrate'],
+            '-maxrate', nv_settings['maxrate'],
+            '-bufsize', nv_settings['bufsize'],
+            '-profile:v', nv_settings['profile'],
+            '-pix_fmt', 'yuv420p',
+        ])
+        logger.info("🚀 Scale: NVENC GPU encoding")
+    else:
+        komut.extend([
+            '-c:v', 'libx264',
+            '-preset', 'fast',
+            '-crf', '18',
+            '-pix_fmt', 'yuv420p',
+        ])
+        logger.info("🔧 Scale: CPU encoding")
+
+    komut.append('-an')
+    komut.extend(cikti_args)
+    return komut
+
+
+def _final_mux_komutu(video_girdisi, ses_dosyasi, ass_file, encoder_type, ses_suresi, audio_filtre_str, cikti_yolu):
+    """
+    Final birleştirme: video + anlatım (+ ass_file verilirse altyazı basılarak yeniden encode)
+
+    Args:
+        video_girdisi: ['-i', dosya], concat demuxer veya boru giriş argümanları
+    """
+    audio_cfg = AUDIO_SETTINGS
+
+    # Final merge - CPU decode + NVENC encode (subtitle filtresi CPU gerektiriyor)
+    komut = [
+        'ffmpeg', '-v', 'warning',
+        *video_girdisi,
+        '-i', ses_dosyasi,
+        '-map', '0:v',
+        '-map', '1:a',
+    ]
+
+    if ass_file:
+        ass_path = ass_file.replace('\\', '/')
+
+        print(f"   📝 Alt yazılar ekleniyor: {os.path.basename(ass_file)}")
+
+        import re
+        if re.match(r'^[A-Za-z]:', ass_path):
+            ass_path_escaped = ass_path.replace(':', '\\:', 1)
+        else:
+            ass_path_escaped = ass_path
+
+        # Subtitle encoding için GPU - klip encoding ile aynı parametreler
+        if GPU_OPTIMIZER_AVAILABLE and NVENC_INFO['available'] and encoder_type == 'nvidia':
+            nv_settings = QUALITY_SETTINGS['nvidia']
+            print(f"   🚀 NVENC GPU altyazı encoding")
+            komut.extend([
+                '-vf', f"subtitles='{ass_path_escaped}'",
+                '-c:v', 'h264_nvenc',
+                '-preset', nv_settings['preset'],
+                '-rc', nv_settings['rc'],
+                '-b:v', nv_settings['bitrate'],
+                '-maxrate', nv_settings['maxrate'],
+                '-bufsize', nv_settings['bufsize'],
+                '-profile:v', nv_settings['profile'],
+                '-pix_fmt', 'yuv420p',
+            ])
+        else:
+            print(f"   📝 CPU altyazı encoding")
+            komut.extend([
+                '-vf', f"subtitles='{ass_path_escaped}'",
+                '-c:v', 'libx264',
+                '-preset', 'fast',
+                '-crf', '18',
+                '-pix_fmt', 'yuv420p',
+            ])
+    else:
+        komut.extend(['-c:v', 'copy'])
+
+    # ✅ FIX: Limit output duration to audio duration (video = audio length)
+    # This ensures video doesn't exceed audio duration by more than a few seconds
+    if ses_suresi:
+        # Add small buffer (2 seconds) to ensure smooth ending
+        komut.extend(['-t', str(ses_suresi + 2)])
+        logger.info(f"🎬 Output duration limited to {ses_suresi + 2:.2f}s (audio + 2s buffer)")
+
+    komut.extend([
+        '-c:a', audio_cfg['codec'],
+        '-b:a', audio_cfg['bitrate'],
+        '-ar', audio_cfg['sample_rate'],
+        '-ac', str(audio_cfg['channels']),
+        '-af', audio_filtre_str,
+        '-movflags', '+faststart',
+        '-y', cikti_yolu
+    ])
+    return komut
+
+
+def xfade_birlestir(dosyalar, transitions, cikti_yolu, encoder_type, ara_cikti=False):
+    """
+    Dosyaları geçiş planıyla tek filter_complex'te birleştir
+
+    Args:
+        dosyalar: Klip/ara dosya yolları, oynatma sırasında
+        transitions: Geçiş planı (len = len(dosyalar) - 1, offset'li)
+        ara_cikti: True = kayıpsız intra ara dosya, False = final encode
+
+    Returns:
+        subprocess.CompletedProcess
+    """
+    # Klipler 1-2 px farklı boyutta olabilir (concat sonrası scale ile aynı sebep)
+    normalize = ('scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,'
+                 f"setsar=1,fps={VIDEO_OUTPUT['fps']},format=yuv420p")
+    filter_complex, v_label, a_label = xfade_filter_complex(transitions, include_audio=True,
+                                                            input_filter=normalize)
+
+    komut = ['ffmpeg', '-v', 'warning']
+    for dosya in dosyalar:
+        komut.extend(['-i', dosya])
+    komut.extend(['-filter_complex', filter_complex, '-map', v_label, '-map', a_label])
+
+    if ara_cikti:
+        komut.extend(TRANSITION_PLANNER_CONFIG['intermediate_video'])
+        komut.extend(TRANSITION_PLANNER_CONFIG['intermediate_audio'])
+        komut.extend(['-pix_fmt', 'yuv420p', '-y', cikti_yolu])
+        return subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+    if GPU_OPTIMIZER_AVAILABLE and NVENC_INFO['available'] and encoder_type == 'nvidia':
+        nv_settings = QUALITY_SETTINGS['nvidia']
+        komut.extend([
+            '-c:v', 'h264_nvenc',
+            '-preset', nv_settings['preset'],
+            '-rc', nv_settings['rc'],
+            '-b:v', nv_settings['bitrate'],
+            '-maxrate', nv_settings['maxrate'],
+            '-bufsize', nv_settings['bufsize'],
+            '-profile:v', nv_settings['profile'],
+        ])
+    else:
+        komut.extend(['-c:v', 'libx264', '-preset', 'fast', '-crf', '18'])
+
+    komut.extend([
+        '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac', '-b:a', AUDIO_SETTINGS['bitrate'],
+        '-movflags', '+faststart',
+        '-y', cikti_yolu
+    ])
+
+    return subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def klip_sureleri_olc(dosyalar, varsayilan):
+    """
+    Encode edilmiş dosyaların gerçek video süreleri (paralel ffprobe)
+
+    Klipler kare sınırında biter; planlanan sürelerle hesaplanan xfade
+    offset'lerinde bu fark her klipte birikir. Ölçülemeyen dosya için
+    varsayilan'daki süre kullanılır.
+    """
+    def _olc(yol):
+        try:
+            sonuc = subprocess.run(
+                ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+                 '-show_entries', 'stream=duration:format=duration', '-of', 'json', yol],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=30
+            )
+            veri = json.loads(sonuc.stdout) if sonuc.returncode == 0 else {}
+        except (subprocess.TimeoutExpired, OSError, ValueError):
+            return None
+        for kaynak in (veri.get('streams') or [{}])[0], veri.get('format', {}):
+            try:
+                return float(kaynak['duration'])
+            except (KeyError, TypeError, ValueError):
+                continue
+        return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(dosyalar)))) as executor:
+        olculen = list(executor.map(_olc, dosyalar))
+    eksik = sum(1 for o in olculen if not o)
+    if eksik:
+        logger.debug(f"{eksik}/{len(dosyalar)} dosyanın süresi ölçülemedi, planlanan süre kullanılacak")
+    return [o if o else v for o, v in zip(olculen, varsayilan)]
+
+
+def xfade_hiyerarsik_birlestir(dosyalar, sureler, transitions, cikti_yolu, encoder_type, temp_klasor):
+    """
+    Uzun klip dizilerini gruplar halinde xfade ile birleştir
+
+    Her seviyede klipler dengeli gruplara bölünür, gruplar paralel olarak
+    kayıpsız ara dosyalara render edilir ve grup çıktıları ek yerlerindeki
+    geçişlerle bir üst seviyede birleştirilir. Filter graph derinliği
+    group_size ile sınırlı kalır.
+
+    Returns:
+        subprocess.CompletedProcess (son adımın veya başarısız grubun)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    grup_boyu = TRANSITION_PLANNER_CONFIG['group_size']
+    max_paralel = TRANSITION_PLANNER_CONFIG['max_parallel_groups'] or multiprocessing.cpu_count()
+    ara_klasor = os.path.join(temp_klasor, 'xfade_groups')
+    os.makedirs(ara_klasor, exist_ok=True)
+
+    seviye = 0
+    while len(dosyalar) > grup_boyu:
+        grup_plani = grup_plani_olustur(sureler, transitions, grup_boyu)
+        gruplar = grup_plani['groups']
+        logger.info(f"🌳 xfade seviye {seviye}: {len(dosyalar)} giriş → {len(gruplar)} grup")
+
+        def grup_render(g_index):
+            grup = gruplar[g_index]
+            grup_dosyalari = dosyalar[grup['start']:grup['end']]
+            if len(grup_dosyalari) == 1:
+                return grup_dosyalari[0], None
+            ara_dosya = os.path.join(
+                ara_klasor, f"L{seviye}_G{g_index:04d}{TRANSITION_PLANNER_CONFIG['intermediate_ext']}"
+            )
+            sonuc = xfade_birlestir(grup_dosyalari, grup['plan'], ara_dosya, encoder_type, ara_cikti=True)
+            return ara_dosya, sonuc
+
+        with ThreadPoolExecutor(max_workers=max_paralel) as executor:
+            sonuclar = list(executor.map(grup_render, range(len(gruplar))))
+
+        for ara_dosya, sonuc in sonuclar:
+            if sonuc is not None and (sonuc.returncode != 0 or not dosya_gecerli_mi(ara_dosya)):
+                return sonuc
+
+        dosyalar = [ara_dosya for ara_dosya, _ in sonuclar]
+        # Grup çıktıları da kare sınırında biter: ek yeri offset'leri ölçülen sürelerden
+        sureler = klip_sureleri_olc(dosyalar, grup_plani['sureler'])
+        transitions = offsetleri_hesapla(sureler, grup_plani['seams'])
+        seviye += 1
+
+    return xfade_birlestir(dosyalar, transitions, cikti_yolu, encoder_type)
+
 
-    return (klip_index, False, None, f"all_failed: {last_error}")
+def altyazi_dosyasi_hazirla(subtitle_config, temp_klasor):
+    """
+    Otomatik altyazı segmentlerinden ASS dosyasını oluştur (subtitle_config['srt_file'])
+
+    Returns:
+        subtitle_config (dosya oluşturulamazsa None)
+    """
+    if not (subtitle_config and subtitle_config.get('enabled')):
+        return subtitle_config
+
+    segment_count = len(subtitle_config.get('segments', []))
+    altyazi_span = telemetry_span_ac('subtitle', segments=segment_count)
+
+    if subtitle_config.get('mode') == 'auto' and segment_count > 0:
+        print(f"   Altyazı: {segment_count} segment")
+
+        # Dinamik altyazı kullanımı kontrolü
+        use_dynamic = subtitle_config.get('use_dynamic', False)
+
+        if use_dynamic:
+            # Sadeleştirilmiş: detaylar kaldırıldı
+            platform = subtitle_config.get('platform', 'youtube_standard')
+            srt_dosya = dinamik_altyazi_ass_olustur(
+                subtitle_config,
+                DYNAMIC_SUBTITLE_CONFIG,
+                temp_klasor,
+                platform
+            )
+        else:
+            srt_dosya = altyazi_srt_olustur(subtitle_config, temp_klasor)
+
+        if srt_dosya:
+            subtitle_config['srt_file'] = srt_dosya
+        else:
+            logger.warning("ASS dosyası oluşturulamadı")
+            subtitle_config = None
+
+    telemetry_span_kapat(altyazi_span, ok=subtitle_config is not None)
+    return subtitle_config
 
 
 def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type, encoder_config, ses_dosyasi=None,
-                    subtitle_config=None, secilen_efektler=None):
+                    subtitle_config=None, secilen_efektler=None, batch_options=None):
     """Parallel processing ile encode
 
     Args:
         secilen_efektler: Kullanıcının seçtiği efektler (set) veya None (tüm efektler)
+        batch_options: Headless çalıştırma ayarları (None = interaktif)
+            {'compress': bool, 'target_size_mb': int}
+            Verilirse soru sorulmaz ve paylaşılan temp klasörleri silinmez
+            (eşzamanlı diğer işler etkilenmesin).
     """
     print(f"\n🚀 Rendering başlıyor...")
 
+    # 📒 Çalışma parametreleri journal'a: çökme sonrası aynı playlist ile devam edilir
+    journal_aktif = False
+    if JOB_JOURNAL_AVAILABLE:
+        try:
+            run_baslat(cikti_adi, {
+                'playlist': playlist,
+                'cikti_adi': cikti_adi,
+                'temp_klasor': temp_klasor,
+                'klasor_yolu': klasor_yolu,
+                'ses_dosyasi': ses_dosyasi,
+                'subtitle_config': subtitle_config,
+                'secilen_efektler': sorted(secilen_efektler) if secilen_efektler is not None else None,
+                'batch_options': batch_options,
+            })
+            journal_aktif = True
+        except Exception as e:
+            logger.warning(f"⚠️ Job journal devre dışı: {e}")
+
     # Encoder info (tek satır)
     if GPU_OPTIMIZER_AVAILABLE and NVENC_INFO['available'] and encoder_type == 'nvidia':
         print(f"   Encoder: GPU ({NVENC_INFO.get('gpu_name', 'NVIDIA')})")
@@ -5368,33 +6442,49 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
     if ses_dosyasi:
         print(f"   Ses: Final birleştirmede eklenecek")
 
+    # 🔊 Loudness ölçümü (1. geçiş) klip encode'uyla paralel; aynı ses + zincir için cache'ten gelir
+    # Ölçüm (ve cache anahtarı) sadece deterministik ön zincir: render'da loudnorm
+    # humanization'dan önce uygulanır, rastgele humanization cache'i kaçırtmaz
+    loudness_future = None
+    if ses_dosyasi and LOUDNESS_AVAILABLE and AUDIO_SETTINGS['normalization']:
+        olcum_zinciri = _ses_on_filtreleri(AUDIO_SETTINGS)
+        loudness_executor = ThreadPoolExecutor(max_workers=1)
+        loudness_future = loudness_executor.submit(
+            loudness_olcum_al, ses_dosyasi, _loudness_hedefi(AUDIO_SETTINGS), ','.join(olcum_zinciri)
+        )
+        loudness_executor.shutdown(wait=False)
+
     # ASS dosyası oluştur
-    if subtitle_config and subtitle_config.get('enabled'):
-        segment_count = len(subtitle_config.get('segments', []))
-
-        if subtitle_config.get('mode') == 'auto' and segment_count > 0:
-            print(f"   Altyazı: {segment_count} segment")
-
-            # Dinamik altyazı kullanımı kontrolü
-            use_dynamic = subtitle_config.get('use_dynamic', False)
-
-            if use_dynamic:
-                # Sadeleştirilmiş: detaylar kaldırıldı
-                platform = subtitle_config.get('platform', 'youtube_standard')
-                srt_dosya = dinamik_altyazi_ass_olustur(
-                    subtitle_config,
-                    DYNAMIC_SUBTITLE_CONFIG,
-                    temp_klasor,
-                    platform
-                )
-            else:
-                srt_dosya = altyazi_srt_olustur(subtitle_config, temp_klasor)
+    subtitle_config = altyazi_dosyasi_hazirla(subtitle_config, temp_klasor)
+
+    # 📝 Sesli render'da zaman çizelgesi baştan belli: altyazı klip encode'unda basılır
+    altyazi_dilimleri = [None] * len(playlist)
+    burn_in = subtitle_config.get('burn_in', 'inline') if subtitle_config else None
+    altyazi_klipte = bool(
+        subtitle_config and subtitle_config.get('srt_file') and ses_dosyasi
+        and burn_in in ('inline', 'overlay')
+    )
+    if altyazi_klipte:
+        try:
+            altyazi_dilimleri = altyazi_dilimleri_olustur(playlist, subtitle_config['srt_file'])
+            print(f"   Altyazı: klip encode'unda basılacak (final mux -c:v copy)")
+        except OSError as e:
+            logger.warning(f"⚠️ Altyazı dilimleri oluşturulamadı, final'de basılacak: {e}")
+            altyazi_klipte = False
 
-            if srt_dosya:
-                subtitle_config['srt_file'] = srt_dosya
-            else:
-                logger.warning("ASS dosyası oluşturulamadı")
-                subtitle_config = None
+    # 🎞️ Katman modu: libass bir kez çalışır, klipler ASS yerine alpha katmanı bindirir
+    if altyazi_klipte and burn_in == 'overlay' and SUBTITLE_OVERLAY_AVAILABLE:
+        try:
+            with telemetry_span('subtitle_overlay') as sp:
+                overlay_yolu = overlay_hazirla(subtitle_config['srt_file'])
+                overlay_hash = overlay_anahtari(subtitle_config['srt_file'])
+                sp['bytes'] = os.path.getsize(overlay_yolu)
+            for dilim in altyazi_dilimleri:
+                dilim['overlay'] = overlay_yolu
+                dilim['overlay_hash'] = overlay_hash
+            print(f"   Altyazı katmanı: {os.path.basename(overlay_yolu)[:16]} (libass yerine overlay)")
+        except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"⚠️ Altyazı katmanı hazırlanamadı, libass kullanılacak: {e}")
 
     cpu_cores = multiprocessing.cpu_count()
 
@@ -5424,21 +6514,55 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
         cumulative += item.get('sure', 0.0)
 
     args_list = [
-        (item, i + 1, encoder_type, encoder_config, temp_klasor, sessiz_yap, subtitle_config, secilen_efektler, cumulative_times[i])
+        (item, i + 1, encoder_type, encoder_config, temp_klasor, sessiz_yap, altyazi_dilimleri[i], secilen_efektler, cumulative_times[i])
         for i, item in enumerate(playlist)
     ]
 
+    # 📒 Journal'da doğrulanmış klipler yeniden encode edilmez
+    klip_hashleri = {}
+    if journal_aktif:
+        bekleyen = []
+        for args in args_list:
+            klip_index = args[1]
+            klip_hashleri[klip_index] = _klip_girdi_hash(args[0], klip_index, encoder_type, sessiz_yap,
+                                                         secilen_efektler, args[6])
+            hazir = dogrulanmis_cikti(cikti_adi, 'clip', str(klip_index), klip_hashleri[klip_index])
+            if hazir:
+                basarili_klip.append((klip_index, hazir))
+            else:
+                bekleyen.append(args)
+        if basarili_klip:
+            print(f"   📒 Önceki çalışmadan {len(basarili_klip)} doğrulanmış klip kullanılıyor")
+        args_list = bekleyen
+        tamamlanan = len(basarili_klip)
+
+    cache_oncesi = None
+    if CACHE_STORE_AVAILABLE:
+        try:
+            cache_oncesi = cache_store.istatistikler()
+        except Exception as e:
+            logger.debug(f"Cache istatistikleri okunamadı: {e}")
+
     import time
     start_time = time.time()
+    atlanan = tamamlanan
+    encode_edilen_sure = 0.0
+
+    encode_span = telemetry_span_ac('encode', clips=len(args_list), reused=atlanan, workers=max_workers)
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+    pool_kwargs = {}
+    if LOGGING_SETUP_AVAILABLE and log_kuyrugu() is not None:
+        pool_kwargs = {'initializer': worker_logging_kur, 'initargs': (log_kuyrugu(), aktif_job_id())}
+
+    with ProcessPoolExecutor(max_workers=max_workers, **pool_kwargs) as executor:
         futures = {executor.submit(klip_isle_parallel, args): args[1] for args in args_list}
 
         ilk_hata_gosterildi = False
 
         for future in as_completed(futures):
-            klip_index, basarili, klip_dosya, hata = future.result()
+            klip_index, basarili, klip_dosya, hata, retry_olaylari = future.result()
             tamamlanan += 1
+            ffmpeg_retry_policy.stats.merge(retry_olaylari)
 
             # Progress bar with ETA
             yuzde = int((tamamlanan / toplam) * 100)
@@ -5448,8 +6572,8 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
 
             # Calculate ETA
             elapsed = time.time() - start_time
-            if tamamlanan > 0:
-                avg_time = elapsed / tamamlanan
+            if tamamlanan > atlanan:
+                avg_time = elapsed / (tamamlanan - atlanan)
                 remaining = (toplam - tamamlanan) * avg_time
                 eta_str = f"ETA: {int(remaining)}s" if remaining > 0 else "Done"
             else:
@@ -5461,9 +6585,24 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
 
             if basarili:
                 basarili_klip.append((klip_index, klip_dosya))
+                if hata != "cache":
+                    encode_edilen_sure += playlist[klip_index - 1]['gercek_sure']
+                try:
+                    encode_span['bytes'] += os.path.getsize(klip_dosya)
+                except OSError:
+                    pass
             else:
                 basarisiz.append(f"Klip {klip_index}: {hata}")
 
+            if journal_aktif:
+                try:
+                    if basarili:
+                        asama_tamamlandi(cikti_adi, 'clip', str(klip_index), klip_hashleri[klip_index], klip_dosya)
+                    else:
+                        asama_hatali(cikti_adi, 'clip', str(klip_index), klip_hashleri[klip_index], hata)
+                except Exception as e:
+                    logger.debug(f"Journal kayıt hatası (klip {klip_index}): {e}")
+
                 if not ilk_hata_gosterildi and hata:
                     ilk_hata_gosterildi = True
                     print(f"\n   ⚠️  İLK HATA (Klip {klip_index}): {hata}")
@@ -5473,18 +6612,65 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
 
     print()
 
+    # Ffmpeg'ler worker process'lerde: en az klip başına bir subprocess
+    encode_span['subprocesses'] += len(args_list)
+    encode_span['failed_clips'] = len(basarisiz)
+    telemetry_span_kapat(encode_span, ok=bool(basarili_klip))
+
     # Encoding summary with timing
     total_time = time.time() - start_time
     print(f"\n   Tamamlandı: {total_time:.0f}s ({len(basarili_klip)}/{toplam} klip)")
+    ffmpeg_retry_policy.stats.print_summary()
+
+    if cache_oncesi is not None:
+        try:
+            cache_sonrasi = cache_store.istatistikler()
+            fark = {k: cache_sonrasi[k] - cache_oncesi[k]
+                    for k in ('hits', 'misses', 'evictions', 'hardlinks', 'reflinks', 'copies')}
+            print(f"   Cache: {fark['hits']} hit / {fark['misses']} miss | "
+                  f"{cache_sonrasi['total_bytes'] / 1024 ** 2:.0f} MB, {cache_sonrasi['objects']} obje")
+            logger.info(f"Cache sayaçları: {fark}")
+        except Exception as e:
+            logger.debug(f"Cache istatistikleri okunamadı: {e}")
 
     if not basarili_klip:
         return False, "Hiçbir klip işlenemedi."
 
+    if altyazi_klipte and basarisiz:
+        # Sonraki dilimlerin offset'leri eksik klibi içerir: boşluk aynı kare
+        # sayısında doldurulmazsa görüntü ve altyazı anlatıma göre kayar
+        tamamlananlar = {idx for idx, _ in basarili_klip}
+        eksikler = [i + 1 for i in range(len(playlist)) if i + 1 not in tamamlananlar]
+        print(f"   ⬛ {len(eksikler)} eksik klip boşluk klibiyle dolduruluyor (altyazı hizası korunur)")
+        for klip_index in eksikler:
+            bosluk = bosluk_klibi_olustur(altyazi_dilimleri[klip_index - 1], klip_index, temp_klasor)
+            if bosluk is None:
+                return False, f"Klip {klip_index} eksik ve boşluk klibi oluşturulamadı: altyazı hizalanamaz"
+            basarili_klip.append((klip_index, bosluk))
+
     basarili_klip.sort(key=lambda x: x[0])
 
     # TRANSİTİON EFFECTS SEÇİMİ
+    # xfade sadece sessiz birleştirmede çalışır; plan ve süre ölçümü o zaman yapılır
+    xfade_uygun = (TRANSITION_EFFECTS['enabled'] and
+                   len(basarili_klip) > 1 and
+                   (len(basarili_klip) <= 15 or
+                    (TRANSITION_PLANNER_AVAILABLE and TRANSITION_PLANNER_CONFIG['hierarchical'])) and
+                   not ses_dosyasi)
+
     transitions = []
-    if TRANSITION_EFFECTS['enabled'] and len(basarili_klip) > 1:
+    klip_sureleri = [playlist[idx - 1]['gercek_sure'] for idx, _ in basarili_klip]
+    if xfade_uygun and TRANSITION_PLANNER_AVAILABLE:
+        # Offset'ler planlanan değil encode edilmiş (kare sınırına yuvarlanmış) sürelerden
+        klip_sureleri = klip_sureleri_olc([klip for _, klip in basarili_klip], klip_sureleri)
+        transitions = gecis_plani_olustur(klip_sureleri)
+        plan_hatalari = plan_dogrula(klip_sureleri, transitions)
+        if plan_hatalari:
+            logger.warning(f"⚠️ Geçiş planı geçersiz, xfade kullanılmayacak: {plan_hatalari[0]}")
+            transitions = []
+        else:
+            logger.debug(f"Geçiş planı: {len(transitions)} geçiş, toplam {plan_suresi(klip_sureleri, transitions):.1f}s")
+    elif xfade_uygun:
         used_transitions = []
 
         for i in range(len(basarili_klip) - 1):
@@ -5496,8 +6682,10 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
                     logger.debug(f"Transition {i + 1}: {trans['type']} ({trans['duration']}s)")
 
     print(f"   Birleştirme başladı...")
+    scratch_olc(temp_klasor)  # Klipler + segmentler: tipik tepe noktası
+    concat_span = telemetry_span_ac('concat', clips=len(basarili_klip), transitions=len(transitions))
 
-    concat_liste = os.path.join(temp_klasor, 'list.txt')
+    concat_liste = scratch_yolu(temp_klasor, 'list.txt')
     with open(concat_liste, 'w', encoding='utf-8') as f:
         for _, klip in basarili_klip:
             path = klip.replace('\\', '/')
@@ -5505,10 +6693,7 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
 
     cikti_yolu = os.path.join(klasor_yolu, cikti_adi)
 
-    use_xfade = (TRANSITION_EFFECTS['enabled'] and
-                 transitions and
-                 len(basarili_klip) <= 15 and
-                 not ses_dosyasi)
+    use_xfade = xfade_uygun and bool(transitions)
 
     if ses_dosyasi:
         print(f"   Ses ekleniyor...")
@@ -5521,111 +6706,42 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
             logger.warning("⚠️ Could not get audio duration, video may be longer than audio")
             ses_suresi = None
 
-        temp_video = os.path.join(temp_klasor, 'merged_nosound.mp4')
-
-        komut = [
-            'ffmpeg', '-v', 'warning',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', concat_liste,
-            '-c', 'copy',
-            '-y', temp_video
-        ]
-        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-        if sonuc.returncode != 0 or not dosya_gecerli_mi(temp_video):
-            return False, f"Video birleştirme hatası: {sonuc.stderr[:200]}"
-
-        # ✅ CRITICAL FIX: Scale concat video ÖNCE subtitle'dan
-        # Problem: Concat edilen kliplerde farklı boyutlar var (1918x1078, 1908x1068, vb.)
-        # Bu GPU encoder'ı crash ettirir (resolution changes)
-        # Çözüm: Concat'tan sonra tüm video'yu kesin 1920x1080'e scale et
-        temp_scaled = os.path.join(temp_klasor, 'merged_scaled.mp4')
-        logger.info("🔧 Normalizing video resolution to 1920x1080...")
-
-        # Scale için GPU encoding - klip encoding ile aynı parametreler
-        if GPU_OPTIMIZER_AVAILABLE and NVENC_INFO['available'] and encoder_type == 'nvidia':
-            nv_settings = QUALITY_SETTINGS['nvidia']
-            scale_komut = [
-                'ffmpeg', '-v', 'warning',
-                '-i', temp_video,
-                '-vf', 'scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2',
-                '-c:v', 'h264_nvenc',
-                '-preset', nv_settings['preset'],
-                '-rc', nv_settings['rc'],
-                '-b:v', nv_settings['bitrate'],
-                '-maxrate', nv_settings['maxrate'],
-                '-bufsize', nv_settings['bufsize'],
-                '-profile:v', nv_settings['profile'],
-                '-pix_fmt', 'yuv420p',
-                '-an',
-                '-y', temp_scaled
-            ]
-            logger.info("🚀 Scale: NVENC GPU encoding")
-        else:
-            scale_komut = [
-                'ffmpeg', '-v', 'warning',
-                '-i', temp_video,
-                '-vf', 'scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2',
-                '-c:v', 'libx264',
-                '-preset', 'fast',
-                '-crf', '18',
-                '-pix_fmt', 'yuv420p',
-                '-an',
-                '-y', temp_scaled
-            ]
-            logger.info("🔧 Scale: CPU encoding")
-
-        scale_sonuc = subprocess.run(scale_komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-        if scale_sonuc.returncode != 0 or not dosya_gecerli_mi(temp_scaled):
-            error_msg = scale_sonuc.stderr[:300] if scale_sonuc.stderr else scale_sonuc.stdout[:300] if scale_sonuc.stdout else "No output"
-            logger.warning(f"⚠️ Scale failed (code {scale_sonuc.returncode}): {error_msg}")
-            logger.debug(f"Scale command: {' '.join(scale_komut[:10])}...")
-            temp_scaled = temp_video  # Fallback
-        else:
-            logger.info("✅ Video normalized to 1920x1080")
-            temp_video = temp_scaled  # Use scaled version
-
         audio_cfg = AUDIO_SETTINGS
 
-        audio_filtreler = []
-
-        # 🔧 STEP 1: SAMPLE RATE CONVERSION (ALWAYS FIRST)
-        # Convert to target sample rate before any processing to maintain quality
+        # 🔧 STEP 1-2: SAMPLE RATE CONVERSION + MONO TO STEREO (ALWAYS FIRST)
+        # Loudness ölçümü bu ön zincirin çıkışında yapıldı
+        audio_filtreler = _ses_on_filtreleri(audio_cfg)
         if audio_cfg['sample_rate'] != '44100':
-            audio_filtreler.append(f"aresample={audio_cfg['sample_rate']}")
             logger.info(f"🔧 Sample rate conversion: input → {audio_cfg['sample_rate']}Hz")
-
-        # 🔧 STEP 2: MONO TO STEREO CONVERSION (PROPER UPMIXING)
-        # Use pan filter for proper mono→stereo conversion instead of just channel duplication
-        # This provides better stereo image and prevents phase issues
-        audio_filtreler.append("pan=stereo|FL=FC|FR=FC")
         logger.info("🔧 Mono→Stereo conversion applied (proper upmixing)")
 
-        # 🎙️ STEP 3: AUDIO HUMANIZATION (if enabled)
-        use_audio_humanization = False
-        if AUDIO_HUMANIZATION_AVAILABLE:
-            try:
-                humanized_audio = build_humanized_audio_filter()
-
-                if humanized_audio and humanized_audio.get('audio_filters'):
-                    # Add humanization filters
-                    audio_filtreler.append(humanized_audio['audio_filters'])
-                    use_audio_humanization = True
-                    logger.info("🎙️ Audio humanization applied (AI → Human voice)")
+        # 🔧 STEP 3: LOUDNESS NORMALIZATION (always applied, ölçülen ön zincirin hemen arkasında)
+        if audio_cfg['normalization']:
+            # Ölçüm klip encode'u sırasında arka planda yapıldı (veya cache'ten geldi) → lineer mod
+            olcum = None
+            if loudness_future is not None:
+                bekleme = time.time()
+                olcum = loudness_future.result()
+                concat_span['loudness_wait_s'] = round(time.time() - bekleme, 2)
+            concat_span['loudness_linear'] = olcum is not None
+
+            if LOUDNESS_AVAILABLE:
+                audio_filtreler.append(loudnorm_filtresi(_loudness_hedefi(audio_cfg), olcum))
+            else:
+                audio_filtreler.append(
+                    f"loudnorm=I={audio_cfg['target_loudness']}:"
+                    f"TP={audio_cfg['true_peak']}:"
+                    f"LRA={audio_cfg['lra']}"
+                )
 
-            except Exception as e:
-                logger.warning(f"⚠️ Audio humanization failed, using standard: {e}")
-                use_audio_humanization = False
+        # 🎙️ STEP 4: AUDIO HUMANIZATION (if enabled; rastgele, loudnorm'dan sonra)
+        ses_humanizasyon = _ses_humanizasyon_filtresi()
+        use_audio_humanization = bool(ses_humanizasyon)
+        if use_audio_humanization:
+            audio_filtreler.append(ses_humanizasyon)
+            logger.info("🎙️ Audio humanization applied (AI → Human voice)")
 
-        # 🔧 STEP 4: LOUDNESS NORMALIZATION (always applied)
         if audio_cfg['normalization']:
-            audio_filtreler.append(
-                f"loudnorm=I={audio_cfg['target_loudness']}:"
-                f"TP={audio_cfg['true_peak']}:"
-                f"LRA={audio_cfg['lra']}"
-            )
             # ✅ İYİLEŞTİRİLDİ: Daha sıkı limiter threshold (clipping'i önlemek için)
             # 0.95 → 0.88 (clipping kesinlikle önlenir)
             audio_filtreler.append("alimiter=limit=0.88:attack=5:release=50:level=disabled")
@@ -5646,149 +6762,228 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
 
         audio_filtre_str = ','.join(audio_filtreler)
 
-        # Final merge - CPU decode + NVENC encode (subtitle filtresi CPU gerektiriyor)
-        komut = [
-            'ffmpeg', '-v', 'warning',
-            '-i', temp_video,
-            '-i', ses_dosyasi,
-            '-map', '0:v',
-            '-map', '1:a',
-        ]
-
-        if subtitle_config and subtitle_config.get('srt_file'):
-            ass_file = subtitle_config['srt_file']
-            ass_path = ass_file.replace('\\', '/')
-
-            print(f"   📝 Alt yazılar ekleniyor: {os.path.basename(ass_file)}")
-
-            import re
-            if re.match(r'^[A-Za-z]:', ass_path):
-                ass_path_escaped = ass_path.replace(':', '\\:', 1)
+        altyazi_gecisi = bool(subtitle_config and subtitle_config.get('srt_file') and not altyazi_klipte)
+        altyazi_basildi = altyazi_klipte
+        temp_video = None
+        sonuc = None
+
+        # 🔀 Ara dosyasız yol: final mux concat'ı doğrudan okur, scale geçişi boru ile bağlanır.
+        # Parçalı altyazı geçişi keyframe'lerde seek ettiği için ara dosyalı yolda kalır.
+        if (STAGE_PIPE_AVAILABLE and STAGE_PIPE_CONFIG['enabled']
+                and not (altyazi_gecisi and altyazi_paralel_uygun(ses_suresi or sum(klip_sureleri)))):
+            concat_girdi = ['-f', 'concat', '-safe', '0', '-i', concat_liste]
+            ass_file = subtitle_config['srt_file'] if altyazi_gecisi else None
+
+            final_baslangic = time.time()
+            if altyazi_klipte:
+                logger.info("🔧 Clips already normalized to 1920x1080, scale pass skipped")
+                komut = _final_mux_komutu(concat_girdi, ses_dosyasi, None, encoder_type,
+                                          ses_suresi, audio_filtre_str, cikti_yolu)
+                sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                concat_span['handoff'] = 'direct'
             else:
-                ass_path_escaped = ass_path
+                # Final mux zaten encode ediyorsa (altyazı) scale geçişi ham kare aktarır: tek encode
+                logger.info("🔧 Normalizing video resolution to 1920x1080 (pipe → final mux)...")
+                uretici = _scale_komutu(concat_girdi, encoder_type, uretici_cikisi(ham=ass_file is not None),
+                                        ham=ass_file is not None)
+                komut = _final_mux_komutu(tuketici_girisi(), ses_dosyasi, ass_file, encoder_type,
+                                          ses_suresi, audio_filtre_str, cikti_yolu)
+                try:
+                    sonuc = boru_ile_calistir(uretici, komut)
+                except OSError as e:
+                    sonuc = subprocess.CompletedProcess(args=[], returncode=1, stdout='', stderr=str(e))
+                concat_span['handoff'] = 'pipe'
+            final_sure = time.time() - final_baslangic
 
-            # Subtitle encoding için GPU - klip encoding ile aynı parametreler
-            if GPU_OPTIMIZER_AVAILABLE and NVENC_INFO['available'] and encoder_type == 'nvidia':
-                nv_settings = QUALITY_SETTINGS['nvidia']
-                print(f"   🚀 NVENC GPU altyazı encoding")
-                komut.extend([
-                    '-vf', f"subtitles='{ass_path_escaped}'",
-                    '-c:v', 'h264_nvenc',
-                    '-preset', nv_settings['preset'],
-                    '-rc', nv_settings['rc'],
-                    '-b:v', nv_settings['bitrate'],
-                    '-maxrate', nv_settings['maxrate'],
-                    '-bufsize', nv_settings['bufsize'],
-                    '-profile:v', nv_settings['profile'],
-                    '-pix_fmt', 'yuv420p',
-                ])
-            else:
-                print(f"   📝 CPU altyazı encoding")
-                komut.extend([
-                    '-vf', f"subtitles='{ass_path_escaped}'",
-                    '-c:v', 'libx264',
-                    '-preset', 'fast',
-                    '-crf', '18',
-                    '-pix_fmt', 'yuv420p',
-                ])
-        else:
-            komut.extend(['-c:v', 'copy'])
+            if sonuc.returncode != 0 or not dosya_gecerli_mi(cikti_yolu):
+                logger.warning(f"⚠️ Ara dosyasız birleştirme başarısız, ara dosyalarla tekrar denenecek: "
+                               f"{sonuc.stderr[-300:]}")
+                concat_span['handoff'] = 'file'
+                sonuc = None
 
-        # ✅ FIX: Limit output duration to audio duration (video = audio length)
-        # This ensures video doesn't exceed audio duration by more than a few seconds
-        if ses_suresi:
-            # Add small buffer (2 seconds) to ensure smooth ending
-            komut.extend(['-t', str(ses_suresi + 2)])
-            logger.info(f"🎬 Output duration limited to {ses_suresi + 2:.2f}s (audio + 2s buffer)")
+        if sonuc is None:
+            temp_video = os.path.join(temp_klasor, 'merged_nosound.mp4')
 
-        komut.extend([
-            '-c:a', audio_cfg['codec'],
-            '-b:a', audio_cfg['bitrate'],
-            '-ar', audio_cfg['sample_rate'],
-            '-ac', str(audio_cfg['channels']),
-            '-af', audio_filtre_str,
-            '-movflags', '+faststart',
-            '-y', cikti_yolu
-        ])
+            komut = [
+                'ffmpeg', '-v', 'warning',
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', concat_liste,
+                '-c', 'copy',
+                '-y', temp_video
+            ]
+            sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
 
-        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            if sonuc.returncode != 0 or not dosya_gecerli_mi(temp_video):
+                telemetry_span_kapat(concat_span, ok=False)
+                return False, f"Video birleştirme hatası: {sonuc.stderr[:200]}"
+
+            # Altyazılı kliplerde boyut ve kare hızı klip encode'unda sabitlendi: scale geçişi gerekmez
+            if altyazi_klipte:
+                logger.info("🔧 Clips already normalized to 1920x1080, scale pass skipped")
+            else:
+                # ✅ CRITICAL FIX: Scale concat video ÖNCE subtitle'dan
+                # Problem: Concat edilen kliplerde farklı boyutlar var (1918x1078, 1908x1068, vb.)
+                # Bu GPU encoder'ı crash ettirir (resolution changes)
+                # Çözüm: Concat'tan sonra tüm video'yu kesin 1920x1080'e scale et
+                temp_scaled = os.path.join(temp_klasor, 'merged_scaled.mp4')
+                logger.info("🔧 Normalizing video resolution to 1920x1080...")
+
+                scale_komut = _scale_komutu(['-i', temp_video], encoder_type, ['-y', temp_scaled])
+                scale_sonuc = subprocess.run(scale_komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+                if scale_sonuc.returncode != 0 or not dosya_gecerli_mi(temp_scaled):
+                    error_msg = scale_sonuc.stderr[:300] if scale_sonuc.stderr else scale_sonuc.stdout[:300] if scale_sonuc.stdout else "No output"
+                    logger.warning(f"⚠️ Scale failed (code {scale_sonuc.returncode}): {error_msg}")
+                    logger.debug(f"Scale command: {' '.join(scale_komut[:10])}...")
+                    temp_scaled = temp_video  # Fallback
+                else:
+                    logger.info("✅ Video normalized to 1920x1080")
+                    temp_video = temp_scaled  # Use scaled version
+
+            # Ayrı altyazı geçişi gerekiyorsa önce parçalar halinde paralel bas, final'de kopyala
+            if altyazi_gecisi:
+                temp_subbed = os.path.join(temp_klasor, 'merged_subbed.mp4')
+                if altyazi_paralel_gecis(temp_video, subtitle_config['srt_file'], temp_subbed,
+                                         encoder_type, temp_klasor, ses_suresi or sum(klip_sureleri)):
+                    try:
+                        os.remove(temp_video)
+                    except OSError:
+                        pass
+                    temp_video = temp_subbed
+                    altyazi_basildi = True
+                    concat_span['subtitle_pass'] = 'chunked'
+
+            komut = _final_mux_komutu(['-i', temp_video], ses_dosyasi,
+                                      subtitle_config['srt_file'] if altyazi_gecisi and not altyazi_basildi else None,
+                                      encoder_type, ses_suresi, audio_filtre_str, cikti_yolu)
+
+            final_baslangic = time.time()
+            sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            final_sure = time.time() - final_baslangic
 
         if sonuc.returncode != 0:
             error_msg = sonuc.stderr[:500] if sonuc.stderr else sonuc.stdout[:500] if sonuc.stdout else "No FFmpeg output"
             logger.error(f"Encoding hatası (code {sonuc.returncode}): {error_msg}")
             logger.error(f"FFmpeg command: {' '.join(komut[:15])}...")
+            telemetry_span_kapat(concat_span, ok=False)
             return False, f"Ses+altyazı birleştirme hatası: {error_msg}"
 
         logger.info(f"✅ Final encoding başarılı")
 
+        if altyazi_klipte:
+            # Atlanan scale + altyazı geçişlerinin tahmini maliyeti: klip encode'unda
+            # ölçülen, video saniyesi başına CPU/GPU-saniyesi × final süre × 2 geçiş
+            concat_span['subtitle_pass'] = 'inline'
+            tasarruf = None
+            if encode_edilen_sure > 0:
+                saniye_maliyeti = total_time * max_workers / encode_edilen_sure
+                tasarruf = max(0.0, (ses_suresi or sum(klip_sureleri)) * saniye_maliyeti * 2 - final_sure)
+                concat_span['saved_est_s'] = round(tasarruf, 1)
+            tasarruf_str = f", ~{tasarruf:.0f}s kazanıldı" if tasarruf is not None else ""
+            print(f"   ⏱️  Final mux: {final_sure:.1f}s (-c:v copy, altyazı/scale geçişi yok{tasarruf_str})")
+            logger.info(f"Altyazı klip encode'unda basıldı: final mux {final_sure:.1f}s{tasarruf_str}")
+        elif subtitle_config and subtitle_config.get('srt_file') and not altyazi_basildi:
+            concat_span['subtitle_pass'] = 'final'
+
         # Verify output file exists and has audio
         if not dosya_gecerli_mi(cikti_yolu):
             logger.error(f"Output file not created or invalid: {cikti_yolu}")
+            telemetry_span_kapat(concat_span, ok=False)
             return False, "Çıktı dosyası oluşturulamadı"
 
-        try:
-            os.remove(temp_video)
-        except:
-            pass
+        if temp_video:
+            try:
+                os.remove(temp_video)
+            except:
+                pass
 
     else:
         if subtitle_config and subtitle_config.get('srt_file'):
-            temp_merged = os.path.join(temp_klasor, 'merged_temp.mp4')
-
-            komut = [
-                'ffmpeg', '-v', 'warning',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', concat_liste,
-                '-c', 'copy',
-                '-y', temp_merged
-            ]
-            sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            # 🔀 Tek geçişli altyazı seek gerektirmez: concat'ı doğrudan okur, ara dosya yazılmaz
+            temp_merged = None
+            video_girdisi = ['-f', 'concat', '-safe', '0', '-i', concat_liste]
+            if not (STAGE_PIPE_AVAILABLE and STAGE_PIPE_CONFIG['enabled']) or altyazi_paralel_uygun(sum(klip_sureleri)):
+                temp_merged = os.path.join(temp_klasor, 'merged_temp.mp4')
+                video_girdisi = ['-i', temp_merged]
+
+                komut = [
+                    'ffmpeg', '-v', 'warning',
+                    '-f', 'concat',
+                    '-safe', '0',
+                    '-i', concat_liste,
+                    '-c', 'copy',
+                    '-y', temp_merged
+                ]
+                sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
 
-            if sonuc.returncode != 0:
-                return False, f"Video birleştirme hatası: {sonuc.stderr[:200]}"
+                if sonuc.returncode != 0:
+                    telemetry_span_kapat(concat_span, ok=False)
+                    return False, f"Video birleştirme hatası: {sonuc.stderr[:200]}"
 
             print(f"   📝 Alt yazılar ekleniyor: {os.path.basename(subtitle_config['srt_file'])}")
 
-            ass_file = subtitle_config['srt_file']
-            ass_path = ass_file.replace('\\', '/')
-
-            import re
-            if re.match(r'^[A-Za-z]:', ass_path):
-                ass_path_escaped = ass_path.replace(':', '\\:', 1)
+            if temp_merged and altyazi_paralel_gecis(temp_merged, subtitle_config['srt_file'], cikti_yolu,
+                                                     encoder_type, temp_klasor, sum(klip_sureleri)):
+                concat_span['subtitle_pass'] = 'chunked'
+                sonuc = subprocess.CompletedProcess(args=[], returncode=0, stdout='', stderr='')
             else:
-                ass_path_escaped = ass_path
+                concat_span['subtitle_pass'] = 'final'
+                ass_file = subtitle_config['srt_file']
+                ass_path = ass_file.replace('\\', '/')
 
-            komut = [
-                'ffmpeg', '-v', 'warning',
-                '-i', temp_merged,
-                '-vf', f"subtitles='{ass_path_escaped}'",
-                '-c:v', 'libx264',
-                '-preset', 'fast',
-                '-crf', '18',
-                '-c:a', 'copy',
-                '-movflags', '+faststart',
-                '-y', cikti_yolu
-            ]
-            sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                import re
+                if re.match(r'^[A-Za-z]:', ass_path):
+                    ass_path_escaped = ass_path.replace(':', '\\:', 1)
+                else:
+                    ass_path_escaped = ass_path
 
-            try:
-                os.remove(temp_merged)
-            except:
-                pass
+                komut = [
+                    'ffmpeg', '-v', 'warning',
+                    *video_girdisi,
+                    '-vf', f"subtitles='{ass_path_escaped}'",
+                    '-c:v', 'libx264',
+                    '-preset', 'fast',
+                    '-crf', '18',
+                    '-c:a', 'copy',
+                    '-movflags', '+faststart',
+                    '-y', cikti_yolu
+                ]
+                sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+            if temp_merged:
+                try:
+                    os.remove(temp_merged)
+                except:
+                    pass
         else:
-            komut = [
-                'ffmpeg', '-v', 'warning',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', concat_liste,
-                '-c', 'copy',
-                '-movflags', '+faststart',
-                '-y', cikti_yolu
-            ]
-            sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            sonuc = None
+            if use_xfade and TRANSITION_PLANNER_AVAILABLE and 'offset' in transitions[0]:
+                sonuc = xfade_hiyerarsik_birlestir(
+                    [klip for _, klip in basarili_klip], klip_sureleri, transitions,
+                    cikti_yolu, encoder_type, temp_klasor
+                )
+                if sonuc.returncode != 0 or not dosya_gecerli_mi(cikti_yolu):
+                    logger.warning(f"⚠️ xfade birleştirme başarısız, concat kullanılacak: {sonuc.stderr[:200]}")
+                    sonuc = None
+
+            if sonuc is None:
+                komut = [
+                    'ffmpeg', '-v', 'warning',
+                    '-f', 'concat',
+                    '-safe', '0',
+                    '-i', concat_liste,
+                    '-c', 'copy',
+                    '-movflags', '+faststart',
+                    '-y', cikti_yolu
+                ]
+                sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
 
     if sonuc.returncode == 0 and dosya_gecerli_mi(cikti_yolu):
+        concat_span['bytes'] = os.path.getsize(cikti_yolu)
+        scratch_olc(temp_klasor)
+        telemetry_span_kapat(concat_span)
+
         temp_output = cikti_yolu + ".temp.mp4"
         final_output = metadata_randomize(cikti_yolu, temp_output)
 
@@ -5804,6 +6999,13 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
             except:
                 pass
 
+        if journal_aktif:
+            try:
+                asama_tamamlandi(cikti_adi, 'final', '', girdi_hash(sorted(klip_hashleri.values())), cikti_yolu)
+                run_bitir(cikti_adi)
+            except Exception as e:
+                logger.debug(f"Journal kayıt hatası (final): {e}")
+
         print(f"\n   🧹 Geçici dosyalar temizleniyor...")
 
         time.sleep(0.5)
@@ -5862,7 +7064,7 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
                 except:
                     pass
 
-        gecici_klasorler = ['temp_safe', 'temp_pro', 'temp_v4']
+        gecici_klasorler = ['temp_safe', 'temp_pro', 'temp_v4'] if batch_options is None else []
         for klasor in gecici_klasorler:
             klasor_path = os.path.join(klasor_yolu, klasor)
             if klasor_path != temp_klasor and os.path.exists(klasor_path):
@@ -5887,12 +7089,19 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
             # Hedef boyut: dakika başına ~25-30 MB (YouTube için ideal)
             # 30 dakika = ~800 MB hedef
             target_size_mb = 800
+            if batch_options is not None:
+                target_size_mb = batch_options.get('target_size_mb') or target_size_mb
 
             if current_size_mb > target_size_mb:
-                compress_secim = input(f"\n   🗜️  Dosya {target_size_mb} MB'dan büyük. Sıkıştırılsın mı? [E/h]: ").strip().lower()
+                if batch_options is not None:
+                    compress_secim = 'e' if batch_options.get('compress') else 'h'
+                else:
+                    compress_secim = input(f"\n   🗜️  Dosya {target_size_mb} MB'dan büyük. Sıkıştırılsın mı? [E/h]: ").strip().lower()
 
                 if compress_secim != 'h':
-                    post_render_compress(cikti_yolu, target_size_mb)
+                    with telemetry_span('compress', target_mb=target_size_mb) as sp:
+                        sp['bytes'] = os.path.getsize(cikti_yolu)
+                        sp['ok'] = post_render_compress(cikti_yolu, target_size_mb)
             else:
                 print(f"   ✅ Boyut ideal aralıkta!")
         except Exception as compress_err:
@@ -5908,10 +7117,13 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
                 # 1. Kalite Kontrolü
                 if ADVANCED_QUALITY_CHECKS.get('enabled', False):
                     logger.info("\n📊 KALITE KONTROLÜ:")
-                    quality_passed, quality_score, quality_details = post_render_quality_check(
-                        cikti_yolu,
-                        ADVANCED_QUALITY_CHECKS
-                    )
+                    with telemetry_span('qc') as sp:
+                        quality_passed, quality_score, quality_details = post_render_quality_check(
+                            cikti_yolu,
+                            ADVANCED_QUALITY_CHECKS
+                        )
+                        sp['bytes'] = os.path.getsize(cikti_yolu)
+                        sp['score'] = quality_score
 
                     if not quality_passed:
                         logger.warning("⚠️  Kalite kontrolü başarısız! Video yine de kaydedildi.")
@@ -5963,11 +7175,132 @@ def parallel_encode(playlist, cikti_adi, temp_klasor, klasor_yolu, encoder_type,
 
         return True, cikti_yolu
     else:
+        telemetry_span_kapat(concat_span, ok=False)
         return False, f"Birleştirme hatası: {sonuc.stderr[:200]}"
 
 
 # ==================== PLAYLIST ====================
 
+def proxy_video_bilgileri(video_bilgileri):
+    """👁️ Önizleme: kaynak yolları cache'lenmiş düşük çözünürlüklü proxy'lerle değiştir"""
+    if not PROXY_PREVIEW_AVAILABLE:
+        return video_bilgileri
+
+    with telemetry_span('proxy', videos=len(video_bilgileri)) as sp:
+        proxyler = proxyleri_hazirla([v['yol'] for v in video_bilgileri])
+        sp['proxies'] = len(proxyler)
+    print(f"   👁️ Proxy: {len(proxyler)}/{len(video_bilgileri)} kaynak ({PROXY_PREVIEW_CONFIG['height']}p)")
+    return [dict(v, yol=proxyler[v['yol']]) if v['yol'] in proxyler else v for v in video_bilgileri]
+
+
+def _onizleme_klibi(item, klip_index, cikti, secilen_efektler, dilim, offset, ses_dosyasi):
+    """Önizleme klibi: tam render'ın filtre zinciri, proxy boyutunda, ultrafast"""
+    cfg = PROXY_PREVIEW_CONFIG
+    filtre = klip_video_filtresi(item, klip_index, cinematic_effects_uret(klip_index, secilen_efektler),
+                                 fingerprint_parametreleri_olustur(klip_index), dilim,
+                                 job_dir=os.path.dirname(cikti))
+    if not dilim:
+        # Dilimsiz kliplerde boyut/kare hızı concat için burada sabitlenir
+        normalize = ("scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,"
+                     f"setsar=1,fps={VIDEO_OUTPUT['fps']}")
+        filtre = f"{filtre},{normalize}" if filtre else normalize
+
+    komut = ['ffmpeg', '-v', 'error', '-nostdin', '-i', item['dosya']]
+    if ses_dosyasi:
+        komut.extend(['-ss', f"{offset:.3f}", '-t', f"{item['gercek_sure']:.3f}", '-i', ses_dosyasi,
+                      '-map', '0:v:0', '-map', '1:a:0', '-c:a', 'aac', '-b:a', cfg['audio_bitrate']])
+    else:
+        komut.append('-an')
+    komut.extend(['-vf', filtre_olcekle(filtre)])
+    if dilim:
+        komut.extend(['-frames:v', str(dilim['frames'])])
+    else:
+        komut.extend(['-t', f"{item['gercek_sure']:.3f}"])
+    komut.extend([
+        '-c:v', 'libx264', '-preset', cfg['preview_preset'], '-crf', str(cfg['preview_crf']),
+        '-pix_fmt', 'yuv420p', '-y', cikti
+    ])
+    sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    return sonuc.returncode == 0 and dosya_gecerli_mi(cikti), sonuc.stderr[-300:]
+
+
+def onizleme_render(playlist, cikti_adi, temp_klasor, klasor_yolu, ses_dosyasi=None,
+                    subtitle_config=None, secilen_efektler=None):
+    """
+    👁️ Hızlı önizleme: stil/efekt/altyazı kontrolü için tam render yerine
+
+    Playlist proxy'ler üzerinden kurulmuş olmalı (proxy_video_bilgileri).
+    Zaman çizelgesinden örneklenen pencerelerdeki klipler tam render'daki
+    filtre zincirleriyle, proxy boyutunda encode edilir; altyazı ve anlatım
+    klibin tam çizelgedeki yerinden alınır. Geçişler, loudnorm ve
+    sıkıştırma atlanır.
+
+    Returns:
+        (basarili, cikti_yolu | hata mesajı)
+    """
+    if not PROXY_PREVIEW_AVAILABLE:
+        return False, "Proxy preview modülü yok"
+
+    baslangic = time.time()
+    pw, ph = proxy_boyutu()
+    print(f"\n👁️ Önizleme render ({pw}x{ph})...")
+
+    subtitle_config = altyazi_dosyasi_hazirla(subtitle_config, temp_klasor)
+    dilimler = [None] * len(playlist)
+    if subtitle_config and subtitle_config.get('srt_file'):
+        dilimler = altyazi_dilimleri_olustur(playlist, subtitle_config['srt_file'])
+
+    # Ses/altyazı zamanı: tam çizelgedeki başlangıç (dilim varsa kare hassas)
+    offsetler = []
+    zaman = 0.0
+    for item, dilim in zip(playlist, dilimler):
+        offsetler.append(dilim['offset'] if dilim else zaman)
+        zaman += item['gercek_sure']
+
+    secilen = pencere_sec([item['gercek_sure'] for item in playlist])
+    print(f"   Pencereler: {len(secilen)}/{len(playlist)} klip "
+          f"({sure_formatla(sum(playlist[i]['gercek_sure'] for i in secilen))} / {sure_formatla(zaman)})")
+
+    dosyalar = {i: os.path.join(temp_klasor, f"p_{i + 1:05d}.mp4") for i in secilen}
+    workers = PROXY_PREVIEW_CONFIG['workers'] or max(2, multiprocessing.cpu_count() // 2)
+    with telemetry_span('preview', clips=len(secilen)) as sp:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_onizleme_klibi, playlist[i], i + 1, dosyalar[i], secilen_efektler,
+                                dilimler[i], offsetler[i], ses_dosyasi): i
+                for i in secilen
+            }
+            hazir = []
+            for future in as_completed(futures):
+                ok, hata = future.result()
+                if ok:
+                    hazir.append(futures[future])
+                else:
+                    logger.warning(f"⚠️ Önizleme klibi {futures[future] + 1} başarısız: {hata}")
+        sp['ok_clips'] = len(hazir)
+
+        if not hazir:
+            sp['ok'] = False
+            return False, "Önizleme klibi üretilemedi"
+
+        concat_liste = scratch_yolu(temp_klasor, 'preview_list.txt')
+        with open(concat_liste, 'w', encoding='utf-8') as f:
+            for i in sorted(hazir):
+                path = dosyalar[i].replace('\\', '/')
+                f.write(f"file '{path}'\n")
+
+        cikti_yolu = os.path.join(klasor_yolu, f"preview_{cikti_adi}")
+        komut = ['ffmpeg', '-v', 'warning', '-f', 'concat', '-safe', '0', '-i', concat_liste,
+                 '-c', 'copy', '-movflags', '+faststart', '-y', cikti_yolu]
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if sonuc.returncode != 0 or not dosya_gecerli_mi(cikti_yolu):
+            sp['ok'] = False
+            return False, f"Önizleme birleştirilemedi: {sonuc.stderr[:200]}"
+
+    print(f"   ✅ Önizleme: {os.path.basename(cikti_yolu)} ({time.time() - baslangic:.1f}s)")
+    return True, cikti_yolu
+
+
 def playlist_olustur(video_bilgileri, hedef_sure, temp_klasor):
     print(f"\n🔬 Playlist oluşturuluyor...")
 
@@ -6035,9 +7368,147 @@ def playlist_olustur(video_bilgileri, hedef_sure, temp_klasor):
 
 # ==================== MAIN ====================
 
+def video_havuzu_oku(klasor_yolu, video_dosyalari=None, verbose=True):
+    """
+    Video havuzundaki dosyaların bilgilerini oku
+
+    Returns:
+        (video_bilgileri, toplam_sure)
+    """
+    if video_dosyalari is None:
+        video_dosyalari = video_dosyalarini_bul(klasor_yolu)
+
+    video_bilgileri = []
+    toplam_sure = 0
+
+    for video in video_dosyalari:
+        video_yolu = os.path.join(klasor_yolu, video)
+        bilgi = video_bilgisi_al(video_yolu)
+
+        if bilgi and bilgi['sure']:
+            video_bilgileri.append({
+                'ad': video,
+                'yol': video_yolu,
+                'sure': bilgi['sure']
+            })
+            toplam_sure += bilgi['sure']
+            if verbose:
+                codec_info = f" [{bilgi.get('codec')}]" if bilgi.get('codec') else ""
+                print(f"   ✓ {video[:50]}{codec_info} - {sure_formatla(bilgi['sure'])}")
+        else:
+            logger.warning(f"Atlandı: {video}")
+
+    return video_bilgileri, toplam_sure
+
+
+def girdi_on_kontrol(video_bilgileri, ses_dosyasi, subtitle_config, hedef_sure,
+                     encoder_config, klasorler, verbose=True):
+    """
+    Pahalı aşamalardan önce tüm girdileri tek seferde doğrula (preflight)
+
+    Returns:
+        (rapor, video_bilgileri) - okunamayan videolar havuzdan çıkarılmış olarak.
+        Preflight modülü yoksa (None, video_bilgileri).
+    """
+    if not PREFLIGHT_AVAILABLE or not PREFLIGHT_CONFIG['enabled']:
+        return None, video_bilgileri
+
+    with telemetry_span('preflight', files=len(video_bilgileri) + (1 if ses_dosyasi else 0)) as sp:
+        rapor = preflight_calistir(
+            [v['yol'] for v in video_bilgileri], ses_dosyasi, subtitle_config,
+            klasorler=klasorler, hedef_sure=hedef_sure,
+            encoders=(encoder_config.get('video', 'libx264'), 'aac')
+        )
+        sp['ok'] = rapor['ok']
+        sp['errors'] = len(rapor['errors'])
+
+    if verbose:
+        preflight_rapor_yazdir(rapor)
+
+    if rapor['bad_videos']:
+        video_bilgileri = [v for v in video_bilgileri if v['yol'] not in rapor['bad_videos']]
+    return rapor, video_bilgileri
+
+
+def altyazi_config_olustur(hikaye_modu=True, secilen_font=None, font_multiplier=1.0,
+                           outline_width=5, shadow=3, style=None):
+    """Kanal türüne göre altyazı config'i (style=None → moda göre otomatik)"""
+    subtitle_config = SUBTITLE_CONFIG.copy()
+
+    if hikaye_modu:
+        # HİKAYE MODU - Otomatik ayarlar
+        from config import STORY_CHANNEL_PRESET
+        subtitle_config['font'] = secilen_font
+        subtitle_config['fontsize'] = int(72 * font_multiplier)
+        subtitle_config['outline_width'] = outline_width
+        subtitle_config['shadow'] = shadow
+        subtitle_config['position'] = 'bottom'
+        subtitle_config['use_dynamic'] = False
+        subtitle_config['platform'] = STORY_CHANNEL_PRESET['platform']
+        subtitle_config['style'] = style or 'tiktok'  # 🎨 Otomatik: TikTok Viral
+
+    else:
+        # GENEL MOD - Manuel ayarlar
+        subtitle_config['font'] = secilen_font
+        subtitle_config['fontsize'] = int(72 * font_multiplier)
+        subtitle_config['outline_width'] = outline_width
+        subtitle_config['shadow'] = shadow
+        subtitle_config['position'] = 'bottom'
+        subtitle_config['use_dynamic'] = False
+        subtitle_config['style'] = style or 'classic'  # 🎨 Otomatik: Classic Karaoke
+
+    return subtitle_config
+
+
+def yarim_kalan_render_devam(run, encoder_type, encoder_config):
+    """
+    Journal'daki açık çalışmayı kayıtlı parametrelerle devam ettir
+
+    Doğrulanmış klipler atlanır; eksik/bozuk klipler ve sonraki aşamalar
+    yeniden yapılır.
+    """
+    params = run['params']
+    secilen_efektler = params.get('secilen_efektler')
+    temp_klasor = params['temp_klasor']
+
+    print(f"\n🚀 Devam ediliyor: {params['cikti_adi']}\n")
+    if LOGGING_SETUP_AVAILABLE:
+        job_log_ayarla(os.path.splitext(params['cikti_adi'])[0])
+    baslangic = time.time()
+    telemetry_run_baslat(mode='resume')
+    scratch_ac(params['cikti_adi'], temp_klasor)
+
+    try:
+        basarili, sonuc = parallel_encode(
+            params['playlist'], params['cikti_adi'], temp_klasor, params['klasor_yolu'],
+            encoder_type, encoder_config, params.get('ses_dosyasi'), params.get('subtitle_config'),
+            set(secilen_efektler) if secilen_efektler is not None else None,
+            batch_options=params.get('batch_options')
+        )
+    finally:
+        scratch_ozet = scratch_kapat(temp_klasor)
+
+    if os.path.exists(temp_klasor):
+        shutil.rmtree(temp_klasor, ignore_errors=True)
+    ilerleme_temizle(params['cikti_adi'])
+    telemetry_run_bitir(ok=basarili, output=params['cikti_adi'], scratch=scratch_ozet)
+
+    sure = time.time() - baslangic
+    if basarili:
+        print(f"\n✅ BAŞARILI: {sonuc} ({os.path.getsize(sonuc) / (1024 * 1024):.1f} MB, "
+              f"{int(sure // 60)}:{int(sure % 60):02d})")
+    else:
+        print(f"\n❌ HATA: {sonuc}")
+    return basarili, sonuc
+
+
 def main():
+    loglama_baslat()
     banner()
 
+    # 👁️ python main.py --onizleme: düşük çözünürlüklü hızlı önizleme
+    onizleme = '--onizleme' in sys.argv and PROXY_PREVIEW_AVAILABLE
+
     # ===== 🆕 YOUTUBE OPTİMİZASYONU: DURUM BİLGİLENDİRMESİ =====
     if YOUTUBE_OPTIMIZATION_ENABLED:
         print(f"\n" + "=" * 100)
@@ -6109,6 +7580,21 @@ def main():
 
     print()
 
+    # ===== 📒 YARIM KALAN RENDER =====
+    yarim_kalan = ilerleme_yukle() if JOB_JOURNAL_AVAILABLE else None
+    if yarim_kalan and yarim_kalan.get('params', {}).get('playlist'):
+        params = yarim_kalan['params']
+        # RAM scratch'teki segmentler çökmeyle kaybolmuş olabilir
+        if os.path.isdir(params['temp_klasor']) and all(os.path.exists(item['dosya']) for item in params['playlist']):
+            klipler = yarim_kalan['stages'].get('clip', {})
+            print(f"📒 Yarım kalan render bulundu: {params['cikti_adi']}")
+            print(f"   ✅ {klipler.get('done', 0)}/{len(params['playlist'])} klip tamamlanmış")
+            devam = input("   ▶️  Kaldığı yerden devam edilsin mi? [E/h]: ").strip().lower()
+            if devam != 'h':
+                yarim_kalan_render_devam(yarim_kalan, encoder_type, encoder_config)
+                return
+        ilerleme_temizle(params['cikti_adi'])
+
     eski_gecici_dosyalar = []
     for pattern in ['s_*.mp4', 'c_*.mp4', 'list.txt', '*.temp.mp4']:
         eski_gecici_dosyalar.extend(glob.glob(os.path.join(RENDER_KLASORU, pattern)))
@@ -6165,24 +7651,9 @@ def main():
     print(f"✅ {len(video_dosyalari)} video bulundu\n")
 
     print("📊 Video bilgileri:")
-    video_bilgileri = []
-    toplam_sure = 0
-
-    for video in video_dosyalari:
-        video_yolu = os.path.join(RANDOMS_KLASORU, video)
-        bilgi = video_bilgisi_al(video_yolu)
-
-        if bilgi and bilgi['sure']:
-            video_bilgileri.append({
-                'ad': video,
-                'yol': video_yolu,
-                'sure': bilgi['sure']
-            })
-            toplam_sure += bilgi['sure']
-            codec_info = f" [{bilgi.get('codec')}]" if bilgi.get('codec') else ""
-            print(f"   ✓ {video[:50]}{codec_info} - {sure_formatla(bilgi['sure'])}")
-        else:
-            logger.warning(f"Atlandı: {video}")
+    telemetry_run_baslat(mode='interactive')
+    with telemetry_span('probe', files=len(video_dosyalari)):
+        video_bilgileri, toplam_sure = video_havuzu_oku(RANDOMS_KLASORU, video_dosyalari)
 
     if not video_bilgileri:
         print("\n❌ Hiçbir video bilgisi okunamadı!")
@@ -6239,40 +7710,38 @@ def main():
     hedef_sure = hedef_sure_al(secilen_ses is not None, ses_suresi)
 
     # ========== SUBTITLE CONFIG (Kanal türüne göre) ==========
-    subtitle_config = SUBTITLE_CONFIG.copy()
-
-    if hikaye_modu:
-        # HİKAYE MODU - Otomatik ayarlar
-        from config import STORY_CHANNEL_PRESET
-        subtitle_config['font'] = secilen_font
-        subtitle_config['fontsize'] = int(72 * font_multiplier)
-        subtitle_config['outline_width'] = outline_width
-        subtitle_config['shadow'] = shadow
-        subtitle_config['position'] = 'bottom'
-        subtitle_config['use_dynamic'] = False
-        subtitle_config['platform'] = STORY_CHANNEL_PRESET['platform']
-        subtitle_config['style'] = 'tiktok'  # 🎨 Otomatik: TikTok Viral
+    subtitle_config = altyazi_config_olustur(hikaye_modu, secilen_font, font_multiplier, outline_width, shadow)
 
-    else:
-        # GENEL MOD - Manuel ayarlar
-        subtitle_config['font'] = secilen_font
-        subtitle_config['fontsize'] = int(72 * font_multiplier)
-        subtitle_config['outline_width'] = outline_width
-        subtitle_config['shadow'] = shadow
-        subtitle_config['position'] = 'bottom'
-        subtitle_config['use_dynamic'] = False
-        subtitle_config['style'] = 'classic'  # 🎨 Otomatik: Classic Karaoke
+    # ========== PREFLIGHT (transkripsiyon ve encode'dan önce) ==========
+    rapor, video_bilgileri = girdi_on_kontrol(
+        video_bilgileri, secilen_ses, subtitle_config, hedef_sure, encoder_config,
+        klasorler=(RENDER_KLASORU, os.path.join(RENDER_KLASORU, 'temp_pro'))
+    )
+    if rapor is not None and not rapor['ok']:
+        print("\n❌ Girdi kontrolü başarısız, render başlatılmadı.")
+        telemetry_run_bitir(False, reason='preflight')
+        input("\nDevam...")
+        return
 
     if subtitle_config and subtitle_config.get('mode') == 'auto' and secilen_ses:
-        subtitle_config = otomatik_altyazi_olustur(secilen_ses, subtitle_config)
+        with telemetry_span('transcribe', audio_s=ses_suresi) as sp:
+            sp['bytes'] = os.path.getsize(secilen_ses)
+            subtitle_config = otomatik_altyazi_olustur(secilen_ses, subtitle_config)
+            sp['ok'] = bool(subtitle_config)
         if not subtitle_config:
             print(f"   ⚠️  Otomatik altyazı başarısız, devam ediliyor...")
         elif subtitle_config.get('use_dynamic'):
             print(f"   🎨 Dinamik altyazı özellikleri uygulanacak!")
 
     cikti_adi = random_dosya_adi_olustur()
+    if LOGGING_SETUP_AVAILABLE:
+        job_log_ayarla(os.path.splitext(cikti_adi)[0])
     print(f"\n💾 ÇIKTI:")
     print(f"   📄 Dosya adı: {cikti_adi} (otomatik)")
+    if onizleme:
+        pw, ph = proxy_boyutu()
+        print(f"   👁️ Önizleme modu: {pw}x{ph}, en fazla {PROXY_PREVIEW_CONFIG['max_duration']}s "
+              f"({PROXY_PREVIEW_CONFIG['windows']} pencere)")
 
     print(f"\n" + "=" * 100)
     print("✅ CAPCUT SEÇİLEBİLİR EFEKT EDITION - 30+ EFEKT + 35+ GEÇİŞ".center(100))
@@ -6309,24 +7778,37 @@ def main():
 
     temp_klasor = os.path.join(RENDER_KLASORU, 'temp_pro')
     os.makedirs(temp_klasor, exist_ok=True)
+    scratch_ac(cikti_adi, temp_klasor)
 
     cache_temizle(max_size_gb=5)
 
+    basarili = False
     try:
         baslangic = time.time()
         render_start_datetime = datetime.now()
 
-        if secilen_ses and ses_suresi:
-            secilen_videolar = akilli_video_sec(video_bilgileri, ses_suresi, max_varyasyon=10)
-        else:
-            secilen_videolar = akilli_video_sec(video_bilgileri, hedef_sure, max_varyasyon=10)
+        # 👁️ Önizleme: segmentasyon ve klipler kaynak yerine cache'lenmiş proxy'lerle
+        if onizleme:
+            video_bilgileri = proxy_video_bilgileri(video_bilgileri)
 
-        playlist = playlist_olustur(secilen_videolar, hedef_sure, temp_klasor)
+        with telemetry_span('analysis', videos=len(video_bilgileri)):
+            if secilen_ses and ses_suresi:
+                secilen_videolar = akilli_video_sec(video_bilgileri, ses_suresi, max_varyasyon=10)
+            else:
+                secilen_videolar = akilli_video_sec(video_bilgileri, hedef_sure, max_varyasyon=10)
 
-        basarili, sonuc = parallel_encode(
-            playlist, cikti_adi, temp_klasor, RENDER_KLASORU,
-            encoder_type, encoder_config, secilen_ses, subtitle_config, secilen_efektler
-        )
+            playlist = playlist_olustur(secilen_videolar, hedef_sure, temp_klasor)
+
+        if onizleme:
+            basarili, sonuc = onizleme_render(
+                playlist, cikti_adi, temp_klasor, RENDER_KLASORU,
+                secilen_ses, subtitle_config, secilen_efektler
+            )
+        else:
+            basarili, sonuc = parallel_encode(
+                playlist, cikti_adi, temp_klasor, RENDER_KLASORU,
+                encoder_type, encoder_config, secilen_ses, subtitle_config, secilen_efektler
+            )
 
         sure = time.time() - baslangic
         render_end_datetime = datetime.now()
@@ -6339,9 +7821,14 @@ def main():
             except:
                 pass
 
-        ilerleme_temizle()
+        ilerleme_temizle(cikti_adi)
+
+        if basarili and onizleme:
+            # Önizleme: istatistik, sıkıştırma ve cache temizliği atlanır (proxy'ler korunur)
+            print(f"\n👁️ Önizleme hazır: {sonuc}")
+            print(f"   ⏱️  Süre: {sure_formatla(sure)}")
 
-        if basarili:
+        elif basarili:
             dosya_boyutu = os.path.getsize(sonuc) / (1024 * 1024)
             gercek_sure_info = video_bilgisi_al(sonuc)
             gercek_sure = gercek_sure_info['sure'] if gercek_sure_info else 0
@@ -6380,6 +7867,8 @@ def main():
 
             if os.path.exists(CACHE_KLASORU):
                 try:
+                    if CACHE_STORE_AVAILABLE:
+                        cache_store.kapat()
                     shutil.rmtree(CACHE_KLASORU, ignore_errors=True)
                     print(f"\n   ✅ Cache silindi!")
                 except:
@@ -6404,7 +7893,9 @@ def main():
 
                     if compress_secim != 'h':
                         compression_start = time.time()
-                        post_render_compress(sonuc, target_size_mb)
+                        with telemetry_span('compress', target_mb=target_size_mb) as sp:
+                            sp['bytes'] = os.path.getsize(sonuc)
+                            sp['ok'] = post_render_compress(sonuc, target_size_mb)
                         compression_seconds = time.time() - compression_start
                         # Boyutu güncelle
                         dosya_boyutu = os.path.getsize(sonuc) / (1024 * 1024)
@@ -6445,6 +7936,9 @@ def main():
     except Exception as e:
         print(f"\n❌ Beklenmeyen hata: {e}")
 
+    # Hata/iptal dahil her durumda RAM scratch silinir
+    telemetry_run_bitir(ok=basarili, output=cikti_adi, scratch=scratch_kapat(temp_klasor))
+
     # ===== 📊 FFMPEG HUMANIZATION STATISTICS =====
     if FFMPEG_HUMANIZATION_AVAILABLE:
         try:
@@ -6456,4 +7950,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if '--efekt-kalibrasyon' in sys.argv:
+        loglama_baslat()
+        efekt_maliyet_kalibrasyonu()
+    elif '--batch' in sys.argv:
+        from batch_runner import cli_main
+        sys.exit(cli_main(sys.argv[sys.argv.index('--batch') + 1:]))
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PARALLEL COMPRESS - Segment Paralel Sıkıştırma
+Girdi keyframe'lerden N parçaya bölünür, parçalar paralel encode edilir
+ve concat demuxer ile yeniden encode edilmeden birleştirilir.
+"""
+
+import os
+import shutil
+import logging
+import tempfile
+import subprocess
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+PARALLEL_COMPRESS_CONFIG = {
+    'enabled': True,
+
+    # Parça sayısı (None = CPU çekirdek sayısı / threads_per_chunk)
+    'chunks': None,
+    'threads_per_chunk': 2,
+
+    # Bundan kısa videolar bölünmez, parçalar bundan kısa olmaz (saniye)
+    'min_chunk_seconds': 30.0,
+
+    # Birleştirilmiş süre girdiden bu kadar saparsa sonuç reddedilir
+    'duration_tolerance': 0.5,
+
+    'probe_timeout': 300,
+}
+
+
+# ============================================================================
+# 🔍 KEYFRAME ANALİZİ
+# ============================================================================
+
+def keyframe_zamanlari(input_path: str) -> List[float]:
+    """
+    Video keyframe zamanları (paket bayraklarından, decode etmeden)
+
+    Returns:
+        Artan sırada zamanlar (saniye), hata durumunda boş liste
+    """
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts_time,flags',
+        '-of', 'csv=p=0',
+        input_path
+    ]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                timeout=PARALLEL_COMPRESS_CONFIG['probe_timeout'])
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"⚠️ Keyframe analizi başarısız: {e}")
+        return []
+
+    zamanlar = []
+    for line in result.stdout.splitlines():
+        parts = line.strip().split(',')
+        if len(parts) >= 2 and 'K' in parts[1]:
+            try:
+                zamanlar.append(float(parts[0]))
+            except ValueError:
+                continue
+
+    return sorted(set(zamanlar))
+
+
+def bolme_noktalari(keyframes: Sequence[float], duration: float, chunks: int,
+                    min_chunk_seconds: Optional[float] = None) -> List[Tuple[float, float]]:
+    """
+    Süreyi eşit parçalara en yakın keyframe'lerden böl
+
+    Returns:
+        [(başlangıç, bitiş)] — ardışık, boşluksuz, ilk 0.0, son duration
+    """
+    min_chunk = PARALLEL_COMPRESS_CONFIG['min_chunk_seconds'] if min_chunk_seconds is None else min_chunk_seconds
+    chunks = max(1, min(chunks, int(duration // max(min_chunk, 1e-6)) or 1))
+
+    sinirlar = [0.0]
+    aday = [k for k in keyframes if 0.0 < k < duration]
+    for i in range(1, chunks):
+        hedef = duration * i / chunks
+        if not aday:
+            break
+        en_yakin = min(aday, key=lambda k: abs(k - hedef))
+        if en_yakin - sinirlar[-1] >= min_chunk and duration - en_yakin >= min_chunk:
+            sinirlar.append(en_yakin)
+
+    sinirlar.append(duration)
+    return list(zip(sinirlar[:-1], sinirlar[1:]))
+
+
+# ============================================================================
+# 🚀 PARALEL ENCODE
+# ============================================================================
+
+def _calistir(cmd: List[str]) -> Tuple[int, str]:
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    return result.returncode, result.stderr[-300:] if result.stderr else ''
+
+
+def _sure_al(path: str) -> Optional[float]:
+    cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+           '-of', 'default=noprint_wrappers=1:nokey=1', path]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=30)
+        return float(result.stdout.strip())
+    except (subprocess.TimeoutExpired, OSError, ValueError):
+        return None
+
+
+def _ses_var_mi(path: str) -> bool:
+    cmd = ['ffprobe', '-v', 'error', '-select_streams', 'a', '-show_entries', 'stream=index',
+           '-of', 'csv=p=0', path]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=30)
+        return bool(result.stdout.strip())
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+
+
+def parca_sayisi() -> int:
+    """Config'e göre parça sayısı"""
+    cfg = PARALLEL_COMPRESS_CONFIG
+    if cfg['chunks']:
+        return cfg['chunks']
+    return max(1, multiprocessing.cpu_count() // max(1, cfg['threads_per_chunk']))
+
+
+def paralel_sikistir(input_path: str, output_path: str, duration: float,
+                     video_args: List[str], audio_args: List[str],
+                     on_progress: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, str]:
+    """
+    Segment paralel encode + concat demuxer ile kayıpsız birleştirme
+
+    Her parça aynı video_args ile encode edilir (ortak bitrate/CRF + VBV
+    bütçesi); ses tek parça olarak paralelde encode edilir. Çıktı
+    +faststart MP4'tür.
+
+    Args:
+        video_args: Örn: ['-c:v', 'libx264', '-preset', 'medium', '-crf', '23', '-maxrate', ...]
+        audio_args: Örn: ['-c:a', 'aac', '-b:a', '128k']
+        on_progress: (tamamlanan, toplam) callback
+
+    Returns:
+        (başarılı, hata mesajı)
+    """
+    cfg = PARALLEL_COMPRESS_CONFIG
+    parcalar = bolme_noktalari(keyframe_zamanlari(input_path), duration, parca_sayisi())
+    if len(parcalar) < 2:
+        return False, "Video bölünemedi (çok kısa veya keyframe yok)"
+
+    work_dir = tempfile.mkdtemp(prefix='par_compress_', dir=os.path.dirname(os.path.abspath(output_path)))
+    try:
+        threads = str(cfg['threads_per_chunk'])
+        isler = {}
+        parca_dosyalari = []
+
+        for i, (start, end) in enumerate(parcalar):
+            parca = os.path.join(work_dir, f"chunk_{i:04d}.mp4")
+            parca_dosyalari.append(parca)
+            isler[f"parça {i + 1}"] = [
+                'ffmpeg', '-v', 'error', '-y',
+                '-ss', f"{start:.6f}", '-i', input_path,
+                '-t', f"{end - start:.6f}",
+                '-map', '0:v:0', '-an',
+            ] + video_args + ['-threads', threads, parca]
+
+        ses_dosyasi = os.path.join(work_dir, 'audio.m4a')
+        has_audio = _ses_var_mi(input_path)
+        if has_audio:
+            isler['ses'] = ['ffmpeg', '-v', 'error', '-y', '-i', input_path,
+                            '-map', '0:a:0', '-vn'] + audio_args + [ses_dosyasi]
+
+        toplam = len(isler)
+        with ThreadPoolExecutor(max_workers=toplam) as executor:
+            futures = {executor.submit(_calistir, cmd): ad for ad, cmd in isler.items()}
+            for tamamlanan, future in enumerate(as_completed(futures), start=1):
+                returncode, stderr = future.result()
+                if returncode != 0:
+                    return False, f"{futures[future]} encode hatası: {stderr}"
+                if on_progress:
+                    on_progress(tamamlanan, toplam)
+
+        liste = os.path.join(work_dir, 'list.txt')
+        with open(liste, 'w', encoding='utf-8') as f:
+            for parca in parca_dosyalari:
+                f.write(f"file '{parca.replace(chr(92), '/')}'\n")
+
+        birlestir = ['ffmpeg', '-v', 'error', '-y',
+                     '-f', 'concat', '-safe', '0', '-i', liste]
+        if has_audio:
+            birlestir.extend(['-i', ses_dosyasi, '-map', '0:v', '-map', '1:a'])
+        birlestir.extend(['-c', 'copy', '-movflags', '+faststart', output_path])
+
+        returncode, stderr = _calistir(birlestir)
+        if returncode != 0:
+            return False, f"Concat hatası: {stderr}"
+
+        cikti_suresi = _sure_al(output_path)
+        if cikti_suresi is None or abs(cikti_suresi - duration) > cfg['duration_tolerance']:
+            return False, f"Birleştirilmiş süre uyuşmuyor ({cikti_suresi} / {duration:.2f}s)"
+
+        return True, ""
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PREFLIGHT - Render Öncesi Girdi Doğrulaması
+Pahalı aşamalardan (transkripsiyon, encode) önce tüm girdiler tek seferde
+ve paralel kontrol edilir: video sonları decode edilebiliyor mu, ses
+baştan sona sağlam mı, altyazı fontları yüklü mü, diskte yer var mı,
+encoder'lar mevcut mu. Sonuç tek bir rapordur; kritik hata varsa render
+hiç başlamaz.
+"""
+
+import os
+import sys
+import time
+import shutil
+import logging
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import SUBTITLE_FONTS
+except ImportError:
+    SUBTITLE_FONTS = {}
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+PREFLIGHT_CONFIG = {
+    'enabled': True,
+    'workers': 8,
+
+    # Videolar: son N saniye decode edilir (baş kısmı havuz okunurken test edildi)
+    'video_tail_seconds': 1.0,
+    'video_timeout': 20,
+
+    # Ses: baştan sona decode (bozuk/kesik ses transkripsiyon ve mux'ta patlar)
+    'audio_full_decode': True,
+    'audio_timeout': 180,
+
+    # Disk: tahmini çıktı × çarpan (klipler + concat ara dosyası + final)
+    'estimated_total_kbps': 8000 + 320,
+    'disk_factor': 3.0,
+    'min_free_gb': 2.0,
+
+    # Havuzun en az bu kadarı sağlam olmalı
+    'min_usable_video_ratio': 0.5,
+
+    # Aktif stilin fontu yoksa libass sessizce başka font kullanır → hata say
+    'missing_font_is_error': True,
+}
+
+
+# ============================================================================
+# 🔍 TEKİL KONTROLLER
+# ============================================================================
+
+def _calistir(cmd: List[str], timeout: float) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Komutu çalıştır
+
+    Sadece sıfır olmayan çıkış kodu hatadır; çıkış kodu 0 iken stderr'e
+    yazılanlar (MP3 "Header missing" gibi zararsız decoder mesajları) uyarıdır.
+
+    Returns:
+        (hata, uyarı) - olmayan None
+    """
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return f"zaman aşımı ({timeout}s)", None
+    except OSError as e:
+        return str(e), None
+    son_satir = (result.stderr.strip().splitlines() or [None])[-1]
+    if result.returncode != 0:
+        return (son_satir or f"çıkış kodu {result.returncode}")[:200], None
+    return None, son_satir[:200] if son_satir else None
+
+
+def video_kontrol(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Videonun son kısmı decode edilebiliyor mu (kesik/bozuk dosyalar); (hata, uyarı)"""
+    cmd = ['ffmpeg', '-v', 'error', '-nostdin',
+           '-sseof', f"-{PREFLIGHT_CONFIG['video_tail_seconds']}", '-i', path,
+           '-map', '0:v:0', '-f', 'null', '-']
+    return _calistir(cmd, PREFLIGHT_CONFIG['video_timeout'])
+
+
+def ses_kontrol(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Ses dosyası baştan sona decode edilebiliyor mu; (hata, uyarı)"""
+    if not os.path.isfile(path):
+        return "dosya bulunamadı", None
+    if PREFLIGHT_CONFIG['audio_full_decode']:
+        cmd = ['ffmpeg', '-v', 'error', '-nostdin', '-i', path, '-map', '0:a:0', '-f', 'null', '-']
+    else:
+        cmd = ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+               '-show_entries', 'stream=codec_name', '-of', 'csv=p=0', path]
+    return _calistir(cmd, PREFLIGHT_CONFIG['audio_timeout'])
+
+
+def encoder_kontrol(encoders: Iterable[str]) -> List[str]:
+    """ffmpeg'de olmayan encoder'lar (ffmpeg/ffprobe yoksa o da hata olarak döner)"""
+    eksik = []
+    for arac in ('ffmpeg', 'ffprobe'):
+        if shutil.which(arac) is None:
+            eksik.append(f"{arac} bulunamadı (PATH)")
+    if eksik:
+        return eksik
+
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'], stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True, timeout=10)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        return [f"ffmpeg -encoders çalıştırılamadı: {e}"]
+
+    mevcut = {line.split()[1] for line in result.stdout.splitlines() if len(line.split()) > 1}
+    return [f"encoder yok: {enc}" for enc in encoders if enc not in mevcut]
+
+
+def disk_kontrol(klasorler: Iterable[str], sure_saniye: float) -> List[str]:
+    """Tahmini ihtiyaç için boş alan yetersiz olan klasörler"""
+    cfg = PREFLIGHT_CONFIG
+    tahmini = sure_saniye * cfg['estimated_total_kbps'] * 1000 / 8 * cfg['disk_factor']
+    gerekli = max(tahmini, cfg['min_free_gb'] * 1024 ** 3)
+
+    hatalar = []
+    kontrol_edilen = set()
+    for klasor in klasorler:
+        # Henüz oluşturulmamış klasörler için en yakın mevcut üst klasör
+        mevcut = os.path.abspath(klasor)
+        while not os.path.exists(mevcut) and os.path.dirname(mevcut) != mevcut:
+            mevcut = os.path.dirname(mevcut)
+        try:
+            usage = shutil.disk_usage(mevcut)
+        except OSError as e:
+            hatalar.append(f"{klasor}: disk bilgisi alınamadı ({e})")
+            continue
+        # Aynı diskteki klasörler tek kez sayılır
+        anahtar = (usage.total, usage.free)
+        if anahtar in kontrol_edilen:
+            continue
+        kontrol_edilen.add(anahtar)
+        if usage.free < gerekli:
+            hatalar.append(f"{klasor}: {usage.free / 1024 ** 3:.1f} GB boş, "
+                           f"~{gerekli / 1024 ** 3:.1f} GB gerekli")
+    return hatalar
+
+
+# ============================================================================
+# 🔤 FONTLAR
+# ============================================================================
+
+_STIL_EKLERI = ('', ' regular', ' bold', ' italic', ' bold italic')
+
+
+def yuklu_fontlar() -> Optional[Set[str]]:
+    """
+    Sistemde yüklü font aileleri (küçük harf)
+
+    Windows: registry font listesi, diğerleri: fc-list. Tespit edilemezse None.
+    """
+    aileler = set()
+
+    if sys.platform == 'win32':
+        try:
+            import winreg
+        except ImportError:
+            return None
+        anahtar_yolu = r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts"
+        for kok in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+            try:
+                with winreg.OpenKey(kok, anahtar_yolu) as anahtar:
+                    for i in range(winreg.QueryInfoKey(anahtar)[1]):
+                        ad = winreg.EnumValue(anahtar, i)[0]
+                        for parca in ad.split('&'):
+                            aileler.add(parca.split('(')[0].strip().lower())
+            except OSError:
+                continue
+        return aileler or None
+
+    if shutil.which('fc-list') is None:
+        return None
+    try:
+        result = subprocess.run(['fc-list', '--format', '%{family}\n'], stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True, timeout=15)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    for line in result.stdout.splitlines():
+        for aile in line.split(','):
+            aileler.add(aile.strip().lower())
+    return aileler or None
+
+
+def font_var_mi(font: str, aileler: Set[str]) -> bool:
+    """'Verdana Bold' gibi stil ekli adlar aile adıyla da eşleşir"""
+    ad = font.strip().lower()
+    for ek in _STIL_EKLERI:
+        if ek and ad.endswith(ek) and ad[:-len(ek)] in aileler:
+            return True
+        if not ek and ad in aileler:
+            return True
+    return False
+
+
+def katalog_fontlari() -> Set[str]:
+    """SUBTITLE_FONTS ve altyazı stillerinde geçen tüm font adları"""
+    fontlar = set()
+    for kategori in SUBTITLE_FONTS.values():
+        for font in kategori.values():
+            if isinstance(font, dict) and font.get('name'):
+                fontlar.add(font['name'])
+    try:
+        from subtitle_styles import SUBTITLE_STYLES
+        fontlar.update(s['fontname'] for s in SUBTITLE_STYLES.values() if s.get('fontname'))
+    except ImportError:
+        pass
+    return fontlar
+
+
+def aktif_fontlar(subtitle_config: Optional[Dict]) -> Set[str]:
+    """Bu render'da kullanılacak fontlar (seçilen font + stilin fontu)"""
+    if not subtitle_config or not subtitle_config.get('enabled'):
+        return set()
+    fontlar = set()
+    if subtitle_config.get('font'):
+        fontlar.add(subtitle_config['font'])
+    try:
+        from subtitle_styles import SUBTITLE_STYLES
+        stil = SUBTITLE_STYLES.get(subtitle_config.get('style') or '')
+        if stil and stil.get('fontname'):
+            fontlar.add(stil['fontname'])
+    except ImportError:
+        pass
+    return fontlar
+
+
+# ============================================================================
+# 🛫 PREFLIGHT
+# ============================================================================
+
+def preflight_calistir(video_yollari: List[str], ses_yolu: Optional[str] = None,
+                       subtitle_config: Optional[Dict] = None,
+                       klasorler: Iterable[str] = (), hedef_sure: float = 0.0,
+                       encoders: Iterable[str] = ('libx264', 'aac')) -> Dict:
+    """
+    Tüm girdileri paralel kontrol et
+
+    Returns:
+        {
+            'ok': bool,                  # kritik hata yok
+            'errors': [str],             # render'ı durduran sorunlar
+            'warnings': [str],
+            'bad_videos': {yol: hata},   # havuzdan çıkarılmalı
+            'elapsed_s': float,
+        }
+    """
+    cfg = PREFLIGHT_CONFIG
+    baslangic = time.time()
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    with ThreadPoolExecutor(max_workers=cfg['workers']) as executor:
+        video_futures = {path: executor.submit(video_kontrol, path) for path in video_yollari}
+        ses_future = executor.submit(ses_kontrol, ses_yolu) if ses_yolu else None
+        encoder_future = executor.submit(encoder_kontrol, list(encoders))
+        disk_future = executor.submit(disk_kontrol, list(klasorler), hedef_sure)
+        font_future = executor.submit(yuklu_fontlar)
+
+        bad_videos = {}
+        for path, future in video_futures.items():
+            hata, uyari = future.result()
+            if hata:
+                bad_videos[path] = hata
+            elif uyari:
+                warnings.append(f"Video decode uyarısı: {os.path.basename(path)} ({uyari})")
+
+        if ses_future is not None:
+            hata, uyari = ses_future.result()
+            if hata:
+                errors.append(f"Ses dosyası bozuk: {os.path.basename(ses_yolu)} ({hata})")
+            elif uyari:
+                warnings.append(f"Ses decode uyarısı: {os.path.basename(ses_yolu)} ({uyari})")
+
+        errors.extend(encoder_future.result())
+        errors.extend(f"Disk: {h}" for h in disk_future.result())
+        aileler = font_future.result()
+
+    for path, hata in bad_videos.items():
+        warnings.append(f"Video okunamıyor, havuzdan çıkarılacak: {os.path.basename(path)} ({hata})")
+    if video_yollari:
+        saglam = len(video_yollari) - len(bad_videos)
+        if saglam == 0 or saglam / len(video_yollari) < cfg['min_usable_video_ratio']:
+            errors.append(f"Video havuzu: {saglam}/{len(video_yollari)} video sağlam")
+
+    if aileler is None:
+        warnings.append("Yüklü fontlar tespit edilemedi, font kontrolü atlandı")
+    else:
+        aktif = aktif_fontlar(subtitle_config)
+        for font in sorted(aktif):
+            if not font_var_mi(font, aileler):
+                mesaj = f"Altyazı fontu yüklü değil: {font}"
+                (errors if cfg['missing_font_is_error'] else warnings).append(mesaj)
+        eksik_katalog = [f for f in sorted(katalog_fontlari() - aktif) if not font_var_mi(f, aileler)]
+        if eksik_katalog:
+            warnings.append(f"Katalogda yüklü olmayan fontlar: {', '.join(eksik_katalog)}")
+
+    rapor = {
+        'ok': not errors,
+        'errors': errors,
+        'warnings': warnings,
+        'bad_videos': bad_videos,
+        'elapsed_s': round(time.time() - baslangic, 2),
+    }
+    logger.info(f"🛫 Preflight: {len(errors)} hata, {len(warnings)} uyarı ({rapor['elapsed_s']}s)")
+    return rapor
+
+
+def rapor_yazdir(rapor: Dict) -> None:
+    """Preflight raporunu konsola yazdır"""
+    print("\n" + "=" * 70)
+    durum = "✅ HAZIR" if rapor['ok'] else "❌ RENDER BAŞLATILAMAZ"
+    print(f"🛫 PREFLIGHT: {durum} ({rapor['elapsed_s']}s)".center(70))
+    print("=" * 70)
+    for hata in rapor['errors']:
+        print(f"   ❌ {hata}")
+    for uyari in rapor['warnings'][:10]:
+        print(f"   ⚠️  {uyari}")
+    if len(rapor['warnings']) > 10:
+        print(f"   ... ve {len(rapor['warnings']) - 10} uyarı daha")
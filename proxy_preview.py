@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PROXY PREVIEW - Düşük Çözünürlüklü Önizleme
+Bir stil, efekt veya altyazı seçimini kontrol etmek için tam 1080p render
+gerekmez. Kaynak videolar bir kez küçük proxy'lere (varsayılan 480p,
+ultrafast, sık keyframe) dönüştürülüp saklanır; önizleme aynı klip filtre
+zincirlerini proxy boyutuna ölçeklenmiş olarak, zaman çizelgesinden
+örneklenmiş pencerelerde çalıştırır.
+
+Cache: <CACHE_KLASORU>/proxies/<anahtar>.mp4 (kaynak yol + boyut + mtime)
+"""
+
+import os
+import re
+import hashlib
+import logging
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import CACHE_KLASORU, VIDEO_OUTPUT
+except ImportError:
+    CACHE_KLASORU = os.path.join(os.getcwd(), '.cache')
+    VIDEO_OUTPUT = {'resolution': '1920x1080', 'fps': 30}
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+PROXY_PREVIEW_CONFIG = {
+    'cache_dir': os.path.join(CACHE_KLASORU, 'proxies'),
+
+    # Proxy: kaynak başına bir kez üretilir
+    'height': 480,
+    'proxy_preset': 'ultrafast',
+    'proxy_crf': 26,
+    # Sık keyframe: segmentasyondaki -c copy kesimleri proxy'de kaymaz
+    'gop': 30,
+
+    # Önizleme encode'u
+    'preview_preset': 'ultrafast',
+    'preview_crf': 30,
+    'audio_bitrate': '128k',
+
+    # Zaman çizelgesinden örneklenen toplam süre ve pencere sayısı
+    'max_duration': 60,
+    'windows': 4,
+
+    'workers': None,  # None = CPU çekirdeği / 2
+    'timeout': 1800,
+}
+
+# Proxy biçimi değişirse eski cache girdileri geçersiz olsun
+_SURUM = 1
+
+
+# ============================================================================
+# 📐 BOYUT
+# ============================================================================
+
+def proxy_boyutu(height: Optional[int] = None) -> Tuple[int, int]:
+    """Çıkış en-boy oranını koruyan (çift sayılı) proxy boyutu"""
+    height = height or PROXY_PREVIEW_CONFIG['height']
+    w, h = (int(x) for x in VIDEO_OUTPUT['resolution'].split('x'))
+    return int(round(w * height / h / 2)) * 2, height
+
+
+def filtre_olcekle(filtre: str, height: Optional[int] = None) -> str:
+    """Filtre zincirindeki çıkış boyutunu (1920:1080 / 1920x1080) proxy boyutuna çevir"""
+    w, h = (int(x) for x in VIDEO_OUTPUT['resolution'].split('x'))
+    pw, ph = proxy_boyutu(height)
+    return re.sub(rf"\b{w}([:x]){h}\b", rf"{pw}\g<1>{ph}", filtre)
+
+
+# ============================================================================
+# 🎞️ PROXY ÜRETİMİ
+# ============================================================================
+
+def proxy_anahtari(video_yolu: str) -> str:
+    """Kaynak yol + boyut + mtime + proxy ayarları → anahtar"""
+    cfg = PROXY_PREVIEW_CONFIG
+    stat = os.stat(video_yolu)
+    kimlik = (f"{os.path.abspath(video_yolu)}|{stat.st_size}|{int(stat.st_mtime)}"
+              f"|{cfg['height']}|{cfg['proxy_preset']}|{cfg['proxy_crf']}|{cfg['gop']}|{_SURUM}")
+    return hashlib.sha1(kimlik.encode('utf-8')).hexdigest()
+
+
+def proxy_hazirla(video_yolu: str) -> str:
+    """
+    Kaynak için proxy yolunu döndür (cache'te yoksa bir kez üret)
+
+    Raises:
+        RuntimeError: ffmpeg proxy üretimi başarısız
+    """
+    cfg = PROXY_PREVIEW_CONFIG
+    klasor = cfg['cache_dir']
+    os.makedirs(klasor, exist_ok=True)
+    yol = os.path.join(klasor, f"{proxy_anahtari(video_yolu)}.mp4")
+    if os.path.exists(yol) and os.path.getsize(yol) > 0:
+        return yol
+
+    gecici = f"{yol}.{os.getpid()}.tmp"
+    komut = [
+        'ffmpeg', '-v', 'error', '-nostdin', '-i', video_yolu,
+        '-vf', f"scale=-2:{cfg['height']}:flags=fast_bilinear",
+        '-c:v', 'libx264', '-preset', cfg['proxy_preset'], '-crf', str(cfg['proxy_crf']),
+        '-g', str(cfg['gop']), '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac', '-b:a', cfg['audio_bitrate'],
+        '-movflags', '+faststart', '-f', 'mp4', '-y', gecici
+    ]
+    try:
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, timeout=cfg['timeout'])
+        if sonuc.returncode != 0 or not os.path.exists(gecici):
+            raise RuntimeError(f"Proxy oluşturulamadı: {sonuc.stderr[:200]}")
+        os.replace(gecici, yol)
+    finally:
+        if os.path.exists(gecici):
+            os.remove(gecici)
+    logger.info(f"🎞️ Proxy oluşturuldu: {os.path.basename(video_yolu)} → {cfg['height']}p")
+    return yol
+
+
+def proxyleri_hazirla(video_yollari: Sequence[str], workers: Optional[int] = None) -> Dict[str, str]:
+    """
+    Kaynakların proxy'leri (paralel)
+
+    Returns:
+        {kaynak_yol: proxy_yol}; üretilemeyen kaynaklar sözlükte yer almaz
+    """
+    workers = workers or PROXY_PREVIEW_CONFIG['workers'] or max(1, (os.cpu_count() or 2) // 2)
+    sonuc = {}
+
+    def _hazirla(yol):
+        try:
+            return yol, proxy_hazirla(yol)
+        except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"⚠️ Proxy hazırlanamadı, kaynak kullanılacak: {os.path.basename(yol)}: {e}")
+            return yol, None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for yol, proxy in executor.map(_hazirla, list(dict.fromkeys(video_yollari))):
+            if proxy:
+                sonuc[yol] = proxy
+    return sonuc
+
+
+# ============================================================================
+# 🪟 PENCERE ÖRNEKLEME
+# ============================================================================
+
+def pencere_sec(sureler: Sequence[float], max_sure: Optional[float] = None,
+                pencere_sayisi: Optional[int] = None) -> List[int]:
+    """
+    Zaman çizelgesine eşit aralıklı önizleme pencereleri
+
+    Toplam süre max_sure'yi aşıyorsa çizelge pencere_sayisi eşit parçaya
+    bölünür, her parçanın ortasındaki (max_sure / pencere_sayisi) uzunluğundaki
+    pencereye değen klipler seçilir. Klipler bölünmez.
+
+    Returns:
+        Seçilen klip indeksleri (artan sırayla)
+    """
+    max_sure = max_sure or PROXY_PREVIEW_CONFIG['max_duration']
+    pencere_sayisi = max(1, pencere_sayisi or PROXY_PREVIEW_CONFIG['windows'])
+    toplam = sum(sureler)
+    if toplam <= max_sure:
+        return list(range(len(sureler)))
+
+    uzunluk = max_sure / pencere_sayisi
+    secilen = set()
+    for p in range(pencere_sayisi):
+        bas = (p + 0.5) * toplam / pencere_sayisi - uzunluk / 2
+        bit = bas + uzunluk
+        zaman = 0.0
+        for i, sure in enumerate(sureler):
+            if zaman < bit and zaman + sure > bas:
+                secilen.add(i)
+            zaman += sure
+            if zaman >= bit:
+                break
+    return sorted(secilen)
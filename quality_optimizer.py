@@ -155,7 +155,7 @@ def get_optimized_video_params(encoder='libx264'):
 # AUDIO QUALITY OPTIMIZER
 # ============================================================================
 
-def get_optimized_audio_filter():
+def get_optimized_audio_filter(measured=None):
     """
     Audio clipping prevention + quality optimization
 
@@ -164,6 +164,10 @@ def get_optimized_audio_filter():
     2. Loudnorm (normalization)
     3. Volume adjustment
 
+    Args:
+        measured: First-pass loudnorm measurement (loudness.olcum_al) of the
+            input; when given, loudnorm runs in linear mode
+
     Returns:
         str: FFmpeg audio filter string
     """
@@ -185,13 +189,27 @@ def get_optimized_audio_filter():
         logger.info(f"🔒 Audio limiter: {config['limiter']['threshold']}dB threshold")
 
     # 2. Loudnorm (with stricter true peak)
-    loudnorm = (
-        f"loudnorm="
-        f"I=-16:"
-        f"TP={config['true_peak_limit']}:"  # Stricter true peak
-        f"LRA=11:"
-        f"print_format=json"
-    )
+    if measured:
+        # Linear mode: constant gain from the cached first-pass measurement
+        loudnorm = (
+            f"loudnorm="
+            f"I=-16:"
+            f"TP={config['true_peak_limit']}:"
+            f"LRA=11:"
+            f"measured_I={measured['input_i']:.2f}:"
+            f"measured_TP={measured['input_tp']:.2f}:"
+            f"measured_LRA={measured['input_lra']:.2f}:"
+            f"measured_thresh={measured['input_thresh']:.2f}:"
+            f"offset={measured['target_offset']:.2f}:"
+            f"linear=true"
+        )
+    else:
+        loudnorm = (
+            f"loudnorm="
+            f"I=-16:"
+            f"TP={config['true_peak_limit']}:"  # Stricter true peak
+            f"LRA=11"
+        )
     filters.append(loudnorm)
 
     # 2.5. Safety limiter after loudnorm to prevent NaN/Inf
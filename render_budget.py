@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RENDER BUDGET - Render Süresi Bütçeli Efekt Seçimi
+Ölçülmüş efekt maliyet tablosu, bütçe hesabı ve kalibrasyon
+"""
+
+import os
+import json
+import time
+import logging
+import subprocess
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import RENDER_KLASORU
+except ImportError:
+    RENDER_KLASORU = os.getcwd()
+
+
+# ============================================================================
+# ⚙️ RENDER BUDGET CONFIG
+# ============================================================================
+
+RENDER_BUDGET_CONFIG = {
+    'enabled': True,
+
+    # Bütçe (ikisi de None ise bütçe uygulanmaz, sadece kategori dengesi)
+    'target_fps': None,           # Örn: 45 → klip başına en az 45 fps render hızı
+    'budget_sec_per_min': None,   # Örn: 40 → çıktı dakikası başına 40 sn render
+
+    # Çıktı fps (bütçeyi kare başına ms'ye çevirmek için)
+    'output_fps': 30,
+
+    # Kalıcı maliyet tablosu (cache temizliğinden etkilenmez)
+    'cost_table_file': os.path.join(RENDER_KLASORU, 'effect_costs.json'),
+
+    # Ölçüm yoksa kullanılacak kategori tahminleri (ms/kare @1080p)
+    'category_cost_ms': {
+        'hafif': 2.0,
+        'orta': 6.0,
+        'agir': 15.0,
+    },
+
+    # Decode + scale + encode taban maliyeti (ms/kare @1080p)
+    'base_cost_ms': 12.0,
+
+    # Kalibrasyon
+    'calibration': {
+        'resolution': '1920x1080',
+        'frames': 90,
+        'timeout': 120,
+        'smoothing': 0.5,   # Yeni ölçümün ağırlığı (EMA)
+    },
+}
+
+
+# ============================================================================
+# 💰 BÜTÇE HESABI
+# ============================================================================
+
+def butce_ms_hesapla(target_fps: Optional[float] = None,
+                     budget_sec_per_min: Optional[float] = None,
+                     output_fps: Optional[float] = None) -> Optional[float]:
+    """
+    Render bütçesini kare başına milisaniyeye çevir
+
+    Args:
+        target_fps: Hedef render hızı (kare/saniye)
+        budget_sec_per_min: Çıktı dakikası başına izin verilen render süresi (saniye)
+        output_fps: Çıktı kare hızı
+
+    Returns:
+        Kare başına bütçe (ms) veya None (bütçe yok)
+    """
+    output_fps = output_fps or RENDER_BUDGET_CONFIG['output_fps']
+    butceler = []
+
+    if target_fps and target_fps > 0:
+        butceler.append(1000.0 / target_fps)
+
+    if budget_sec_per_min and budget_sec_per_min > 0:
+        butceler.append((budget_sec_per_min * 1000.0) / (60.0 * output_fps))
+
+    # İkisi de verildiyse daha sıkı olanı geçerli
+    return min(butceler) if butceler else None
+
+
+# ============================================================================
+# 📋 MALİYET TABLOSU
+# ============================================================================
+
+def maliyet_tablosu_yukle(path: Optional[str] = None) -> Dict:
+    """
+    Kalıcı efekt maliyet tablosunu yükle
+
+    Returns:
+        {'base_ms': float|None, 'effects': {efekt: {'ms_per_frame': float, 'samples': int}}}
+        Dosya yoksa/bozuksa boş tablo döner
+    """
+    path = path or RENDER_BUDGET_CONFIG['cost_table_file']
+    bos_tablo = {'version': 1, 'base_ms': None, 'effects': {}}
+
+    if not os.path.exists(path):
+        return bos_tablo
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            tablo = json.load(f)
+        if not isinstance(tablo.get('effects'), dict):
+            return bos_tablo
+        tablo.setdefault('base_ms', None)
+        return tablo
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Efekt maliyet tablosu okunamadı: {e}")
+        return bos_tablo
+
+
+def maliyet_tablosu_kaydet(tablo: Dict, path: Optional[str] = None) -> bool:
+    """Maliyet tablosunu atomik olarak kaydet (yarım yazılmış dosya kalmaz)"""
+    path = path or RENDER_BUDGET_CONFIG['cost_table_file']
+    tablo['updated'] = datetime.now().isoformat(timespec='seconds')
+
+    try:
+        klasor = os.path.dirname(path)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(tablo, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, path)
+        return True
+    except OSError as e:
+        logger.warning(f"⚠️ Efekt maliyet tablosu kaydedilemedi: {e}")
+        return False
+
+
+def olcum_ekle(tablo: Dict, efekt: str, ms_per_frame: float) -> None:
+    """Tabloya yeni ölçüm ekle (EMA ile yumuşatılır)"""
+    alpha = RENDER_BUDGET_CONFIG['calibration']['smoothing']
+    kayit = tablo['effects'].get(efekt)
+
+    if kayit and kayit.get('samples', 0) > 0:
+        kayit['ms_per_frame'] = round((1 - alpha) * kayit['ms_per_frame'] + alpha * ms_per_frame, 3)
+        kayit['samples'] += 1
+    else:
+        tablo['effects'][efekt] = {'ms_per_frame': round(ms_per_frame, 3), 'samples': 1}
+
+
+def efekt_maliyeti(efekt: str, performans: str, tablo: Optional[Dict] = None) -> float:
+    """
+    Efektin kare başına maliyeti (ms)
+
+    Ölçüm varsa ölçülen değer, yoksa performans kategorisi tahmini kullanılır.
+    """
+    if tablo:
+        kayit = tablo.get('effects', {}).get(efekt)
+        if kayit and kayit.get('ms_per_frame') is not None:
+            return float(kayit['ms_per_frame'])
+
+    return RENDER_BUDGET_CONFIG['category_cost_ms'].get(performans, RENDER_BUDGET_CONFIG['category_cost_ms']['orta'])
+
+
+def taban_maliyet(tablo: Optional[Dict] = None) -> float:
+    """Efektsiz render maliyeti (decode + normalize + encode)"""
+    if tablo and tablo.get('base_ms') is not None:
+        return float(tablo['base_ms'])
+    return RENDER_BUDGET_CONFIG['base_cost_ms']
+
+
+def kombinasyon_maliyeti(efektler: Iterable[str], efekt_ozellikleri: Dict, tablo: Optional[Dict] = None) -> float:
+    """Efekt kombinasyonunun toplam kare maliyeti (taban dahil)"""
+    toplam = taban_maliyet(tablo)
+    for efekt in efektler:
+        performans = efekt_ozellikleri.get(efekt, {}).get('performans', 'orta')
+        toplam += efekt_maliyeti(efekt, performans, tablo)
+    return toplam
+
+
+# ============================================================================
+# ⏱️ KALİBRASYON (ffmpeg testsrc2 ile ölçüm)
+# ============================================================================
+
+def filtre_maliyeti_olc(video_filtre: Optional[str], frames: Optional[int] = None) -> Optional[float]:
+    """
+    Bir filtre zincirinin kare başına süresini ölç (sentetik 1080p kaynak)
+
+    Returns:
+        ms/kare veya None (ölçüm başarısız)
+    """
+    cal = RENDER_BUDGET_CONFIG['calibration']
+    frames = frames or cal['frames']
+    fps = RENDER_BUDGET_CONFIG['output_fps']
+
+    komut = [
+        'ffmpeg', '-hide_banner', '-v', 'error', '-nostdin',
+        '-f', 'lavfi', '-i', f"testsrc2=size={cal['resolution']}:rate={fps}",
+        '-frames:v', str(frames),
+    ]
+    if video_filtre:
+        komut.extend(['-vf', video_filtre])
+    komut.extend(['-f', 'null', '-'])
+
+    try:
+        baslangic = time.perf_counter()
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, timeout=cal['timeout'])
+        gecen = time.perf_counter() - baslangic
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"⚠️ Filtre ölçümü başarısız: {e}")
+        return None
+
+    if sonuc.returncode != 0:
+        logger.debug(f"Filtre ölçümü hata: {sonuc.stderr[:200]}")
+        return None
+
+    return (gecen * 1000.0) / frames
+
+
+def kalibrasyon_yap(efekt_filtreleri: Dict[str, str], taban_filtre: Optional[str] = None,
+                    path: Optional[str] = None) -> Dict:
+    """
+    Efektlerin gerçek maliyetini ölç ve kalıcı tabloya yaz
+
+    Args:
+        efekt_filtreleri: {efekt_adi: taban + efekt filtre zinciri}
+        taban_filtre: Efektsiz filtre zinciri (fark = efekt maliyeti)
+        path: Tablo dosyası (varsayılan: config)
+
+    Returns:
+        Güncellenmiş tablo
+    """
+    tablo = maliyet_tablosu_yukle(path)
+
+    taban_ms = filtre_maliyeti_olc(taban_filtre)
+    if taban_ms is None:
+        logger.warning("⚠️ Taban ölçümü başarısız, kalibrasyon iptal")
+        return tablo
+    tablo['base_ms'] = round(taban_ms, 3)
+    print(f"   ⏱️  Taban: {taban_ms:.2f} ms/kare")
+
+    for efekt, filtre in efekt_filtreleri.items():
+        toplam_ms = filtre_maliyeti_olc(filtre)
+        if toplam_ms is None:
+            print(f"   ⚠️  {efekt}: ölçülemedi (kategori tahmini kullanılacak)")
+            continue
+        efekt_ms = max(0.0, toplam_ms - taban_ms)
+        olcum_ekle(tablo, efekt, efekt_ms)
+        print(f"   ⏱️  {efekt:25s} +{efekt_ms:6.2f} ms/kare")
+
+    maliyet_tablosu_kaydet(tablo, path)
+    return tablo
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SCRATCH SPACE - RAM / Disk Ara Dosya Alanı
+Kısa ömürlü küçük ara dosyalar (ASS, concat listeleri, kısa segmentler)
+yeterli bellek varsa RAM tabanlı bir klasöre (Linux: /dev/shm), büyükleri
+işin disk temp klasörüne yerleştirilir. Her iş için RAM + disk kullanımının
+tepe değeri izlenir.
+
+Temizlik:
+    - alan_kapat() (iş sonunda, finally içinde)
+    - atexit + SIGTERM → SystemExit (normal çıkış, Ctrl+C, kill)
+    - Sert çökmede (SIGKILL, elektrik) sahibi ölmüş RAM klasörleri bir
+      sonraki çalıştırmada yetim_temizle() ile silinir.
+    - Aynı iş (job_id + disk klasörü) yeniden açılırsa (journal'dan devam)
+      sahibi ölmüş RAM klasörü silinmez, devralınır: içindeki segmentler
+      yeniden kullanılır.
+
+Tepe kullanım aşama sınırlarında olc() ile ölçülür; dosya_yolu() dizin
+taramaz, yalnız yerleşim sayaçlarını günceller.
+
+Kullanım:
+    alan_ac(job_id, temp_klasor)
+    yol = dosya_yolu(temp_klasor, 'subtitles.ass')      # RAM'e sığarsa RAM
+    yol = dosya_yolu(temp_klasor, 's_0001.mp4', 12e6)   # tahmini boyutla
+    ozet = alan_kapat(temp_klasor)                      # {'peak_total_mb', ...}
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import shutil
+import signal
+import logging
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+SCRATCH_CONFIG = {
+    'enabled': True,
+
+    # RAM tabanlı kök klasör (None = otomatik: Linux'ta /dev/shm; Windows'ta
+    # bir RAM disk yolu verilmedikçe her şey diskte kalır)
+    'ram_root': None,
+
+    # İş başına RAM'e yerleştirilebilecek tahmini toplam
+    'ram_budget_bytes': 1024 ** 3,
+
+    # Tahmini boyutu bundan büyük dosyalar diske
+    'max_ram_file_bytes': 64 * 1024 ** 2,
+
+    # Sistemde her zaman boş kalacak bellek (encoder/filtreler için)
+    'min_free_memory_bytes': 2 * 1024 ** 3,
+
+    # Boyutu verilmeyen metin dosyaları (ASS, concat listesi) için tahmin
+    'text_estimate_bytes': 4 * 1024 ** 2,
+    'text_extensions': ('.ass', '.srt', '.txt', '.csv', '.json'),
+
+    # Sahibi belirlenemeyen (Windows) yetim klasörlerin silinme yaşı
+    'orphan_max_age_s': 12 * 3600,
+
+    'prefix': 'render_scratch_',
+}
+
+_SAHIP_DOSYASI = '.owner.json'
+
+_alanlar: Dict[str, 'ScratchAlani'] = {}
+_kayit_lock = threading.Lock()
+_yetim_tarandi = False
+_atexit_kuruldu = False
+
+
+# ============================================================================
+# 🧠 BELLEK
+# ============================================================================
+
+def ram_koku() -> Optional[str]:
+    """Kullanılabilir RAM tabanlı kök klasör (yoksa None)"""
+    kok = SCRATCH_CONFIG['ram_root']
+    if kok is None and sys.platform.startswith('linux'):
+        kok = '/dev/shm'
+    if kok and os.path.isdir(kok) and os.access(kok, os.W_OK):
+        return kok
+    return None
+
+
+def bos_bellek() -> Optional[int]:
+    """Kullanılabilir sistem belleği (byte); okunamazsa None"""
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for satir in f:
+                if satir.startswith('MemAvailable:'):
+                    return int(satir.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _klasor_boyutu(klasor: Optional[str]) -> int:
+    toplam = 0
+    if not klasor:
+        return 0
+    try:
+        with os.scandir(klasor) as it:
+            for girdi in it:
+                try:
+                    if girdi.is_dir(follow_symlinks=False):
+                        toplam += _klasor_boyutu(girdi.path)
+                    else:
+                        toplam += girdi.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return toplam
+
+
+# ============================================================================
+# 🧮 İŞ ALANI
+# ============================================================================
+
+class ScratchAlani:
+    """Bir işin ara dosya alanı: küçük dosyalar RAM'de, büyükler diskte"""
+
+    def __init__(self, job_id: str, disk_klasor: str, ram_kok: Optional[str] = None,
+                 devral: Optional[str] = None):
+        """
+        Args:
+            devral: Aynı işin önceki (çökmüş) sürecine ait RAM klasörü; yenisi
+                    oluşturulmaz, içerik korunur
+        """
+        self.job_id = job_id
+        self.disk_klasor = disk_klasor
+        self.ram_klasor = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._ram_rezerv = 0
+        self._disk_rezerv = 0
+        self._kapali = False
+        self.ram_dosya = 0
+        self.disk_dosya = 0
+        self.peak = {'ram': 0, 'disk': 0, 'total': 0}
+
+        os.makedirs(disk_klasor, exist_ok=True)
+        ram_kok = ram_kok or ram_koku()
+        if ram_kok or devral:
+            try:
+                if devral:
+                    self.ram_klasor = devral
+                    self._ram_rezerv = _klasor_boyutu(devral)
+                else:
+                    self.ram_klasor = tempfile.mkdtemp(prefix=f"{SCRATCH_CONFIG['prefix']}{self._pid}_",
+                                                       dir=ram_kok)
+                gecici = os.path.join(self.ram_klasor, f"{_SAHIP_DOSYASI}.tmp")
+                with open(gecici, 'w', encoding='utf-8') as f:
+                    json.dump({'pid': self._pid, 'job_id': job_id, 'disk': _anahtar(disk_klasor),
+                               'created': time.time()}, f)
+                os.replace(gecici, os.path.join(self.ram_klasor, _SAHIP_DOSYASI))
+            except OSError as e:
+                logger.warning(f"⚠️ RAM scratch oluşturulamadı, yalnız disk kullanılacak: {e}")
+                self.ram_klasor = None
+
+    def _ram_uygun(self, boyut: int) -> bool:
+        cfg = SCRATCH_CONFIG
+        if not self.ram_klasor or boyut <= 0 or boyut > cfg['max_ram_file_bytes']:
+            return False
+        if self._ram_rezerv + boyut > cfg['ram_budget_bytes']:
+            return False
+        try:
+            if shutil.disk_usage(self.ram_klasor).free < boyut:
+                return False
+        except OSError:
+            return False
+        bellek = bos_bellek()
+        return bellek is None or bellek - boyut >= cfg['min_free_memory_bytes']
+
+    def dosya_yolu(self, ad: str, tahmini_boyut: Optional[float] = None) -> str:
+        """
+        Ara dosya yolu (dosya oluşturulmaz)
+
+        Args:
+            tahmini_boyut: Byte; None = metin uzantılarında küçük tahmin, diğerlerinde disk
+        """
+        if tahmini_boyut is None:
+            uzanti = os.path.splitext(ad)[1].lower()
+            tahmini_boyut = SCRATCH_CONFIG['text_estimate_bytes'] if uzanti in SCRATCH_CONFIG['text_extensions'] else 0
+        boyut = int(tahmini_boyut)
+
+        with self._lock:
+            if not self._kapali and self._ram_uygun(boyut):
+                self._ram_rezerv += boyut
+                self.ram_dosya += 1
+                return os.path.join(self.ram_klasor, ad)
+            self._disk_rezerv += boyut
+            self.disk_dosya += 1
+            return os.path.join(self.disk_klasor, ad)
+
+    def olc(self) -> Dict[str, int]:
+        """Anlık RAM/disk kullanımı (dizin taraması: aşama sınırlarında çağrılır); tepe değerleri günceller"""
+        ram = _klasor_boyutu(self.ram_klasor)
+        disk = _klasor_boyutu(self.disk_klasor)
+        with self._lock:
+            self.peak['ram'] = max(self.peak['ram'], ram)
+            self.peak['disk'] = max(self.peak['disk'], disk)
+            self.peak['total'] = max(self.peak['total'], ram + disk)
+        return {'ram': ram, 'disk': disk}
+
+    def ozet(self) -> Dict:
+        mb = 1024 ** 2
+        return {
+            'peak_ram_mb': round(self.peak['ram'] / mb, 1),
+            'peak_disk_mb': round(self.peak['disk'] / mb, 1),
+            'peak_total_mb': round(self.peak['total'] / mb, 1),
+            'ram_files': self.ram_dosya,
+            'disk_files': self.disk_dosya,
+            # dosya_yolu() tahminlerinin toplamı
+            'reserved_ram_mb': round(self._ram_rezerv / mb, 1),
+            'reserved_disk_mb': round(self._disk_rezerv / mb, 1),
+        }
+
+    def kapat(self) -> Dict:
+        """Son ölçüm + RAM klasörünü sil (tekrar çağrılabilir; disk klasörü sahibine ait)"""
+        if not self._kapali and os.getpid() == self._pid:
+            self.olc()
+            self._kapali = True
+            if self.ram_klasor:
+                shutil.rmtree(self.ram_klasor, ignore_errors=True)
+        return self.ozet()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.kapat()
+        return False
+
+
+# ============================================================================
+# 🗂️ KAYIT (disk temp klasörü → alan)
+# ============================================================================
+
+def _anahtar(disk_klasor: str) -> str:
+    return os.path.normcase(os.path.abspath(disk_klasor))
+
+
+def _hepsini_kapat() -> None:
+    with _kayit_lock:
+        alanlar = list(_alanlar.values())
+        _alanlar.clear()
+    for alan in alanlar:
+        alan.kapat()
+
+
+def _sigterm(signum, frame):
+    raise SystemExit(128 + signum)
+
+
+def _cikis_kancalari() -> None:
+    global _atexit_kuruldu
+    if _atexit_kuruldu:
+        return
+    _atexit_kuruldu = True
+    atexit.register(_hepsini_kapat)
+    # SIGTERM varsayılan olarak atexit/finally çalıştırmadan öldürür
+    if threading.current_thread() is threading.main_thread() and hasattr(signal, 'SIGTERM'):
+        try:
+            if signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+                signal.signal(signal.SIGTERM, _sigterm)
+        except (ValueError, OSError):
+            pass
+
+
+def _sahip_yasiyor(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _ram_klasorleri(ram_kok: str) -> List[Tuple[str, Optional[Dict]]]:
+    """Kökteki scratch klasörleri ve sahip bilgileri (okunamazsa None)"""
+    try:
+        girdiler = [g for g in os.scandir(ram_kok)
+                    if g.name.startswith(SCRATCH_CONFIG['prefix']) and g.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+    sonuc = []
+    for girdi in girdiler:
+        try:
+            with open(os.path.join(girdi.path, _SAHIP_DOSYASI), 'r', encoding='utf-8') as f:
+                sahip = json.load(f)
+            sahip = {**sahip, 'pid': int(sahip['pid']), 'created': float(sahip['created'])}
+        except (OSError, ValueError, KeyError, TypeError):
+            sahip = None
+        sonuc.append((girdi.path, sahip))
+    return sonuc
+
+
+def _yetim_mi(klasor: str, sahip: Optional[Dict]) -> bool:
+    if sahip is None:
+        return True
+    if sahip['pid'] == os.getpid():
+        return False
+    if os.name == 'nt':
+        # os.kill(pid, 0) Windows'ta süreci sonlandırır: yaşa göre karar verilir
+        return time.time() - sahip['created'] > SCRATCH_CONFIG['orphan_max_age_s']
+    return not _sahip_yasiyor(sahip['pid'])
+
+
+def devralinacak_klasor(job_id: str, disk_klasor: str, ram_kok: Optional[str] = None) -> Optional[str]:
+    """Aynı işin sahibi ölmüş RAM klasörü (journal'dan devamda segmentleri tutar)"""
+    ram_kok = ram_kok or ram_koku()
+    if not ram_kok:
+        return None
+    adaylar = [(sahip['created'], klasor) for klasor, sahip in _ram_klasorleri(ram_kok)
+               if sahip and sahip.get('job_id') == job_id
+               and sahip.get('disk', _anahtar(disk_klasor)) == _anahtar(disk_klasor)
+               and sahip['pid'] != os.getpid() and _yetim_mi(klasor, sahip)]
+    return max(adaylar)[1] if adaylar else None
+
+
+def yetim_temizle(ram_kok: Optional[str] = None, koru: Optional[str] = None) -> int:
+    """
+    Sahibi ölmüş (veya çok eski) RAM scratch klasörlerini sil; silinen sayısı
+
+    Args:
+        koru: Silinmeyecek klasör (devralınan)
+    """
+    ram_kok = ram_kok or ram_koku()
+    if not ram_kok:
+        return 0
+    silinen = 0
+    for klasor, sahip in _ram_klasorleri(ram_kok):
+        if koru and os.path.normcase(klasor) == os.path.normcase(koru):
+            continue
+        if _yetim_mi(klasor, sahip):
+            shutil.rmtree(klasor, ignore_errors=True)
+            silinen += 1
+    if silinen:
+        logger.info(f"🧹 {silinen} yetim RAM scratch klasörü silindi")
+    return silinen
+
+
+def alan_ac(job_id: str, disk_klasor: str) -> Optional[ScratchAlani]:
+    """İş için scratch alanı aç ve disk temp klasörüne kaydet (devre dışıysa None)"""
+    global _yetim_tarandi
+    if not SCRATCH_CONFIG['enabled']:
+        return None
+    # Önce devralınacak klasör: yetim taraması onu silmemeli
+    devral = devralinacak_klasor(job_id, disk_klasor)
+    if not _yetim_tarandi:
+        _yetim_tarandi = True
+        yetim_temizle(koru=devral)
+    _cikis_kancalari()
+
+    alan = ScratchAlani(job_id, disk_klasor, devral=devral)
+    if devral:
+        logger.info(f"🧮 Scratch: önceki çalışmanın RAM klasörü devralındı ({devral})")
+    with _kayit_lock:
+        eski = _alanlar.pop(_anahtar(disk_klasor), None)
+        _alanlar[_anahtar(disk_klasor)] = alan
+    if eski:
+        eski.kapat()
+    if alan.ram_klasor:
+        logger.info(f"🧮 Scratch: RAM {alan.ram_klasor} + disk {disk_klasor}")
+    return alan
+
+
+def alan(disk_klasor: str) -> Optional[ScratchAlani]:
+    with _kayit_lock:
+        return _alanlar.get(_anahtar(disk_klasor))
+
+
+def dosya_yolu(disk_klasor: str, ad: str, tahmini_boyut: Optional[float] = None) -> str:
+    """Kayıtlı alan varsa onun yerleşimi, yoksa disk_klasor/ad"""
+    kayitli = alan(disk_klasor)
+    if kayitli is None:
+        return os.path.join(disk_klasor, ad)
+    return kayitli.dosya_yolu(ad, tahmini_boyut)
+
+
+def olc(disk_klasor: str) -> Optional[Dict[str, int]]:
+    """Aşama sınırlarında tepe kullanımı güncelle"""
+    kayitli = alan(disk_klasor)
+    return kayitli.olc() if kayitli else None
+
+
+def alan_kapat(disk_klasor: str) -> Optional[Dict]:
+    """Alanı kapat, RAM klasörünü sil; tepe kullanım özeti (alan yoksa None)"""
+    with _kayit_lock:
+        kayitli = _alanlar.pop(_anahtar(disk_klasor), None)
+    if kayitli is None:
+        return None
+    ozet = kayitli.kapat()
+    logger.info(f"🧮 Scratch tepe: {ozet['peak_total_mb']} MB "
+                f"(RAM {ozet['peak_ram_mb']} MB / {ozet['ram_files']} dosya, "
+                f"disk {ozet['peak_disk_mb']} MB / {ozet['disk_files']} dosya)")
+    return ozet
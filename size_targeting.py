@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SIZE TARGETING - Tek Geçişli Hedef Boyut Sıkıştırma
+Birkaç kısa örnek segment encode edilerek hedef boyut için gereken CRF
+tahmin edilir; final encode tek geçişte CRF + VBV sınırı ile yapılır.
+"""
+
+import os
+import math
+import shutil
+import logging
+import tempfile
+import subprocess
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+SIZE_TARGETING_CONFIG = {
+    # 'single_pass' = örneklenmiş CRF tahmini + VBV, 'two_pass' = klasik 2-pass
+    'strategy': 'single_pass',
+
+    # Hedef boyuttan izin verilen sapma (0.05 = ±%5)
+    'size_tolerance': 0.05,
+
+    # Hedef dışında kalırsa ölçülen orana göre kaç kez düzeltme encode'u
+    'max_corrections': 1,
+
+    # Örnekleme: videoya eşit aralıklı dağıtılmış kısa segmentler
+    'sample_count': 6,
+    'sample_seconds': 4.0,
+    'probe_crfs': (20, 28),      # Eğim için iki CRF noktası
+    'crf_range': (16, 34),
+
+    # Final encode
+    'preset': 'medium',
+    'audio_bitrate_kbps': 128,
+    'container_overhead': 0.01,  # mp4 kutuları
+
+    # VBV: tepe bitrate = hedef × maxrate_factor, buffer = hedef × bufsize_factor
+    'maxrate_factor': 1.5,
+    'bufsize_factor': 2.0,
+
+    'sample_timeout': 120,
+}
+
+
+# ============================================================================
+# 📐 HESAPLAR
+# ============================================================================
+
+def hedef_video_kbps(target_size_mb: float, duration: float, audio_kbps: Optional[int] = None) -> int:
+    """Hedef dosya boyutu için video bitrate'i (ses ve konteyner payı düşülmüş)"""
+    cfg = SIZE_TARGETING_CONFIG
+    audio_kbps = cfg['audio_bitrate_kbps'] if audio_kbps is None else audio_kbps
+    total_kbps = (target_size_mb * 8 * 1024) / max(duration, 1.0)
+    video_kbps = total_kbps * (1 - cfg['container_overhead']) - audio_kbps
+    return max(int(video_kbps), 300)
+
+
+def ornek_noktalari(duration: float, count: int, sample_seconds: float) -> List[float]:
+    """Videoya eşit dağılmış örnek başlangıçları (baş ve son kenarlar hariç)"""
+    if duration <= sample_seconds * 2:
+        return [0.0]
+    count = max(1, min(count, int(duration // sample_seconds)))
+    step = duration / (count + 1)
+    return [round(step * (i + 1) - sample_seconds / 2, 3) for i in range(count)]
+
+
+def crf_hesapla(olcumler: Dict[int, float], target_kbps: float) -> float:
+    """
+    İki CRF ölçümünden hedef bitrate için CRF
+
+    Model: bitrate = b0 × 2^(-(crf - crf0) / k)   (x264'te k ≈ 6)
+    """
+    lo, hi = sorted(olcumler)
+    b_lo, b_hi = olcumler[lo], olcumler[hi]
+
+    if b_lo > 0 and b_hi > 0 and b_lo > b_hi:
+        k = (hi - lo) / math.log2(b_lo / b_hi)
+    else:
+        k = 6.0
+
+    crf = lo + k * math.log2(b_lo / target_kbps) if b_lo > 0 else lo
+    crf_min, crf_max = SIZE_TARGETING_CONFIG['crf_range']
+    return round(min(max(crf, crf_min), crf_max), 1)
+
+
+def vbv_ayarlari(target_kbps: int) -> List[str]:
+    """CRF encode için VBV tepe sınırı"""
+    cfg = SIZE_TARGETING_CONFIG
+    return [
+        '-maxrate', f"{int(target_kbps * cfg['maxrate_factor'])}k",
+        '-bufsize', f"{int(target_kbps * cfg['bufsize_factor'])}k",
+    ]
+
+
+# ============================================================================
+# 🔬 ÖRNEK ENCODE
+# ============================================================================
+
+def ornek_bitrate_olc(input_path: str, crf: float, noktalar: List[float],
+                      sample_seconds: float, work_dir: str) -> Optional[float]:
+    """
+    Örnek segmentleri verilen CRF ile encode et, ortalama video kbps döndür
+    """
+    cfg = SIZE_TARGETING_CONFIG
+    toplam_bit = 0
+    toplam_sure = 0.0
+
+    for i, start in enumerate(noktalar):
+        out = os.path.join(work_dir, f"sample_{crf}_{i}.mkv")
+        cmd = [
+            'ffmpeg', '-v', 'error', '-y',
+            '-ss', str(start), '-i', input_path,
+            '-t', str(sample_seconds),
+            '-an',
+            '-c:v', 'libx264', '-preset', cfg['preset'], '-crf', str(crf),
+            out
+        ]
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    text=True, timeout=cfg['sample_timeout'])
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.warning(f"⚠️ Örnek encode başarısız: {e}")
+            return None
+
+        if result.returncode != 0 or not os.path.exists(out):
+            logger.debug(f"Örnek encode hata: {result.stderr[:200]}")
+            return None
+
+        toplam_bit += os.path.getsize(out) * 8
+        toplam_sure += sample_seconds
+        os.remove(out)
+
+    if toplam_sure <= 0:
+        return None
+    return toplam_bit / toplam_sure / 1000.0
+
+
+def crf_tahmin_et(input_path: str, duration: float, target_kbps: int) -> Optional[Dict]:
+    """
+    Hedef video bitrate'i için CRF tahmini
+
+    Returns:
+        {'crf', 'measurements': {crf: kbps}, 'samples'} veya None
+    """
+    cfg = SIZE_TARGETING_CONFIG
+    noktalar = ornek_noktalari(duration, cfg['sample_count'], cfg['sample_seconds'])
+    sample_seconds = min(cfg['sample_seconds'], duration)
+
+    work_dir = tempfile.mkdtemp(prefix='size_probe_')
+    try:
+        olcumler = {}
+        for crf in cfg['probe_crfs']:
+            kbps = ornek_bitrate_olc(input_path, crf, noktalar, sample_seconds, work_dir)
+            if kbps is None:
+                return None
+            olcumler[crf] = kbps
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'crf': crf_hesapla(olcumler, target_kbps),
+        'measurements': olcumler,
+        'samples': len(noktalar),
+    }
+
+
+def duzeltilmis_crf(crf: float, achieved_mb: float, target_mb: float, k: float = 6.0) -> float:
+    """Gerçekleşen boyuta göre CRF düzeltmesi (aynı log-bitrate modeli)"""
+    crf_min, crf_max = SIZE_TARGETING_CONFIG['crf_range']
+    yeni = crf + k * math.log2(achieved_mb / target_mb)
+    return round(min(max(yeni, crf_min), crf_max), 1)
+
+
+# ============================================================================
+# 📊 RAPOR
+# ============================================================================
+
+def boyut_raporu(achieved_mb: float, target_mb: float, tolerance: Optional[float] = None) -> Dict:
+    """Ulaşılan boyut / hedef karşılaştırması"""
+    tolerance = SIZE_TARGETING_CONFIG['size_tolerance'] if tolerance is None else tolerance
+    deviation = (achieved_mb - target_mb) / target_mb
+    return {
+        'achieved_mb': round(achieved_mb, 1),
+        'target_mb': target_mb,
+        'deviation': round(deviation, 4),
+        'within_tolerance': abs(deviation) <= tolerance,
+        'tolerance': tolerance,
+    }
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+STAGE PIPE - Aşamalar Arası Boru (pipe) Aktarımı
+Bir ffmpeg aşamasının çıktısını tam bir ara dosyaya yazıp sonraki ffmpeg
+sürecinin onu diskten geri okuması yerine, iki süreç bir boru ile
+bağlanır: üretici NUT akışını stdout'a yazar, tüketici stdin'den okur.
+Kareler diske hiç dokunmaz.
+
+NUT: zaman damgalarını ve ham (rawvideo) veya sıkıştırılmış akışları
+seek gerektirmeden taşır (mp4'ün aksine moov atomu beklemez).
+Adsız boru kullanılır: Windows'ta da çalışır (os.mkfifo yok).
+
+Seek gerektiren aşamalar (keyframe parçalama, iki geçişli analiz)
+ara dosya ile çalışmaya devam eder.
+"""
+
+import logging
+import subprocess
+import threading
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+STAGE_PIPE_CONFIG = {
+    'enabled': True,
+    'format': 'nut',
+    'timeout': None,
+}
+
+
+# ============================================================================
+# 🔀 BORU
+# ============================================================================
+
+def uretici_cikisi(ham: bool = False) -> List[str]:
+    """
+    Üretici komutunun çıkış argümanları
+
+    Args:
+        ham: True = sıkıştırılmamış kareler (tüketici zaten yeniden encode ediyorsa
+             üreticide ikinci bir encode'a gerek yok)
+    """
+    kodek = ['-c:v', 'rawvideo'] if ham else []
+    return kodek + ['-f', STAGE_PIPE_CONFIG['format'], 'pipe:1']
+
+
+def tuketici_girisi() -> List[str]:
+    """Tüketici komutunun giriş argümanları"""
+    return ['-f', STAGE_PIPE_CONFIG['format'], '-i', 'pipe:0']
+
+
+def _oku(akis, hedef: list) -> None:
+    try:
+        hedef.append(akis.read())
+    finally:
+        akis.close()
+
+
+def boru_ile_calistir(uretici: List[str], tuketici: List[str],
+                      timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+    """
+    Üretici stdout → tüketici stdin; iki süreç de bittiğinde tek sonuç
+
+    Returns:
+        CompletedProcess: returncode iki süreçten biri başarısızsa 0 değil
+        (üretici erken biterse tüketici kısa ama "başarılı" bir çıktı yazabilir);
+        stderr iki sürecin hata çıktısı
+    """
+    timeout = timeout if timeout is not None else STAGE_PIPE_CONFIG['timeout']
+    p1 = subprocess.Popen(uretici, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        p2 = subprocess.Popen(tuketici, stdin=p1.stdout, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError:
+        p1.kill()
+        p1.wait()
+        raise
+    # Tüketici erken çıkarsa üretici EPIPE alıp dursun
+    p1.stdout.close()
+
+    # Üreticinin stderr'i ayrı okunur: dolan boru üreticiyi kilitlemesin
+    uretici_hata: list = []
+    okuyucu = threading.Thread(target=_oku, args=(p1.stderr, uretici_hata), daemon=True)
+    okuyucu.start()
+
+    try:
+        stdout, stderr = p2.communicate(timeout=timeout)
+        p1.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        p1.kill()
+        p2.kill()
+        p1.wait()
+        p2.wait()
+        raise
+    okuyucu.join()
+
+    hata = (uretici_hata[0] if uretici_hata else b'') + stderr
+    returncode = p2.returncode or p1.returncode
+    if p1.returncode and not p2.returncode:
+        logger.debug(f"Boru üreticisi başarısız (code {p1.returncode})")
+    return subprocess.CompletedProcess(
+        args=[uretici, tuketici], returncode=returncode,
+        stdout=stdout.decode('utf-8', 'replace'), stderr=hata.decode('utf-8', 'replace')
+    )
@@ -10,6 +10,20 @@ import subprocess
 import json
 from typing import Dict, List, Tuple, Optional
 
+try:
+    from effect_tracks import EFFECT_TRACKS_CONFIG, static_zoom_filters
+    EFFECT_TRACKS_AVAILABLE = True
+except ImportError:
+    EFFECT_TRACKS_AVAILABLE = False
+
+
+def _static_zoom(zoom: float) -> List[str]:
+    """Sabit zoom: crop+scale (zoompan'ın kare başına ifadesi ve 25 fps varsayılanı olmadan)"""
+    if EFFECT_TRACKS_AVAILABLE and EFFECT_TRACKS_CONFIG.get('replace_static_zoompan', True):
+        return static_zoom_filters(zoom, '1920x1080')
+    return [f"zoompan=z='{zoom:.2f}':d=1:x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':s=1920x1080"]
+
+
 # ============================================================================
 # 🎣 HOOK OPTIMIZER - İlk 3 Saniye Viral Efektler
 # ============================================================================
@@ -38,9 +52,7 @@ def generate_hook_effects(clip_duration: float, base_effects: str = "") -> str:
 
     # 1. 🔥 AGGRESSIVE ZOOM - Basit zoom in effect
     # Constant zoom 1.12x (smooth, no expression errors)
-    hook_filters.append(
-        "zoompan=z='1.12':d=1:x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':s=1920x1080"
-    )
+    hook_filters.extend(_static_zoom(1.12))
 
     # 2. 🌈 BRIGHT COLORS - Kontrast & Saturation boost
     # İlk 3 saniyede daha canlı renkler
@@ -209,9 +221,7 @@ def generate_climax_effects(intensity: float = 1.0) -> str:
 
     # 1. 🔍 ZOOM PULSE - Dramatic zoom (basit, sabit zoom)
     zoom_amount = 1.0 + (0.15 * intensity)  # Max 1.15x zoom
-    climax_filters.append(
-        f"zoompan=z='{zoom_amount:.2f}':d=1:x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':s=1920x1080"
-    )
+    climax_filters.extend(_static_zoom(round(zoom_amount, 2)))
 
     # 2. 📳 CROP - Static crop (shake expressions kaldırıldı)
     crop_amount = int(15 * intensity)  # Max 15 pixels
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SUBTITLE BURN - Segment Paralel Altyazı Basma
+Altyazının ayrı bir geçişte basılması gerektiğinde (birleştirilmiş video)
+tek bir `subtitles=` filtresi libass'i tek thread'de çalıştırır. Bunun
+yerine video keyframe'lerden kayıpsız parçalanır, her parça için zamanı
+kaydırılmış bir ASS dilimi yazılır, parçalar paralel basılıp encode edilir
+ve sonuç kayıpsız birleştirilir.
+
+Zaman hizası:
+    Parça başlangıcı keyframe'in kendi pts'idir (segment muxer listesi).
+    Dilimdeki olaylar 'origin' kadar geri kaydırılır; parçanın kareleri
+    filtre içinde (start - origin) kadar ileri kaydırılır. Parçaya taşan
+    olaylar kırpılmaz (\\k, \\t, \\fad animasyonları olay başlangıcına
+    göredir), origin en erken taşan olayın başlangıcına çekilir.
+"""
+
+import os
+import re
+import csv
+import math
+import shutil
+import logging
+import subprocess
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+SUBTITLE_BURN_CONFIG = {
+    'enabled': True,
+
+    # Bu süreden kısa videolarda tek geçiş daha hızlı (parçalama + birleştirme maliyeti)
+    'min_duration': 120,
+
+    # Hedef parça süresi; kesim bir sonraki keyframe'de olur
+    'chunk_seconds': 60,
+
+    # None = CPU çekirdeği / 2
+    'workers': None,
+
+    # Tüketici GPU'larında eşzamanlı NVENC oturum sınırı
+    'nvenc_max_workers': 3,
+
+    'chunk_timeout': 900,
+}
+
+_ZAMAN_RE = re.compile(r'^(\d+):(\d{2}):(\d{2})\.(\d{2})$')
+
+
+# ============================================================================
+# 📜 ASS DİLİMLERİ
+# ============================================================================
+
+def ass_zaman_oku(zaman: str) -> int:
+    """'h:mm:ss.cc' → santisaniye"""
+    m = _ZAMAN_RE.match(zaman.strip())
+    if not m:
+        raise ValueError(f"Geçersiz ASS zamanı: {zaman}")
+    h, dk, sn, cs = (int(x) for x in m.groups())
+    return ((h * 60 + dk) * 60 + sn) * 100 + cs
+
+
+def ass_zaman_yaz(cs: int) -> str:
+    """santisaniye → 'h:mm:ss.cc'"""
+    h, kalan = divmod(cs, 360000)
+    dk, kalan = divmod(kalan, 6000)
+    sn, cs = divmod(kalan, 100)
+    return f"{h}:{dk:02d}:{sn:02d}.{cs:02d}"
+
+
+def ass_ayristir(ass_icerik: str) -> Tuple[List[str], List[Tuple[int, int, str, str]]]:
+    """
+    ASS dosyasını başlık ve Dialogue olaylarına ayır
+
+    Returns:
+        (baslik_satirlari, [(start_cs, end_cs, 'Dialogue: Layer', 'Style,...,Text'), ...])
+    """
+    baslik = []
+    olaylar = []
+    for satir in ass_icerik.splitlines():
+        if satir.startswith('Dialogue:'):
+            # Dialogue: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text
+            parcalar = satir.split(',', 3)
+            olaylar.append((ass_zaman_oku(parcalar[1]), ass_zaman_oku(parcalar[2]), parcalar[0], parcalar[3]))
+        elif not satir.startswith('Comment:'):
+            baslik.append(satir)
+    return baslik, olaylar
+
+
+def ass_dilimi_olustur(baslik: Sequence[str], olaylar: Sequence[Tuple[int, int, str, str]],
+                       start: float, end: Optional[float]) -> Tuple[str, float]:
+    """
+    [start, end) parçasına düşen olayları zamanı kaydırılmış ASS olarak yaz
+
+    Returns:
+        (ass_icerik, video_offset) - parça kareleri filtrede video_offset
+        saniye ileri kaydırılınca dilimdeki zamanlarla birebir örtüşür.
+    """
+    start_cs = start * 100
+    end_cs = math.inf if end is None else end * 100
+    secilen = [o for o in olaylar if o[1] > start_cs and o[0] < end_cs]
+
+    # Origin santisaniye ızgarasında: kaydırılan ASS zamanları yuvarlanmaz
+    origin_cs = int(math.floor(start_cs + 1e-6))
+    if secilen:
+        origin_cs = min(origin_cs, min(o[0] for o in secilen))
+
+    # Olaylar [Events] bölümündeki Format satırının hemen ardına
+    satirlar = list(baslik)
+    konum = len(satirlar)
+    events = next((i for i, s in enumerate(satirlar) if s.strip().lower() == '[events]'), None)
+    if events is not None:
+        konum = next((i + 1 for i in range(events + 1, len(satirlar))
+                      if satirlar[i].startswith('Format:')), events + 1)
+    satirlar[konum:konum] = [
+        f"{onek},{ass_zaman_yaz(bas - origin_cs)},{ass_zaman_yaz(bit - origin_cs)},{geri}"
+        for bas, bit, onek, geri in secilen
+    ]
+
+    return '\n'.join(satirlar) + '\n', start - origin_cs / 100
+
+
+def _filtre_yolu(path: str) -> str:
+    path = path.replace('\\', '/').replace("'", "\\'")
+    if re.match(r'^[A-Za-z]:', path):
+        path = path.replace(':', '\\:', 1)
+    return path
+
+
+# ============================================================================
+# ✂️ PARÇALAMA / BİRLEŞTİRME
+# ============================================================================
+
+def keyframe_parcala(girdi: str, klasor: str, chunk_seconds: float) -> List[Dict]:
+    """
+    Videoyu keyframe'lerden kayıpsız parçala (sadece video)
+
+    Returns:
+        [{'path', 'start', 'end'}, ...] - zamanlar kaynağın kendi pts'i
+    """
+    os.makedirs(klasor, exist_ok=True)
+    liste = os.path.join(klasor, 'chunks.csv')
+    komut = [
+        'ffmpeg', '-v', 'error', '-nostdin', '-i', girdi,
+        '-map', '0:v:0', '-c', 'copy',
+        '-f', 'segment', '-segment_time', str(chunk_seconds),
+        '-reset_timestamps', '1',
+        '-segment_list', liste, '-segment_list_type', 'csv',
+        '-y', os.path.join(klasor, 'chunk_%04d.mp4')
+    ]
+    sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if sonuc.returncode != 0:
+        raise RuntimeError(f"Parçalama hatası: {sonuc.stderr[:200]}")
+
+    parcalar = []
+    with open(liste, 'r', encoding='utf-8') as f:
+        for satir in csv.reader(f):
+            if len(satir) >= 3:
+                parcalar.append({
+                    'path': os.path.join(klasor, satir[0]),
+                    'start': float(satir[1]),
+                    'end': float(satir[2]),
+                })
+    if not parcalar:
+        raise RuntimeError("Parçalama sonucu boş")
+    parcalar[-1]['end'] = None  # Son parça: videonun sonuna kadar
+    return parcalar
+
+
+def _parca_bas(parca: Dict, baslik: List[str], olaylar: List, encoder_args: List[str],
+               timeout: float) -> Optional[str]:
+    """Tek parçaya altyazı bas; hata varsa mesajı döndür"""
+    ass_icerik, offset = ass_dilimi_olustur(baslik, olaylar, parca['start'], parca['end'])
+    ass_yolu = os.path.splitext(parca['path'])[0] + '.ass'
+    with open(ass_yolu, 'w', encoding='utf-8') as f:
+        f.write(ass_icerik)
+
+    vf = (f"setpts=PTS-STARTPTS+{offset:.6f}/TB,"
+          f"subtitles='{_filtre_yolu(ass_yolu)}',"
+          "setpts=PTS-STARTPTS")
+    parca['burned'] = os.path.splitext(parca['path'])[0] + '_sub.mp4'
+    komut = ['ffmpeg', '-v', 'error', '-nostdin', '-i', parca['path'], '-vf', vf,
+             *encoder_args, '-an', '-y', parca['burned']]
+    try:
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return f"zaman aşımı ({timeout}s)"
+    if sonuc.returncode != 0:
+        return (sonuc.stderr.strip().splitlines() or [f"çıkış kodu {sonuc.returncode}"])[-1][:200]
+    return None
+
+
+def paralel_altyazi_bas(girdi: str, ass_dosya: str, cikti: str, encoder_args: List[str],
+                        temp_klasor: str, nvenc: bool = False,
+                        workers: Optional[int] = None) -> Dict:
+    """
+    Birleştirilmiş videoya altyazıyı parçalar halinde paralel bas
+
+    Girdideki ses akışı (varsa) olduğu gibi kopyalanır.
+
+    Args:
+        encoder_args: Parça encode parametreleri ('-c:v', ... , '-pix_fmt', ...)
+        nvenc: True = worker sayısı NVENC oturum sınırıyla kısıtlanır
+
+    Returns:
+        {'chunks': int, 'workers': int}
+
+    Raises:
+        RuntimeError: Parçalama, basma veya birleştirme hatası
+    """
+    cfg = SUBTITLE_BURN_CONFIG
+    calisma = os.path.join(temp_klasor, 'sub_chunks')
+    shutil.rmtree(calisma, ignore_errors=True)
+
+    try:
+        with open(ass_dosya, 'r', encoding='utf-8-sig') as f:
+            baslik, olaylar = ass_ayristir(f.read())
+
+        parcalar = keyframe_parcala(girdi, calisma, cfg['chunk_seconds'])
+
+        if workers is None:
+            workers = cfg['workers'] or max(2, multiprocessing.cpu_count() // 2)
+        if nvenc:
+            workers = min(workers, cfg['nvenc_max_workers'])
+        workers = max(1, min(workers, len(parcalar)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hatalar = list(executor.map(
+                lambda p: _parca_bas(p, baslik, olaylar, encoder_args, cfg['chunk_timeout']), parcalar
+            ))
+        for parca, hata in zip(parcalar, hatalar):
+            if hata:
+                raise RuntimeError(f"{os.path.basename(parca['path'])}: {hata}")
+
+        concat_liste = os.path.join(calisma, 'list.txt')
+        with open(concat_liste, 'w', encoding='utf-8') as f:
+            for parca in parcalar:
+                f.write(f"file '{parca['burned'].replace(chr(92), '/')}'\n")
+
+        komut = [
+            'ffmpeg', '-v', 'error', '-nostdin',
+            '-f', 'concat', '-safe', '0', '-i', concat_liste,
+            '-i', girdi,
+            '-map', '0:v', '-map', '1:a?',
+            '-c', 'copy', '-movflags', '+faststart',
+            '-y', cikti
+        ]
+        sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if sonuc.returncode != 0:
+            raise RuntimeError(f"Birleştirme hatası: {sonuc.stderr[:200]}")
+    finally:
+        shutil.rmtree(calisma, ignore_errors=True)
+
+    logger.info(f"📝 Altyazı {len(parcalar)} parçada, {workers} worker ile basıldı")
+    return {'chunks': len(parcalar), 'workers': workers}
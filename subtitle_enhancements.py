@@ -9,6 +9,8 @@ import re
 import random
 from typing import Dict, List, Tuple
 
+from line_breaker import en_iyi_kirilim
+
 # ============================================================================
 # 🎯 DRAMATIC WORD DETECTION - Önemli Kelimeleri Tespit Et
 # ============================================================================
@@ -340,26 +342,10 @@ def smart_line_break_with_sizing(words: List[Dict], max_chars_per_line: int = 35
         line1 = enhance_subtitle_segment(words, base_fontsize)
         return line1, ""
 
-    # En iyi bölme noktasını bul
-    total_words = len(words)
-    best_split = total_words // 2
-    min_imbalance = float('inf')
-
-    for i in range(1, total_words):
-        line1_words = words[:i]
-        line2_words = words[i:]
-
-        # Her satırın tahmini pixel genişliğini hesapla
-        line1_width = sum(len(w['text']) * calculate_dynamic_size(w['text'], base_fontsize, *is_dramatic_word(w['text'])[:2])
-                          for w in line1_words)
-        line2_width = sum(len(w['text']) * calculate_dynamic_size(w['text'], base_fontsize, *is_dramatic_word(w['text'])[:2])
-                          for w in line2_words)
-
-        imbalance = abs(line1_width - line2_width)
-
-        if imbalance < min_imbalance:
-            min_imbalance = imbalance
-            best_split = i
+    # Her kelimenin tahmini pixel genişliği bir kez hesaplanır, en dengeli bölme noktası bulunur
+    widths = [len(w['text']) * calculate_dynamic_size(w['text'], base_fontsize, *is_dramatic_word(w['text'])[:2])
+              for w in words]
+    best_split = en_iyi_kirilim(widths, bosluk=0, satir_sayisi=2)[0]
 
     # Satırları oluştur
     line1_words = words[:best_split]
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SUBTITLE OVERLAY - Önceden Rasterize Edilmiş Altyazı Katmanı
+Karaoke ağırlıklı ASS dosyalarında (\\k, \\t, glow/pulse) libass
+rasterizasyonu her render'da baştan yapılır. Aynı anlatım farklı arka
+planlarla tekrar render edildiğinde altyazı katmanı değişmez: bir kez
+şeffaf (alpha) bir videoya basılır, ASS içeriğinin hash'iyle saklanır ve
+sonraki render'larda libass yerine ucuz bir `overlay` kullanılır.
+
+Katman: qtrle/argb .mov (boş kareler RLE ile neredeyse yer kaplamaz).
+"""
+
+import os
+import hashlib
+import logging
+import subprocess
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import CACHE_KLASORU, VIDEO_OUTPUT
+except ImportError:
+    CACHE_KLASORU = os.path.join(os.getcwd(), '.cache')
+    VIDEO_OUTPUT = {'resolution': '1920x1080', 'fps': 30}
+
+try:
+    import cache_store
+    CACHE_STORE_AVAILABLE = True
+except ImportError:
+    CACHE_STORE_AVAILABLE = False
+
+try:
+    from subtitle_burn import ass_ayristir
+except ImportError:
+    ass_ayristir = None
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+SUBTITLE_OVERLAY_CONFIG = {
+    # cache_store yoksa katmanlar burada tutulur
+    'cache_dir': os.path.join(CACHE_KLASORU, 'overlays'),
+
+    'codec': 'qtrle',
+    'pix_fmt': 'argb',
+
+    # Keyframe aralığı (kare): klip başına seek maliyetini sınırlar
+    'gop': 60,
+
+    # Son olaydan sonra eklenen boş süre
+    'tail_seconds': 1.0,
+
+    'timeout': 3600,
+}
+
+# Katman biçimi değişirse eski cache girdileri geçersiz olsun
+_SURUM = 1
+
+
+# ============================================================================
+# 🔑 ANAHTAR / YOL
+# ============================================================================
+
+def overlay_anahtari(ass_dosya: str, resolution: Optional[str] = None, fps: Optional[int] = None) -> str:
+    """ASS içeriği + çözünürlük + kare hızı → katman anahtarı"""
+    cfg = SUBTITLE_OVERLAY_CONFIG
+    h = hashlib.sha256()
+    with open(ass_dosya, 'rb') as f:
+        h.update(f.read())
+    h.update(f"|{resolution or VIDEO_OUTPUT['resolution']}|{fps or VIDEO_OUTPUT['fps']}"
+             f"|{cfg['codec']}|{cfg['pix_fmt']}|{cfg['gop']}|{_SURUM}".encode())
+    return h.hexdigest()
+
+
+def _ass_suresi(ass_dosya: str) -> float:
+    """Son olayın bitişi (saniye)"""
+    with open(ass_dosya, 'r', encoding='utf-8-sig') as f:
+        icerik = f.read()
+    if ass_ayristir is None:
+        raise RuntimeError("subtitle_burn modülü gerekli (ASS ayrıştırma)")
+    _, olaylar = ass_ayristir(icerik)
+    return max((bit for _, bit, _, _ in olaylar), default=0) / 100
+
+
+def _filtre_yolu(path: str) -> str:
+    import re
+    path = path.replace('\\', '/').replace("'", "\\'")
+    if re.match(r'^[A-Za-z]:', path):
+        path = path.replace(':', '\\:', 1)
+    return path
+
+
+# ============================================================================
+# 🎞️ KATMAN ÜRETİMİ
+# ============================================================================
+
+def _rasterize(ass_dosya: str, cikti: str, resolution: str, fps: int) -> None:
+    cfg = SUBTITLE_OVERLAY_CONFIG
+    sure = _ass_suresi(ass_dosya) + cfg['tail_seconds']
+    komut = [
+        'ffmpeg', '-v', 'error', '-nostdin',
+        '-f', 'lavfi', '-i', f"color=c=black@0.0:s={resolution}:r={fps}:d={sure:.3f},format=rgba",
+        '-vf', f"subtitles='{_filtre_yolu(ass_dosya)}':alpha=1",
+        '-c:v', cfg['codec'], '-pix_fmt', cfg['pix_fmt'], '-g', str(cfg['gop']),
+        '-f', 'mov', '-y', cikti
+    ]
+    sonuc = subprocess.run(komut, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                           text=True, timeout=cfg['timeout'])
+    if sonuc.returncode != 0 or not os.path.exists(cikti):
+        raise RuntimeError(f"Altyazı katmanı oluşturulamadı: {sonuc.stderr[:200]}")
+
+
+def overlay_hazirla(ass_dosya: str, resolution: Optional[str] = None, fps: Optional[int] = None) -> str:
+    """
+    ASS için alpha katman yolunu döndür (cache'te yoksa bir kez rasterize et)
+
+    Raises:
+        RuntimeError: ffmpeg rasterizasyonu başarısız
+    """
+    resolution = resolution or VIDEO_OUTPUT['resolution']
+    fps = fps or VIDEO_OUTPUT['fps']
+    anahtar = overlay_anahtari(ass_dosya, resolution, fps)
+    cache_key = f"subtitle_overlay:{anahtar}"
+
+    if CACHE_STORE_AVAILABLE:
+        try:
+            mevcut = cache_store.ara(cache_key)
+            if mevcut:
+                logger.info(f"✅ Altyazı katmanı cache'ten: {anahtar[:12]}")
+                return mevcut
+        except Exception as e:
+            logger.debug(f"Cache store okunamadı: {e}")
+
+    klasor = SUBTITLE_OVERLAY_CONFIG['cache_dir']
+    os.makedirs(klasor, exist_ok=True)
+    yol = os.path.join(klasor, f"{anahtar}.mov")
+    if os.path.exists(yol) and os.path.getsize(yol) > 0:
+        logger.info(f"✅ Altyazı katmanı cache'ten: {anahtar[:12]}")
+        return yol
+
+    gecici = f"{yol}.{os.getpid()}.tmp"
+    try:
+        _rasterize(ass_dosya, gecici, resolution, fps)
+        os.replace(gecici, yol)
+    finally:
+        if os.path.exists(gecici):
+            os.remove(gecici)
+    logger.info(f"🎞️ Altyazı katmanı oluşturuldu: {anahtar[:12]} ({os.path.getsize(yol) / 1024 ** 2:.1f} MB)")
+
+    if CACHE_STORE_AVAILABLE:
+        try:
+            obje = cache_store.ekle(cache_key, yol)
+            if obje:
+                os.remove(yol)
+                return obje
+        except Exception as e:
+            logger.debug(f"Cache store'a eklenemedi: {e}")
+    return yol
+
+
+def overlay_filtresi(overlay_yolu: str, offset: float) -> str:
+    """
+    Klip filtresinin sonuna eklenecek katman birleştirme zinciri
+
+    Klip kareleri (pts) final zaman çizelgesinde offset'ten başlamalı;
+    katman kendi pts'iyle okunduğu için overlay kareleri birebir eşler.
+    """
+    cfg = SUBTITLE_OVERLAY_CONFIG
+    seek = max(0.0, offset - cfg['gop'] / VIDEO_OUTPUT['fps'])
+    return (
+        f"[ovl_base];movie=filename='{_filtre_yolu(overlay_yolu)}':seek_point={seek:.3f},"
+        f"trim=start={offset:.6f}[ovl_sub];"
+        "[ovl_base][ovl_sub]overlay=format=auto:eof_action=pass:repeatlast=0"
+    )
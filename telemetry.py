@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TELEMETRY - Aşama Bazlı Çalışma Ölçümleri
+Her aşama (probe, transcribe, subtitle, analysis, encode, concat, qc,
+compress) bir span olarak süre, işlenen byte ve başlatılan subprocess
+sayısıyla JSON-lines dosyasına yazılır. Özetleyici birçok çalışmada wall
+time'ın nereye gittiğini gösterir.
+
+Kullanım:
+    with span('encode', clips=120) as s:
+        ...
+        s['bytes'] += os.path.getsize(cikti)
+
+    python telemetry.py [--last 20] [spans.jsonl]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+try:
+    from config import RENDER_KLASORU
+except ImportError:
+    RENDER_KLASORU = os.getcwd()
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+TELEMETRY_CONFIG = {
+    'enabled': True,
+    'path': os.path.join(RENDER_KLASORU, 'telemetry', 'spans.jsonl'),
+
+    # Özet: son N çalışma (None = hepsi)
+    'summary_last_runs': None,
+}
+
+_lock = threading.Lock()
+_local = threading.local()
+
+# Çalışma başına subprocess sayacı (audit hook ile); paralel batch işleri
+# thread'lerde koştuğu için sayaç process global değil, çalışmanın bağlamında
+_sayac: contextvars.ContextVar = contextvars.ContextVar('telemetry_subprocess_sayaci', default=None)
+_aktif_sayaclar: List[List[int]] = []
+_genel_sayac = [0]  # Çalışma dışı span'ler
+_hook_kurulu = False
+
+
+def _gecerli_sayac() -> List[int]:
+    """
+    Bu bağlamın sayacı
+
+    Bağlamı olmayan yardımcı thread'ler (ThreadPoolExecutor) tek aktif
+    çalışma varsa ona sayılır; birden fazla iş varsa hiçbirine karıştırılmaz.
+    """
+    sayac = _sayac.get()
+    if sayac is None:
+        aktif = _aktif_sayaclar
+        sayac = aktif[0] if len(aktif) == 1 else _genel_sayac
+    return sayac
+
+
+def _audit_hook(event: str, args) -> None:
+    if event == 'subprocess.Popen':
+        _gecerli_sayac()[0] += 1
+
+
+def _hook_kur() -> None:
+    global _hook_kurulu
+    if not _hook_kurulu:
+        sys.addaudithook(_audit_hook)
+        _hook_kurulu = True
+
+
+# ============================================================================
+# ✍️ KAYIT
+# ============================================================================
+
+def _yaz(kayit: Dict) -> None:
+    if not TELEMETRY_CONFIG['enabled']:
+        return
+    path = TELEMETRY_CONFIG['path']
+    satir = json.dumps(kayit, ensure_ascii=False, default=str) + '\n'
+    try:
+        with _lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(satir)
+    except OSError:
+        pass  # Telemetri render'ı asla durdurmaz
+
+
+def aktif_run() -> Optional[str]:
+    return getattr(_local, 'run', None)
+
+
+def run_baslat(run_id: Optional[str] = None, **attrs) -> str:
+    """Bu thread için yeni çalışma başlat (span'ler bu id ile yazılır)"""
+    _hook_kur()
+    run_id = run_id or f"{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}"
+    _local.run = run_id
+    _local.run_start = time.time()
+    _local.run_attrs = dict(attrs)
+    sayac = [0]
+    _local.sayac = sayac
+    _sayac.set(sayac)
+    with _lock:
+        _aktif_sayaclar.append(sayac)
+    return run_id
+
+
+def run_bitir(ok: bool = True, **attrs) -> None:
+    """Çalışmanın toplam wall time'ını yaz"""
+    run_id = aktif_run()
+    if run_id is None:
+        return
+    kayit_attrs = dict(getattr(_local, 'run_attrs', {}))
+    kayit_attrs.update(attrs)
+    _yaz({
+        'type': 'run',
+        'run_id': run_id,
+        'ts': _local.run_start,
+        'duration_s': round(time.time() - _local.run_start, 3),
+        'ok': ok,
+        'pid': os.getpid(),
+        'attrs': kayit_attrs,
+    })
+    _local.run = None
+    sayac = getattr(_local, 'sayac', None)
+    _local.sayac = None
+    _sayac.set(None)
+    with _lock:
+        # Listeler değerle karşılaştırılır; kimlikle ara
+        _aktif_sayaclar[:] = [s for s in _aktif_sayaclar if s is not sayac]
+
+
+def span_ac(stage: str, **attrs) -> Dict:
+    """
+    Aşama ölçümünü başlat (with kullanılamayan uzun akışlar için)
+
+    Dönen sözlüğe 'bytes', 'subprocesses' (process dışı işler için) ve ek
+    attribute'lar eklenebilir; span_kapat ile yazılır.
+    """
+    _hook_kur()
+    veri = {'bytes': 0, 'subprocesses': 0}
+    veri.update(attrs)
+    veri['_stage'] = stage
+    veri['_start'] = time.time()
+    veri['_sayac'] = _gecerli_sayac()
+    veri['_sayac_baslangic'] = veri['_sayac'][0]
+    return veri
+
+
+def span_kapat(veri: Dict, ok: bool = True) -> None:
+    """Açık span'i yaz (ikinci çağrı yok sayılır)"""
+    if veri.get('_kapali'):
+        return
+    veri['_kapali'] = True
+    ek = {k: v for k, v in veri.items() if not k.startswith('_')}
+    _yaz({
+        'type': 'span',
+        'run_id': aktif_run(),
+        'stage': veri['_stage'],
+        'ts': veri['_start'],
+        'duration_s': round(time.time() - veri['_start'], 3),
+        'bytes': ek.pop('bytes'),
+        'subprocesses': ek.pop('subprocesses') + (veri['_sayac'][0] - veri['_sayac_baslangic']),
+        'ok': ok and ek.pop('ok', True),
+        'pid': os.getpid(),
+        'attrs': ek,
+    })
+
+
+@contextmanager
+def span(stage: str, **attrs) -> Iterator[Dict]:
+    """Aşama ölçümü; hata fırlarsa span ok=False yazılır"""
+    veri = span_ac(stage, **attrs)
+    ok = True
+    try:
+        yield veri
+    except BaseException:
+        ok = False
+        raise
+    finally:
+        span_kapat(veri, ok)
+
+
+# ============================================================================
+# 📊 ÖZET
+# ============================================================================
+
+def kayitlari_oku(path: Optional[str] = None) -> List[Dict]:
+    """JSON-lines kayıtları (bozuk satırlar atlanır)"""
+    path = path or TELEMETRY_CONFIG['path']
+    kayitlar = []
+    if not os.path.exists(path):
+        return kayitlar
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                kayitlar.append(json.loads(line))
+            except ValueError:
+                continue
+    return kayitlar
+
+
+def _yuzdelik(degerler: List[float], oran: float) -> float:
+    sirali = sorted(degerler)
+    return sirali[min(len(sirali) - 1, int(round(oran * (len(sirali) - 1))))]
+
+
+def ozetle(kayitlar: List[Dict], last_runs: Optional[int] = None) -> Dict:
+    """
+    Aşama bazlı süre dağılımı
+
+    Returns:
+        {
+            'runs': int, 'wall_s': float, 'unaccounted_s': float,
+            'stages': {stage: {'count', 'total_s', 'mean_s', 'p95_s', 'share',
+                               'bytes', 'subprocesses', 'failed'}}
+        }
+    """
+    runs = [k for k in kayitlar if k.get('type') == 'run']
+    if last_runs:
+        runs = runs[-last_runs:]
+    run_ids = {r['run_id'] for r in runs}
+    spans = [k for k in kayitlar if k.get('type') == 'span' and (not last_runs or k.get('run_id') in run_ids)]
+
+    wall = sum(r['duration_s'] for r in runs)
+    gruplar: Dict[str, List[Dict]] = {}
+    for s in spans:
+        gruplar.setdefault(s['stage'], []).append(s)
+
+    stages = {}
+    for stage, liste in gruplar.items():
+        sureler = [s['duration_s'] for s in liste]
+        toplam = sum(sureler)
+        stages[stage] = {
+            'count': len(liste),
+            'total_s': round(toplam, 3),
+            'mean_s': round(toplam / len(liste), 3),
+            'p95_s': round(_yuzdelik(sureler, 0.95), 3),
+            'share': round(toplam / wall, 4) if wall else None,
+            'bytes': sum(s.get('bytes') or 0 for s in liste),
+            'subprocesses': sum(s.get('subprocesses') or 0 for s in liste),
+            'failed': sum(1 for s in liste if not s.get('ok', True)),
+        }
+
+    return {
+        'runs': len(runs),
+        'wall_s': round(wall, 3),
+        'unaccounted_s': round(wall - sum(v['total_s'] for v in stages.values()), 3) if wall else None,
+        'stages': stages,
+    }
+
+
+def ozet_yazdir(ozet: Dict) -> None:
+    """Özeti konsola yazdır (en pahalı aşama önce)"""
+    print("\n" + "=" * 78)
+    print(f"📊 TELEMETRİ ÖZETİ: {ozet['runs']} çalışma, {ozet['wall_s'] / 60:.1f} dk".center(78))
+    print("=" * 78)
+    print(f"   {'aşama':<12}{'adet':>6}{'toplam':>11}{'ort':>9}{'p95':>9}{'pay':>8}{'MB':>10}{'proc':>7}")
+
+    sirali = sorted(ozet['stages'].items(), key=lambda kv: kv[1]['total_s'], reverse=True)
+    for stage, v in sirali:
+        pay = f"{v['share'] * 100:.1f}%" if v['share'] is not None else '-'
+        hata = f"  ❌{v['failed']}" if v['failed'] else ''
+        print(f"   {stage:<12}{v['count']:>6}{v['total_s']:>10.1f}s{v['mean_s']:>8.1f}s{v['p95_s']:>8.1f}s"
+              f"{pay:>8}{v['bytes'] / 1024 ** 2:>10.0f}{v['subprocesses']:>7}{hata}")
+
+    if ozet['unaccounted_s'] is not None:
+        print(f"   {'(diğer)':<12}{'':>6}{ozet['unaccounted_s']:>10.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Telemetri özeti")
+    parser.add_argument('path', nargs='?', default=None, help="spans.jsonl")
+    parser.add_argument('--last', type=int, default=TELEMETRY_CONFIG['summary_last_runs'],
+                        help="Son N çalışma")
+    args = parser.parse_args()
+    ozet_yazdir(ozetle(kayitlari_oku(args.path), args.last))
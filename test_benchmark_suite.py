@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test script for pipeline benchmark history and regression thresholds"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_suite import (
+    _zincir_kimligi,
+    gecmis_oku,
+    gecmise_ekle,
+    regresyon_kontrol,
+    sentetik_altyazi,
+)
+
+
+def _kayit(saniyeler, node='ci', duration=10):
+    return {
+        'machine': {'node': node, 'cpus': 8},
+        'input': {'duration': duration, 'resolution': '1920x1080'},
+        'stages': {ad: {'seconds': s} for ad, s in saniyeler.items()},
+    }
+
+
+def test_regression_against_median_baseline():
+    """Referans uyumlu çalışmaların medyanı; hem yüzde hem mutlak eşik aşılmalı"""
+    gecmis = [_kayit({'effect': s, 'probe': 0.010}) for s in (2.0, 2.1, 9.0)]
+    gecmis.append(_kayit({'effect': 0.1}, node='baska'))      # Farklı makine
+    gecmis.append(_kayit({'effect': 0.1}, duration=30))       # Farklı girdi
+
+    rapor = {r['stage']: r for r in regresyon_kontrol(
+        _kayit({'effect': 2.6, 'probe': 0.020, 'qc': 1.0}), gecmis,
+        esik_yuzde=15, min_saniye=0.05)}
+
+    assert rapor['effect']['baseline'] == 2.1 and rapor['effect']['runs'] == 3
+    assert rapor['effect']['regression']
+    # %100 yavaş ama 10 ms: gürültü sayılır
+    assert not rapor['probe']['regression']
+    assert 'qc' not in rapor
+
+    assert regresyon_kontrol(_kayit({'effect': 2.6}), gecmis, pencere=2)[0]['baseline'] == 5.55
+
+
+def test_history_roundtrip_and_synthetic_subtitles():
+    """Geçmiş atomik yazılır; sentetik altyazı deterministik ve süreyi kaplar"""
+    with tempfile.TemporaryDirectory() as klasor:
+        yol = os.path.join(klasor, 'sub', 'history.json')
+        assert gecmis_oku(yol) == []
+        gecmise_ekle(_kayit({'effect': 1.0}), yol)
+        gecmise_ekle(_kayit({'effect': 1.2}), yol)
+        assert [k['stages']['effect']['seconds'] for k in gecmis_oku(yol)] == [1.0, 1.2]
+        assert not os.path.exists(yol + '.tmp')
+
+    segmentler = sentetik_altyazi(10, seed=42)
+    assert segmentler == sentetik_altyazi(10, seed=42)
+    assert segmentler[0]['start'] == 0 and segmentler[-1]['end'] == 10
+    assert all(s['words'][-1]['end'] <= s['end'] + 1e-9 for s in segmentler)
+
+
+def test_effect_chain_identity_ignores_track_file_names():
+    """Efekt track dosya adındaki rastgele ek zincir kimliğini değiştirmez"""
+    a = "fps=30,sendcmd=f='/tmp/tracks/crop_shk1_6dcd9c30129e.cmd',crop@shk1=iw-12:ih-12:6:6"
+    b = "fps=30,sendcmd=f='/tmp/tracks/crop_shk1_6d19f7cfa673.cmd',crop@shk1=iw-12:ih-12:6:6"
+    assert _zincir_kimligi(a) == _zincir_kimligi(b)
+    assert _zincir_kimligi(a) != _zincir_kimligi(a.replace('iw-12', 'iw-14'))
+    assert _zincir_kimligi(None) is None
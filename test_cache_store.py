@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Test script for cache store (SQLite index connections across fork)"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import cache_store
+
+
+def test_forked_child_opens_its_own_connection():
+    """Fork öncesi açılan bağlantı child'da kullanılmaz; child kendi bağlantısıyla yazar"""
+    if not hasattr(os, 'fork'):
+        pytest.skip("fork yok")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, 'cache')
+        klip = os.path.join(tmp, 'clip.mp4')
+        with open(klip, 'wb') as f:
+            f.write(b'\x00' * 4096)
+
+        # Parent bağlantıyı fork'tan önce açar (parallel_encode'daki istatistikler çağrısı gibi)
+        parent_conn = cache_store._baglanti(root)
+        cache_store.istatistikler(root)
+
+        pid = os.fork()
+        if pid == 0:
+            kod = 1
+            try:
+                child_conn = cache_store._baglanti(root)
+                if child_conn is not parent_conn:
+                    cache_store.ekle('klip-1', klip, root)
+                    kod = 0 if cache_store.ara('klip-1', root) else 2
+            finally:
+                os._exit(kod)
+
+        _, durum = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(durum) == 0
+
+        # Parent'ın bağlantısı sağlam ve child'ın yazdıklarını görüyor
+        assert cache_store._baglanti(root) is parent_conn
+        assert cache_store.ara('klip-1', root) is not None
+        stats = cache_store.istatistikler(root)
+        assert stats['inserts'] == 1 and stats['hits'] == 2
+        cache_store.kapat()
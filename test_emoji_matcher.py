@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Test script for the compiled emoji matcher (priority and tie-break rules)"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from emoji_matcher import EmojiEslestirici, emoji_bul, eslestirici
+
+
+def test_earliest_pattern_wins_regardless_of_position():
+    """Birden çok kalıp eşleşirse metindeki sıra değil emoji_map sırası belirler"""
+    m = EmojiEslestirici({'korku|karanlık': '😱', 'mutlu|güzel': '😊', 'para': '💰'})
+    assert m.bul("Para yok ama çok mutlu, sonra karanlık çöktü") == '😱'
+    assert m.bul("Para yok ama çok mutlu") == '😊'
+    assert m.bul("Para") == '💰'
+    assert m.bul("Bir şey yok") is None
+
+
+def test_duplicate_keyword_uses_first_pattern():
+    """Aynı anahtar kelime iki kalıpta varsa ilk kalıbın emojisi"""
+    m = EmojiEslestirici({'ev|yuva': '🏠', 'aile|ev': '👨‍👩‍👧'})
+    assert m.bul("Eve döndük") == '🏠'
+    assert m.bul("Aile toplandı") == '👨‍👩‍👧'
+
+
+def test_prefix_keywords_at_same_position():
+    """Regex en uzun kelimeyi seçse de aynı konumdaki önek kelimenin önceliği geçerli"""
+    m = EmojiEslestirici({'dur': '✋', 'durum': '📋'})
+    assert m.bul("Durum kötü") == '✋'
+    m = EmojiEslestirici({'durum': '📋', 'dur': '✋'})
+    assert m.bul("Durum kötü") == '📋'
+    assert m.bul("Dur dedim") == '✋'
+
+
+def test_word_start_only_and_multiword_overlap():
+    """Eşleşme kelime başında (ekler serbest); çok kelimeli eşleşmenin içi de taranır"""
+    m = EmojiEslestirici({'hot': '🔥', 'kitap': '📚'})
+    assert m.bul("Photo çektik") is None
+    assert m.bul("Kitaplar masada") == '📚'
+
+    m = EmojiEslestirici({'gece': '🌙', 'iyi gece': '😴'})
+    # 'iyi gece' daha uzun ama 'gece' map'te önce: içteki kelime başı da bulunur
+    assert m.bul("iyi geceler") == '🌙'
+    m = EmojiEslestirici({'iyi gece': '😴', 'gece': '🌙'})
+    assert m.bul("iyi geceler") == '😴'
+
+
+def test_cached_compile_and_empty_map():
+    """Aynı içerikli map bir kez derlenir; boş map hiçbir şey eşleştirmez"""
+    emoji_map = {'mutlu': '😊'}
+    assert eslestirici(dict(emoji_map)) is eslestirici(dict(emoji_map))
+    assert emoji_bul("mutlu", emoji_map) == '😊'
+    assert EmojiEslestirici({}).bul("mutlu") is None
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Test script for filter graph optimizer (eq merge, identity drop, crop+scale fold)"""
+
+import os
+import sys
+import shutil
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from filter_graph_optimizer import (
+    parse_filter_graph,
+    build_filter_graph,
+    optimize_filter_graph,
+    verify_optimization,
+    FILTER_GRAPH_OPTIMIZER_CONFIG,
+)
+from story_features import generate_hook_effects, generate_climax_effects
+
+
+def test_roundtrip_keeps_labels_and_quotes():
+    """Parse → build zinciri birebir korumalı"""
+    graph = ("zoompan=z='if(lte(on,15),1.1*on/15,1.1)':d=1,"
+             "format=yuv420p,split[main][ref];[ref]hflip[flipped];[main][flipped]hstack")
+    assert build_filter_graph(parse_filter_graph(graph)) == graph
+
+
+def test_identity_and_duplicates_removed():
+    """Etkisiz filtreler ve tekrarlanan format dönüşümleri kalkar"""
+    graph = "fps=30,eq=contrast=1:brightness=0,setpts=1.0*PTS,hflip,hflip,format=yuv420p,format=yuv420p"
+    assert optimize_filter_graph(graph, exact_only=True) == "fps=30,format=yuv420p"
+
+
+def test_consecutive_eq_merged():
+    """eq,eq → tek eq (contrast çarpılır, brightness ölçeklenip toplanır)"""
+    result = optimize_filter_graph("eq=contrast=1.25:brightness=0.05,eq=contrast=1.2:saturation=1.1")
+    stages = parse_filter_graph(result)
+    assert len(stages) == 1 and stages[0]['name'] == 'eq'
+    assert 'contrast=1.5' in result and 'brightness=0.06' in result and 'saturation=1.1' in result
+
+
+def test_eq_merge_out_of_range_not_merged():
+    """Birleşik değer ffmpeg aralığı dışına çıkarsa (brightness 1.2, saturation 4) birleştirilmez"""
+    graph = "eq=saturation=2:brightness=0.6,eq=saturation=2:brightness=0.6"
+    assert optimize_filter_graph(graph) == graph
+
+
+def test_eq_with_gamma_before_linear_not_merged():
+    """Gamma'dan sonra doğrusal ayar gelirse birleştirilemez"""
+    graph = "eq=gamma=1.5,eq=contrast=1.2"
+    assert optimize_filter_graph(graph) == graph
+
+
+def test_hook_and_climax_crop_scale_folded():
+    """Hook + climax zincirindeki crop,scale,crop,scale tek crop + tek scale olur"""
+    graph = ("crop=in_w-16:in_h-16:8:8,scale=1920:1080:flags=lanczos,"
+             "crop=in_w-30:in_h-30:15:15,scale=1920:1080:flags=lanczos")
+    stages = parse_filter_graph(optimize_filter_graph(graph))
+    assert [s['name'] for s in stages] == ['crop', 'scale']
+
+
+def test_size_changing_scale_options_not_collapsed():
+    """force_original_aspect_ratio / force_divisible_by çıktı boyutunu değiştirir, katlanmaz"""
+    for graph in ("scale=1920:1080,scale=1920:1080:force_original_aspect_ratio=decrease",
+                  "scale=1280:720:force_divisible_by=4,scale=1920:1080",
+                  "crop=in_w-16:in_h-16:8:8,scale=1920:1080:force_original_aspect_ratio=decrease,"
+                  "crop=in_w-30:in_h-30:15:15,scale=1920:1080"):
+        assert optimize_filter_graph(graph) == graph
+    assert optimize_filter_graph("scale=1280:720,scale=1920:1080:flags=lanczos") == "scale=1920:1080:flags=lanczos"
+
+
+def test_real_hook_and_climax_chain_reduced():
+    """Gerçek zincirde eq geometrinin arkasına geçer, zoom + kenar crop'ları katlanır"""
+    full = generate_hook_effects(3.0) + ',' + generate_climax_effects(1.0)
+    before = [s['name'] for s in parse_filter_graph(full)]
+    after = [s['name'] for s in parse_filter_graph(optimize_filter_graph(full))]
+    assert len(before) == 13
+    assert after == ['crop', 'scale', 'eq', 'vignette', 'unsharp', 'crop', 'scale', 'eq', 'unsharp']
+
+
+def test_frame_hash_exact_passes():
+    """Exact geçişler test klibinde framemd5 ile birebir aynı (ffmpeg varsa)"""
+    if not shutil.which('ffmpeg'):
+        pytest.skip("ffmpeg yok")
+
+    import subprocess
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = os.path.join(tmp, 'clip.mp4')
+        subprocess.run(['ffmpeg', '-v', 'error', '-f', 'lavfi', '-i', 'testsrc2=size=320x240:rate=30',
+                        '-t', '1', '-pix_fmt', 'yuv420p', '-y', clip], check=True)
+        graph = "eq=contrast=1:brightness=0,hflip,hflip,format=yuv420p,format=yuv420p,eq=saturation=1.2"
+        report = verify_optimization(clip, graph, frames=30)
+        assert report['exact_match']
+        assert report['stages'][1] < report['stages'][0]
+
+
+def test_frame_psnr_approx_passes():
+    """Yaklaşık geçişler (eq taşıma/birleştirme, crop+scale katlama) boyutu korur, PSNR sınırın üstünde"""
+    if not shutil.which('ffmpeg'):
+        pytest.skip("ffmpeg yok")
+
+    import subprocess
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = os.path.join(tmp, 'clip.mp4')
+        subprocess.run(['ffmpeg', '-v', 'error', '-f', 'lavfi', '-i', 'testsrc2=size=640x360:rate=30',
+                        '-vf', 'gblur=sigma=2', '-t', '1', '-pix_fmt', 'yuv420p', '-y', clip], check=True)
+        graph = (generate_hook_effects(3.0) + ',' + generate_climax_effects(1.0)
+                 + ",eq=contrast=1.1,eq=brightness=0.02")
+        report = verify_optimization(clip, graph, frames=10)
+        assert report['stages'][2] < report['stages'][0]
+        assert report['size_match']
+        assert report['psnr'] >= FILTER_GRAPH_OPTIMIZER_CONFIG['verify_min_psnr']
+        assert report['approx_ok']
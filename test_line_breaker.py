@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Test script for the shared prefix-sum / DP line breaking engine"""
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from line_breaker import en_iyi_kirilim, satirlara_bol, toplu_kirilim
+
+
+def _eski_bolme(words, max_chars):
+    """Önceki O(n²) döngü: |len1 - len2| en küçük, ilk bulunan kazanır"""
+    best, min_diff = None, float('inf')
+    for i in range(1, len(words)):
+        len1 = len(' '.join(words[:i]))
+        len2 = len(' '.join(words[i:]))
+        if len1 <= max_chars and len2 <= max_chars and abs(len1 - len2) < min_diff:
+            min_diff, best = abs(len1 - len2), i
+    return best
+
+
+def test_two_lines_match_previous_split():
+    """2 satırda DP eski dengeleme döngüsüyle aynı noktayı seçer (sığmıyorsa None)"""
+    rng = random.Random(7)
+    for _ in range(300):
+        words = ['x' * rng.randint(1, 9) for _ in range(rng.randint(2, 14))]
+        max_chars = rng.randint(8, 40)
+        kirilim = en_iyi_kirilim([len(w) for w in words], max_chars, satir_sayisi=2)
+        beklenen = _eski_bolme(words, max_chars)
+        assert (kirilim[0] if kirilim else None) == beklenen
+
+
+def test_fewest_lines_and_batch():
+    """Sığan en az satır seçilir; toplu çağrı tekil çağrılarla aynı sonucu verir"""
+    words = "bu gece karanlık ormanda garip sesler duyduk ve koştuk".split()
+    kirilim = en_iyi_kirilim([len(w) for w in words], 20, max_satir=3)
+    satirlar = [' '.join(s) for s in satirlara_bol(words, kirilim)]
+    assert len(satirlar) == 3 and all(len(s) <= 20 for s in satirlar)
+
+    assert en_iyi_kirilim([len(w) for w in words], 200, max_satir=3) == []
+    assert en_iyi_kirilim([50, 3], 20, max_satir=3) is None
+
+    segmentler = [words, words[:4], ["tek"]]
+    assert toplu_kirilim(segmentler, max_genislik=20, max_satir=3) == [
+        en_iyi_kirilim([len(w) for w in s], 20, max_satir=3) for s in segmentler
+    ]
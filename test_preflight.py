@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Test script for preflight (exit code vs stderr handling)"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from preflight import _calistir
+
+
+def _python(kod):
+    return [sys.executable, '-c', kod]
+
+
+def test_stderr_with_zero_exit_is_warning():
+    """Çıkış kodu 0 + stderr (MP3 "Header missing" gibi) hata değil uyarı"""
+    hata, uyari = _calistir(_python("import sys; sys.stderr.write('[mp3] Header missing\\n')"), 10)
+    assert hata is None
+    assert uyari == '[mp3] Header missing'
+
+
+def test_nonzero_exit_is_error():
+    """Sıfır olmayan çıkış kodu hata; mesaj stderr'in son satırı, yoksa çıkış kodu"""
+    hata, uyari = _calistir(_python("import sys; sys.stderr.write('a\\nInvalid data\\n'); sys.exit(1)"), 10)
+    assert hata == 'Invalid data' and uyari is None
+    assert _calistir(_python("import sys; sys.exit(3)"), 10) == ('çıkış kodu 3', None)
+
+
+def test_clean_run_returns_nothing():
+    """Temiz çalışma: ne hata ne uyarı"""
+    assert _calistir(_python("pass"), 10) == (None, None)
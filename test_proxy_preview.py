@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Test script for proxy preview window sampling and filter rescaling"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from proxy_preview import filtre_olcekle, pencere_sec, proxy_boyutu
+
+
+def test_windows_spread_over_timeline():
+    """Kısa çizelge tamamen alınır; uzun çizelgeden eşit aralıklı pencereler seçilir"""
+    assert pencere_sec([5.0] * 6, max_sure=60, pencere_sayisi=4) == list(range(6))
+
+    sureler = [5.0] * 120  # 10 dakika
+    secilen = pencere_sec(sureler, max_sure=60, pencere_sayisi=4)
+    assert sum(sureler[i] for i in secilen) <= 60 + 4 * 5.0
+    # Her çeyrekten klip var
+    assert {i * 4 // len(sureler) for i in secilen} == {0, 1, 2, 3}
+    assert secilen == sorted(secilen)
+
+
+def test_filter_rescaled_to_proxy():
+    """Çıkış boyutu proxy boyutuna çevrilir, diğer sayılar korunur"""
+    assert proxy_boyutu(480) == (854, 480)
+    filtre = ("scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,"
+              "zoompan=z=1.1:d=1:s=1920x1080:fps=30,crop=19200:10800")
+    sonuc = filtre_olcekle(filtre, 480)
+    assert sonuc.count('854:480') == 2 and 's=854x480' in sonuc
+    assert 'crop=19200:10800' in sonuc
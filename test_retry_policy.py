@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Test script for error-classified retry policy (fail fast, degrade, stats)"""
+
+import os
+import sys
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from error_handler import (
+    ErrorCategory,
+    RetryAction,
+    RetryPolicy,
+    classify_exception,
+    parse_ffmpeg_error,
+    retry_on_failure,
+)
+
+
+def test_permanent_errors_fail_fast():
+    """Eksik dosya / bozuk girdi: ilk denemede FAIL, bekleme yok"""
+    policy = RetryPolicy()
+    for stderr in ["input.mp4: No such file or directory",
+                   "input.mp4: Invalid data found when processing input",
+                   "Unknown encoder 'libx265'"]:
+        decision = policy.decide(parse_ffmpeg_error(stderr), 1, can_degrade=True)
+        assert decision.action == RetryAction.FAIL, stderr
+        assert decision.delay == 0.0
+
+
+def test_gpu_degrades_and_transient_retries():
+    """GPU hatası CPU'ya düşer; geçici hata önce retry, sonra degrade"""
+    policy = RetryPolicy()
+    gpu = parse_ffmpeg_error("[h264_nvenc] InitializeEncoder failed")
+    assert policy.decide(gpu, 1, can_degrade=True).action == RetryAction.DEGRADE
+
+    first = policy.decide(ErrorCategory.FFMPEG_ERROR, 1, can_degrade=True)
+    assert first.action == RetryAction.RETRY and first.delay > 0
+    assert policy.decide(ErrorCategory.FFMPEG_ERROR, 2, can_degrade=True).action == RetryAction.DEGRADE
+    assert policy.decide(ErrorCategory.FFMPEG_ERROR, 2, can_degrade=False).action == RetryAction.FAIL
+
+    stats = policy.stats.summary()
+    assert stats['gpu_error']['degrade'] == 1
+    assert stats['ffmpeg_error']['failures'] == 3
+
+
+def test_decorator_stops_on_permanent_error():
+    """policy ile decorator kalıcı hatada tekrar denemez"""
+    policy = RetryPolicy()
+    calls = []
+
+    @retry_on_failure(max_attempts=3, delay=0.0, policy=policy)
+    def missing():
+        calls.append(1)
+        raise subprocess.CalledProcessError(1, 'ffmpeg', stderr="x.mp4: No such file or directory")
+
+    try:
+        missing()
+    except subprocess.CalledProcessError:
+        pass
+    assert len(calls) == 1
+    assert classify_exception(subprocess.TimeoutExpired('ffmpeg', 1)) == ErrorCategory.TIMEOUT_ERROR
+    assert policy.stats.summary()['file_not_found']['fail'] == 1
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test script for RAM/disk scratch placement, peak tracking and orphan cleanup"""
+
+import os
+import sys
+import json
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import scratch_space
+from scratch_space import SCRATCH_CONFIG, alan_ac, alan_kapat, dosya_yolu, yetim_temizle
+
+
+def _ayarla(ram_kok):
+    eski = dict(SCRATCH_CONFIG)
+    SCRATCH_CONFIG.update({'ram_root': ram_kok, 'min_free_memory_bytes': 0,
+                           'ram_budget_bytes': 10 * 1024 ** 2, 'max_ram_file_bytes': 8 * 1024 ** 2,
+                           'text_estimate_bytes': 1024 ** 2})
+    return eski
+
+
+def test_small_files_in_ram_large_on_disk():
+    """Küçük dosyalar RAM'e, büyükler ve bütçeyi aşanlar diske; kapatınca RAM silinir, tepe kalır"""
+    with tempfile.TemporaryDirectory() as ram, tempfile.TemporaryDirectory() as disk:
+        eski = _ayarla(ram)
+        try:
+            alan = alan_ac('job', disk)
+            ass = dosya_yolu(disk, 'subtitles.ass')
+            assert ass.startswith(alan.ram_klasor)
+            assert dosya_yolu(disk, 'big.mp4', 50 * 1024 ** 2).startswith(disk)
+            assert dosya_yolu(disk, 'unknown.mp4').startswith(disk)
+
+            ilk = dosya_yolu(disk, 's_0000.mp4', 7 * 1024 ** 2)
+            assert ilk.startswith(alan.ram_klasor)
+            assert dosya_yolu(disk, 's_0001.mp4', 7 * 1024 ** 2).startswith(disk)  # bütçe doldu
+
+            with open(ilk, 'wb') as f:
+                f.write(b'\0' * 300000)
+            ozet = alan_kapat(disk)
+            assert not os.path.exists(alan.ram_klasor)
+            assert ozet['peak_ram_mb'] > 0.2 and ozet['ram_files'] == 2 and ozet['disk_files'] == 3
+            assert dosya_yolu(disk, 'x.ass') == os.path.join(disk, 'x.ass')  # alan kapalı
+        finally:
+            SCRATCH_CONFIG.update(eski)
+
+
+def test_orphan_dirs_removed():
+    """Sahibi ölmüş RAM klasörü silinir, yaşayan sürecinki korunur"""
+    with tempfile.TemporaryDirectory() as ram:
+        for ad, pid in (('olu', 2 ** 22 + 12345), ('canli', os.getppid())):
+            klasor = os.path.join(ram, f"{SCRATCH_CONFIG['prefix']}{ad}")
+            os.makedirs(klasor)
+            with open(os.path.join(klasor, scratch_space._SAHIP_DOSYASI), 'w') as f:
+                json.dump({'pid': pid, 'job_id': ad, 'created': 0}, f)
+        if os.name != 'nt':
+            assert yetim_temizle(ram) == 1
+            assert os.listdir(ram) == [f"{SCRATCH_CONFIG['prefix']}canli"]
+
+
+def test_resume_adopts_dead_owners_ram_dir():
+    """Aynı işin çökmüş sürecine ait RAM klasörü silinmez, devralınır; başka işinki silinir"""
+    if os.name == 'nt':
+        pytest.skip("pid sahipliği Windows'ta yaşa göre belirlenir")
+    with tempfile.TemporaryDirectory() as ram, tempfile.TemporaryDirectory() as disk:
+        eski = _ayarla(ram)
+        onceki_tarama = scratch_space._yetim_tarandi
+        scratch_space._yetim_tarandi = False
+        try:
+            olu_pid = 2 ** 22 + 12345
+            klasorler = {}
+            for job_id in ('render.mp4', 'baska.mp4'):
+                klasor = os.path.join(ram, f"{SCRATCH_CONFIG['prefix']}{job_id}")
+                os.makedirs(klasor)
+                with open(os.path.join(klasor, scratch_space._SAHIP_DOSYASI), 'w') as f:
+                    json.dump({'pid': olu_pid, 'job_id': job_id, 'disk': scratch_space._anahtar(disk),
+                               'created': 0}, f)
+                klasorler[job_id] = klasor
+            segment = os.path.join(klasorler['render.mp4'], 's_0001.mp4')
+            with open(segment, 'wb') as f:
+                f.write(b'\0' * 1000)
+
+            alan = alan_ac('render.mp4', disk)
+            assert alan.ram_klasor == klasorler['render.mp4'] and os.path.exists(segment)
+            assert not os.path.exists(klasorler['baska.mp4'])
+
+            ozet = alan_kapat(disk)
+            assert not os.path.exists(alan.ram_klasor)
+            assert ozet['reserved_ram_mb'] == 0.0
+        finally:
+            scratch_space._yetim_tarandi = onceki_tarama
+            SCRATCH_CONFIG.update(eski)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Test script for producer → consumer pipe handoff between stages"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stage_pipe import boru_ile_calistir, tuketici_girisi, uretici_cikisi
+
+PY = sys.executable
+
+
+def test_data_flows_without_temp_file():
+    """Üreticinin çıktısı tüketiciye boru ile akar (boru tamponundan büyük veri dahil)"""
+    uretici = [PY, '-c', "import sys; sys.stdout.write('x' * 5000000); sys.stderr.write('uretici-log')"]
+    tuketici = [PY, '-c', "import sys; print(len(sys.stdin.read()))"]
+    sonuc = boru_ile_calistir(uretici, tuketici, timeout=60)
+    assert sonuc.returncode == 0
+    assert sonuc.stdout.strip() == '5000000'
+    assert 'uretici-log' in sonuc.stderr
+
+
+def test_producer_failure_is_reported():
+    """Üretici hata verirse tüketici başarılı bitse bile sonuç başarısız"""
+    uretici = [PY, '-c', "import sys; sys.stdout.write('yarım'); sys.exit(3)"]
+    tuketici = [PY, '-c', "import sys; sys.stdin.read()"]
+    assert boru_ile_calistir(uretici, tuketici, timeout=60).returncode == 3
+
+    assert uretici_cikisi(ham=True)[:2] == ['-c:v', 'rawvideo'] and uretici_cikisi()[-1] == 'pipe:1'
+    assert tuketici_girisi()[-2:] == ['-i', 'pipe:0']
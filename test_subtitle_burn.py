@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test script for time-shifted ASS slices used by segment-parallel burn-in"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from subtitle_burn import ass_ayristir, ass_dilimi_olustur, ass_zaman_oku, ass_zaman_yaz
+
+ASS = """[Script Info]
+PlayResX: 1920
+PlayResY: 1080
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize
+Style: Default,Impact,72
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:58.00,0:00:59.20,Default,,0,0,0,,{\\k20}önce
+Dialogue: 0,0:00:59.50,0:01:01.00,Default,,0,0,0,,{\\fad(200,0)}sınırda
+Dialogue: 0,0:01:05.00,0:01:06.00,Default,,0,0,0,,sonra
+"""
+
+
+def _olaylar(dilim):
+    return [s for s in dilim.splitlines() if s.startswith('Dialogue:')]
+
+
+def test_seam_event_keeps_timeline():
+    """Sınıra taşan olay kırpılmaz; dilim zamanı + origin = kaynak zamanı (kare hassas)"""
+    baslik, olaylar = ass_ayristir(ASS)
+    start = 60.033367  # keyframe pts santisaniye ızgarasında değil
+    dilim, offset = ass_dilimi_olustur(baslik, olaylar, start, 120.0)
+
+    satirlar = _olaylar(dilim)
+    assert len(satirlar) == 2
+    ilk = satirlar[0].split(',')
+    assert ilk[1] == '0:00:00.00' and ilk[2] == '0:00:01.50'
+    assert '{\\fad(200,0)}sınırda' in satirlar[0]
+
+    # Parçanın ilk karesi (pts 0) dilimde offset'te görünür: origin 59.50
+    assert abs((offset + 59.50) - start) < 1e-9
+
+
+def test_chunk_before_events_and_roundtrip():
+    """Olay içermeyen parça boş dilim üretir; zaman biçimi gidiş-dönüş korunur"""
+    baslik, olaylar = ass_ayristir(ASS)
+    dilim, offset = ass_dilimi_olustur(baslik, olaylar, 0.0, 50.0)
+    assert _olaylar(dilim) == [] and offset == 0.0
+    assert '[Events]' in dilim and 'Style: Default,Impact,72' in dilim
+
+    son, _ = ass_dilimi_olustur(baslik, olaylar, 62.0, None)
+    assert _olaylar(son)[0].split(',')[1] == '0:00:03.00'
+
+    for zaman in ('0:00:00.00', '0:01:01.07', '1:59:59.99'):
+        assert ass_zaman_yaz(ass_zaman_oku(zaman)) == zaman
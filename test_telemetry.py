@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Test script for telemetry (per-run subprocess counters)"""
+
+import os
+import sys
+import tempfile
+import threading
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import telemetry
+
+
+def test_parallel_runs_count_only_their_own_subprocesses():
+    """Paralel thread'lerdeki çalışmalar birbirinin subprocess'lerini saymaz"""
+    with tempfile.TemporaryDirectory() as tmp:
+        eski_yol = telemetry.TELEMETRY_CONFIG['path']
+        telemetry.TELEMETRY_CONFIG['path'] = os.path.join(tmp, 'spans.jsonl')
+        try:
+            hazir = threading.Barrier(2)
+
+            def is_calistir(run_id, adet):
+                telemetry.run_baslat(run_id)
+                with telemetry.span('encode'):
+                    hazir.wait()
+                    for _ in range(adet):
+                        subprocess.run([sys.executable, '-c', 'pass'])
+                    hazir.wait()
+                telemetry.run_bitir()
+
+            threads = [threading.Thread(target=is_calistir, args=('a', 1)),
+                       threading.Thread(target=is_calistir, args=('b', 3))]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            spans = {k['run_id']: k for k in telemetry.kayitlari_oku() if k['type'] == 'span'}
+        finally:
+            telemetry.TELEMETRY_CONFIG['path'] = eski_yol
+
+    assert spans['a']['subprocesses'] == 1
+    assert spans['b']['subprocesses'] == 3
+    assert telemetry._aktif_sayaclar == []
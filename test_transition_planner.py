@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Test script for transition planner (cumulative offsets, validation, filter_complex)"""
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from transition_planner import (
+    gecis_plani_olustur,
+    plan_dogrula,
+    plan_suresi,
+    grup_plani_olustur,
+    offsetleri_hesapla,
+    xfade_filter_complex,
+)
+
+
+def test_offsets_use_actual_durations():
+    """Offset'ler sabit overlap değil, her geçişin kendi süresiyle kayar"""
+    sureler = [8.0, 9.5, 7.25, 10.0]
+    plan = gecis_plani_olustur(sureler, rng=random.Random(7))
+
+    merged = sureler[0]
+    for k, gecis in enumerate(plan):
+        assert abs(gecis['offset'] - (merged - gecis['duration'])) < 1e-6
+        merged += sureler[k + 1] - gecis['duration']
+
+    assert abs(plan_suresi(sureler, plan) - merged) < 1e-6
+    assert plan_dogrula(sureler, plan) == []
+
+
+def test_long_playlist_valid():
+    """Yüzlerce klip: plan geçerli, filter_complex her girişi bir kez kullanır"""
+    rng = random.Random(3)
+    sureler = [rng.uniform(2.0, 11.0) for _ in range(500)]
+    plan = gecis_plani_olustur(sureler, rng=rng)
+
+    assert len(plan) == 499
+    assert plan_dogrula(sureler, plan) == []
+
+    graph, v_label, a_label = xfade_filter_complex(plan, include_audio=True)
+    assert v_label == '[v499]' and a_label == '[a499]'
+    assert graph.count('xfade=') == 499 and graph.count('acrossfade=') == 499
+    assert '[499:v]' in graph and '[500:v]' not in graph
+
+
+def test_grouped_plan_matches_flat_timeline():
+    """Gruplu birleştirme düz zincirle aynı toplam süreyi verir, gruplar dengeli"""
+    rng = random.Random(11)
+    sureler = [rng.uniform(3.0, 11.0) for _ in range(145)]
+    plan = gecis_plani_olustur(sureler, rng=rng)
+
+    seviye_sureler, seviye_plan = sureler, plan
+    while len(seviye_sureler) > 12:
+        grup_plani = grup_plani_olustur(seviye_sureler, seviye_plan, 12)
+        boylar = [g['end'] - g['start'] for g in grup_plani['groups']]
+        assert max(boylar) <= 12 and max(boylar) - min(boylar) <= 1
+        for g in grup_plani['groups']:
+            assert plan_dogrula(seviye_sureler[g['start']:g['end']], g['plan']) == []
+        seviye_sureler, seviye_plan = grup_plani['sureler'], grup_plani['seams']
+        assert plan_dogrula(seviye_sureler, seviye_plan) == []
+
+    assert abs(plan_suresi(seviye_sureler, seviye_plan) - plan_suresi(sureler, plan)) < 1e-6
+
+
+def test_invalid_plan_reported():
+    """Klipten uzun geçiş ve geri giden offset yakalanır"""
+    sureler = [5.0, 1.0, 5.0]
+    plan = [
+        {'type': 'fade', 'duration': 2.0, 'offset': 3.0},
+        {'type': 'fade', 'duration': 0.5, 'offset': 2.0},
+    ]
+    hatalar = plan_dogrula(sureler, plan)
+    assert any('klipten uzun' in h for h in hatalar)
+    assert any('offset artmıyor' in h for h in hatalar)
+
+
+def test_offsets_recomputed_from_measured_durations():
+    """Kare sınırına yuvarlanmış süreler: offset'ler planlanan değil ölçülen sürelerle ilerler"""
+    planlanan = [2.0] * 6
+    plan = gecis_plani_olustur(planlanan)
+    # 30 fps'te her klip bir kare uzun encode edilmiş
+    olculen = [s + 1 / 30 for s in planlanan]
+    yeni = offsetleri_hesapla(olculen, plan)
+
+    assert [g['type'] for g in yeni] == [g['type'] for g in plan]
+    kayma = [round(y['offset'] - p['offset'], 3) for y, p in zip(yeni, plan)]
+    assert kayma == [round((k + 1) / 30, 3) for k in range(len(plan))]
+    assert not plan_dogrula(olculen, yeni)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TRANSITION PLANNER - Önceden Hesaplanmış Geçiş Planı
+Tüm geçiş dizisi tek geçişte seçilir, offset'ler gerçek geçiş
+süreleriyle kümülatif hesaplanır ve tek bir doğrulanmış
+xfade filter_complex üretilir (yüzlerce klip için O(n)).
+"""
+
+import random
+import logging
+from bisect import bisect
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from effects import TRANSITION_EFFECTS
+except ImportError:
+    TRANSITION_EFFECTS = {
+        'enabled': True,
+        'default_duration': (0.5, 1.5),
+        'overlap_duration': 1.0,
+        'transitions': {'fade': {'weight': 1.0, 'description': 'Smooth fade transition'}},
+        'avoid_repetition': True,
+        'min_clip_gap': 3,
+    }
+
+
+# ============================================================================
+# ⚙️ CONFIG
+# ============================================================================
+
+TRANSITION_PLANNER_CONFIG = {
+    # Tekrar eden geçişin ağırlık çarpanı (transition_sec ile aynı)
+    'repeat_penalty': 0.1,
+
+    # Geçiş, komşu klibin en fazla bu oranını kaplayabilir
+    'max_clip_ratio': 0.45,
+
+    # Bundan kısa geçiş üretilmez (saniye)
+    'min_duration': 0.1,
+
+    # Hiyerarşik birleştirme: bu sayıdan fazla klip gruplar halinde
+    # ara dosyalara render edilir, sonra ek yerlerinden birleştirilir
+    'hierarchical': True,
+    'group_size': 12,
+    'max_parallel_groups': None,  # None = CPU çekirdek sayısı
+
+    # Ara dosyalar (kayıpsız, sadece intra kare → ek yerinde kalite kaybı yok)
+    'intermediate_ext': '.mkv',
+    'intermediate_video': ['-c:v', 'libx264', '-preset', 'ultrafast', '-qp', '0', '-g', '1'],
+    'intermediate_audio': ['-c:a', 'pcm_s16le'],
+}
+
+
+# ============================================================================
+# 🎲 GEÇİŞ SEÇİMİ
+# ============================================================================
+
+_tablo_cache = {}
+
+
+def _secim_tablosu(transitions: Dict) -> Tuple[List[str], List[float], List[str]]:
+    """İsim, ağırlık ve açıklama listeleri (config başına bir kez kurulur)"""
+    key = id(transitions)
+    tablo = _tablo_cache.get(key)
+    if tablo is None or tablo[0] is not transitions:
+        names = list(transitions.keys())
+        tablo = (
+            transitions,
+            names,
+            [transitions[n]['weight'] for n in names],
+            [transitions[n].get('description', '') for n in names],
+        )
+        _tablo_cache[key] = tablo
+    return tablo[1], tablo[2], tablo[3]
+
+
+def gecis_sec(index: int, recent: Sequence[str] = (), config: Optional[Dict] = None,
+              rng: Optional[random.Random] = None) -> Optional[Dict]:
+    """
+    Tek geçiş seç (son kullanılanların ağırlığı düşürülür)
+
+    Returns:
+        {'type', 'duration', 'description', 'index'} veya None (kapalı)
+    """
+    config = config or TRANSITION_EFFECTS
+    if not config.get('enabled'):
+        return None
+
+    rng = rng or random
+    names, weights, descriptions = _secim_tablosu(config['transitions'])
+
+    if recent and config.get('avoid_repetition'):
+        penalty = TRANSITION_PLANNER_CONFIG['repeat_penalty']
+        recent_set = set(recent)
+        weights = [w * penalty if n in recent_set else w for n, w in zip(names, weights)]
+
+    cum_weights = list(accumulate(weights))
+    i = bisect(cum_weights, rng.random() * cum_weights[-1])
+    i = min(i, len(names) - 1)
+
+    return {
+        'type': names[i],
+        'duration': round(rng.uniform(*config['default_duration']), 2),
+        'description': descriptions[i],
+        'index': index,
+    }
+
+
+# ============================================================================
+# 📋 PLAN
+# ============================================================================
+
+def gecis_plani_olustur(sureler: Sequence[float], config: Optional[Dict] = None,
+                        rng: Optional[random.Random] = None) -> List[Dict]:
+    """
+    Tüm klip dizisi için geçiş planı (tek geçiş, O(n))
+
+    Her geçişin süresi komşu kliplere sığacak şekilde kısaltılır ve
+    offset, birleştirilmiş akışın o ana kadarki gerçek uzunluğundan
+    hesaplanır:  offset_k = Σ sure[0..k] - Σ duration[0..k-1] - duration_k
+
+    Args:
+        sureler: Klip süreleri (saniye), oynatma sırasında
+        config: TRANSITION_EFFECTS benzeri config
+
+    Returns:
+        [{'type', 'duration', 'description', 'index', 'offset'}] (len = n-1)
+    """
+    config = config or TRANSITION_EFFECTS
+    if not config.get('enabled') or len(sureler) < 2:
+        return []
+
+    max_ratio = TRANSITION_PLANNER_CONFIG['max_clip_ratio']
+    min_duration = TRANSITION_PLANNER_CONFIG['min_duration']
+    gap = max(1, config.get('min_clip_gap', 1))
+
+    plan = []
+    recent = []
+    merged_length = sureler[0]
+
+    for k in range(len(sureler) - 1):
+        gecis = gecis_sec(k, recent[-gap:], config, rng)
+
+        # Geçiş iki komşu klibin de yarısından azını kaplamalı
+        limit = min(sureler[k], sureler[k + 1]) * max_ratio
+        duration = round(max(min_duration, min(gecis['duration'], limit)), 3)
+        gecis['duration'] = duration
+        gecis['offset'] = round(max(0.0, merged_length - duration), 3)
+
+        merged_length += sureler[k + 1] - duration
+        plan.append(gecis)
+        recent.append(gecis['type'])
+
+    return plan
+
+
+def plan_suresi(sureler: Sequence[float], plan: Sequence[Dict]) -> float:
+    """Plan uygulandıktan sonraki toplam süre"""
+    return sum(sureler) - sum(g['duration'] for g in plan)
+
+
+def plan_dogrula(sureler: Sequence[float], plan: Sequence[Dict]) -> List[str]:
+    """
+    Planı doğrula
+
+    Returns:
+        Hata mesajları listesi (boş = geçerli)
+    """
+    hatalar = []
+
+    if len(plan) != max(0, len(sureler) - 1):
+        hatalar.append(f"Geçiş sayısı {len(plan)}, beklenen {max(0, len(sureler) - 1)}")
+        return hatalar
+
+    merged_length = sureler[0] if sureler else 0.0
+    previous_offset = -1.0
+
+    for k, gecis in enumerate(plan):
+        duration = gecis['duration']
+        offset = gecis['offset']
+
+        if duration <= 0:
+            hatalar.append(f"Geçiş {k}: süre pozitif değil ({duration})")
+        if duration > sureler[k + 1] or duration > sureler[k]:
+            hatalar.append(f"Geçiş {k}: süre ({duration}s) klipten uzun")
+        if offset <= previous_offset:
+            hatalar.append(f"Geçiş {k}: offset artmıyor ({offset} <= {previous_offset})")
+        if offset + duration > merged_length + 1e-3:
+            hatalar.append(f"Geçiş {k}: offset+süre ({offset + duration:.3f}) akıştan uzun ({merged_length:.3f})")
+
+        previous_offset = offset
+        merged_length += sureler[k + 1] - duration
+
+    return hatalar
+
+
+# ============================================================================
+# 🌳 HİYERARŞİK GRUPLAMA
+# ============================================================================
+
+def offsetleri_hesapla(sureler: Sequence[float], plan: Sequence[Dict]) -> List[Dict]:
+    """Plandaki geçiş tipleri/süreleri korunarak offset'leri yeniden hesapla"""
+    yeni_plan = []
+    merged_length = sureler[0] if sureler else 0.0
+
+    for k, gecis in enumerate(plan):
+        yeni = dict(gecis)
+        yeni['offset'] = round(max(0.0, merged_length - gecis['duration']), 3)
+        yeni_plan.append(yeni)
+        merged_length += sureler[k + 1] - gecis['duration']
+
+    return yeni_plan
+
+
+def grup_plani_olustur(sureler: Sequence[float], plan: Sequence[Dict],
+                       grup_boyu: Optional[int] = None) -> Dict:
+    """
+    Planı dengeli gruplara böl (filter graph derinliği grup_boyu ile sınırlı)
+
+    Grup içi geçişler aynı kalır; gruplar arasındaki geçişler ek yeri
+    (seam) planı olur ve offset'leri grup süreleri üzerinden hesaplanır.
+    Sonuç, toplamda tek düz zincirle aynı zaman çizelgesini verir.
+
+    Returns:
+        {
+            'groups': [{'start', 'end', 'plan', 'sure'}],  # end hariç
+            'seams': [...],                               # len(groups) - 1
+            'sureler': [grup süreleri],
+        }
+    """
+    grup_boyu = max(2, grup_boyu or TRANSITION_PLANNER_CONFIG['group_size'])
+    n = len(sureler)
+
+    # Dengeli bölme: son grup tek klip kalmasın
+    grup_sayisi = max(1, -(-n // grup_boyu))
+    taban, artan = divmod(n, grup_sayisi)
+
+    groups = []
+    seams = []
+    start = 0
+    for g in range(grup_sayisi):
+        end = start + taban + (1 if g < artan else 0)
+        alt_sureler = sureler[start:end]
+        alt_plan = offsetleri_hesapla(alt_sureler, plan[start:end - 1])
+        groups.append({
+            'start': start,
+            'end': end,
+            'plan': alt_plan,
+            'sure': plan_suresi(alt_sureler, alt_plan),
+        })
+        if end < n:
+            seams.append(plan[end - 1])
+        start = end
+
+    grup_sureleri = [g['sure'] for g in groups]
+    return {
+        'groups': groups,
+        'seams': offsetleri_hesapla(grup_sureleri, seams),
+        'sureler': grup_sureleri,
+    }
+
+
+# ============================================================================
+# 🎬 FILTER_COMPLEX
+# ============================================================================
+
+def xfade_filter_complex(plan: Sequence[Dict], include_audio: bool = False,
+                         input_offset: int = 0, input_filter: Optional[str] = None) -> Tuple[str, str, Optional[str]]:
+    """
+    Plan için tek filter_complex üret
+
+    Video: [0:v][1:v]xfade[v1];[v1][2:v]xfade[v2];...
+    Ses:   acrossfade ile aynı sürelerde (toplam süre video ile eşit kalır)
+
+    Args:
+        plan: gecis_plani_olustur çıktısı
+        include_audio: acrossfade zinciri de ekle
+        input_offset: İlk klibin ffmpeg input index'i
+        input_filter: Her video girişine uygulanacak normalizasyon
+            (xfade aynı boyut/fps/timebase ister)
+
+    Returns:
+        (filter_complex, video_label, audio_label)
+    """
+    parts = []
+
+    def video_input(i: int) -> str:
+        if not input_filter:
+            return f"[{i}:v]"
+        parts.append(f"[{i}:v]{input_filter}[n{i}]")
+        return f"[n{i}]"
+
+    v_label = video_input(input_offset)
+    a_label = f"[{input_offset}:a]"
+
+    for k, gecis in enumerate(plan, start=1):
+        v_in = video_input(input_offset + k)
+        v_out = f"[v{k}]"
+        parts.append(
+            f"{v_label}{v_in}xfade=transition={gecis['type']}:"
+            f"duration={gecis['duration']}:offset={gecis['offset']}{v_out}"
+        )
+        v_label = v_out
+
+        if include_audio:
+            a_out = f"[a{k}]"
+            parts.append(f"{a_label}[{input_offset + k}:a]acrossfade=d={gecis['duration']}{a_out}")
+            a_label = a_out
+
+    return ';'.join(parts), v_label, (a_label if include_audio else None)